@@ -46,17 +46,16 @@ from chirptext.leutile import Counter, Timer
 
 from chirptext import texttaglib as ttl
 
-from yawlib import YLConfig, SynsetID
-from yawlib import GWordnetSQLite
-from yawlib import WordnetSQL
-from yawlib.omwsql import OMWSQL
+from yawlib import SynsetID
+
+from omwtk.registry import LazyResource
 
 # ---------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------
 
-omw = OMWSQL(YLConfig.OMW_DB)
-wn30 = WordnetSQL(YLConfig.WNSQL30_PATH)
+omw = LazyResource('omw')
+wn30 = LazyResource('wn30')
 DATA_DIR = os.path.abspath('./data')
 
 
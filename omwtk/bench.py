@@ -0,0 +1,628 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Synthetic wordnet fixtures and benchmarks for omwtk hot paths
+Latest version can be found at https://github.com/letuananh/omwtk
+
+Fixtures are SQLite databases with the same schemas as OMW, Gloss WordNet, PWN-3.0 (WNSQL),
+EWDB (ewmap.db) and NTU-MC, filled with random (but reproducible) synsets.
+Benchmarks run against these fixtures (shared resources are redirected through omwtk.registry)
+and every result is appended to a JSON lines file so that runs can be compared.
+
+Usage:
+    python3 -m omwtk.bench gen -s 1k 100k
+    python3 -m omwtk.bench run -s 1k -c compare_synset topk_mfs
+    python3 -m omwtk.bench list
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import os
+import json
+import time
+import random
+import logging
+import platform
+import tempfile
+import argparse
+import subprocess
+from collections import OrderedDict
+from collections import namedtuple
+from collections import defaultdict as dd
+
+from puchikarui import Schema
+from chirptext.leutile import TextReport
+
+from omwtk import registry
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+BENCH_DIR = 'data/bench'
+RESULT_FILE = os.path.join(BENCH_DIR, 'results.jsonl')
+SIZES = OrderedDict([('1k', 1000), ('100k', 100000), ('1m', 1000000)])
+DEFAULT_SEED = 31
+BATCH_SIZE = 10000
+SAMPLE_SIZE = 500
+LANGS = ('eng', 'jpn', 'ita')
+FIXTURE_DBS = ('omw', 'gwn', 'wn30', 'ewdb', 'ntumc')
+
+OMW_SETUP = '''
+CREATE TABLE synset (synset TEXT PRIMARY KEY, pos TEXT, name TEXT, src TEXT);
+CREATE TABLE word (wordid INTEGER PRIMARY KEY, lang TEXT, lemma TEXT, pron TEXT, pos TEXT);
+CREATE TABLE synlink (synset1 TEXT, synset2 TEXT, link TEXT, src TEXT);
+CREATE TABLE sense (synset TEXT, wordid INTEGER, lang TEXT, rank TEXT, lexid INTEGER, freq INTEGER, src TEXT);
+CREATE TABLE synset_def (synset TEXT, lang TEXT, def TEXT, sid TEXT, usr TEXT);
+CREATE TABLE synset_ex (synset TEXT, lang TEXT, def TEXT, sid TEXT);
+CREATE INDEX word_lemma_idx ON word(lemma);
+CREATE INDEX sense_synset_idx ON sense(synset);
+CREATE INDEX sense_wordid_idx ON sense(wordid);
+CREATE INDEX synset_def_synset_idx ON synset_def(synset, lang);
+CREATE INDEX synset_ex_synset_idx ON synset_ex(synset, lang);
+'''
+
+WN30_SETUP = '''
+CREATE TABLE synsets (synsetid INTEGER PRIMARY KEY, pos TEXT, lexdomainid INTEGER, definition TEXT);
+CREATE TABLE senses (wordid INTEGER, casedwordid INTEGER, synsetid INTEGER, senseid INTEGER PRIMARY KEY, sensenum INTEGER, lexid INTEGER, tagcount INTEGER, sensekey TEXT);
+CREATE INDEX senses_synsetid_idx ON senses(synsetid);
+'''
+
+EWDB_SETUP = '''
+CREATE TABLE sense (ID INTEGER PRIMARY KEY AUTOINCREMENT, synsetid TEXT, lemma TEXT, pos TEXT, definition TEXT, flag INTEGER, mwe INTEGER);
+CREATE TABLE pred (senseID INTEGER, pred TEXT);
+CREATE TABLE flag (ID INTEGER PRIMARY KEY, text TEXT, description TEXT);
+CREATE INDEX sense_lemma_idx ON sense(lemma);
+CREATE INDEX sense_synsetid_idx ON sense(synsetid);
+'''
+
+NTUMC_SETUP = '''
+CREATE TABLE sent (sid INTEGER PRIMARY KEY, docID INTEGER, pid TEXT, sent TEXT, comment TEXT, usrname TEXT);
+CREATE TABLE word (sid INTEGER, wid INTEGER, word TEXT, pos TEXT, lemma TEXT, cfrom INTEGER, cto INTEGER, comment TEXT, usrname TEXT);
+CREATE TABLE concept (sid INTEGER, cid INTEGER, clemma TEXT, tag TEXT, tags TEXT, comment TEXT, ntag TEXT, usrname TEXT);
+CREATE TABLE cwl (sid INTEGER, wid INTEGER, cid INTEGER);
+CREATE INDEX word_sid_idx ON word(sid);
+CREATE INDEX concept_sid_idx ON concept(sid);
+CREATE INDEX cwl_sid_idx ON cwl(sid);
+'''
+
+
+def getLogger():
+    return logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------------
+# Synthetic data
+# -------------------------------------------------------------------------------
+
+SYLLABLES = 'ka ki ku ke ko sa shi su se so ta te to na ni nu ne no ma mi mu me mo ra ri ru re ro la li lo ba be bo da de do'.split()
+SyntheticSynset = namedtuple('SyntheticSynset', 'offset pos lemmas definitions gwn_def freq')
+
+
+def parse_size(size):
+    ''' 1k, 100k, 1m or a number '''
+    return SIZES[size] if size in SIZES else int(size)
+
+
+class SyntheticWordnet(object):
+    ''' Reproducible random synsets with a controlled amount of typos, scientific names, duplicates and MWEs '''
+
+    def __init__(self, size, seed=DEFAULT_SEED):
+        self.size = size
+        self.seed = seed
+        rand = random.Random(seed)
+        vocab_size = max(500, min(20000, size // 10))
+        self.vocab = sorted({''.join(rand.choice(SYLLABLES) for _ in range(rand.randint(1, 4))) for _ in range(vocab_size)})
+
+    @staticmethod
+    def offset(idx):
+        return '{:08d}'.format(100000 + idx * 37)
+
+    @staticmethod
+    def pos(idx):
+        return 'nnnnnnvvar'[idx % 10]
+
+    def synsets(self):
+        rand = random.Random(self.seed)
+        vocab = self.vocab
+        prev_def = None
+        for idx in range(self.size):
+            pos = SyntheticWordnet.pos(idx)
+            lemmas = []
+            for _ in range(rand.choice((1, 1, 1, 2, 3))):
+                roll = rand.random()
+                if roll < 0.1:
+                    lemma = '{} {}'.format(rand.choice(vocab), rand.choice(vocab))
+                elif roll < 0.12:
+                    lemma = '{} of the {}'.format(rand.choice(vocab), rand.choice(vocab))
+                elif roll < 0.13:
+                    lemma = "{}'s {}".format(rand.choice(vocab), rand.choice(vocab))
+                elif roll < 0.15:
+                    lemma = '{}-{}'.format(rand.choice(vocab), rand.choice(vocab))
+                elif roll < 0.18:
+                    lemma = rand.choice(vocab).capitalize()
+                else:
+                    lemma = rand.choice(vocab)
+                lemmas.append(lemma)
+            words = [rand.choice(vocab) for _ in range(rand.randint(4, 12))]
+            roll = rand.random()
+            if roll < 0.02 and prev_def:
+                # a definition shared by several synsets
+                sdef = prev_def
+            elif roll < 0.04:
+                sdef = '{} ({} {})'.format(' '.join(words), rand.choice(vocab).capitalize(), rand.choice(vocab))
+            elif roll < 0.05:
+                sdef = '{} , {}'.format(' '.join(words[:2]), ' '.join(words[2:]))
+            elif roll < 0.06:
+                sdef = '{}  {}'.format(' '.join(words[:3]), ' '.join(words[3:]))
+            elif roll < 0.07:
+                sdef = '{} ( {} )'.format(' '.join(words[:-1]), words[-1])
+            else:
+                sdef = ' '.join(words)
+            definitions = [sdef]
+            if rand.random() < 0.05:
+                definitions.append(' '.join(rand.choice(vocab) for _ in range(rand.randint(3, 8))))
+            gwn_def = '; '.join(definitions) + ';'
+            if rand.random() < 0.05:
+                gwn_def = '{} {};'.format(' '.join(words[:-1]), rand.choice(vocab))
+            prev_def = sdef
+            freq = int(rand.paretovariate(1.2)) - 1
+            yield SyntheticSynset(SyntheticWordnet.offset(idx), pos, lemmas, definitions, gwn_def, freq)
+
+
+def _batches(rows, size=BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _executemany(ctx, query, rows):
+    for batch in _batches(rows):
+        ctx.cur.executemany(query, batch)
+
+
+def make_omw(path, swn, langs=LANGS):
+    db = Schema(path, setup_script=OMW_SETUP)
+    with db.ctx() as ctx:
+        wordids = {}
+
+        def word_id(lang, lemma, pos):
+            key = (lang, lemma, pos)
+            if key not in wordids:
+                wordids[key] = len(wordids) + 1
+                words.append((wordids[key], lang, lemma, None, pos))
+            return wordids[key]
+        for batch in _batches(swn.synsets()):
+            words, synsets, senses, defs = [], [], [], []
+            for ss in batch:
+                sid = '{}-{}'.format(ss.offset, ss.pos)
+                synsets.append((sid, ss.pos, ss.lemmas[0], 'synthetic'))
+                for lang in langs:
+                    # other languages cover 1/3 of the synsets
+                    if lang != 'eng' and int(ss.offset) % 3:
+                        continue
+                    for rank, lemma in enumerate(ss.lemmas):
+                        lemma = lemma if lang == 'eng' else '{}_{}'.format(lemma, lang)
+                        senses.append((sid, word_id(lang, lemma, ss.pos), lang, rank, 0, ss.freq, 'synthetic'))
+                    for dsid, sdef in enumerate(ss.definitions):
+                        sdef = sdef if lang == 'eng' else '{} ({})'.format(sdef, lang)
+                        defs.append((sid, lang, sdef, dsid, 'bench' if ss.freq > 10 else None))
+            ctx.cur.executemany('INSERT INTO synset VALUES (?, ?, ?, ?)', synsets)
+            ctx.cur.executemany('INSERT INTO word VALUES (?, ?, ?, ?, ?)', words)
+            ctx.cur.executemany('INSERT INTO sense VALUES (?, ?, ?, ?, ?, ?, ?)', senses)
+            ctx.cur.executemany('INSERT INTO synset_def VALUES (?, ?, ?, ?, ?)', defs)
+        ctx.commit()
+
+
+def make_gwn(path, swn):
+    from yawlib import GWordnetSQLite
+    db = GWordnetSQLite(path)
+    with db.ctx() as ctx:
+        gid = 0
+        item_id = 0
+        for batch in _batches(swn.synsets()):
+            synsets, terms, sensekeys, raws, glosses, items = [], [], [], [], [], []
+            for ss in batch:
+                gwn_pos = 's' if ss.pos == 'a' and int(ss.offset) % 2 else ss.pos
+                sid = '{}{}'.format(gwn_pos, ss.offset)
+                synsets.append((sid, ss.offset, gwn_pos))
+                for lemma in ss.lemmas:
+                    terms.append((sid, lemma))
+                    sensekeys.append((sid, '{}%{}:00:00::'.format(lemma.replace(' ', '_').lower(), 'nvar'.index(ss.pos) + 1)))
+                raws.append((sid, 'orig', ss.gwn_def))
+                gid += 1
+                glosses.append((gid, '{}_d'.format(sid), sid, 'def', ss.gwn_def))
+                for order, token in enumerate(ss.gwn_def.split()):
+                    item_id += 1
+                    items.append((item_id, order, gid, 'wf', token.strip(';'), None, 'word', None, None, ' ', token, None))
+            ctx.cur.executemany('INSERT INTO synset VALUES (?, ?, ?)', synsets)
+            ctx.cur.executemany('INSERT INTO term VALUES (?, ?)', terms)
+            ctx.cur.executemany('INSERT INTO sensekey VALUES (?, ?)', sensekeys)
+            ctx.cur.executemany('INSERT INTO gloss_raw VALUES (?, ?, ?)', raws)
+            ctx.cur.executemany('INSERT INTO gloss VALUES (?, ?, ?, ?, ?)', glosses)
+            ctx.cur.executemany('INSERT INTO glossitem VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', items)
+        ctx.execute('CREATE INDEX IF NOT EXISTS gloss_sid_idx ON gloss(sid)')
+        ctx.execute('CREATE INDEX IF NOT EXISTS gloss_surface_idx ON gloss(surface)')
+        ctx.execute('CREATE INDEX IF NOT EXISTS glossitem_gid_idx ON glossitem(gid)')
+        ctx.execute('CREATE INDEX IF NOT EXISTS gloss_raw_sid_idx ON gloss_raw(sid)')
+        ctx.commit()
+
+
+def make_wn30(path, swn):
+    db = Schema(path, setup_script=WN30_SETUP)
+    with db.ctx() as ctx:
+        rows = (((1 + 'nvar'.index(ss.pos)) * 100000000 + int(ss.offset),
+                 's' if ss.pos == 'a' and int(ss.offset) % 2 else ss.pos, 0, '; '.join(ss.definitions))
+                for ss in swn.synsets())
+        _executemany(ctx, 'INSERT INTO synsets VALUES (?, ?, ?, ?)', rows)
+        _executemany(ctx, 'INSERT INTO senses VALUES (NULL, NULL, ?, NULL, 1, ?, 0, ?)', _wn30_senses(swn))
+        ctx.commit()
+
+
+def _wn30_senses(swn):
+    ''' (synsetid, lexid, sensekey) for all lemmas, lexid makes sensekeys of the same lemma unique '''
+    lexids = dd(int)
+    for ss in swn.synsets():
+        posnum = 1 + 'nvar'.index(ss.pos)
+        if ss.pos == 'a' and int(ss.offset) % 2:
+            posnum = 5
+        for lemma in ss.lemmas:
+            lemma = lemma.lower().replace(' ', '_')
+            lexid = lexids[lemma]
+            lexids[lemma] += 1
+            yield ((1 + 'nvar'.index(ss.pos)) * 100000000 + int(ss.offset), lexid,
+                   '{}%{}:00:{:02d}::'.format(lemma, posnum, lexid))
+
+
+def make_ewdb(path, swn):
+    db = Schema(path, setup_script=EWDB_SETUP)
+    with db.ctx() as ctx:
+        rows = (('{}-{}'.format(ss.offset, ss.pos), lemma, ss.pos, ss.definitions[0], None, None)
+                for ss in swn.synsets() for lemma in ss.lemmas)
+        _executemany(ctx, 'INSERT INTO sense (synsetid, lemma, pos, definition, flag, mwe) VALUES (?, ?, ?, ?, ?, ?)', rows)
+        ctx.commit()
+
+
+def make_ntumc(path, swn, start_sid=10000):
+    ''' An NTU-MC corpus with 1 sentence for every 10 synsets '''
+    rand = random.Random(swn.seed)
+    db = Schema(path, setup_script=NTUMC_SETUP)
+    tags = ('e', 'x', 'org', '!bad', '99999999-n')
+    with db.ctx() as ctx:
+        sents, words, concepts, links = [], [], [], []
+        for idx in range(max(1, swn.size // 10)):
+            sid = start_sid + idx
+            tokens = [rand.choice(swn.vocab) for _ in range(rand.randint(5, 20))]
+            sents.append((sid, 1, None, ' '.join(tokens), None, None))
+            cfrom = 0
+            for wid, token in enumerate(tokens):
+                words.append((sid, wid, token, 'NN', token, cfrom, cfrom + len(token), None, None))
+                cfrom += len(token) + 1
+            for cid, wid in enumerate(sorted(rand.sample(range(len(tokens)), min(3, len(tokens))))):
+                if rand.random() < 0.1:
+                    tag = rand.choice(tags)
+                else:
+                    ssidx = rand.randrange(swn.size)
+                    tag = '{}-{}'.format(SyntheticWordnet.offset(ssidx), SyntheticWordnet.pos(ssidx))
+                concepts.append((sid, cid, tokens[wid], tag, None, None, None, None))
+                links.append((sid, wid, cid))
+        _executemany(ctx, 'INSERT INTO sent VALUES (?, ?, ?, ?, ?, ?)', sents)
+        _executemany(ctx, 'INSERT INTO word VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', words)
+        _executemany(ctx, 'INSERT INTO concept VALUES (?, ?, ?, ?, ?, ?, ?, ?)', concepts)
+        _executemany(ctx, 'INSERT INTO cwl VALUES (?, ?, ?)', links)
+        ctx.commit()
+
+
+MAKERS = OrderedDict([('omw', make_omw), ('gwn', make_gwn), ('wn30', make_wn30), ('ewdb', make_ewdb), ('ntumc', make_ntumc)])
+
+
+# -------------------------------------------------------------------------------
+# Fixtures
+# -------------------------------------------------------------------------------
+
+class Fixture(object):
+    ''' A set of synthetic databases of the same size '''
+
+    def __init__(self, size, bench_dir=BENCH_DIR, seed=DEFAULT_SEED):
+        self.label = size
+        self.size = parse_size(size)
+        self.seed = seed
+        self.folder = os.path.join(bench_dir, str(size))
+
+    def path(self, name):
+        return os.path.join(self.folder, '{}.db'.format(name))
+
+    def generate(self, force=False, rp=None):
+        os.makedirs(self.folder, exist_ok=True)
+        swn = SyntheticWordnet(self.size, self.seed)
+        for name, maker in MAKERS.items():
+            path = self.path(name)
+            if os.path.isfile(path):
+                if not force:
+                    continue
+                os.unlink(path)
+            start = time.time()
+            maker(path, swn)
+            if rp is not None:
+                rp.print("{} ({} synsets) was generated in {:.2f}s".format(path, self.size, time.time() - start))
+        return self
+
+    def sample(self, k=SAMPLE_SIZE):
+        ''' Reproducible sample of synset IDs '''
+        rand = random.Random(self.seed)
+        indices = sorted(rand.sample(range(self.size), min(k, self.size)))
+        return ['{}-{}'.format(SyntheticWordnet.offset(i), SyntheticWordnet.pos(i)) for i in indices]
+
+    def register(self):
+        ''' Redirect shared wordnet resources to this fixture '''
+        from yawlib import GWordnetSQLite, WordnetSQL
+        from yawlib.omwsql import OMWSQL
+        registry.register('omw', lambda: OMWSQL(self.path('omw')))
+        registry.register('gwn', lambda: GWordnetSQLite(self.path('gwn')))
+        registry.register('wn30', lambda: WordnetSQL(self.path('wn30')))
+
+
+# -------------------------------------------------------------------------------
+# Benchmark cases
+# Each case is a function(fixture, tmpdir) which does the work once
+# -------------------------------------------------------------------------------
+
+def bench_compare_synset(fx, tmpdir):
+    from omwtk.compare_wn import compare_synset
+    omw, gwn = registry.get_omw(), registry.get_gwn()
+    with omw.ctx() as omw_ctx, gwn.ctx() as gwn_ctx:
+        for sid in fx.sample():
+            compare_synset(omw, gwn, sid, omw_ctx, gwn_ctx)
+
+
+def bench_bulk_compare(fx, tmpdir):
+    from omwtk.compare_wn import bulk_compare
+    with registry.get_omw().ctx() as omw_ctx, registry.get_gwn().ctx() as gwn_ctx:
+        for diff in bulk_compare(fx.sample(), omw_ctx, gwn_ctx):
+            pass
+
+
+def bench_topk_mfs(fx, tmpdir):
+    from omwtk.extract import MFSRanking
+    # the ranking is built in tmpdir so that the ranking of the real OMW database is not replaced
+    MFSRanking(os.path.join(tmpdir, 'mfs.db'), omw_path=fx.path('omw')).ensure().topk(3000)
+
+
+def bench_extract_omw(fx, tmpdir):
+    from omwtk.extract import extract_omw
+    extract_omw(None, argparse.Namespace(topk=None, output=os.path.join(tmpdir, 'omw'), langs=None, workers=1))
+
+
+def bench_find_omw_typo(fx, tmpdir):
+    from omwtk.patch import find_omw_typo
+    find_omw_typo(None, argparse.Namespace(action='patch', output=os.path.join(tmpdir, 'typo.sql'), langs=None, index=False))
+
+
+def bench_omw_fix_dup(fx, tmpdir):
+    from omwtk.patch import omw_fix_dup
+    omw_fix_dup(None, argparse.Namespace(output=os.path.join(tmpdir, 'dup.sql'), topk=None, langs=None, apply=False, dry_run=False, undo=None))
+
+
+def bench_verify_patch(fx, tmpdir):
+    import yaml
+    from omwtk.patch import verify_patch
+    patch_path = os.path.join(tmpdir, 'patches.yaml')
+    if not os.path.isfile(patch_path):
+        with registry.get_wn().ctx() as ctx:
+            rows = ctx.select('''SELECT sensekey, definition FROM senses JOIN synsets ON senses.synsetid = synsets.synsetid
+            ORDER BY senseid LIMIT ?''', (SAMPLE_SIZE * 4,))
+            # every third patch does not match OMW, and every fifth one has an unknown sensekey
+            patches = [{'sensekey': sk if idx % 5 else sk + 'x', 'orig_def': sdef if idx % 3 else sdef + '!',
+                        'new_def': sdef, 'comment': '', 'source': 'bench', 'informant': ''}
+                       for idx, (sk, sdef) in enumerate(rows)]
+        with open(patch_path, 'w') as outfile:
+            yaml.dump(patches, outfile)
+    verify_patch(None, argparse.Namespace(input=patch_path))
+
+
+def _mwe_case(func_name):
+    def bench_mwe(fx, tmpdir):
+        from omwtk import lex2pred
+        db = lex2pred.EWDB(fx.path('ewdb'))
+        with db.ctx() as ctx:
+            getattr(lex2pred, func_name)(db, ctx)
+    bench_mwe.__name__ = 'bench_{}'.format(func_name)
+    return bench_mwe
+
+
+def bench_corpus2txt(fx, tmpdir):
+    from chirptext import texttaglib as ttl
+    from omwtk.corpus2txt import NTUMCSchema, import_sents
+    db = NTUMCSchema(fx.path('ntumc'))
+    wn = registry.get_wn()
+    with db.ctx() as ctx, wn.ctx() as wnctx:
+        sents = ctx.sent.select()
+        import_sents(ttl.Document('bench', tmpdir), sents, ctx, wn, wnctx)
+
+
+CASES = OrderedDict([('compare_synset', bench_compare_synset),
+                     ('bulk_compare', bench_bulk_compare),
+                     ('topk_mfs', bench_topk_mfs),
+                     ('extract_omw', bench_extract_omw),
+                     ('find_omw_typo', bench_find_omw_typo),
+                     ('omw_fix_dup', bench_omw_fix_dup),
+                     ('verify_patch', bench_verify_patch),
+                     ('mine_mwe', _mwe_case('mine_mwe')),
+                     ('mine_mwe_of', _mwe_case('mine_mwe_of')),
+                     ('mine_mwe_apos_s', _mwe_case('mine_mwe_apos_s')),
+                     ('mine_mwe_extra', _mwe_case('mine_mwe_extra')),
+                     ('mine_mwe_nospace', _mwe_case('mine_mwe_nospace')),
+                     ('corpus2txt', bench_corpus2txt)])
+
+
+# -------------------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------------------
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def run_case(name, fx, repeat=3):
+    ''' Run a benchmark case several times and return a result record (a dict) '''
+    func = CASES[name]
+    timings = []
+    status = 'OK'
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                func(fx, tmpdir)
+            except Exception as e:
+                getLogger().exception("Benchmark {} failed".format(name))
+                status = 'Error: {}'.format(e)
+                break
+            timings.append(time.perf_counter() - start)
+    return OrderedDict([('case', name),
+                        ('size', fx.label),
+                        ('synsets', fx.size),
+                        ('repeat', len(timings)),
+                        ('best', min(timings) if timings else None),
+                        ('mean', sum(timings) / len(timings) if timings else None),
+                        ('status', status)])
+
+
+def read_results(path=RESULT_FILE):
+    ''' Read all previous results (list of dicts) '''
+    if not os.path.isfile(path):
+        return []
+    with open(path, encoding='utf-8') as infile:
+        return [json.loads(line) for line in infile if line.strip()]
+
+
+def last_results(results):
+    ''' Latest successful result of each (case, size) '''
+    latest = {}
+    for r in results:
+        if r.get('status') == 'OK':
+            latest[(r['case'], r['size'])] = r
+    return latest
+
+
+def run_benchmarks(sizes, cases=None, repeat=3, output=RESULT_FILE, bench_dir=BENCH_DIR, rp=None):
+    rp = rp if rp is not None else TextReport()
+    cases = cases if cases else list(CASES.keys())
+    previous = last_results(read_results(output))
+    run_info = OrderedDict([('time', time.strftime('%Y-%m-%dT%H:%M:%S')),
+                            ('commit', git_revision()),
+                            ('python', platform.python_version())])
+    records = []
+    for size in sizes:
+        fx = Fixture(size, bench_dir=bench_dir).generate(rp=rp)
+        fx.register()
+        rp.header("Benchmarks: {} synsets".format(fx.size))
+        for name in cases:
+            record = OrderedDict(run_info)
+            record.update(run_case(name, fx, repeat))
+            records.append(record)
+            prev = previous.get((name, fx.label))
+            if record['status'] != 'OK':
+                rp.print("{:<18} {}".format(name, record['status']))
+            elif prev:
+                change = (record['best'] - prev['best']) / prev['best'] * 100 if prev['best'] else 0
+                rp.print("{:<18} {:>10.4f}s  ({:+.1f}% vs {})".format(name, record['best'], change, prev.get('commit')))
+            else:
+                rp.print("{:<18} {:>10.4f}s".format(name, record['best']))
+    if output:
+        if os.path.dirname(output):
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+        with open(output, 'a', encoding='utf-8') as outfile:
+            for record in records:
+                outfile.write(json.dumps(record) + '\n')
+        rp.print("Results were appended to {}".format(output))
+    return records
+
+
+# -------------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------------
+
+def gen_fixtures(args):
+    rp = TextReport()
+    for size in args.sizes:
+        Fixture(size, bench_dir=args.dir, seed=args.seed).generate(force=args.force, rp=rp)
+
+
+def run(args):
+    run_benchmarks(args.sizes, args.cases, repeat=args.repeat, output=args.output, bench_dir=args.dir)
+
+
+def list_cases(args):
+    for name in CASES:
+        print(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic fixtures and benchmarks for omwtk")
+    tasks = parser.add_subparsers(help='Task to be done')
+    # generate fixtures
+    gen_task = tasks.add_parser('gen', help='Generate fixture databases')
+    gen_task.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    gen_task.add_argument('-f', '--force', help='Regenerate existing databases', action='store_true')
+    gen_task.set_defaults(func=gen_fixtures)
+    # run benchmarks
+    run_task = tasks.add_parser('run', help='Run benchmarks')
+    run_task.add_argument('-c', '--cases', nargs='*', choices=list(CASES.keys()), help='Benchmark cases (default: all)')
+    run_task.add_argument('-r', '--repeat', type=int, default=3)
+    run_task.add_argument('-o', '--output', help='Result file (JSON lines)', default=RESULT_FILE)
+    run_task.set_defaults(func=run)
+    for task in (gen_task, run_task):
+        task.add_argument('-s', '--sizes', nargs='*', default=['1k'], help='Fixture sizes (1k, 100k, 1m or a number)')
+        task.add_argument('-d', '--dir', help='Fixture folder', default=BENCH_DIR)
+    # list cases
+    list_task = tasks.add_parser('list', help='List benchmark cases')
+    list_task.set_defaults(func=list_cases)
+    args = parser.parse_args()
+    if 'func' not in args:
+        parser.print_help()
+    else:
+        args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -39,72 +39,191 @@ __status__ = "Prototype"
 
 import os
 import re
+import argparse
+import hashlib
+from array import array
+from bisect import bisect_left
+from functools import partial
+from multiprocessing import Pool
+from collections import OrderedDict
+from collections import namedtuple
+from collections import defaultdict as dd
+from puchikarui import Schema, with_ctx
+from chirptext.leutile import grouper
 from chirptext.leutile import TextReport, StringTool
 from chirptext.leutile import Counter, Timer
 
-from yawlib import YLConfig, SynsetID
-from yawlib import GWordnetSQLite
-from yawlib import WordnetSQL
-from yawlib.omwsql import OMWSQL
+from yawlib import SynsetID, Synset
+from yawlib.models import POS
+from yawlib.glosswordnet import GlossedSynset
+
+from omwtk.registry import LazyResource
+from omwtk.multireport import MultiReport
 
 # ---------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------
 
-omw = OMWSQL(YLConfig.OMW_DB)
-gwn = GWordnetSQLite(YLConfig.GWN30_DB)
-wn30 = WordnetSQL(YLConfig.WNSQL30_PATH)
+omw = LazyResource('omw')
+gwn = LazyResource('gwn')
+wn30 = LazyResource('wn30')
 ssid_filepath = 'data/ssids.txt'
+cache_filepath = 'data/omw_gwn_cache.db'
+# salt of cache hashes, change it whenever the comparison logic changes so that cached results are recomputed
+CACHE_VERSION = 'compare-2'
 
 
 # ---------------------------------------------------------------------
 # Functions
 # ---------------------------------------------------------------------
 
+class SynsetIDSet(object):
+    ''' A sorted set of synset IDs packed into integers (POS number * 10^8 + offset, i.e. WNSQL IDs)
+    Set operations are done by merging sorted arrays, SynsetID objects are only created when iterating '''
+
+    POS_BASE = 10 ** 8
+
+    def __init__(self, packed=(), is_sorted=False):
+        if is_sorted:
+            self.packed = array('q', packed)
+        else:
+            self.packed = array('q', sorted(set(packed)))
+
+    @staticmethod
+    def pack(synsetid):
+        ''' Pack a synset ID (SynsetID object or string in canonical/WNSQL/GWN format) into an integer '''
+        if not isinstance(synsetid, SynsetID):
+            synsetid = SynsetID.from_string(synsetid)
+        return int(POS.pos2num(synsetid.pos)) * SynsetIDSet.POS_BASE + int(synsetid.offset)
+
+    @staticmethod
+    def unpack(value):
+        return SynsetID('{:08d}'.format(value % SynsetIDSet.POS_BASE), POS.num2pos(value // SynsetIDSet.POS_BASE))
+
+    @staticmethod
+    def from_ids(synsetids, on_error=None):
+        ''' Pack many synset IDs. Invalid IDs are passed to on_error if provided, otherwise an error will be raised '''
+        packed = []
+        for sid in synsetids:
+            try:
+                packed.append(SynsetIDSet.pack(sid))
+            except Exception:
+                if on_error is None:
+                    raise
+                on_error(sid)
+        return SynsetIDSet(packed)
+
+    def __len__(self):
+        return len(self.packed)
+
+    def __iter__(self):
+        return (SynsetIDSet.unpack(x) for x in self.packed)
+
+    def __contains__(self, synsetid):
+        value = SynsetIDSet.pack(synsetid)
+        idx = bisect_left(self.packed, value)
+        return idx < len(self.packed) and self.packed[idx] == value
+
+    def __eq__(self, other):
+        return isinstance(other, SynsetIDSet) and self.packed == other.packed
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [SynsetIDSet.unpack(x) for x in self.packed[idx]]
+        return SynsetIDSet.unpack(self.packed[idx])
+
+    def _merge(self, other, keep_left, keep_both, keep_right):
+        a, b = self.packed, other.packed
+        result = array('q')
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                if keep_left:
+                    result.append(a[i])
+                i += 1
+            elif a[i] > b[j]:
+                if keep_right:
+                    result.append(b[j])
+                j += 1
+            else:
+                if keep_both:
+                    result.append(a[i])
+                i += 1
+                j += 1
+        if keep_left:
+            result.extend(a[i:])
+        if keep_right:
+            result.extend(b[j:])
+        return SynsetIDSet(result, is_sorted=True)
+
+    def intersection(self, other):
+        return self._merge(other, False, True, False)
+
+    def difference(self, other):
+        return self._merge(other, True, False, False)
+
+    def union(self, other):
+        return self._merge(other, True, True, True)
+
+    __and__ = intersection
+    __sub__ = difference
+    __or__ = union
+
+    def to_list(self):
+        return list(self)
+
+    def __repr__(self):
+        return "SynsetIDSet({} synsets)".format(len(self))
+
+
+def get_omw_ssids():
+    with omw.ctx() as ctx:
+        rows = ctx.execute('SELECT DISTINCT synset FROM sense')
+        return SynsetIDSet.from_ids((x[0] for x in rows), on_error=print)
+
+
+def get_gwn_ssids():
+    with gwn.ctx() as ctx:
+        return SynsetIDSet.from_ids(x[0] for x in ctx.execute('SELECT ID FROM synset'))
+
+
+def get_wn30_ssids():
+    wn_ss = wn30.schema.ss.select(columns=('synsetid',))
+    return SynsetIDSet.from_ids(x.synsetid for x in wn_ss)
+
+
 def get_omw_synsets():
-    omw_ss = omw.sense.select()
-    omw_ssids = set()
-    for x in omw_ss:
-        try:
-            omw_ssids.add(SynsetID.from_string(x.synset))
-        except:
-            print(x)
-    return list(omw_ssids)
+    return get_omw_ssids().to_list()
 
 
 def get_gwn_synsets():
-    gwn_ss = gwn.synset.select(columns=('ID',))
-    return [SynsetID.from_string(x.ID) for x in gwn_ss]
+    return get_gwn_ssids().to_list()
 
 
 def get_wn30_synsets():
-    wn_ss = wn30.schema.ss.select()
-    wn_ssids = [SynsetID.from_string(x.synsetid) for x in wn_ss]
-    return wn_ssids
+    return get_wn30_ssids().to_list()
 
 
 def count_synsets():
     # OMW
-    omw_ssids = get_omw_synsets()
+    omw_ssids = get_omw_ssids()
     print("OMW synsets: {}".format(len(omw_ssids)))
     print(omw_ssids[:5])
 
     # Glosstag corpus
-    gwn_ssids = get_gwn_synsets()
+    gwn_ssids = get_gwn_ssids()
     print("GWN synsets: {}".format(len(gwn_ssids)))
     print(gwn_ssids[:5])
 
     # Princeton WN 3.0
-    wn_ssids = get_wn30_synsets()
+    wn_ssids = get_wn30_ssids()
     print("WN synsets: {}".format(len(wn_ssids)))
     print(wn_ssids[:5])
 
 
 def omw_vs_gwn():
     rp = TextReport("data/omw_new.txt")
-    omw_ssids = set(get_omw_synsets())
-    gwn_ssids = set(get_gwn_synsets())
-    omw_new = omw_ssids - gwn_ssids
+    omw_new = get_omw_ssids() - get_gwn_ssids()
     for ss in omw_new:
         s = omw.get_synset(ss)
         lemma = s.lemma if s.lemma else "** no lex **"
@@ -143,16 +262,22 @@ def fix_typo(a_def):
 
 def join_definitions(ss):
     ''' Join definitions and detect any duplication '''
-    if len(ss.definitions) == 0:
+    return join_defs(ss.definitions)
+
+
+def join_defs(definitions):
+    ''' Join a list of definitions, a definition which is a part of the longest one is a duplication
+    Return the joined definition and a list of duplicated entries '''
+    if len(definitions) == 0:
         return '', []
     duplicated_entries = []
-    longest = ss.definitions[0]
-    for d in ss.definitions[1:]:
+    longest = definitions[0]
+    for d in definitions[1:]:
         if len(d) > len(longest):
             longest = d
     # remove duplicated entries
     final = []
-    for d in ss.definitions:
+    for d in definitions:
         if d != longest and d + ';' in longest:
             duplicated_entries.append(d)
         else:
@@ -162,11 +287,8 @@ def join_definitions(ss):
     return definition, duplicated_entries
 
 
-def compare_synset(omw, gwn, ss, omw_ctx=None, gwn_ctx=None):
-    omwss = omw.get_synset(ss, ctx=omw_ctx)
-    gwnss = gwn.get_synset(ss, ctx=gwn_ctx)
-    tags = set()
-    # normalize GWN definition
+def normalize_gwn_def(gwnss):
+    ''' Match gloss surfaces and normalize GWN definition for comparing '''
     try:
         gwnss.match_surface()
     except:
@@ -174,6 +296,12 @@ def compare_synset(omw, gwn, ss, omw_ctx=None, gwn_ctx=None):
     gdef = gwnss.get_def().surface.replace('  ', ' ')
     if gdef.endswith(";"):
         gdef = gdef[:-1].strip()
+    return gdef
+
+
+def tag_definitions(omwss, gdef):
+    ''' Compare OMW definitions to a normalized GWN definition and tag the differences '''
+    tags = set()
     # join OMW definitions into one
     odef, dup_defs = join_definitions(omwss)
     if dup_defs:
@@ -193,9 +321,254 @@ def compare_synset(omw, gwn, ss, omw_ctx=None, gwn_ctx=None):
             tags.add(TAGS.DIFF)
         else:
             tags.add(TAGS.SAME)
+    return tags, odef
+
+
+def compare_synset(omw, gwn, ss, omw_ctx=None, gwn_ctx=None):
+    omwss = omw.get_synset(ss, ctx=omw_ctx)
+    gwnss = gwn.get_synset(ss, ctx=gwn_ctx)
+    gdef = normalize_gwn_def(gwnss)
+    tags, odef = tag_definitions(omwss, gdef)
     return tags, odef, gdef
 
 
+# ---------------------------------------------------------------------
+# Bulk comparison
+# ---------------------------------------------------------------------
+
+SynsetDiff = namedtuple('SynsetDiff', 'sid tags odef gdef omwss gsurface usrs omw_hash gwn_hash cached')
+BULK_SIZE = 5000
+
+
+def _fill_ssid_table(ctx, ssids, table='cmp_ssid'):
+    ''' (Re)create a temp table with synset IDs so that they can be joined to '''
+    ctx.execute('DROP TABLE IF EXISTS temp.{}'.format(table))
+    ctx.execute('CREATE TEMP TABLE {} (sid TEXT PRIMARY KEY)'.format(table))
+    ctx.cur.executemany('INSERT OR IGNORE INTO temp.{} VALUES (?)'.format(table), ((sid,) for sid in ssids))
+
+
+def bulk_omw_synsets(ssids, ctx, lang='eng', lemmas=False):
+    ''' Load OMW definitions (and lemmas if required) for many synsets at once
+    Return a map of synset ID to Synset and a map of synset ID to users who edited its definitions '''
+    synsets = OrderedDict((sid, Synset(sid, lang=lang)) for sid in ssids)
+    usrs = dd(set)
+    _fill_ssid_table(ctx, synsets.keys())
+    if lemmas:
+        # CROSS JOIN makes SQLite look up the requested synsets instead of scanning the whole table
+        query = '''SELECT DISTINCT sense.synset, word.wordid, word.lemma FROM temp.cmp_ssid
+        CROSS JOIN sense ON sense.synset = cmp_ssid.sid
+        JOIN word ON sense.wordid = word.wordid
+        WHERE word.lang = ?
+        ORDER BY sense.synset, word.rowid'''
+        for sid, wordid, lemma in ctx.select(query, (lang,)):
+            synsets[sid].lemmas.append(lemma)
+    query = '''SELECT synset_def.synset, def, usr FROM temp.cmp_ssid
+    CROSS JOIN synset_def ON synset_def.synset = cmp_ssid.sid
+    WHERE lang = ?
+    ORDER BY synset_def.synset, synset_def.rowid'''
+    for sid, sdef, usr in ctx.select(query, (lang,)):
+        synsets[sid].definitions.append(sdef)
+        if usr:
+            usrs[sid].add(usr)
+    return synsets, usrs
+
+
+def bulk_gwn_synsets(ssids, ctx):
+    ''' Load GWN synsets (raw glosses, glosses and gloss items) for many synsets at once '''
+    synsets = OrderedDict((sid, GlossedSynset(sid)) for sid in ssids)
+    gwn_ids = {ss.ID.to_gwnsql(): ss for ss in synsets.values()}
+    _fill_ssid_table(ctx, gwn_ids.keys())
+    rows = ctx.select('''SELECT gloss_raw.sid, cat, gloss FROM gloss_raw
+    JOIN temp.cmp_ssid ON gloss_raw.sid = cmp_ssid.sid
+    ORDER BY gloss_raw.sid, gloss_raw.rowid''')
+    for sid, cat, gloss in rows:
+        gwn_ids[sid].add_raw_gloss(cat, gloss)
+    glosses = {}
+    rows = ctx.select('''SELECT gloss.id, gloss.origid, gloss.sid, gloss.cat, gloss.surface FROM gloss
+    JOIN temp.cmp_ssid ON gloss.sid = cmp_ssid.sid
+    ORDER BY gloss.sid, gloss.id''')
+    for gid, origid, sid, cat, surface in rows:
+        gloss = gwn_ids[sid].add_gloss(origid, cat, gid)
+        gloss.surface = surface
+        glosses[gid] = gloss
+    rows = ctx.select('''SELECT glossitem.id, gid, tag, lemma, pos, glossitem.cat, coll, rdf, glossitem.origid, sep, text FROM glossitem
+    JOIN gloss ON glossitem.gid = gloss.id
+    JOIN temp.cmp_ssid ON gloss.sid = cmp_ssid.sid
+    ORDER BY glossitem.gid, glossitem.id''')
+    for itemid, gid, tag, lemma, pos, cat, coll, rdf, origid, sep, text in rows:
+        glosses[gid].add_gloss_item(tag, lemma, pos, cat, coll, rdf, origid, sep, text, itemid)
+    return synsets
+
+
+def def_hash(texts):
+    ''' Hash a sequence of definition strings (salted with CACHE_VERSION) '''
+    return hashlib.sha1('\n'.join([CACHE_VERSION] + [t if t else '' for t in texts]).encode('utf-8')).hexdigest()
+
+
+def bulk_gwn_hashes(ssids, ctx):
+    ''' Hash raw glosses, gloss surfaces and gloss item texts (used by match_surface) of many GWN synsets without building synset objects '''
+    gwn_ids = {SynsetID.from_string(sid).to_gwnsql(): sid for sid in ssids}
+    texts = OrderedDict((sid, []) for sid in ssids)
+    _fill_ssid_table(ctx, gwn_ids.keys())
+    rows = ctx.select('''SELECT gloss_raw.sid, cat, gloss FROM gloss_raw
+    JOIN temp.cmp_ssid ON gloss_raw.sid = cmp_ssid.sid
+    ORDER BY gloss_raw.sid, gloss_raw.rowid''')
+    for sid, cat, gloss in rows:
+        texts[gwn_ids[sid]].extend((cat, gloss))
+    rows = ctx.select('''SELECT gloss.sid, gloss.cat, gloss.surface FROM gloss
+    JOIN temp.cmp_ssid ON gloss.sid = cmp_ssid.sid
+    ORDER BY gloss.sid, gloss.id''')
+    for sid, cat, surface in rows:
+        texts[gwn_ids[sid]].extend((cat, surface))
+    rows = ctx.select('''SELECT gloss.sid, glossitem.gid, glossitem.text FROM glossitem
+    JOIN gloss ON glossitem.gid = gloss.id
+    JOIN temp.cmp_ssid ON gloss.sid = cmp_ssid.sid
+    ORDER BY gloss.sid, glossitem.gid, glossitem.id''')
+    for sid, gid, text in rows:
+        texts[gwn_ids[sid]].extend((str(gid), text))
+    return {sid: def_hash(t) for sid, t in texts.items()}
+
+
+def bulk_gwn_definitions(ssids, ctx):
+    ''' Lemmas and definitions (surface of the first def gloss) of many GWN synsets at once
+    Return a map of synset ID to (lemmas, definition), synsets which cannot be found are not included '''
+    gwn_ids = {SynsetID.from_string(sid).to_gwnsql(): sid for sid in ssids}
+    _fill_ssid_table(ctx, gwn_ids.keys())
+    entries = OrderedDict()
+    for (sid,) in ctx.select('SELECT synset.id FROM temp.cmp_ssid CROSS JOIN synset ON synset.id = cmp_ssid.sid ORDER BY synset.id'):
+        entries[gwn_ids[sid]] = ([], None)
+    rows = ctx.select('''SELECT term.sid, term.term FROM temp.cmp_ssid
+    CROSS JOIN term ON term.sid = cmp_ssid.sid
+    ORDER BY term.sid, term.rowid''')
+    for sid, term in rows:
+        entries[gwn_ids[sid]][0].append(term)
+    rows = ctx.select('''SELECT gloss.sid, gloss.surface FROM temp.cmp_ssid
+    CROSS JOIN gloss ON gloss.sid = cmp_ssid.sid
+    WHERE gloss.cat = 'def'
+    ORDER BY gloss.sid, gloss.rowid''')
+    for sid, surface in rows:
+        lemmas, definition = entries[gwn_ids[sid]]
+        if definition is None:
+            entries[gwn_ids[sid]] = (lemmas, surface)
+    return entries
+
+
+class CompareCache(Schema):
+    ''' Comparison results keyed by hashes of OMW and GWN definitions '''
+
+    SETUP_SCRIPT = '''CREATE TABLE IF NOT EXISTS result (
+    sid TEXT PRIMARY KEY,
+    omw_hash TEXT,
+    gwn_hash TEXT,
+    tags TEXT,
+    odef TEXT,
+    gdef TEXT,
+    gsurface TEXT);'''
+
+    def __init__(self, data_source=cache_filepath):
+        super().__init__(data_source, setup_script=CompareCache.SETUP_SCRIPT)
+        self.add_table('result', ['sid', 'omw_hash', 'gwn_hash', 'tags', 'odef', 'gdef', 'gsurface'], id_cols=('sid',))
+
+    @with_ctx
+    def lookup(self, ssids, ctx=None):
+        ''' Get cached results of many synsets, return a map of synset ID to result row '''
+        results = {}
+        for batch in grouper(ssids, 900):
+            sids = tuple(sid for sid in batch if sid)
+            query = "sid IN ({})".format(', '.join(["?"] * len(sids)))
+            for row in ctx.result.select(query, sids):
+                results[row.sid] = row
+        return results
+
+    @staticmethod
+    def to_row(diff):
+        return (diff.omwss.ID.to_canonical(), diff.omw_hash, diff.gwn_hash, ' '.join(sorted(diff.tags)), diff.odef, diff.gdef, diff.gsurface)
+
+    @with_ctx
+    def store(self, rows, ctx=None):
+        ''' Store (or replace) many result rows (see CompareCache.to_row) '''
+        ctx.cur.executemany('INSERT OR REPLACE INTO result VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+        ctx.commit()
+
+
+def bulk_compare(ssids, omw_ctx, gwn_ctx, lang='eng', bulk_size=BULK_SIZE, cache=None, cache_ctx=None):
+    ''' Compare synsets in chunks of bulk_size synsets, yield a SynsetDiff for each synset (in input order)
+    When a CompareCache is provided, synsets whose definitions were not changed are not compared again '''
+    for chunk in grouper(ssids, bulk_size):
+        sids = [str(ss) for ss in chunk if ss]
+        cids = [SynsetID.from_string(sid).to_canonical() for sid in sids]
+        omw_synsets, usrs = bulk_omw_synsets(cids, omw_ctx, lang=lang)
+        omw_hashes = {cid: def_hash(ss.definitions) for cid, ss in omw_synsets.items()}
+        if cache is not None:
+            gwn_hashes = bulk_gwn_hashes(omw_synsets.keys(), gwn_ctx)
+            cached = cache.lookup(omw_synsets.keys(), ctx=cache_ctx)
+            cached = {cid: row for cid, row in cached.items() if row.omw_hash == omw_hashes[cid] and row.gwn_hash == gwn_hashes[cid]}
+        else:
+            gwn_hashes = {}
+            cached = {}
+        gwn_synsets = bulk_gwn_synsets([cid for cid in omw_synsets.keys() if cid not in cached], gwn_ctx)
+        for sid, cid in zip(sids, cids):
+            omwss = omw_synsets[cid]
+            if cid in cached:
+                row = cached[cid]
+                tags = set(row.tags.split())
+                yield SynsetDiff(sid, tags, row.odef, row.gdef, omwss, row.gsurface, usrs[cid], row.omw_hash, row.gwn_hash, True)
+            else:
+                gwnss = gwn_synsets[cid]
+                gsurface = gwnss.definition
+                gdef = normalize_gwn_def(gwnss)
+                tags, odef = tag_definitions(omwss, gdef)
+                yield SynsetDiff(sid, tags, odef, gdef, omwss, gsurface, usrs[cid], omw_hashes[cid], gwn_hashes.get(cid), False)
+
+
+class GlossIndex(object):
+    ''' Map GWN gloss surfaces to the IDs of the synsets that use them '''
+
+    def __init__(self):
+        self.surface_map = dd(list)
+
+    @staticmethod
+    def build(ctx):
+        ''' Build an index from all glosses of a GWN database in one pass '''
+        index = GlossIndex()
+        for sid, surface in ctx.execute('SELECT sid, surface FROM gloss ORDER BY id'):
+            index.surface_map[surface].append(str(SynsetID.from_string(sid)))
+        return index
+
+    def shared_by(self, surface):
+        ''' IDs of all synsets that have this gloss '''
+        return self.surface_map.get(surface, [])
+
+    def is_shared(self, surface):
+        return len(self.shared_by(surface)) > 1
+
+    def clusters(self):
+        ''' All shared glosses and the synsets that share them '''
+        return {surface: ssids for surface, ssids in self.surface_map.items() if len(ssids) > 1}
+
+    def dup_ssids(self):
+        ''' IDs of all synsets that have at least one shared gloss '''
+        return {ss for ssids in self.clusters().values() for ss in ssids}
+
+    def __len__(self):
+        return len(self.surface_map)
+
+
+_gloss_index = None
+
+
+def get_gloss_index(ctx=None):
+    ''' Get the GWN gloss index of this process (built on first use) '''
+    global _gloss_index
+    if _gloss_index is None:
+        if ctx is None:
+            with gwn.ctx() as ctx:
+                _gloss_index = GlossIndex.build(ctx)
+        else:
+            _gloss_index = GlossIndex.build(ctx)
+    return _gloss_index
+
+
 class TAGS:
     '''** Tags
     - DUP :: Synsets with non-unique definitions
@@ -219,72 +592,132 @@ class TAGS:
     ORDER = [OMW, DUP, REP, SCINAME, TYPO, DIFF, SAME, IDENT]
 
 
-def omw_vs_gwn_def():
-    rp = TextReport("data/omw_gwn_report.txt")
-    rpdiff = TextReport("data/omw_gwn_diff.txt")
-    rptypo = TextReport("data/omw_gwn_typo.txt")
-    rpsn = TextReport("data/omw_gwn_sciname.txt")
-    c = Counter(TAGS.ORDER)
+REPORT_FILES = OrderedDict([('report', 'data/omw_gwn_report.txt'),
+                            ('diff', 'data/omw_gwn_diff.txt'),
+                            ('typo', 'data/omw_gwn_typo.txt'),
+                            ('sciname', 'data/omw_gwn_sciname.txt')])
+SHARDS_PER_WORKER = 4
 
-    # ssids to compare
+
+def tags_to_str(tags):
+    return ' '.join('[{}]'.format(t.upper()) for t in sorted(tags, key=TAGS.ORDER.index))
+
+
+def shard_ssids(ssids, shards):
+    ''' Sort synset IDs by POS and offset and split them into contiguous ranges '''
+    sids = sorted((SynsetID.from_string(str(ss)) for ss in ssids), key=lambda x: (x.pos, x.offset))
+    size = max(1, -(-len(sids) // shards))
+    return [[str(ss) for ss in sids[i:i + size]] for i in range(0, len(sids), size)]
+
+
+def compare_shard(ssids, lang='eng', cache_path=None, jsonl=False):
+    ''' Compare a shard of synsets using its own OMW and GWN connections
+    Return tag counts, report fragments (by report name, including JSON lines when jsonl is True),
+    the IDs of DIFF synsets and new cache rows (only when cache_path is provided) '''
+    c = Counter(TAGS.ORDER)
+    mux = MultiReport(jsonl=MultiReport.JSONL if jsonl else None)
+    for name in REPORT_FILES:
+        mux.add_sink(name)
     diff_ssids = []
-    ssids = read_diff_ssids()
-    if not ssids:
-        print("Generating synset ID list")
-        omw_ssids = set(get_omw_synsets())
-        gwn_ssids = set(get_gwn_synsets())
-        # only care about old GWN synsets
-        ssids = omw_ssids.intersection(gwn_ssids)
-    else:
-        print("Comparing {} synsets loaded from {}".format(len(ssids), ssid_filepath))
-    lang = 'eng'
+    cache_rows = []
+    cache = CompareCache(cache_path) if cache_path else None
     with omw.ctx() as omw_ctx, gwn.ctx() as gwn_ctx:
-        print("Comparing {} synsets".format(len(ssids)))
-        for ss in list(ssids):
-            ss = str(ss)
+        gloss_index = get_gloss_index(gwn_ctx)
+        cache_ctx = cache.ctx() if cache is not None else None
+        for d in bulk_compare(ssids, omw_ctx, gwn_ctx, lang=lang, cache=cache, cache_ctx=cache_ctx):
+            ss, tags, odef, gdef, omwss, gsurface, usrs = d[:7]
             c.count("total")
-            tags, odef, gdef = compare_synset(omw, gwn, ss, omw_ctx, gwn_ctx)
-            omwss = omw.get_synset(ss, ctx=omw_ctx)
-            tags_str = ' '.join('[{}]'.format(t.upper()) for t in tags)
+            if cache is not None:
+                if d.cached:
+                    c.count("cache:reused")
+                else:
+                    c.count("cache:recomputed")
+                    cache_rows.append(CompareCache.to_row(d))
+            reason = None
+            sinks = ['report']
             if TAGS.DIFF in tags:
                 diff_ssids.append(ss)
                 # [FCB] why did we change?
-                gwnss = gwn.get_synset(ss, ctx=gwn_ctx)
-                glosses = gwn_ctx.gloss.select('surface = ?', (gwnss.definition,))
-                if glosses and len(glosses) > 1:
+                if gloss_index.is_shared(gsurface):
                     tags.add(TAGS.DUP)
-                    ssids = [str(SynsetID.from_string(g.sid)) for g in glosses]
-                    reason = "Not unique (Shared among {}) so OMW team changed it".format(' '.join(ssids))
+                    shared_ssids = gloss_index.shared_by(gsurface)
+                    reason = "Not unique (Shared among {}) so OMW team changed it".format(' '.join(shared_ssids))
                 else:
                     tags.add(TAGS.OMW)
-                    defs = omw.sdef.select('synset=? and lang=?', (ss, lang))
-                    usrs = {d.usr for d in defs if d.usr}
-                    usrs_str = ', '.join(usrs) if usrs else "someone in NTU"
+                    usrs_str = ', '.join(sorted(usrs)) if usrs else "someone in NTU"
                     reason = "{} made this change.".format(usrs_str)
-                tags_str = ' '.join('[{}]'.format(t.upper()) for t in tags)
-                rpdiff.header("{} {}".format(tags_str, ss))
-                rpdiff.print("OMW: {}".format(omwss.definition))
-                rpdiff.print("GWN: {}".format(gdef))
-                rpdiff.print("Reason: {}".format(reason))
+                sinks.append('diff')
             if TAGS.SCINAME in tags:
-                rpsn.header("{} {}".format(tags_str, ss))
-                rpsn.print("OMW: {}".format(omwss.definition))
-                rpsn.print("GWN: {}".format(gdef))
+                sinks.append('sciname')
             if TAGS.REP in tags or TAGS.TYPO in tags:
-                rptypo.header("{} {}".format(tags_str, ss))
-                rptypo.print("OMW: {}".format(omwss.definition))
-                rptypo.print("GWN: {}".format(gdef))
+                sinks.append('typo')
+            # render each synset once for all reports
+            mux.record("{} {}".format(tags_to_str(tags), ss),
+                       ("OMW: {}".format(omwss.definition), "GWN: {}".format(gdef)),
+                       sinks, synset=ss, tags=sorted(tags, key=TAGS.ORDER.index),
+                       omw=omwss.definition, gwn=gdef, reason=reason)
+            if reason:
+                mux.write("Reason: {}\n".format(reason), 'diff')
             # master report
             for tag in tags:
                 c.count(tag)
             if not tags:
                 c.count(TAGS.IDENT)
-            rp.header("{} {}".format(tags_str, ss))
-            rp.print("OMW: {}".format(omwss.definition))
-            rp.print("GWN: {}".format(gdef))
+        if cache_ctx is not None:
+            cache_ctx.close()
+    return dict(c), OrderedDict((name, mux.content(name)) for name in mux.sinks), diff_ssids, cache_rows
 
-    # done
-    c.summarise(report=rp)
+
+def omw_vs_gwn_def(workers=1, cache_path=None, jsonl=None):
+    # ssids to compare
+    ssids = read_diff_ssids()
+    if not ssids:
+        print("Generating synset ID list")
+        # only care about old GWN synsets
+        ssids = get_omw_ssids() & get_gwn_ssids()
+    else:
+        print("Comparing {} synsets loaded from {}".format(len(ssids), ssid_filepath))
+    print("Comparing {} synsets".format(len(ssids)))
+    if cache_path:
+        # make sure that the cache DB is created before workers start reading it
+        cache = CompareCache(cache_path)
+        cache.ctx().close()
+    # build the gloss index once so that forked workers can share it
+    gloss_index = get_gloss_index()
+    print("Indexed {} GWN glosses ({} shared)".format(len(gloss_index), len(gloss_index.clusters())))
+    task = partial(compare_shard, cache_path=cache_path, jsonl=bool(jsonl))
+    if workers > 1:
+        shards = shard_ssids(ssids, workers * SHARDS_PER_WORKER)
+        print("Using {} workers for {} shards".format(workers, len(shards)))
+        with Pool(workers) as pool:
+            results = pool.map(task, shards)
+    else:
+        results = [task(shard) for shard in shard_ssids(ssids, 1)]
+    # merge shard results (in shard order)
+    totals = dd(int)
+    diff_ssids = []
+    mux = MultiReport(jsonl=jsonl)
+    for name, path in REPORT_FILES.items():
+        mux.add_sink(name, path)
+    for counts, fragments, shard_diff_ssids, cache_rows in results:
+        for tag, count in counts.items():
+            totals[tag] += count
+        diff_ssids.extend(shard_diff_ssids)
+        for name, fragment in fragments.items():
+            mux.write(fragment, name)
+        if cache_rows:
+            cache.store(cache_rows)
+    if cache_path:
+        print("Cache: {} reused, {} recomputed ({})".format(totals.pop('cache:reused', 0), totals.pop('cache:recomputed', 0), cache_path))
+    # done (insert counts in a fixed order so that ties are reported deterministically)
+    c = Counter(TAGS.ORDER)
+    for tag in ['total'] + TAGS.ORDER + sorted(set(totals) - set(TAGS.ORDER) - {'total'}):
+        if totals.get(tag):
+            c[tag] = totals[tag]
+    summary = TextReport.string()
+    c.summarise(report=summary)
+    mux.write(summary.content(), 'report')
+    mux.close()
     with open('data/omw_gwn_diff_ssids.txt', 'wt') as diff_ssid_file:
         for ss in diff_ssids:
             diff_ssid_file.write('{}\n'.format(ss))
@@ -299,10 +732,15 @@ def join(token, *items):
 # ---------------------------------------------------------------------
 
 def main():
-    print("Script to compare WNSQL30 to OMW")
+    parser = argparse.ArgumentParser(description="Script to compare WNSQL30 to OMW")
+    parser.add_argument('-w', '--workers', help='Number of worker processes', type=int, default=1)
+    parser.add_argument('-c', '--cache', help='Path to comparison cache DB', default=cache_filepath)
+    parser.add_argument('--nocache', help='Compare all synsets without using the cache', action='store_true')
+    parser.add_argument('-j', '--jsonl', help='Write comparison results to a JSON lines file as well')
+    args = parser.parse_args()
     t = Timer()
     t.start("Compare OMW to GWN")
-    omw_vs_gwn_def()
+    omw_vs_gwn_def(workers=args.workers, cache_path=None if args.nocache else args.cache, jsonl=args.jsonl)
     t.end()
 
 
@@ -42,7 +42,7 @@ import logging
 from puchikarui import Schema
 from chirptext.leutile import FileHelper, Counter, TextReport
 from chirptext import texttaglib as ttl
-from yawlib.helpers import get_wn
+from omwtk.registry import get_wn
 
 ########################################################################
 # Configuration
@@ -70,6 +70,75 @@ class NTUMCSchema(Schema):
 
 ########################################################################
 
+def import_sents(doc, sents, ctx, wn, wnctx):
+    ''' Import NTU-MC sentences (with words, concepts and links) into a texttaglib document
+    Return (PWN-3.0 synsets, OMW-extra synsets, stats) '''
+    ignored_concepts = set()
+    omwextra = set()
+    synsets = set()
+    stats = Counter()
+    # import sents to tagged doc
+    for sent in sents:
+        tsent = doc.new_sent(sent.sent, sent.sid)  # tagged-sentence
+        # import tokens
+        # sid, wid, word, lemma, pos
+        words = ctx.word.select(where='sid = ?', values=(sent.sid,), orderby='sid, wid')
+        tsent.import_tokens(w.word for w in words)
+        word_token_map = {}
+        for token, word in zip(tsent.tokens, words):
+            token.pos = word.pos
+            token.lemma = word.lemma
+            token.new_tag(label=word.wid, tagtype='orig_wid')
+            word_token_map[word.wid] = token
+            stats.count("Word")
+        concepts = ctx.concept.select(where='sid = ?', values=(sent.sid,), orderby='sid, cid')
+        # import concept
+        # c.sid, c.cid, c.clemma, c.tag
+        for c in concepts:
+            if c.tag in ('e', 'x', 'w', 'org', 'loc', 'per', 'dat', 'oth', 'num', 'dat:year'):
+                ignored_concepts.add((c.sid, c.cid))
+                stats.count("Tag-ignored")
+                continue
+            elif c.tag.startswith('!'):
+                getLogger().warning("Invalid synset format {}".format(c.tag))
+                ignored_concepts.add((c.sid, c.cid))
+                stats.count("Tag-error")
+                continue
+            else:
+                ctag = c.tag.replace('=', '').strip()
+                tconcept = tsent.new_concept(tag=ctag, clemma=c.clemma, ID=c.cid)
+                # ensure that the concept is in PW30
+                if ctag in omwextra:
+                    tconcept.comment = 'EXTRA'
+                    stats.count("Tag-OMW")
+                elif ctag not in synsets:
+                    ssinfo = wnctx.ss.by_id(wn.ensure_sid(ctag))
+                    if not ssinfo:
+                        getLogger().info("Synset not found: {} {}".format(c.tag, c.clemma))
+                        omwextra.add(ctag)
+                        tconcept.comment = 'EXTRA'
+                        stats.count("Tag-OMW")
+                    else:
+                        synsets.add(ctag)
+                        stats.count("Tag-PWN30")
+                else:
+                    stats.count("Tag-PWN30")
+        links = ctx.cwl.select(where='sid = ?', values=(sent.sid,), orderby='sid, cid, wid')
+        # link concepts to words
+        for link in links:
+            if (link.sid, link.cid) in ignored_concepts:
+                continue
+            token = word_token_map[link.wid]
+            tsent.concept(link.cid).add_token(token)
+        # write tags
+        for c in tsent.concepts:
+            cfrom = min(t.cfrom for t in c.tokens)
+            cto = max(t.cto for t in c.tokens)
+            tagtype = 'OMW' if c.comment == "EXTRA" else 'WN'
+            tsent.new_tag(c.tag, cfrom, cto, tagtype=tagtype)
+    return synsets, omwextra, stats
+
+
 def main():
     print("Script to convert NTU-MC to text file")
     try:
@@ -83,69 +152,7 @@ def main():
         sents = ctx.sent.select(where='sid >= ? and sid <= ?', values=[10000, 10999])
         # convert to texttaglib
         doc = ttl.Document("speckled", DATA_DIR)
-        ignored_concepts = set()
-        omwextra = set()
-        synsets = set()
-        stats = Counter()
-        # import sents to tagged doc
-        for sent in sents:
-            tsent = doc.new_sent(sent.sent, sent.sid)  # tagged-sentence
-            # import tokens
-            # sid, wid, word, lemma, pos
-            words = ctx.word.select(where='sid = ?', values=(sent.sid,), orderby='sid, wid')
-            tsent.import_tokens(w.word for w in words)
-            word_token_map = {}
-            for token, word in zip(tsent.tokens, words):
-                token.pos = word.pos
-                token.lemma = word.lemma
-                token.new_tag(label=word.wid, tagtype='orig_wid')
-                word_token_map[word.wid] = token
-                stats.count("Word")
-            concepts = ctx.concept.select(where='sid = ?', values=(sent.sid,), orderby='sid, cid')
-            # import concept
-            # c.sid, c.cid, c.clemma, c.tag
-            for c in concepts:
-                if c.tag in ('e', 'x', 'w', 'org', 'loc', 'per', 'dat', 'oth', 'num', 'dat:year'):
-                    ignored_concepts.add((c.sid, c.cid))
-                    stats.count("Tag-ignored")
-                    continue
-                elif c.tag.startswith('!'):
-                    getLogger().warning("Invalid synset format {}".format(c.tag))
-                    ignored_concepts.add((c.sid, c.cid))
-                    stats.count("Tag-error")
-                    continue
-                else:
-                    ctag = c.tag.replace('=', '').strip()
-                    tconcept = tsent.new_concept(tag=ctag, clemma=c.clemma, ID=c.cid)
-                    # ensure that the concept is in PW30
-                    if ctag in omwextra:
-                        tconcept.comment = 'EXTRA'
-                        stats.count("Tag-OMW")
-                    elif ctag not in synsets:
-                        ssinfo = wnctx.ss.by_id(wn.ensure_sid(ctag))
-                        if not ssinfo:
-                            getLogger().info("Synset not found: {} {}".format(c.tag, c.clemma))
-                            omwextra.add(ctag)
-                            tconcept.comment = 'EXTRA'
-                            stats.count("Tag-OMW")
-                        else:
-                            synsets.add(ctag)
-                            stats.count("Tag-PWN30")
-                    else:
-                        stats.count("Tag-PWN30")
-            links = ctx.cwl.select(where='sid = ?', values=(sent.sid,), orderby='sid, cid, wid')
-            # link concepts to words
-            for link in links:
-                if (link.sid, link.cid) in ignored_concepts:
-                    continue
-                token = word_token_map[link.wid]
-                tsent.concept(link.cid).add_token(token)
-            # write tags
-            for c in tsent.concepts:
-                cfrom = min(t.cfrom for t in c.tokens)
-                cto = max(t.cto for t in c.tokens)
-                tagtype = 'OMW' if c.comment == "EXTRA" else 'WN'
-                tsent.new_tag(c.tag, cfrom, cto, tagtype=tagtype)
+        synsets, omwextra, stats = import_sents(doc, sents, ctx, wn, wnctx)
     # remove duplicated concepts
     for sent in doc:
         for w, concepts in sent.tcmap().items():
@@ -49,27 +49,41 @@ __credits__ = []
 
 import os
 import re
+import csv
 import logging
 import yaml
 import random
 from collections import OrderedDict
 from collections import namedtuple
-from lxml import etree
+from contextlib import ExitStack
+from functools import partial
+from multiprocessing import Pool
 
 from chirptext.io import CSV
 from chirptext import TextReport, FileHelper, Counter, FileHub
+from chirptext.leutile import grouper
 from chirptext.cli import CLIApp, setup_logging
-from yawlib.helpers import get_gwn
-from yawlib.helpers import get_wn, get_omw
+from puchikarui import Schema, with_ctx
+from omwtk.registry import LazyResource, get_omw
+from omwtk.sidedb import SideDB
+from omwtk.compare_wn import bulk_omw_synsets
+from omwtk.ilimap import get_ili_map
+from omwtk.wn_ntumc_top3000 import top3000_synsets
+from omwtk.wncheck import validate, compile_rules, report as check_report, DUPLICATE
+from omwtk.wndiff import iter_lmf_elements
 
 # -------------------------------------------------------------------------------
 # Configuration
 # -------------------------------------------------------------------------------
 
 DATA_FOLDER = os.path.abspath(os.path.expanduser('./data'))
-omw = get_omw()
-gwn = get_gwn()
-wn = get_wn()
+MFS_RANK_PATH = os.path.join(DATA_FOLDER, 'omw_mfs_rank.db')
+MFS_LEDGER_PATH = os.path.join(DATA_FOLDER, 'mfs_ledger.db')
+MFS_BATCH_SIZE = 5000
+LMF_TAGS = ('Synset', 'LexicalEntry')
+omw = LazyResource('omw')
+gwn = LazyResource('gwn')
+wn = LazyResource('wn30')
 setup_logging('logging.json', 'logs')
 
 
@@ -81,42 +95,136 @@ def getLogger():
 # Data structures
 # -------------------------------------------------------------------------------
 
+class MFSRanking(SideDB):
+    ''' English OMW senses ranked by frequency (a side database of OMW)
+    The ranking is rebuilt when the modification stamp of the OMW database changes '''
+
+    SETUP_SCRIPT = '''
+    CREATE TABLE IF NOT EXISTS rank (rank INTEGER PRIMARY KEY, synset TEXT, freq INTEGER);
+    '''
+    # Same order as the original top-k query (one row per sense/definition pair, ties in table order)
+    RANK_QUERY = '''INSERT INTO rank (synset, freq)
+    SELECT sense.synset, freq FROM srcdb.sense
+    LEFT JOIN srcdb.synset_def
+    ON sense.synset = synset_def.synset
+    AND sense.lang = synset_def.lang
+    WHERE sense.lang = 'eng'
+    ORDER BY freq DESC, sense.rowid, synset_def.rowid'''
+
+    def __init__(self, data_source=MFS_RANK_PATH, omw_path=None):
+        super().__init__(data_source, src_path=omw_path, setup_script=MFSRanking.SETUP_SCRIPT)
+        self.add_table('rank', ['rank', 'synset', 'freq'], id_cols=('rank',))
+
+    def build(self, ctx):
+        getLogger().info("Ranking OMW senses by frequency ({})".format(self.src_path))
+        ctx.cur.execute('DELETE FROM rank')
+        ctx.cur.execute(MFSRanking.RANK_QUERY)
+
+    @with_ctx
+    def topk(self, k, ctx=None):
+        ''' Synsets of the top k ranked senses (a set) '''
+        return set(r['synset'] for r in ctx.execute('SELECT synset FROM rank WHERE rank <= ?', (k,)))
+
+    @with_ctx
+    def rank_range(self, start, end, ctx=None):
+        ''' Synsets of the senses ranked from start+1 to end (a list ordered by rank, without duplicates) '''
+        rows = ctx.execute('SELECT synset FROM rank WHERE rank > ? AND rank <= ? ORDER BY rank', (start, end))
+        return list(OrderedDict.fromkeys(r['synset'] for r in rows))
+
+
+def get_mfs_ranking(path=MFS_RANK_PATH):
+    ''' Get an up-to-date sense ranking of the current OMW database '''
+    return MFSRanking(path, omw_path=omw.ds.path).ensure()
+
+
+class MFSLedger(Schema):
+    ''' Synsets which have been issued to annotators (one row per synset) '''
+
+    SETUP_SCRIPT = '''
+    CREATE TABLE IF NOT EXISTS issued (synset TEXT PRIMARY KEY, round TEXT, shard TEXT);
+    CREATE INDEX IF NOT EXISTS issued_round_idx ON issued(round);
+    '''
+
+    def __init__(self, data_source=MFS_LEDGER_PATH):
+        super().__init__(data_source, setup_script=MFSLedger.SETUP_SCRIPT)
+        self.add_table('issued', ['synset', 'round', 'shard'], id_cols=('synset',))
+
+    @with_ctx
+    def issue(self, rows, ctx=None):
+        ''' Record issued synsets, rows are (synset, round, shard) tuples '''
+        ctx.cur.executemany('INSERT OR IGNORE INTO issued VALUES (?, ?, ?)', rows)
+        ctx.commit()
+
+    @with_ctx
+    def import_done(self, ssids, round_name, ctx=None):
+        ''' Record synsets which were issued before the ledger existed (e.g. data/omw3000_synsets.txt) '''
+        self.issue(((sid, round_name, None) for sid in ssids if sid), ctx=ctx)
+
+    @with_ctx
+    def new_synsets(self, ranking_path, k, ctx=None):
+        ''' Synsets of the top k ranked senses which have not been issued (ordered by rank) '''
+        ctx.execute('ATTACH DATABASE ? AS rankdb', (ranking_path,))
+        try:
+            rows = ctx.select('''SELECT synset FROM rankdb.rank
+            WHERE rank <= ? AND synset NOT IN (SELECT synset FROM issued)
+            GROUP BY synset ORDER BY MIN(rank)''', (k,))
+        finally:
+            ctx.execute('DETACH DATABASE rankdb')
+        return [r['synset'] for r in rows]
+
+    @with_ctx
+    def summary(self, ctx=None):
+        ''' Number of issued synsets by round '''
+        return OrderedDict((r['round'], r['total']) for r in ctx.select('SELECT round, COUNT(*) AS total FROM issued GROUP BY round ORDER BY MIN(rowid)'))
+
+
+def split_plan(items, plan=('*',)):
+    ''' Split items into named shards (A, B, C, ...)
+    Each shard size in plan can be a number, a ratio (e.g. 0.5) or * (the rest).
+    Items which are not covered by the plan go to the last shard '''
+    shards = []
+    start = 0
+    for idx, size in enumerate(plan):
+        size = str(size)
+        if size == '*':
+            end = len(items)
+        elif '.' in size:
+            end = start + int(round(float(size) * len(items)))
+        else:
+            end = start + int(size)
+        end = min(end, len(items))
+        shards.append([chr(ord('A') + idx), items[start:end]])
+        start = end
+    if shards and start < len(items):
+        shards[-1][1] = shards[-1][1] + items[start:]
+    return [tuple(x) for x in shards]
+
+
 # -------------------------------------------------------------------------------
 # Application logic
 # -------------------------------------------------------------------------------
 
+
 def topk_mfs(k=3000):
-    with omw.ctx() as ctx:
-        query = '''SELECT sense.synset FROM sense
-        LEFT JOIN synset_def
-        ON sense.synset = synset_def.synset
-        AND sense.lang = synset_def.lang
-        WHERE sense.lang = 'eng'
-        ORDER BY freq DESC
-        LIMIT ?'''
-        result = ctx.execute(query, params=(k,))
-        topk_synsets = set(x['synset'] for x in result)
-    return topk_synsets
+    return get_mfs_ranking().topk(k)
 
 
 def verify_mfs(cli, args):
         top3000 = topk_mfs(3000)
-        from omwtk.wn_ntumc_top3000 import WN_NTUMC_TOP3000
-        first_round = set(x['synset'] for x in WN_NTUMC_TOP3000)
+        first_round = top3000_synsets()
         print(top3000 == first_round)
 
 
 def gen_mfs_5000(cli, args):
     rp = TextReport(args.output)
-    from omwtk.wn_ntumc_top3000 import WN_NTUMC_TOP3000
-    first_round = set(x['synset'] for x in WN_NTUMC_TOP3000)
+    first_round = top3000_synsets()
     top5000 = topk_mfs(5000)
     round2 = list(top5000.difference(first_round))
     random.shuffle(round2)
     with FileHub(working_dir='data', default_mode='w') as hub, omw.ctx() as ctx:
         filename = 'omw5000A'
-        for idx, sid in enumerate(round2):
-            ss = omw.get_synset(sid, ctx=ctx)
+        synsets, _ = bulk_omw_synsets(round2, ctx, lemmas=True)
+        for idx, ss in enumerate(synsets.values()):
             if idx > 200:
                 filename = 'omw5000B'
             hub['omw5000'].header(ss.ID, 'lemmas: {}'.format(", ".join(ss.lemmas)))
@@ -153,8 +261,8 @@ def gen_mfs_5500(cli, args):
     with FileHub(working_dir='data', default_mode='w') as hub, omw.ctx() as ctx:
         profile = 'omw5300'
         filename = 'omw5300A'
-        for idx, sid in enumerate(third_round):
-            ss = omw.get_synset(sid, ctx=ctx)
+        synsets, _ = bulk_omw_synsets(third_round, ctx, lemmas=True)
+        for idx, ss in enumerate(synsets.values()):
             hub[profile].header(ss.ID, 'lemmas: {}'.format(", ".join(ss.lemmas)))
             for d in ss.definitions:
                 hub[filename].writeline(d)
@@ -170,8 +278,8 @@ def gen_mfs_3000(cli, args):
     random.shuffle(ssids)
     with FileHub(working_dir='data', default_mode='w') as hub, omw.ctx() as ctx:
         filename = 'omw3000A'
-        for idx, sid in enumerate(ssids):
-            ss = omw.get_synset(sid, ctx=ctx)
+        synsets, _ = bulk_omw_synsets(ssids, ctx, lemmas=True)
+        for idx, ss in enumerate(synsets.values()):
             if idx > len(ssids) / 2:
                 filename = 'omw3000B'
             hub['omw3000'].header(ss.ID, 'lemmas: {}'.format(", ".join(ss.lemmas)))
@@ -183,54 +291,95 @@ def gen_mfs_3000(cli, args):
             rp.print(hub[f].path)
 
 
+def gen_mfs(cli, args):
+    ''' Issue synsets of the top k senses which have not been issued yet '''
+    rp = TextReport()
+    ledger = MFSLedger(args.ledger)
+    for path in args.done if args.done else []:
+        ledger.import_done(read_lines(path), os.path.splitext(os.path.basename(path))[0])
+    new_ssids = ledger.new_synsets(get_mfs_ranking().ds.path, args.topk)
+    random.Random(args.seed).shuffle(new_ssids)
+    profile = args.name if args.name else 'omw{}'.format(args.topk)
+    shards = split_plan(new_ssids, args.split)
+    with FileHub(working_dir=args.outdir, default_mode='w') as hub, omw.ctx() as ctx:
+        for shard, ssids in shards:
+            filename = profile + shard
+            for batch in grouper(ssids, MFS_BATCH_SIZE):
+                batch = [sid for sid in batch if sid]
+                synsets, _ = bulk_omw_synsets(batch, ctx, lemmas=True)
+                for sid, ss in synsets.items():
+                    hub[profile].header(ss.ID, 'lemmas: {}'.format(", ".join(ss.lemmas)))
+                    for d in ss.definitions:
+                        hub[filename].writeline(d)
+                        hub[profile].print(d, level=1)
+                    hub[profile + '_synsets'].writeline(sid)
+                ledger.issue((sid, profile, shard) for sid in batch)
+            rp.print("Shard {}: {} synsets".format(filename, len(ssids)))
+        rp.header("Generated files")
+        for f in hub.files.keys():
+            rp.print(hub[f].path)
+    rp.header("Issued synsets")
+    for round_name, total in ledger.summary().items():
+        rp.print("{}: {}".format(round_name, total))
+
+
 def extract_wn31(cli, args):
     c = Counter()
     rp = TextReport()
-    entries = []
     infile = FileHelper.abspath(args.input)
     if not os.path.isfile(infile):
         rp.print("File not found")
-    else:
-        rp.print("Processing {}".format(infile))
-        tree = etree.iterparse(infile)
-        for event, element in tree:
-            if event == 'end' and element.tag == 'Synset':
-                for child in element:
-                    if child.tag == 'Definition':
-                        entries.append((element.get('id'), element.get('ili'), child.text))
-                        c.count('Definition')
+        return
+    rp.print("Processing {}".format(infile))
+    with ExitStack() as stack:
+        # Format: wn31sid ili definition
+        outfile = stack.enter_context(open(args.output, 'w', encoding='utf-8', newline=''))
+        writer = csv.writer(outfile, dialect='excel-tab')
+        sense_writer = None
+        if args.senses:
+            # Format: entry_id lemma pos sense_id synset
+            sense_file = stack.enter_context(open(args.senses, 'w', encoding='utf-8', newline=''))
+            sense_writer = csv.writer(sense_file, dialect='excel-tab')
+        # lexical entries are always parsed (and freed) so that they do not pile up before the synsets
+        for element in iter_lmf_elements(infile, LMF_TAGS):
+            if element.tag == 'Synset':
+                for child in element.iterchildren('Definition'):
+                    writer.writerow((element.get('id'), element.get('ili'), child.text))
+                    c.count('Definition')
                 c.count("Synset")
-                element.clear()
-        c.summarise(report=rp)
-    # Format: wn31sid ili definition
-    CSV.write_tsv(args.output, entries)
+            elif sense_writer is not None:
+                lemma = element.find('Lemma')
+                form, pos = (lemma.get('writtenForm'), lemma.get('partOfSpeech')) if lemma is not None else (None, None)
+                for sense in element.iterchildren('Sense'):
+                    sense_writer.writerow((element.get('id'), form, pos, sense.get('id'), sense.get('synset')))
+                    c.count("Sense")
+                c.count("LexicalEntry")
+    c.summarise(report=rp)
 
 
 def verify_wn31(cli, args):
-    wn31 = CSV.read('data/wn31.csv', dialect='excel-tab')
-    for sid, iid, sdef in wn31:
-        if '"' in sdef and not (sdef.endswith('"') or sdef.endswith(')') or sdef.endswith(';')):
-            cli.logger.warning("Invalid definition ({} - {}) {}".format(sid, iid, sdef))
-            exit()
-    print("Done!")
-    pass
+    ''' Check all definitions of an extracted WN-3.1 TSV file '''
+    check_ids = not args.rules or DUPLICATE in args.rules
+    c, violations = validate(args.input, compile_rules(args.rules, args.patterns), workers=args.workers, check_ids=check_ids)
+    check_report(c, violations, output=args.output)
+    if violations:
+        cli.logger.warning("Found {} violation(s) in {}".format(len(violations), args.input))
+    else:
+        print("Done!")
 
 
 def wn31_to_wn30(cli, args):
-    csvlines = CSV.read('data/ili-map-pwn30.tab')
-    ili_map = {k: v for k, v in csvlines}
+    ili_map = get_ili_map()
     notfound = []
     c = Counter()
     print("ILI-wn30 map: {}".format(len(ili_map)))
-    wn31 = CSV.read('data/wn31.csv', dialect='excel-tab')
+    wn31 = list(CSV.read('data/wn31.csv', dialect='excel-tab'))
+    wn30_ids = ili_map.translate([iid for sid, iid, sdef in wn31], 'ili', 'pwn30')
     with omw.ctx() as ctx, TextReport('data/wn31_diff.txt') as diff_file:
-        for sid, iid, sdef in wn31:
-            if iid in ili_map:
+        for (sid, iid, sdef), wn30_id in zip(wn31, wn30_ids):
+            if wn30_id:
                 c.count("Found")
-                wn30_id = ili_map[iid]
                 try:
-                    if wn30_id.endswith('s'):
-                        wn30_id = wn30_id[:-1] + 'a'
                     wn30_ss = omw.get_synset(wn30_id, ctx=ctx)
                 except:
                     cli.logger.exception("Cannot find synset {}".format(wn30_id))
@@ -250,44 +399,77 @@ def wn31_to_wn30(cli, args):
     pass
 
 
+# Senses are ranked by frequency (ties in table order), definitions of a (lemma, synset) pair are joined in rank order.
+# Window functions are used because the order of GROUP_CONCAT in an aggregate query is not guaranteed.
+OMW_EXPORT_QUERY = '''SELECT lemma, synset, sdef FROM (
+    SELECT lemma, synset, rn,
+    GROUP_CONCAT(sdef, '; ') OVER (PARTITION BY lemma, synset ORDER BY rn ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING) AS sdef,
+    ROW_NUMBER() OVER (PARTITION BY lemma, synset ORDER BY rn) AS nth
+    FROM (
+        SELECT lemma, sense.synset AS synset, def AS sdef, ROW_NUMBER() OVER (ORDER BY freq DESC, sense.rowid, synset_def.rowid) AS rn
+        FROM sense
+        JOIN word ON sense.wordid = word.wordid AND sense.lang = word.lang
+        JOIN synset_def ON sense.synset = synset_def.synset AND sense.lang = synset_def.lang
+        WHERE sense.lang = ? AND word.lang = ? AND synset_def.lang = ? AND pos = ?)
+    WHERE ? IS NULL OR rn <= ?)
+WHERE nth = 1
+ORDER BY rn'''
+
+
+def omw_export_paths(output, lang, pos):
+    ''' English files keep their old names (e.g. omw_n.txt) '''
+    prefix = "{}_{}".format(output, pos) if lang == 'eng' else "{}_{}_{}".format(output, lang, pos)
+    return prefix + '.txt', prefix + '_lemma.txt'
+
+
+def export_omw_shard(shard, topk=None, output=None):
+    ''' Export senses of a language and a POS (definitions of a sense are joined in SQL)
+    Rows are written to the TSV and lemma files as they are read '''
+    lang, pos = shard
+    senses = 0
+    potential_names = 0
+    limit = int(topk) if topk else None
+    params = (lang, lang, lang, pos, limit, limit)
+    with ExitStack() as stack:
+        ctx = stack.enter_context(get_omw().ctx())
+        writer = lemma_file = None
+        if output:
+            out_path, lemma_out_path = omw_export_paths(output, lang, pos)
+            writer = csv.writer(stack.enter_context(open(out_path, 'w', encoding='utf-8', newline='')), dialect='excel-tab')
+            lemma_file = stack.enter_context(open(lemma_out_path, 'w', encoding='utf-8'))
+        for lemma, sid, sdef in ctx.execute(OMW_EXPORT_QUERY, params):
+            senses += 1
+            if lemma.lower() != lemma:
+                potential_names += 1
+            if writer is not None:
+                writer.writerow((lemma, sid, sdef))
+                lemma_file.write(lemma)
+                lemma_file.write('\n')
+    return lang, pos, senses, potential_names
+
+
 def extract_omw(cli, args):
     ''' OMW Extractor '''
     rp = TextReport()
-    omw = get_omw()
     WN_POS = 'nvar'
-    with omw.ctx() as ctx:
-        for pos in WN_POS:
-            rp.header("POS: {}".format(pos))
-            query = '''SELECT lemma, sense.synset, def as sdef FROM sense LEFT JOIN word ON sense.wordid = word.wordid and sense.lang=word.lang LEFT JOIN synset_def ON sense.synset = synset_def.synset AND sense.lang = synset_def.lang WHERE sense.lang='eng' AND word.lang='eng' AND synset_def.lang='eng' AND pos=? ORDER By freq DESC '''
-            params = [pos]
-            if args.topk:
-                query += ' LIMIT ?'
-                params.append(args.topk)
-            results = ctx.select(query, params)
-            senses = OrderedDict()
-            potential_names = 0
-            for lemma, sid, sdef in results:
-                if lemma.lower() != lemma:
-                    # if pos not in 'nar':
-                    #     rp.print("{} - {}".format(lemma, pos))
-                    potential_names += 1
-                if (lemma, sid) in senses:
-                    senses[(lemma, sid)] += "; " + sdef
-                else:
-                    senses[(lemma, sid)] = sdef
-            print("Found {} sense in OMW".format(len(senses.keys())))
-            print("Potential name: {}".format(potential_names))
-            if args.output:
-                out_path = "{}_{}.txt".format(args.output, pos)
-                wordsenses = (k + (v,) for k, v in senses.items())
-                CSV.write_tsv(out_path, wordsenses, quoting=CSV.QUOTE_MINIMAL)
-                print("Written to {}".format(out_path))
-                lemma_out_path = "{}_{}_lemma.txt".format(args.output, pos)
-                with open(lemma_out_path, 'w') as outfile:
-                    for l, sid in senses.keys():
-                        outfile.write(l)
-                        outfile.write('\n')
-                    print("Written to {}".format(lemma_out_path))
+    langs = args.langs if args.langs else ['eng']
+    if 'all' in langs:
+        with get_omw().ctx() as ctx:
+            langs = [r['lang'] for r in ctx.select('SELECT DISTINCT lang FROM synset_def ORDER BY lang')]
+    shards = [(lang, pos) for lang in langs for pos in WN_POS]
+    export = partial(export_omw_shard, topk=args.topk, output=args.output)
+    if args.workers > 1:
+        with Pool(args.workers) as pool:
+            results = pool.map(export, shards)
+    else:
+        results = [export(shard) for shard in shards]
+    for lang, pos, senses, potential_names in results:
+        rp.header("Lang: {} - POS: {}".format(lang, pos))
+        rp.print("Found {} sense in OMW".format(senses))
+        rp.print("Potential name: {}".format(potential_names))
+        if args.output:
+            for path in omw_export_paths(args.output, lang, pos):
+                rp.print("Written to {}".format(path))
 
 
 # -------------------------------------------------------------------------------
@@ -306,20 +488,37 @@ def main():
     # mfs 5250
     task = app.add_task('mfs5500', func=gen_mfs_5500)
     task.add_argument('-o', '--output', help='Output file')
+    # generic MFS round
+    task = app.add_task('mfs', func=gen_mfs)
+    task.add_argument('-k', '--topk', help='Top k senses', type=int, required=True)
+    task.add_argument('-s', '--split', help='Shard sizes (number, ratio or *), e.g. 201 *', nargs='*', default=['*'])
+    task.add_argument('--seed', help='Random seed for shuffling synsets', type=int)
+    task.add_argument('-n', '--name', help='Round name (default: omw<k>)')
+    task.add_argument('-d', '--done', help='Synset files which were issued before (imported to the ledger)', nargs='*')
+    task.add_argument('-l', '--ledger', help='Ledger of issued synsets', default=MFS_LEDGER_PATH)
+    task.add_argument('-o', '--outdir', help='Output folder', default='data')
     # verify dataset
     task = app.add_task('verify', func=verify_mfs)
     # wn31 to csv
     task = app.add_task('wn31', func=extract_wn31)
     task.add_argument('-i', '--input', default='data/wn31.xml')
     task.add_argument('-o', '--output', help='Output file', default='data/wn31.csv')
+    task.add_argument('-s', '--senses', help='Write lexical entries and senses to this file')
     # verify wn31
     task = app.add_task('check31', func=verify_wn31)
+    task.add_argument('-i', '--input', default='data/wn31.csv')
+    task.add_argument('-o', '--output', help='Write all violations to this file', default='data/wn31_violations.tsv')
+    task.add_argument('-r', '--rules', help='Rules to check (default: all)', nargs='*')
+    task.add_argument('-p', '--patterns', help='Extra rules (name=regex)', nargs='*')
+    task.add_argument('-w', '--workers', help='Number of worker processes', type=int, default=1)
     # wn31 to wn30
     task = app.add_task('31230', func=wn31_to_wn30)
     # omw2txt
     task = app.add_task('omw', func=extract_omw)
     task.add_argument('-n', '--topk', help='Limit top n')
     task.add_argument('-o', '--output', help='Output files')
+    task.add_argument('-l', '--langs', help='Languages (default: eng, all: all languages)', nargs='*')
+    task.add_argument('-w', '--workers', help='Number of worker processes', type=int, default=1)
     # run app
     app.run()
 
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Compiled ILI <-> PWN-3.0 <-> PWN-3.1 mapping index
+Latest version can be found at https://github.com/letuananh/omwtk
+
+The tab files (data/ili-map-pwn30.tab and data/ili-map-pwn31.tab, format: ili<TAB>synset ID) are compiled
+into a binary file of packed integer arrays once. The index records the paths, sizes and modification times
+of its tab files, it is compiled again when other tab files are requested or when they have changed. The file is memory-mapped, so every tool (and every
+worker process) shares the same pages without parsing the tab files again.
+Satellite adjectives (-s) are normalized to -a.
+
+Usage:
+    from omwtk.ilimap import get_ili_map
+    ili_map = get_ili_map()
+    ili_map.ili_to_pwn30('i35545')                           # => '00001740-n'
+    ili_map.translate(['i35545', 'i1'], 'ili', 'pwn31')      # => list of PWN-3.1 IDs (None if not found)
+
+To (re)compile the index:
+    python3 -m omwtk.ilimap
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import os
+import re
+import json
+import mmap
+import struct
+import logging
+import argparse
+from array import array
+from bisect import bisect_left
+
+from yawlib.models import POS
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+PWN30_TAB = 'data/ili-map-pwn30.tab'
+PWN31_TAB = 'data/ili-map-pwn31.tab'
+INDEX_PATH = 'data/ili-map.bin'
+MAGIC = b'ILIMAP02'
+# magic, max ILI number, number of PWN-3.0 IDs, number of PWN-3.1 IDs, size of the sources block (JSON, padded to 8 bytes)
+HEADER = struct.Struct('<8sqqqq')
+POS_BASE = 10 ** 8
+SYNSET_ID = re.compile(r'(?P<offset>\d{8})-?(?P<pos>[nvarsx])')
+WORDNETS = ('pwn30', 'pwn31')
+
+
+def getLogger():
+    return logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------------
+# Packing
+# -------------------------------------------------------------------------------
+
+def pack_ili(ili):
+    ''' i35545 => 35545 (0 if it is not a valid ILI) '''
+    return int(ili[1:]) if ili and ili[0] == 'i' and ili[1:].isdigit() else 0
+
+
+def pack_synset(sid):
+    ''' Pack a synset ID (00001740-n, wn31-00001740-s, n00001740, etc.) into an integer, satellites become adjectives '''
+    m = SYNSET_ID.search(sid) if sid else None
+    if not m:
+        # GWN format (n00001740)
+        if sid and len(sid) == 9 and sid[0] in POS.POSES and sid[1:].isdigit():
+            offset, pos = sid[1:], sid[0]
+        else:
+            return 0
+    else:
+        offset, pos = m.group('offset'), m.group('pos')
+    if pos == 's':
+        pos = 'a'
+    return int(POS.pos2num(pos)) * POS_BASE + int(offset)
+
+
+def unpack_synset(value):
+    return '{:08d}-{}'.format(value % POS_BASE, POS.num2pos(value // POS_BASE)) if value else None
+
+
+def read_tab(path):
+    ''' Yield (ILI number, packed synset ID) from an ILI map tab file '''
+    with open(path, encoding='utf-8') as infile:
+        for line in infile:
+            parts = line.split()
+            if len(parts) >= 2:
+                ili, sid = pack_ili(parts[0]), pack_synset(parts[1])
+                if ili and sid:
+                    yield ili, sid
+
+
+# -------------------------------------------------------------------------------
+# Index
+# -------------------------------------------------------------------------------
+
+def tab_stamps(pwn30_tab=PWN30_TAB, pwn31_tab=PWN31_TAB):
+    ''' [absolute path, mtime_ns, size] of each tab file (None for missing files) '''
+    stamps = []
+    for tab in (pwn30_tab, pwn31_tab):
+        if tab and os.path.isfile(tab):
+            st = os.stat(tab)
+            stamps.append([os.path.abspath(tab), st.st_mtime_ns, st.st_size])
+        else:
+            stamps.append([os.path.abspath(tab) if tab else None, None, None])
+    return stamps
+
+
+def pack_sources(stamps):
+    block = json.dumps(stamps).encode('utf-8')
+    return block + b' ' * (-len(block) % 8)
+
+
+def read_header(infile):
+    ''' Read (header fields, tab stamps) of an index file, None if it is not a valid index '''
+    header = infile.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    magic, max_ili, n30, n31, sources_size = HEADER.unpack(header)
+    if magic != MAGIC:
+        return None
+    return (max_ili, n30, n31, sources_size), json.loads(infile.read(sources_size).decode('utf-8'))
+
+
+def compile_index(path=INDEX_PATH, pwn30_tab=PWN30_TAB, pwn31_tab=PWN31_TAB):
+    ''' Compile tab files into a binary index
+    Layout: header, sources (tab stamps), ILI => PWN-3.0, ILI => PWN-3.1 (direct addressing by ILI number),
+    then sorted PWN-3.0 IDs with their ILIs and sorted PWN-3.1 IDs with their ILIs '''
+    maps = []
+    for tab in (pwn30_tab, pwn31_tab):
+        maps.append(sorted(read_tab(tab)) if tab and os.path.isfile(tab) else [])
+    max_ili = max([m[-1][0] for m in maps if m] + [0])
+    arrays = []
+    for mapping in maps:
+        forward = array('q', bytes(8 * (max_ili + 1)))
+        for ili, sid in mapping:
+            forward[ili] = sid
+        arrays.append(forward)
+    for mapping in maps:
+        rev = sorted((sid, ili) for ili, sid in mapping)
+        arrays.append(array('q', (sid for sid, _ in rev)))
+        arrays.append(array('q', (ili for _, ili in rev)))
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as outfile:
+        sources = pack_sources(tab_stamps(pwn30_tab, pwn31_tab))
+        outfile.write(HEADER.pack(MAGIC, max_ili, len(maps[0]), len(maps[1]), len(sources)))
+        outfile.write(sources)
+        for arr in arrays:
+            arr.tofile(outfile)
+    os.replace(tmp_path, path)
+    getLogger().info("ILI index was compiled to {} ({} PWN-3.0 and {} PWN-3.1 synsets)".format(path, len(maps[0]), len(maps[1])))
+    return path
+
+
+def is_outdated(path=INDEX_PATH, pwn30_tab=PWN30_TAB, pwn31_tab=PWN31_TAB):
+    ''' An index is outdated when it was compiled from other tab files or the tab files have changed since '''
+    if not os.path.isfile(path):
+        return True
+    with open(path, 'rb') as infile:
+        header = read_header(infile)
+    return header is None or header[1] != tab_stamps(pwn30_tab, pwn31_tab)
+
+
+class ILIMap(object):
+    ''' Memory-mapped ILI <-> PWN-3.0 <-> PWN-3.1 index
+    ILI lookups are O(1) (direct addressing), synset lookups are binary searches on sorted packed IDs '''
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        with open(path, 'rb') as infile:
+            self.mm = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.max_ili, n30, n31, sources_size = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            raise Exception("Invalid ILI index file: {}".format(path))
+        self.sources = json.loads(self.mm[HEADER.size:HEADER.size + sources_size].decode('utf-8'))
+        view = memoryview(self.mm)[HEADER.size + sources_size:].cast('q')
+        sizes = (self.max_ili + 1, self.max_ili + 1, n30, n30, n31, n31)
+        parts = []
+        start = 0
+        for size in sizes:
+            parts.append(view[start:start + size])
+            start += size
+        self.forward = {'pwn30': parts[0], 'pwn31': parts[1]}
+        self.reverse = {'pwn30': (parts[2], parts[3]), 'pwn31': (parts[4], parts[5])}
+        # views must be released before the memory map can be closed
+        self._views = parts + [view]
+
+    def _ili_to(self, ili_num, wn):
+        return self.forward[wn][ili_num] if 0 < ili_num <= self.max_ili else 0
+
+    def _to_ili(self, packed, wn):
+        keys, ilis = self.reverse[wn]
+        idx = bisect_left(keys, packed)
+        return ilis[idx] if packed and idx < len(keys) and keys[idx] == packed else 0
+
+    def ili_to_pwn30(self, ili):
+        return unpack_synset(self._ili_to(pack_ili(ili), 'pwn30'))
+
+    def ili_to_pwn31(self, ili):
+        return unpack_synset(self._ili_to(pack_ili(ili), 'pwn31'))
+
+    def pwn30_to_ili(self, sid):
+        ili = self._to_ili(pack_synset(sid), 'pwn30')
+        return 'i{}'.format(ili) if ili else None
+
+    def pwn31_to_ili(self, sid):
+        ili = self._to_ili(pack_synset(sid), 'pwn31')
+        return 'i{}'.format(ili) if ili else None
+
+    def translate(self, ids, src, dst):
+        ''' Translate a batch of IDs between 'ili', 'pwn30' and 'pwn31' (None for IDs which cannot be mapped) '''
+        if src == 'ili':
+            ilis = [pack_ili(i) for i in ids]
+        else:
+            ilis = [self._to_ili(pack_synset(sid), src) for sid in ids]
+        if dst == 'ili':
+            return ['i{}'.format(i) if i else None for i in ilis]
+        return [unpack_synset(self._ili_to(i, dst)) if i else None for i in ilis]
+
+    def __len__(self):
+        return len(self.reverse['pwn30'][0])
+
+    def close(self):
+        if self.mm is None:
+            return
+        self.forward = self.reverse = None
+        for view in self._views:
+            view.release()
+        self._views = []
+        self.mm.close()
+        self.mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+_ili_map = None
+
+
+def get_ili_map(path=INDEX_PATH, pwn30_tab=PWN30_TAB, pwn31_tab=PWN31_TAB):
+    ''' Get the shared ILI map of the given tab files, (re)compile it first if the index was built from other or older tab files '''
+    global _ili_map
+    if _ili_map is None or _ili_map.mm is None or _ili_map.path != path or _ili_map.sources != tab_stamps(pwn30_tab, pwn31_tab):
+        # the old map must be closed before its file can be replaced
+        if _ili_map is not None:
+            _ili_map.close()
+            _ili_map = None
+        if is_outdated(path, pwn30_tab, pwn31_tab):
+            compile_index(path, pwn30_tab, pwn31_tab)
+        _ili_map = ILIMap(path)
+    return _ili_map
+
+
+# -------------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile ILI <-> PWN-3.0 <-> PWN-3.1 mapping index")
+    parser.add_argument('--pwn30', help='ILI to PWN-3.0 map', default=PWN30_TAB)
+    parser.add_argument('--pwn31', help='ILI to PWN-3.1 map', default=PWN31_TAB)
+    parser.add_argument('-o', '--output', help='Index file', default=INDEX_PATH)
+    args = parser.parse_args()
+    compile_index(args.output, args.pwn30, args.pwn31)
+    ili_map = ILIMap(args.output)
+    print("ILI index: {} ({} PWN-3.0 synsets, max ILI: i{})".format(args.output, len(ili_map), ili_map.max_ili))
+
+
+if __name__ == "__main__":
+    main()
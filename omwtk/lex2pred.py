@@ -53,24 +53,22 @@ from collections import defaultdict as dd
 from lxml import etree
 
 from puchikarui import Schema, with_ctx
-from coolisf import GrammarHub
 from chirptext.leutile import grouper
 from chirptext.io import CSV
 from chirptext import TextReport, FileHelper, Counter, FileHub
 from chirptext.cli import CLIApp, setup_logging
-from yawlib.helpers import get_gwn
-from yawlib.helpers import get_wn, get_omw
+from omwtk.registry import LazyResource
 
 # -------------------------------------------------------------------------------
 # Configuration
 # -------------------------------------------------------------------------------
 
 DATA_FOLDER = os.path.abspath(os.path.expanduser('./data'))
-omw = get_omw()
-gwn = get_gwn()
-wn = get_wn()
+omw = LazyResource('omw')
+gwn = LazyResource('gwn')
+wn = LazyResource('wn30')
 setup_logging('logging.json', 'logs')
-ghub = GrammarHub()
+ghub = LazyResource('ghub')
 MY_DIR = os.path.dirname(__file__)
 SETUP_FILE = os.path.join(MY_DIR, 'scripts', 'ewdb.sql')
 ROOTS = {'n': 'root_wn_n',
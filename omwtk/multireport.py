@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Buffered report multiplexer: render a record once and write it to several report files
+Latest version can be found at https://github.com/letuananh/omwtk
+
+Usage:
+    with MultiReport(jsonl='data/report.jsonl') as mux:
+        mux.add_sink('report', 'data/report.txt')
+        mux.add_sink('diff', 'data/diff.txt')
+        mux.record("[DIFF] 01850676-n", ["OMW: ...", "GWN: ..."], ('report', 'diff'), synset='01850676-n')
+
+A sink without a path is kept in memory, its content can be retrieved with MultiReport.content()
+The JSON lines stream is a sink named MultiReport.JSONL
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import io
+import json
+from collections import OrderedDict
+
+from chirptext import TextReport
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+BUFFER_SIZE = 1 << 20  # characters
+
+
+# -------------------------------------------------------------------------------
+# Data structures
+# -------------------------------------------------------------------------------
+
+class Sink(object):
+    ''' A report file (or an in-memory buffer when path is None) with a write buffer '''
+
+    def __init__(self, path=None, mode='w', buffer_size=BUFFER_SIZE):
+        self.path = path
+        self.stream = open(path, mode, encoding='utf-8') if path else io.StringIO()
+        self.buffer_size = buffer_size
+        self.pending = []
+        self.pending_size = 0
+
+    def write(self, text):
+        self.pending.append(text)
+        self.pending_size += len(text)
+        if self.pending_size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.stream.write(''.join(self.pending))
+            self.pending = []
+            self.pending_size = 0
+
+    def content(self):
+        self.flush()
+        return self.stream.getvalue() if self.path is None else ''
+
+    def close(self):
+        self.flush()
+        if self.path:
+            self.stream.close()
+
+
+class MultiReport(object):
+    ''' Render each record once and route it to several report sinks
+    Records can also be written to a JSON lines (structured) stream '''
+
+    JSONL = '*jsonl*'
+
+    def __init__(self, jsonl=None, buffer_size=BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.sinks = OrderedDict()
+        if jsonl:
+            self.add_sink(MultiReport.JSONL, jsonl if jsonl != MultiReport.JSONL else None)
+
+    def add_sink(self, name, path=None, mode='w'):
+        self.sinks[name] = Sink(path, mode=mode, buffer_size=self.buffer_size)
+        return self
+
+    @staticmethod
+    def render(title, lines=()):
+        ''' Render a record (a header and some lines) in TextReport format '''
+        rp = TextReport.string()
+        rp.header(title)
+        for line in lines:
+            rp.print(line)
+        return rp.content()
+
+    def write(self, text, *sinks):
+        for name in sinks:
+            self.sinks[name].write(text)
+
+    def emit(self, **fields):
+        ''' Write a structured record to the JSON lines stream (if available) '''
+        if MultiReport.JSONL in self.sinks:
+            self.sinks[MultiReport.JSONL].write(json.dumps(fields, ensure_ascii=False) + '\n')
+
+    def record(self, title, lines, sinks, **fields):
+        ''' Render a record once, write it to all given sinks and emit its fields to the JSON lines stream '''
+        text = MultiReport.render(title, lines)
+        self.write(text, *sinks)
+        if fields:
+            self.emit(**fields)
+        return text
+
+    def content(self, name):
+        ''' Content of an in-memory sink (the JSON lines stream is named MultiReport.JSONL) '''
+        return self.sinks[name].content()
+
+    def flush(self):
+        for sink in self.sinks.values():
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks.values():
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
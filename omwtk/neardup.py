@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Find near-duplicate definitions in OMW (all languages) with MinHash and locality-sensitive hashing
+Latest version can be found at https://github.com/letuananh/omwtk
+
+Each synset definition (all definitions of a synset joined by "; ") is turned into a set of character
+shingles and then into a MinHash signature. Signatures are split into bands and only definitions which
+share at least one band are compared, so the cost stays close to linear in the number of definitions.
+
+Usage:
+    python3 -m omwtk.neardup -t 0.8 -o data/omw_neardup.txt
+    python3 -m omwtk.neardup -l eng jpn
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import zlib
+import random
+import logging
+import argparse
+from array import array
+from itertools import groupby
+from collections import defaultdict as dd
+
+from chirptext.leutile import TextReport, Counter, Timer
+
+from omwtk.registry import get_omw
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+SHINGLE_SIZE = 4
+NUM_PERM = 128
+THRESHOLD = 0.8
+# members of a bucket are compared with at most this many clusters of the bucket
+MAX_BUCKET_ROOTS = 1000
+
+
+def getLogger():
+    return logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------------
+# MinHash
+# -------------------------------------------------------------------------------
+
+def shingles(text, size=SHINGLE_SIZE):
+    ''' Character shingles of a normalized definition (works for languages without spaces too) '''
+    text = ' '.join(text.lower().split()).rstrip(';').strip()
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHash(object):
+    ''' One permutation MinHash: each shingle is hashed once (CRC32) and put into one of num_perm bins.
+    An empty bin copies the value of the first non-empty bin in its own (fixed) probing sequence
+    (optimal densification) so that all signatures are comparable '''
+
+    def __init__(self, num_perm=NUM_PERM):
+        self.num_perm = num_perm
+        self.probes = [random.Random(i).sample(range(num_perm), num_perm) for i in range(num_perm)]
+
+    def signature(self, items):
+        sig = [None] * self.num_perm
+        for item in items:
+            h = zlib.crc32(item.encode('utf-8'))
+            idx, value = h % self.num_perm, h // self.num_perm
+            if sig[idx] is None or value < sig[idx]:
+                sig[idx] = value
+        if None in sig:
+            self.densify(sig)
+        return array('Q', sig)
+
+    def densify(self, sig):
+        values = list(sig)
+        if not any(v is not None for v in values):
+            sig[:] = [0] * self.num_perm
+            return
+        for i, v in enumerate(values):
+            if v is None:
+                for j in self.probes[i]:
+                    if values[j] is not None:
+                        sig[i] = values[j]
+                        break
+
+    @staticmethod
+    def similarity(sig1, sig2):
+        ''' Estimated Jaccard similarity of two signatures '''
+        return sum(1 for a, b in zip(sig1, sig2) if a == b) / len(sig1)
+
+
+def lsh_params(threshold, num_perm=NUM_PERM):
+    ''' Choose (bands, rows) so that the LSH threshold (1/bands) ** (1/rows) is the closest one below the given threshold
+    (candidates are verified afterward, so missing pairs is worse than comparing a few more) '''
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0:
+            bands = num_perm // rows
+            lsh_threshold = (1 / bands) ** (1 / rows)
+            if lsh_threshold <= threshold and (best is None or lsh_threshold > best[0]):
+                best = (lsh_threshold, bands, rows)
+    return (best[1], best[2]) if best else (num_perm, 1)
+
+
+class LSHIndex(object):
+    ''' Group items whose signatures share at least one band, then cluster the ones which are similar enough '''
+
+    def __init__(self, threshold=THRESHOLD, num_perm=NUM_PERM):
+        self.threshold = threshold
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self.buckets = dd(list)
+        self.signatures = []
+
+    def add(self, sig):
+        idx = len(self.signatures)
+        self.signatures.append(sig)
+        for band in range(self.bands):
+            start = band * self.rows
+            self.buckets[(band, sig[start:start + self.rows].tobytes())].append(idx)
+        return idx
+
+    def clusters(self):
+        ''' Clusters of item indices (only clusters with more than 1 item) '''
+        parent = list(range(len(self.signatures)))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+        for members in self.buckets.values():
+            if len(members) < 2:
+                continue
+            # compare every member with the distinct clusters seen so far in this bucket (at most MAX_BUCKET_ROOTS of them),
+            # so that two members are merged even when neither is similar to the first one
+            roots = []
+            for idx in members:
+                merged = False
+                for other in roots:
+                    ra, rb = find(other), find(idx)
+                    if ra == rb:
+                        merged = True
+                    elif MinHash.similarity(self.signatures[other], self.signatures[idx]) >= self.threshold:
+                        parent[rb] = ra
+                        merged = True
+                if not merged and len(roots) < MAX_BUCKET_ROOTS:
+                    roots.append(idx)
+        groups = dd(list)
+        for idx in range(len(parent)):
+            groups[find(idx)].append(idx)
+        return [g for g in groups.values() if len(g) > 1]
+
+
+# -------------------------------------------------------------------------------
+# OMW
+# -------------------------------------------------------------------------------
+
+def iter_omw_defs(ctx, langs=None):
+    ''' Stream (lang, synset, definition) from OMW, ordered by language '''
+    query = 'SELECT lang, synset, def FROM synset_def'
+    params = []
+    if langs:
+        query += ' WHERE lang IN ({})'.format(','.join('?' * len(langs)))
+        params = list(langs)
+    query += ' ORDER BY lang, synset, rowid'
+    rows = ctx.execute(query, params)
+    for (lang, sid), defs in groupby(rows, key=lambda r: (r[0], r[1])):
+        yield lang, sid, '; '.join(d[2] for d in defs if d[2])
+
+
+def find_near_dups(entries, threshold=THRESHOLD, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE):
+    ''' Find clusters of near-duplicate definitions in a stream of (lang, synset, definition)
+    Yield (lang, clusters) where each cluster is a list of (synset, definition) '''
+    mh = MinHash(num_perm)
+    for lang, rows in groupby(entries, key=lambda x: x[0]):
+        index = LSHIndex(threshold, num_perm)
+        items = []
+        for _, sid, definition in rows:
+            if not definition:
+                continue
+            index.add(mh.signature(shingles(definition, shingle_size)))
+            items.append((sid, definition))
+        clusters = [[items[i] for i in sorted(c)] for c in index.clusters()]
+        clusters.sort(key=lambda c: c[0][0])
+        yield lang, clusters
+
+
+def omw_near_dups(langs=None, threshold=THRESHOLD, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, output=None):
+    c = Counter()
+    rp = TextReport(output)
+    with get_omw().ctx() as ctx:
+        entries = iter_omw_defs(ctx, langs)
+        for lang, clusters in find_near_dups(entries, threshold, num_perm, shingle_size):
+            c.count("Languages")
+            if not clusters:
+                continue
+            c[lang] += len(clusters)
+            rp.header("Language: {} ({} clusters)".format(lang, len(clusters)), level="h0")
+            for cluster in clusters:
+                rp.header("Cluster of {} synsets".format(len(cluster)))
+                for sid, definition in cluster:
+                    rp.print("{}: {}".format(sid, definition))
+    rp.header("Summary", level="h0")
+    c.summarise(report=rp)
+    return c
+
+
+# -------------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate definitions in OMW")
+    parser.add_argument('-l', '--langs', nargs='*', help='Languages (default: all)')
+    parser.add_argument('-t', '--threshold', help='Jaccard similarity threshold', type=float, default=THRESHOLD)
+    parser.add_argument('-p', '--perm', help='Number of MinHash permutations', type=int, default=NUM_PERM)
+    parser.add_argument('-k', '--shingle', help='Shingle size (characters)', type=int, default=SHINGLE_SIZE)
+    parser.add_argument('-o', '--output', help='Output file', default='data/omw_neardup.txt')
+    args = parser.parse_args()
+    t = Timer()
+    t.start("Finding near-duplicate definitions")
+    omw_near_dups(args.langs, args.threshold, args.perm, args.shingle, args.output)
+    t.end()
+
+
+if __name__ == "__main__":
+    main()
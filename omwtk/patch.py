@@ -49,25 +49,48 @@ __credits__ = []
 
 import os
 import re
+import sys
+import glob
+import hashlib
 import logging
+import time
 import yaml
 import json
 from collections import OrderedDict
+from collections import namedtuple
+from itertools import groupby, islice
 
 from chirptext import TextReport, FileHelper, Counter
+from chirptext.leutile import grouper
 from chirptext.cli import CLIApp, setup_logging
-from chirptext.anhxa import to_obj
+from puchikarui import Schema, with_ctx
 from yawlib import SynsetID
-from yawlib.helpers import get_gwn
-from yawlib.helpers import get_wn, get_omw
+from omwtk.registry import get_gwn, get_wn, get_omw
+from omwtk.sidedb import SideDB, file_stamp
 
-from omwtk.compare_wn import join_definitions
+from omwtk.compare_wn import join_defs, bulk_omw_synsets, bulk_gwn_definitions
 
 # -------------------------------------------------------------------------------
 # Configuration
 # -------------------------------------------------------------------------------
 
 DATA_FOLDER = os.path.abspath(os.path.expanduser('./data'))
+TYPO_INDEX_PATH = os.path.join(DATA_FOLDER, 'omw_typo.db')
+PATCH_FOLDER = os.path.join(DATA_FOLDER, 'patches')
+PATCH_STORE_PATH = os.path.join(DATA_FOLDER, 'patches.db')
+PATCH_EXTS = ('.yaml', '.yml', '.json', '.jsonl', '.csv')
+NTTAT_SSID = re.compile(r'\d{8}-[nvarx]')
+PATCH_BATCH_SIZE = 1000
+UNDO_LOG_PATTERN = os.path.join(DATA_FOLDER, 'omw_undo_{}.jsonl')
+# Typo classes. A definition is checked for all of them with one search,
+# definitions with typos are then classified (every pattern is a lookahead so that overlapping typos are all found)
+TYPOS = OrderedDict([('space_bracket', r' \)'),
+                     ('double_space', r'  '),
+                     ('trailing_eg', r' e\.g\.$'),
+                     ('space_comma', r' ,'),
+                     ('trailing_colon', r':$')])
+TYPO_SEARCH = re.compile('|'.join(TYPOS.values()))
+TYPO_PATTERN = re.compile('|'.join('(?=(?P<{}>{}))'.format(name, pattern) for name, pattern in TYPOS.items()))
 setup_logging('logging.json', 'logs')
 
 
@@ -81,8 +104,9 @@ def getLogger():
 
 class DefPatch(object):
 
-    def __init__(self, sensekey='', orig_def='', new_def='', source='', comment='', informant=''):
+    def __init__(self, sensekey='', orig_def='', new_def='', source='', comment='', informant='', synset=''):
         self.sensekey = sensekey.strip()
+        self.synset = synset
         self.orig_def = orig_def
         self.new_def = new_def
         self.source = source
@@ -95,7 +119,13 @@ class DefPatch(object):
                             ("new_def", self.new_def),
                             ("comment", self.comment),
                             ("source", self.source),
-                            ("informant", self.informant)])
+                            ("informant", self.informant)] +
+                           ([("synset", self.synset)] if self.synset else []))
+
+    def digest(self):
+        ''' Content address of a patch (the targeted sensekey or synset and the edit) '''
+        content = json.dumps([self.sensekey, self.synset, self.orig_def, self.new_def], ensure_ascii=False)
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
 
     JOHN_MCCRAE_FIELD_MAP = {"sensekey": "sensekey",
                              "original_def": "orig_def",
@@ -106,15 +136,200 @@ class DefPatch(object):
 
     @staticmethod
     def from_string(patch_string):
-        lines = [l.split("\t") for l in patch_string.splitlines()]
-        patch_dict = {k: v for k, v in lines}
-        return to_obj(DefPatch, patch_dict, **DefPatch.JOHN_MCCRAE_FIELD_MAP)
+        return DefPatch.from_lines(patch_string.splitlines())
+
+    @staticmethod
+    def from_lines(lines):
+        ''' Create a patch from key<TAB>value lines (John McCrae format) '''
+        fields = DefPatch.JOHN_MCCRAE_FIELD_MAP
+        kwargs = {}
+        for line in lines:
+            k, v = line.split("\t")
+            if k in fields:
+                kwargs[fields[k]] = v
+        return DefPatch(**kwargs)
 
     @staticmethod
     def from_dict(yaml_dict):
+        if 'definition' in yaml_dict:
+            # NTTAT or manual patch (synset, lemmas, definition)
+            return DefPatch(synset=yaml_dict['synset'], new_def=yaml_dict['definition'])
         return DefPatch(**yaml_dict)
 
 
+# a fix of an OMW definition, action is either update (orig_def => new_def) or delete (orig_def)
+DefFix = namedtuple('DefFix', ['action', 'synset', 'lang', 'orig_def', 'new_def'])
+
+
+class TypoIndex(SideDB):
+    ''' OMW definitions with typos (one row per definition and typo class, a side database of OMW)
+    The index is rebuilt when the modification stamp of the OMW database changes '''
+
+    SETUP_SCRIPT = '''
+    CREATE TABLE IF NOT EXISTS typo (defid INTEGER, synset TEXT, lang TEXT, def TEXT, cls TEXT);
+    CREATE INDEX IF NOT EXISTS typo_lang_cls_idx ON typo(lang, cls);
+    '''
+
+    def __init__(self, data_source=TYPO_INDEX_PATH, omw_path=None):
+        super().__init__(data_source, src_path=omw_path, setup_script=TypoIndex.SETUP_SCRIPT)
+        self.add_table('typo', ['defid', 'synset', 'lang', 'def', 'cls'])
+
+    def build(self, ctx):
+        getLogger().info("Scanning OMW definitions for typos ({})".format(self.src_path))
+        ctx.cur.execute('DELETE FROM typo')
+        # read with a separate cursor while inserting
+        rows = ctx.conn.execute('SELECT rowid, synset, lang, def FROM srcdb.synset_def')
+        entries = ((defid, sid, lang, sdef, cls) for defid, sid, lang, sdef, classes in scan_typos(rows) for cls in classes)
+        ctx.cur.executemany('INSERT INTO typo VALUES (?, ?, ?, ?, ?)', entries)
+
+    @with_ctx
+    def typos(self, langs=None, ctx=None):
+        ''' A list of (defid, synset, lang, def, classes) in OMW order '''
+        query = 'SELECT defid, synset, lang, def, GROUP_CONCAT(cls) FROM typo'
+        params = []
+        if langs:
+            query += ' WHERE lang IN ({})'.format(','.join('?' * len(langs)))
+            params = list(langs)
+        query += ' GROUP BY defid ORDER BY defid'
+        return [(defid, sid, lang, sdef, [cls for cls in TYPOS if cls in classes.split(',')])
+                for defid, sid, lang, sdef, classes in ctx.select(query, params)]
+
+
+def get_typo_index(path=TYPO_INDEX_PATH):
+    ''' Get an up-to-date typo index of the current OMW database '''
+    return TypoIndex(path, omw_path=get_omw().ds.path).ensure()
+
+
+# a patch in the patch store with the files it was found in
+PatchRecord = namedtuple('PatchRecord', ['hash', 'patch', 'paths'])
+# patches which target the same synset (or sensekey when the synset is unknown), conflict is True when they disagree
+PatchOverlap = namedtuple('PatchOverlap', ['key', 'conflict', 'records'])
+
+
+class PatchStore(Schema):
+    ''' Content-addressed store of definition patches from all patch files
+    Every distinct patch is stored once (by DefPatch.digest()) and linked to the files it was found in.
+    Patches are indexed by sensekey, synset and target (the synset, or the sensekey when the synset is unknown) '''
+
+    SETUP_SCRIPT = '''
+    CREATE TABLE IF NOT EXISTS source (sourceid INTEGER PRIMARY KEY, path TEXT UNIQUE, stamp TEXT);
+    CREATE TABLE IF NOT EXISTS patch (hash TEXT PRIMARY KEY, sensekey TEXT, synset TEXT, orig_def TEXT, new_def TEXT, comment TEXT, source TEXT, informant TEXT);
+    CREATE TABLE IF NOT EXISTS patch_source (hash TEXT, sourceid INTEGER, PRIMARY KEY (hash, sourceid)) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS patch_sensekey_idx ON patch(sensekey);
+    CREATE INDEX IF NOT EXISTS patch_synset_idx ON patch(synset);
+    CREATE INDEX IF NOT EXISTS patch_target_idx ON patch(coalesce(synset, sensekey));
+    CREATE INDEX IF NOT EXISTS patch_source_sourceid_idx ON patch_source(sourceid);
+    '''
+    FIELDS = ('sensekey', 'synset', 'orig_def', 'new_def', 'comment', 'source', 'informant')
+    QUERY_FIELDS = FIELDS + ('hash', 'path')
+
+    def __init__(self, data_source=PATCH_STORE_PATH):
+        super().__init__(data_source, setup_script=PatchStore.SETUP_SCRIPT)
+        self.add_table('source', ['sourceid', 'path', 'stamp'], id_cols=('sourceid',))
+        self.add_table('patch', ('hash',) + PatchStore.FIELDS, id_cols=('hash',))
+        self.add_table('patch_source', ['hash', 'sourceid'])
+
+    @with_ctx
+    def ingest(self, path, force=False, ctx=None):
+        ''' Add patches of a file (or replace them if the file was ingested before)
+        Return the number of patches in the file, None if the file has not changed since the last time '''
+        path = os.path.abspath(path)
+        stamp = file_stamp(path)
+        row = ctx.source.select_single('path = ?', (path,))
+        if row is not None and row.stamp == stamp and not force:
+            return None
+        patches = OrderedDict((p.digest(), p) for p in iter_patch_file(path))
+        # ctx.execute() commits, statements of one file are executed with the cursor in one transaction
+        ctx.commit()
+        cur = ctx.cur
+        try:
+            if row is None:
+                cur.execute('INSERT INTO source (path, stamp) VALUES (?, ?)', (path, stamp))
+                sourceid = cur.lastrowid
+            else:
+                sourceid = row.sourceid
+                cur.execute('UPDATE source SET stamp = ? WHERE sourceid = ?', (stamp, sourceid))
+                cur.execute('DELETE FROM patch_source WHERE sourceid = ?', (sourceid,))
+            cur.executemany('INSERT OR IGNORE INTO patch VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                            ((h, p.sensekey or None, p.synset or None, p.orig_def, p.new_def, p.comment, p.source, p.informant) for h, p in patches.items()))
+            cur.executemany('INSERT INTO patch_source VALUES (?, ?)', ((h, sourceid) for h in patches))
+            # patches which are not in any file anymore
+            cur.execute('DELETE FROM patch WHERE hash NOT IN (SELECT hash FROM patch_source)')
+            ctx.commit()
+        except:
+            ctx.rollback()
+            raise
+        return len(patches)
+
+    @with_ctx
+    def prune(self, ctx=None):
+        ''' Remove files which do not exist anymore (and their patches unless they are also in other files)
+        Return the removed paths '''
+        missing = [(r['sourceid'], r['path']) for r in ctx.select('SELECT sourceid, path FROM source') if not os.path.isfile(r['path'])]
+        if missing:
+            ctx.commit()
+            cur = ctx.cur
+            try:
+                cur.executemany('DELETE FROM patch_source WHERE sourceid = ?', ((sourceid,) for sourceid, _ in missing))
+                cur.executemany('DELETE FROM source WHERE sourceid = ?', ((sourceid,) for sourceid, _ in missing))
+                cur.execute('DELETE FROM patch WHERE hash NOT IN (SELECT hash FROM patch_source)')
+                ctx.commit()
+            except:
+                ctx.rollback()
+                raise
+        return [path for _, path in missing]
+
+    @with_ctx
+    def resolve(self, wnctx, ctx=None):
+        ''' Fill in synset IDs of sensekey patches (with one WordNet query), return the number of resolved patches '''
+        sensekeys = [r[0] for r in ctx.select('SELECT DISTINCT sensekey FROM patch WHERE synset IS NULL AND sensekey IS NOT NULL')]
+        sk_map = resolve_sensekeys(sensekeys, wnctx)
+        ctx.cur.executemany('UPDATE patch SET synset = ? WHERE sensekey = ? AND synset IS NULL', ((sid, sk) for sk, sid in sk_map.items()))
+        count = ctx.cur.rowcount if sk_map else 0
+        ctx.commit()
+        return count
+
+    def _records(self, rows):
+        return [PatchRecord(r['hash'], DefPatch(**{f: r[f] or '' for f in PatchStore.FIELDS}), r['paths'].split('\t')) for r in rows]
+
+    @with_ctx
+    def find(self, query=None, exclude_conflicts=False, ctx=None):
+        ''' Select patches by field (a dict of field => SQL LIKE pattern, path is the path of a patch file)
+        Return a list of PatchRecord sorted by target '''
+        conditions = []
+        params = []
+        for field, pattern in (query.items() if query else []):
+            if field not in PatchStore.QUERY_FIELDS:
+                raise Exception("Unknown patch field: {}".format(field))
+            if field == 'path':
+                conditions.append('hash IN (SELECT hash FROM patch_source JOIN source USING (sourceid) WHERE path LIKE ?)')
+            else:
+                conditions.append('{} LIKE ?'.format(field))
+            params.append(pattern)
+        if exclude_conflicts:
+            conditions.append('coalesce(synset, sensekey) NOT IN (SELECT coalesce(synset, sensekey) AS target FROM patch GROUP BY target HAVING COUNT(DISTINCT new_def) > 1)')
+        sql = '''SELECT patch.*, (SELECT GROUP_CONCAT(path, '\t') FROM patch_source JOIN source USING (sourceid) WHERE patch_source.hash = patch.hash) AS paths
+        FROM patch'''
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY coalesce(synset, sensekey), hash'
+        return self._records(ctx.select(sql, params))
+
+    @with_ctx
+    def overlaps(self, conflicts_only=False, ctx=None):
+        ''' Find targets with more than one patch (one indexed pass over patch), return a list of PatchOverlap '''
+        rows = ctx.select('''WITH overlap AS (SELECT coalesce(synset, sensekey) AS target, COUNT(DISTINCT new_def) AS edits FROM patch
+        GROUP BY target HAVING COUNT(*) > 1 AND edits > ?)
+        SELECT overlap.target, overlap.edits, patch.*, (SELECT GROUP_CONCAT(path, '\t') FROM patch_source JOIN source USING (sourceid) WHERE patch_source.hash = patch.hash) AS paths
+        FROM overlap JOIN patch ON coalesce(patch.synset, patch.sensekey) = overlap.target
+        ORDER BY overlap.target, patch.hash''', (1 if conflicts_only else 0,))
+        overlaps = []
+        for target, group in groupby(rows, key=lambda r: r['target']):
+            group = list(group)
+            overlaps.append(PatchOverlap(target, group[0]['edits'] > 1, self._records(group)))
+        return overlaps
+
+
 # -------------------------------------------------------------------------------
 # Application logic
 # -------------------------------------------------------------------------------
@@ -126,15 +341,95 @@ def _represent_dict_in_order(dumper, odict):
 
 # Use a safe dictionary representer for OrderectDict
 yaml.add_representer(OrderedDict, _represent_dict_in_order)
+yaml.add_representer(OrderedDict, _represent_dict_in_order, Dumper=yaml.SafeDumper)
+if hasattr(yaml, 'CSafeDumper'):
+    yaml.add_representer(OrderedDict, _represent_dict_in_order, Dumper=yaml.CSafeDumper)
+
+
+def iter_csv_patches(patch_path):
+    ''' Parse patches in John McCrae <john@mccr.ae> format incrementally
+    A patch is a list of key<TAB>value lines, patches are separated by <TAB><NEWLINE> '''
+    with open(patch_path) as infile:
+        lines = []
+        for line in infile:
+            if line.endswith("\t\n"):
+                lines.append(line[:-2])
+                yield DefPatch.from_lines(lines)
+                lines = []
+            else:
+                lines.append(line[:-1] if line.endswith("\n") else line)
+        if any(lines):
+            yield DefPatch.from_lines(l for l in lines if l)
 
 
 def read_csv(patch_path):
     # John McCrae <john@mccr.ae> format
-    with open(patch_path) as infile:
-        content = infile.read()
-        raw_patches = content.split("\t\n")
-        patches = [DefPatch.from_string(p) for p in raw_patches]
-        return patches
+    return list(iter_csv_patches(patch_path))
+
+
+def iter_patch_file(path):
+    ''' Read patches from a YAML or JSON (a list of patches), JSON lines or John McCrae CSV file '''
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        yield from iter_csv_patches(path)
+        return
+    with open(path, encoding='utf-8') as infile:
+        if ext == '.jsonl':
+            items = (json.loads(line) for line in infile if line.strip())
+        elif ext == '.json':
+            items = json.load(infile)
+        else:
+            items = yaml.safe_load(infile)
+        for item in (items if items else []):
+            yield DefPatch.from_dict(item)
+
+
+def find_patch_files(paths):
+    ''' Patch files of the given files and folders '''
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(f for f in glob.glob(os.path.join(path, '*')) if f.lower().endswith(PATCH_EXTS))
+        else:
+            yield path
+
+
+def parse_query(query):
+    ''' Parse a list of field=pattern into a dict '''
+    fields = OrderedDict()
+    for item in (query if query else []):
+        field, _, pattern = item.partition('=')
+        if not _:
+            raise Exception("Invalid query (field=pattern is expected): {}".format(item))
+        fields[field] = pattern
+    return fields
+
+
+def yaml_dumper():
+    ''' The C emitter (libyaml) when it is available '''
+    return getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def write_patches(patches, outfile, fmt='yaml', batch_size=PATCH_BATCH_SIZE):
+    ''' Write patches as JSON lines or as a YAML list (dumped in batches, the output is the same as dumping the whole list) '''
+    count = 0
+    if fmt == 'jsonl':
+        for patch in patches:
+            outfile.write(json.dumps(patch.to_json(), ensure_ascii=False))
+            outfile.write('\n')
+            count += 1
+        return count
+    dumper = yaml_dumper()
+    batch = []
+    for patch in patches:
+        batch.append(patch.to_json())
+        if len(batch) == batch_size:
+            outfile.write(yaml.dump(batch, Dumper=dumper, default_flow_style=False, allow_unicode=True))
+            count += len(batch)
+            batch = []
+    if batch or not count:
+        outfile.write(yaml.dump(batch, Dumper=dumper, default_flow_style=False, allow_unicode=True))
+        count += len(batch)
+    return count
 
 
 def convert(cli, args):
@@ -149,68 +444,280 @@ def convert(cli, args):
         raise Exception("File {} does not exist.".format(patch_path))
     # validate output file
     out_path = args.output if args.output else None
-    if out_path == '*.yaml':
-        out_path = FileHelper.replace_ext(patch_path, 'yaml')
+    if out_path in ('*.yaml', '*.jsonl'):
+        out_path = FileHelper.replace_ext(patch_path, out_path[2:])
     rp.print("Input:", patch_path)
     rp.print("Output:", out_path if out_path else '*stdout*')
-    # convert patches
-    patches = read_csv(patch_path)
-    json_patches = [p.to_json() for p in patches]
-    yaml_str = yaml.dump(json_patches, default_flow_style=False)
-    # dump output
+    # convert patches (one by one)
+    fmt = args.format if args.format else ('jsonl' if out_path and out_path.endswith('.jsonl') else 'yaml')
+    patches = iter_csv_patches(patch_path)
     if out_path:
-        with open(out_path, 'w') as outfile:
-            outfile.write(yaml_str)
+        with open(out_path, 'w', encoding='utf-8') as outfile:
+            count = write_patches(patches, outfile, fmt)
         if args.echo:
-            print(yaml_str)
+            with open(out_path, encoding='utf-8') as infile:
+                for line in infile:
+                    print(line, end='')
     else:
-        print(yaml_str)
+        count = write_patches(patches, sys.stdout, fmt)
+    rp.print("Converted {} patches".format(count))
 
 
 def fix_gwn_def(a_def):
     return a_def[:-1] if a_def.endswith(';') else a_def
 
 
+def resolve_sensekeys(sensekeys, wnctx):
+    ''' Map sensekeys to synset IDs with one query (sensekeys which cannot be found are not included) '''
+    wnctx.execute('CREATE TEMP TABLE IF NOT EXISTS patch_sk (sensekey TEXT PRIMARY KEY)')
+    wnctx.execute('DELETE FROM temp.patch_sk')
+    wnctx.cur.executemany('INSERT OR IGNORE INTO temp.patch_sk VALUES (?)', ((sk,) for sk in sensekeys))
+    rows = wnctx.execute('''SELECT patch_sk.sensekey, senses.synsetid FROM senses
+    JOIN temp.patch_sk ON lower(senses.sensekey) = patch_sk.sensekey ORDER BY senses.rowid''')
+    sk_map = {}
+    for sensekey, synsetid in rows:
+        if sensekey not in sk_map:
+            sk_map[sensekey] = str(SynsetID.from_string(str(synsetid)))
+    return sk_map
+
+
+def omw_definitions(ssids, ctx):
+    ''' Definitions of OMW synsets (joined by "; ", trailing semicolons are removed), synsets which do not exist are not included '''
+    ssids = list(ssids)
+    existing = set()
+    for batch in grouper(ssids, 500):
+        batch = [sid for sid in batch if sid is not None]
+        rows = ctx.select('SELECT synset FROM synset WHERE synset IN ({})'.format(','.join('?' * len(batch))), batch)
+        existing.update(r[0] for r in rows)
+    synsets, _ = bulk_omw_synsets([sid for sid in ssids if sid in existing], ctx)
+    return {sid: fix_gwn_def(ss.definition) for sid, ss in synsets.items()}
+
+
+def load_patches(args):
+    ''' Patches of a patch file (args.input) or patches in the patch store (args.db) selected by args.query '''
+    if args.input:
+        if not os.path.isfile(args.input):
+            raise Exception("Patch file not found")
+        return list(iter_patch_file(args.input))
+    if not os.path.isfile(args.db):
+        raise Exception("Patch store not found: {}".format(args.db))
+    return [r.patch for r in PatchStore(args.db).find(parse_query(args.query))]
+
+
 def verify_patch(cli, args):
     rp = TextReport()
     c = Counter()
-    if not args.input or not os.path.isfile(args.input):
-        raise Exception("Patch file not found")
-    # load patches
-    with open(args.input) as infile:
-        patches = [DefPatch.from_dict(p) for p in yaml.safe_load(infile)]
+    patches = load_patches(args)
     rp.print("Found {} patches.".format(len(patches)))
     # Validate against GWN-30
     # gwn = get_gwn()  # don't use GWN, for now
     omw = get_omw()
     wn = get_wn()
     with omw.ctx() as ctx, wn.ctx() as wnctx:
+        # resolve all sensekeys and fetch all definitions at once
+        sk_map = resolve_sensekeys({p.sensekey for p in patches if p.sensekey and not p.synset}, wnctx)
+        ssdefs = omw_definitions({p.synset for p in patches if p.synset} | set(sk_map.values()), ctx)
         for patch in patches:
-            try:
-                sid = wn.sk2sid(patch.sensekey, ctx=wnctx)
-                if not sid:
-                    raise Exception("sensekey `{}' does not exist.".format(patch.sensekey))
-                ss = omw.get_synset(sid, ctx=ctx)
-                ssdef = ss.definition[:-1] if ss.definition.endswith(';') else ss.definition
-                if patch.orig_def == ssdef:
-                    c.count("Found")
-                    rp.print("-", "{} [{}]".format(patch.orig_def, patch.sensekey))
-                    rp.print(" ", patch.new_def)
-                    if patch.comment:
-                        rp.print("C", patch.comment)
-                else:
-                    c.count("Found - diff")
-                    rp.print("[DIFF]", "{} [{}]".format(patch.orig_def, patch.sensekey))
-                    rp.print("New:  ", "{} [{}]".format(patch.new_def, patch.sensekey))
-                    rp.print("      ", ssdef)
-                    rp.print("Note: ", patch.comment)
-            except:
-                getLogger().warn("sensekey `{}' couldn't be found".format(patch.sensekey))
+            ssdef = ssdefs.get(patch.synset if patch.synset else sk_map.get(patch.sensekey))
+            if ssdef is None:
+                getLogger().warning("sensekey `{}' couldn't be found".format(patch.sensekey or patch.synset))
                 c.count("Not found")
-                continue
+            elif patch.orig_def == ssdef:
+                c.count("Found")
+                rp.print("-", "{} [{}]".format(patch.orig_def, patch.sensekey or patch.synset))
+                rp.print(" ", patch.new_def)
+                if patch.comment:
+                    rp.print("C", patch.comment)
+            else:
+                c.count("Found - diff")
+                rp.print("[DIFF]", "{} [{}]".format(patch.orig_def, patch.sensekey or patch.synset))
+                rp.print("New:  ", "{} [{}]".format(patch.new_def, patch.sensekey or patch.synset))
+                rp.print("      ", ssdef)
+                rp.print("Note: ", patch.comment)
         c.summarise(report=rp)
 
 
+def apply_fixes(fixes, ctx, dry_run=False, undo_path=None):
+    ''' Apply definition fixes (DefFix) in one transaction
+    Rows are matched by (synset, lang, def). The number of changed rows must be the same as the number of matched rows,
+    otherwise nothing is changed. In dry-run mode the transaction is always rolled back.
+    The undo log (JSON lines) contains every changed row before the change '''
+    c = Counter()
+    fixes = list(OrderedDict.fromkeys(fixes))
+    ctx.execute('CREATE TEMP TABLE IF NOT EXISTS def_fix (fixid INTEGER PRIMARY KEY, action TEXT, synset TEXT, lang TEXT, orig_def TEXT, new_def TEXT)')
+    ctx.execute('DELETE FROM temp.def_fix')
+    ctx.cur.executemany('INSERT INTO temp.def_fix (action, synset, lang, orig_def, new_def) VALUES (?, ?, ?, ?, ?)', fixes)
+    # matched rows (verification and undo log)
+    rows = ctx.select('''SELECT def_fix.fixid, def_fix.action, def_fix.new_def, def_fix.synset AS fix_synset, def_fix.lang AS fix_lang, def_fix.orig_def AS fix_def,
+    synset_def.rowid AS defid, synset_def.*
+    FROM temp.def_fix LEFT JOIN synset_def ON synset_def.synset = def_fix.synset AND synset_def.lang = def_fix.lang AND synset_def.def = def_fix.orig_def
+    ORDER BY def_fix.fixid''')
+    expected = Counter()
+    undo_entries = []
+    for row in rows:
+        if row['defid'] is None:
+            c.count("Not matched")
+            getLogger().warning("Definition not found ({} [{}]): {}".format(row['fix_synset'], row['fix_lang'], row['fix_def']))
+            continue
+        expected.count(row['action'])
+        entry = OrderedDict((k, row[k]) for k in row.keys() if k not in ('fixid', 'new_def') and not k.startswith('fix_'))
+        if row['action'] == 'update':
+            entry['new_def'] = row['new_def']
+        undo_entries.append(entry)
+    c["Matched"] = len(undo_entries)
+    updates = [(f.new_def, f.synset, f.lang, f.orig_def) for f in fixes if f.action == 'update']
+    deletes = [(f.synset, f.lang, f.orig_def) for f in fixes if f.action == 'delete']
+    # ctx.execute() commits after every statement, the transaction is managed on the connection instead
+    ctx.commit()
+    ctx.conn.execute('BEGIN')
+    try:
+        ctx.cur.executemany('UPDATE synset_def SET def = ? WHERE synset = ? AND lang = ? AND def = ?', updates)
+        c["Updated"] = ctx.cur.rowcount if updates else 0
+        ctx.cur.executemany('DELETE FROM synset_def WHERE synset = ? AND lang = ? AND def = ?', deletes)
+        c["Deleted"] = ctx.cur.rowcount if deletes else 0
+        if c["Updated"] != expected["update"] or c["Deleted"] != expected["delete"]:
+            raise Exception("Row counts do not match (updated: {}/{}, deleted: {}/{})".format(c["Updated"], expected["update"], c["Deleted"], expected["delete"]))
+        if dry_run:
+            ctx.conn.rollback()
+        else:
+            if undo_path:
+                with open(undo_path, 'w', encoding='utf-8') as outfile:
+                    for entry in undo_entries:
+                        outfile.write(json.dumps(entry, ensure_ascii=False))
+                        outfile.write('\n')
+            ctx.conn.commit()
+    except:
+        ctx.conn.rollback()
+        raise
+    return c
+
+
+def undo_fixes(undo_path, ctx):
+    ''' Restore rows from an undo log in one transaction '''
+    c = Counter()
+    updates = []
+    inserts = []
+    with open(undo_path, encoding='utf-8') as infile:
+        for line in infile:
+            entry = json.loads(line)
+            if entry['action'] == 'update':
+                updates.append((entry['def'], entry['defid'], entry['new_def']))
+            else:
+                inserts.append((entry['defid'], entry['synset'], entry['lang'], entry['def'], entry.get('sid'), entry.get('usr')))
+    ctx.commit()
+    ctx.conn.execute('BEGIN')
+    try:
+        ctx.cur.executemany('UPDATE synset_def SET def = ? WHERE rowid = ? AND def = ?', updates)
+        c["Restored"] = ctx.cur.rowcount if updates else 0
+        ctx.cur.executemany('INSERT INTO synset_def (rowid, synset, lang, def, sid, usr) VALUES (?, ?, ?, ?, ?, ?)', inserts)
+        c["Reinserted"] = ctx.cur.rowcount if inserts else 0
+        if c["Restored"] != len(updates):
+            raise Exception("{} of {} updated rows could not be restored".format(len(updates) - c["Restored"], len(updates)))
+        ctx.conn.commit()
+    except:
+        ctx.conn.rollback()
+        raise
+    return c
+
+
+def run_fixes(fixes, args):
+    ''' Apply fixes to OMW and report '''
+    undo_path = args.undo if args.undo else UNDO_LOG_PATTERN.format(time.strftime('%Y%m%d_%H%M%S'))
+    with get_omw().ctx() as ctx:
+        c = apply_fixes(fixes, ctx, dry_run=args.dry_run, undo_path=undo_path)
+    rp = TextReport()
+    rp.header("Dry run (nothing was changed)" if args.dry_run else "Applied")
+    c.summarise(report=rp)
+    if not args.dry_run:
+        rp.print("Undo log: {}".format(undo_path))
+    return c
+
+
+def undo_patch(cli, args):
+    with get_omw().ctx() as ctx:
+        undo_fixes(args.input, ctx).summarise()
+
+
+def patch_store(cli, args):
+    ''' Ingest patch files into the patch store, list patches or overlapping patches '''
+    rp = TextReport()
+    c = Counter()
+    store = PatchStore(args.db)
+    if args.action == 'ingest':
+        # deleted or renamed files
+        for path in store.prune():
+            c.count("Removed files")
+            rp.print("{}: removed".format(path))
+        for path in find_patch_files(args.inputs if args.inputs else [PATCH_FOLDER]):
+            count = store.ingest(path, force=args.force)
+            if count is None:
+                c.count("Unchanged files")
+            else:
+                c.count("Ingested files")
+                c["Patches"] += count
+                rp.print("{}: {} patches".format(path, count))
+        if not args.no_resolve:
+            with get_wn().ctx() as wnctx:
+                c["Resolved sensekeys"] = store.resolve(wnctx)
+    elif args.action == 'list':
+        for record in store.find(parse_query(args.query)):
+            c.count("Patches")
+            rp.print("{} [{}] {} => {}".format(record.patch.synset or record.patch.sensekey, record.hash[:10], record.patch.orig_def, record.patch.new_def))
+    elif args.action == 'conflicts':
+        for overlap in store.overlaps(conflicts_only=args.conflicts_only):
+            c.count("Conflicts" if overlap.conflict else "Overlaps")
+            rp.header("{} {}".format("CONFLICT" if overlap.conflict else "OVERLAP", overlap.key))
+            for record in overlap.records:
+                rp.print("[{}] {} => {}".format(record.hash[:10], record.patch.orig_def, record.patch.new_def))
+                rp.print("             {}".format(', '.join(record.paths)))
+    c.summarise(report=rp)
+
+
+def patch_fixes(patches, ctx, lang='eng'):
+    ''' Fixes of the stored definition rows for patches. Definitions are matched the same way as verify_patch does
+    (trailing semicolons are ignored), a synset with more than one definition row cannot be patched.
+    Return the fixes and the patches whose original definition does not match '''
+    synsets, _ = bulk_omw_synsets(OrderedDict.fromkeys(p.synset for p in patches), ctx, lang=lang)
+    fixes = []
+    mismatches = []
+    for patch in patches:
+        defs = synsets[patch.synset].definitions
+        if len(defs) > 1:
+            raise Exception("Synset {} has {} definitions ({}), patches can only be applied to one definition".format(patch.synset, len(defs), lang))
+        if defs and fix_gwn_def(defs[0]) == patch.orig_def:
+            fixes.append(DefFix('update', patch.synset, lang, defs[0], patch.new_def))
+        else:
+            mismatches.append(patch)
+    return fixes, mismatches
+
+
+def apply_patch(cli, args):
+    ''' Apply patches from the patch store (selected by query) to OMW, conflicting patches are skipped '''
+    c = Counter()
+    store = PatchStore(args.db)
+    conflicts = {o.key for o in store.overlaps(conflicts_only=True)}
+    patches = []
+    for record in store.find(parse_query(args.query)):
+        patch = record.patch
+        if not patch.synset:
+            c.count("Skipped (unknown synset)")
+        elif patch.synset in conflicts:
+            c.count("Skipped (conflict)")
+        elif not patch.orig_def:
+            c.count("Skipped (no original definition)")
+        else:
+            patches.append(patch)
+    with get_omw().ctx() as ctx:
+        fixes, mismatches = patch_fixes(patches, ctx, lang=args.lang)
+    for patch in mismatches:
+        c.count("Skipped (definition differs)")
+        getLogger().warning("Definition of {} differs from the patch: {}".format(patch.synset, patch.orig_def))
+    c.summarise()
+    if fixes:
+        run_fixes(fixes, args)
+    return c
+
+
 def fix_typo(a_def):
     if a_def.endswith(' e.g.'):
         a_def = a_def[:-5]
@@ -223,51 +730,111 @@ def to_sqlite_string(a_string):
     return a_string.replace("'", "''")
 
 
+def typo_classes(a_def):
+    ''' Typo classes of a definition (in TYPOS order) '''
+    if not a_def or not TYPO_SEARCH.search(a_def):
+        return []
+    found = {m.lastgroup for m in TYPO_PATTERN.finditer(a_def)}
+    return [cls for cls in TYPOS if cls in found]
+
+
+def scan_typos(rows):
+    ''' Stream (defid, synset, lang, def) and yield (defid, synset, lang, def, classes) for definitions with typos '''
+    for defid, sid, lang, sdef in rows:
+        classes = typo_classes(sdef)
+        if classes:
+            yield defid, sid, lang, sdef, classes
+
+
+def iter_omw_typos(langs=None):
+    ''' Scan OMW definitions of the given languages (all languages by default) for typos '''
+    query = 'SELECT rowid, synset, lang, def FROM synset_def'
+    if langs:
+        query += ' WHERE lang IN ({})'.format(','.join('?' * len(langs)))
+    with get_omw().ctx() as ctx:
+        yield from scan_typos(ctx.execute(query, list(langs) if langs else []))
+
+
 def find_omw_typo(cli, args):
-    omw = get_omw()
-    with omw.ctx() as ctx:
-        defs = ctx.synset_def.select("lang='eng' and (def like '% )%' or def like '%  %' or def like '% e.g.' or def like '% ,%' or def like '%:')")
+    c = Counter()
+    langs = args.langs if args.langs else ['eng']
+    if 'all' in langs:
+        langs = None
+    typos = get_typo_index().typos(langs) if args.index else iter_omw_typos(langs)
+    patch_script = TextReport(args.output) if args.action == 'patch' else None
+    fixes = []
+    for defid, sid, lang, sdef, classes in typos:
+        c.count("Definitions")
+        for cls in classes:
+            c.count(cls)
+        fixed_def = fix_typo(sdef)
         if args.action == 'list':
-            print("Found {} definitions with typo".format(len(defs)))
-            for d in defs:
-                print(d)
-                print("Fixed: {}".format(repr(fix_typo(d._2))))
+            print("{} [{}] {} | {}".format(sid, lang, repr(sdef), ', '.join(classes)))
+            print("Fixed: {}".format(repr(fixed_def)))
         elif args.action == 'patch':
-            patch_script = TextReport(args.output)
-            for d in defs:
-                fixed_def = fix_typo(d._2)
-                patch_script.writeline("-- Orig : {} [{}]".format(d._2, d.synset))
-                patch_script.writeline("-- Fixed: {}".format(fixed_def))
-                patch_script.writeline("UPDATE synset_def SET def = '{}' WHERE synset='{}' AND def='{}';\n".format(to_sqlite_string(fixed_def), d.synset, to_sqlite_string(d._2)))
+            patch_script.writeline("-- Orig : {} [{}]".format(sdef, sid))
+            patch_script.writeline("-- Fixed: {}".format(fixed_def))
+            patch_script.writeline("UPDATE synset_def SET def = '{}' WHERE synset='{}' AND lang='{}' AND def='{}';\n".format(to_sqlite_string(fixed_def), sid, lang, to_sqlite_string(sdef)))
+        elif args.action == 'apply':
+            fixes.append(DefFix('update', sid, lang, sdef, fixed_def))
+    print("Found {} definitions with typo".format(c["Definitions"]))
+    c.summarise()
+    if fixes:
+        run_fixes(fixes, args)
+    return c
+
+
+def iter_nttat_ssids(path):
+    ''' Stream synset IDs (in order of appearance) from an NTTAT file '''
+    with open(path, 'r', encoding='utf-8') as infile:
+        for line in infile:
+            yield from NTTAT_SSID.findall(line)
+
+
+def nttat_shard_paths(output, shards):
+    return ['{}_{}.json'.format(output, idx) for idx in range(1, shards + 1)]
+
+
+def write_nttat_shards(records, total, paths):
+    ''' Split records into consecutive shards of (almost) the same size and write each record to its shard as it comes
+    Every shard is a JSON list (the same as json.dumps(shard, indent=2)) '''
+    records = iter(records)
+    counts = []
+    for idx, path in enumerate(paths):
+        size = (idx + 1) * total // len(paths) - idx * total // len(paths)
+        with open(path, 'w', encoding='utf-8') as outfile:
+            outfile.write('[' if size else '[]')
+            for ridx, record in enumerate(islice(records, size)):
+                outfile.write(',\n  ' if ridx else '\n  ')
+                outfile.write(json.dumps(record, indent=2).replace('\n', '\n  '))
+            outfile.write('\n]' if size else '')
+        counts.append(size)
+    return counts
 
 
 def read_nttat(cli, args):
-    ''' Convert NTTAT patch to JSON '''
-    stdout = TextReport()
-    ext = 'json'
-    rp = TextReport("{}_1.{}".format(args.output, ext))
-    rp2 = TextReport("{}_2.{}".format(args.output, ext))
-    gwn = get_gwn()
-    data = []
-    with open(args.input, 'r') as infile, gwn.ctx() as ctx:
-        ssids = re.findall('\d{8}-[nvarx]', infile.read())
-        print(len(ssids))
-        print(ssids)
-        for sid in ssids:
-            ss = gwn.get_synset(sid, ctx=ctx)
-            sdef = fix_gwn_def(ss.definition)
-            stdout.header(sid, "Lemmas: {}".format(", ".join(ss.lemmas)))
-            stdout.print(sdef)
-            data.append({"synset": sid,
-                         "lemmas": ss.lemmas,
-                         "definition": sdef})
-    cut = int(len(data) / 2)
-    # first half
-    first_half = json.dumps(data[:cut], indent=2)
-    rp.write(first_half)
-    # second half
-    second_half = json.dumps(data[cut:], indent=2)
-    rp2.write(second_half)
+    ''' Convert NTTAT patch to JSON shards (lemmas and definitions of all synsets are fetched from GWN at once) '''
+    rp = TextReport()
+    c = Counter()
+    ssids = list(iter_nttat_ssids(args.input))
+    with get_gwn().ctx() as ctx:
+        entries = bulk_gwn_definitions(ssids, ctx)
+    for sid in ssids:
+        if sid not in entries:
+            getLogger().warning("Synset {} could not be found in GWN".format(sid))
+        elif entries[sid][1] is None:
+            getLogger().warning("Synset {} does not have a definition".format(sid))
+    found = [sid for sid in ssids if sid in entries and entries[sid][1] is not None]
+    c["Synsets"] = len(ssids)
+    c["Not found"] = len(ssids) - len(found)
+    records = ({"synset": sid,
+                "lemmas": entries[sid][0],
+                "definition": fix_gwn_def(entries[sid][1])} for sid in found)
+    output = args.output if args.output else os.path.splitext(args.input)[0]
+    paths = nttat_shard_paths(output, args.shards)
+    for path, count in zip(paths, write_nttat_shards(records, len(found), paths)):
+        rp.print("{}: {} synsets".format(path, count))
+    c.summarise(report=rp)
 
 
 def remove_puncs(a_str):
@@ -294,31 +861,50 @@ def manual_patch(cli, args):
                 rp.print(fixed_def)
 
 
+def iter_dup_defs(ctx, langs=None, topk=None):
+    ''' Scan synset_def once (ordered by synset and language)
+    Yield (synset, lang, definitions, fixed definition, duplicated entries) for groups with duplicated entries '''
+    query = 'SELECT synset, lang, def FROM synset_def'
+    conditions = []
+    params = []
+    if langs:
+        conditions.append('lang IN ({})'.format(','.join('?' * len(langs))))
+        params.extend(langs)
+    if topk:
+        # synsets of the first k senses
+        conditions.append('synset IN (SELECT synset FROM sense LIMIT ?)')
+        params.append(int(topk))
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    query += ' ORDER BY synset, lang, rowid'
+    for (sid, lang), rows in groupby(ctx.execute(query, params), key=lambda r: (r[0], r[1])):
+        definitions = [r[2] for r in rows]
+        if len(definitions) < 2:
+            continue
+        fixed_def, dup_defs = join_defs(definitions)
+        if dup_defs:
+            yield sid, lang, definitions, fixed_def, dup_defs
+
+
 def omw_fix_dup(cli, args):
     rp = TextReport(args.output)
-    omw = get_omw()
     c = Counter()
-    with omw.ctx() as ctx:
-        senses = ctx.sense.select(limit=args.topk, columns=('synset',))
-        synsetids = {s.synset for s in senses}
-        rp.print("-- OMW synsets: {}\n".format(len(synsetids)))
-        for sid in synsetids:
-            try:
-                sid = SynsetID.from_string(sid)
-            except:
-                cli.logger.warning("Ignored synset ID: {}".format(sid))
-                continue
-            ss = omw.get_synset(sid, ctx=ctx)
-            fixed_def, dup_defs = join_definitions(ss)
-            if dup_defs:
-                c.count("Duplicated")
-                rp.print("-- Original {}: {}".format(ss.ID, ss.definition))
-                rp.print("-- Fixed    {}: {}".format(ss.ID, fixed_def))
-                for dup in dup_defs:
-                    rp.print("DELETE FROM synset_def WHERE synset='{}' and def='{}';".format(ss.ID, to_sqlite_string(dup)))
-                rp.print()
-        c.summarise()
-        pass
+    fixes = []
+    langs = args.langs if args.langs and 'all' not in args.langs else None
+    with get_omw().ctx() as ctx:
+        for sid, lang, definitions, fixed_def, dup_defs in iter_dup_defs(ctx, langs, args.topk):
+            c.count("Duplicated")
+            c.count("Duplicated ({})".format(lang))
+            rp.print("-- Original {} [{}]: {}".format(sid, lang, '; '.join(definitions)))
+            rp.print("-- Fixed    {} [{}]: {}".format(sid, lang, fixed_def))
+            for dup in dup_defs:
+                rp.print("DELETE FROM synset_def WHERE synset='{}' AND lang='{}' AND def='{}';".format(sid, lang, to_sqlite_string(dup)))
+                fixes.append(DefFix('delete', sid, lang, dup, None))
+            rp.print()
+    c.summarise()
+    if (args.apply or args.dry_run) and fixes:
+        run_fixes(fixes, args)
+    return c
 
 
 # -------------------------------------------------------------------------------
@@ -331,26 +917,57 @@ def main():
     # convert
     task = app.add_task('convert', func=convert)
     task.add_argument('-i', '--input', help='Input CSV file')
-    task.add_argument('-o', '--output', help='Output YAML file')
+    task.add_argument('-o', '--output', help='Output YAML or JSONL file (*.yaml or *.jsonl: next to the input file)')
+    task.add_argument('-f', '--format', help='Output format (default: by output file extension)', choices=['yaml', 'jsonl'])
     task.add_argument('-e', '--echo', help='Echo output to stdout', action='store_true')
     # verify a patch
     task = app.add_task('verify', func=verify_patch)
-    task.add_argument('-i', '--input', help='YAML patch path')
+    task.add_argument('-i', '--input', help='Patch file (YAML, JSON, JSONL or CSV), patches in the patch store are used by default')
+    task.add_argument('-d', '--db', help='Patch store', default=PATCH_STORE_PATH)
+    task.add_argument('-q', '--query', help='Select patches from the store by field=pattern (SQL LIKE), fields: {}'.format(', '.join(PatchStore.QUERY_FIELDS)), nargs='*')
+
+    task = app.add_task('store', func=patch_store)
+    task.add_argument('action', help='Action to be done on the patch store', choices=['ingest', 'list', 'conflicts'])
+    task.add_argument('-i', '--inputs', help='Patch files or folders to ingest (default: {})'.format(PATCH_FOLDER), nargs='*')
+    task.add_argument('-d', '--db', help='Patch store', default=PATCH_STORE_PATH)
+    task.add_argument('-q', '--query', help='Select patches by field=pattern (SQL LIKE), fields: {}'.format(', '.join(PatchStore.QUERY_FIELDS)), nargs='*')
+    task.add_argument('-f', '--force', help='Ingest files even if they have not changed', action='store_true')
+    task.add_argument('-c', '--conflicts-only', help='Only show patches which disagree', action='store_true')
+    task.add_argument('--no-resolve', help='Do not map sensekeys to synsets with WordNet', action='store_true')
+
+    task = app.add_task('apply', func=apply_patch)
+    task.add_argument('-d', '--db', help='Patch store', default=PATCH_STORE_PATH)
+    task.add_argument('-q', '--query', help='Select patches by field=pattern (SQL LIKE), fields: {}'.format(', '.join(PatchStore.QUERY_FIELDS)), nargs='*')
+    task.add_argument('-l', '--lang', help='OMW language', default='eng')
+    task.add_argument('-n', '--dry-run', help='Verify fixes without changing OMW', action='store_true')
+    task.add_argument('-u', '--undo', help='Undo log path')
     # find typo
     task = app.add_task('typo', func=find_omw_typo)
-    task.add_argument('action', help='Action to be done about typo', choices=['list', 'patch'])
+    task.add_argument('action', help='Action to be done about typo', choices=['list', 'patch', 'apply'])
     task.add_argument('-o', '--output', help='Output script')
+    task.add_argument('-l', '--langs', help='Languages (default: eng, all: all languages)', nargs='*')
+    task.add_argument('-x', '--index', help='Use (and refresh if needed) the typo index ({})'.format(TYPO_INDEX_PATH), action='store_true')
+    task.add_argument('-n', '--dry-run', help='Verify fixes without changing OMW (apply only)', action='store_true')
+    task.add_argument('-u', '--undo', help='Undo log path (apply only)')
     # read NTTAT
     task = app.add_task('nttat', func=read_nttat)
     task.add_argument('-i', '--input', help='Input NTTAT file', default='data/NTTAT.txt')
-    task.add_argument('-o', '--output', help='Output YAML file')
+    task.add_argument('-o', '--output', help='Output prefix (shards are written to {output}_1.json, {output}_2.json, etc.)')
+    task.add_argument('-n', '--shards', help='Number of output shards', type=int, default=2)
     # fix NTTAT
     task = app.add_task('manual', func=manual_patch)
     task.add_argument('-i', '--input', help='Input OMW patch (json)')
     # List all duplicated entries
     task = app.add_task('dup', func=omw_fix_dup)
     task.add_argument('-o', '--output', help='Output patch script')
-    task.add_argument('-k', '--topk', help='Only process top k synsets')
+    task.add_argument('-k', '--topk', help='Only process synsets of the first k senses')
+    task.add_argument('-l', '--langs', help='Languages (default: all)', nargs='*')
+    task.add_argument('-a', '--apply', help='Apply fixes to OMW', action='store_true')
+    task.add_argument('-n', '--dry-run', help='Verify fixes without changing OMW', action='store_true')
+    task.add_argument('-u', '--undo', help='Undo log path')
+    # undo applied fixes
+    task = app.add_task('undo', func=undo_patch)
+    task.add_argument('-i', '--input', help='Undo log', required=True)
     # run app
     app.run()
 
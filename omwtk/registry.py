@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Shared wordnet resources (OMW, GWN, PWN-3.0 and ERG) which are only created when they are used
+Latest version can be found at https://github.com/letuananh/omwtk
+
+Usage:
+    from omwtk.registry import LazyResource, get_omw
+    omw = LazyResource('omw')  # nothing is opened until omw is used
+    omw2 = get_omw()           # the same OMWSQL object
+
+To see how long it takes to import each tool (and which resources were opened) run:
+    python3 -m omwtk.registry
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import sys
+import time
+import logging
+import importlib
+from collections import OrderedDict
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+TOOLS = ['omwtk.compare_wn', 'omwtk.extract', 'omwtk.patch', 'omwtk.lex2pred', 'omwtk.bb2ttl']
+
+
+def getLogger():
+    return logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------------
+# Factories
+# -------------------------------------------------------------------------------
+
+def _create_omw():
+    from yawlib.helpers import get_omw as _get_omw
+    return _get_omw()
+
+
+def _create_gwn():
+    from yawlib.helpers import get_gwn as _get_gwn
+    return _get_gwn()
+
+
+def _create_wn30():
+    from yawlib.helpers import get_wn as _get_wn
+    return _get_wn()
+
+
+def _create_ghub():
+    from coolisf import GrammarHub
+    return GrammarHub()
+
+
+_factories = OrderedDict([('omw', _create_omw),
+                          ('gwn', _create_gwn),
+                          ('wn30', _create_wn30),
+                          ('ghub', _create_ghub)])
+_resources = {}
+_timings = OrderedDict()
+
+
+# -------------------------------------------------------------------------------
+# Registry
+# -------------------------------------------------------------------------------
+
+def register(name, factory):
+    ''' Register (or replace) a resource factory. A created resource with the same name will be dropped '''
+    _factories[name] = factory
+    _resources.pop(name, None)
+    _timings.pop(name, None)
+
+
+def get(name):
+    ''' Get a shared resource by name, create it on first use '''
+    if name not in _resources:
+        if name not in _factories:
+            raise KeyError("Unknown resource: {}".format(name))
+        start = time.time()
+        _resources[name] = _factories[name]()
+        _timings[name] = time.time() - start
+        getLogger().debug("Resource {} was created in {:.3f}s".format(name, _timings[name]))
+    return _resources[name]
+
+
+def is_loaded(name):
+    return name in _resources
+
+
+def timings():
+    ''' Time spent to create each loaded resource (in seconds) '''
+    return OrderedDict(_timings)
+
+
+def get_omw():
+    return get('omw')
+
+
+def get_gwn():
+    return get('gwn')
+
+
+def get_wn():
+    return get('wn30')
+
+
+def get_ghub():
+    return get('ghub')
+
+
+def get_erg():
+    return get_ghub().ERG
+
+
+class LazyResource(object):
+    ''' A placeholder for a shared resource, the resource is created when one of its attributes is used '''
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(get(self._name), attr)
+
+    def __repr__(self):
+        return "LazyResource({}{})".format(self._name, '' if is_loaded(self._name) else ', not loaded')
+
+
+# -------------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------------
+
+def main():
+    ''' Show import time of each tool and the resources that were created while importing '''
+    modules = sys.argv[1:] if len(sys.argv) > 1 else TOOLS
+    for module in modules:
+        start = time.time()
+        try:
+            importlib.import_module(module)
+            status = "OK"
+        except Exception as e:
+            status = "Failed ({})".format(e)
+        print("{:<24} {:>8.3f}s  {}".format(module, time.time() - start, status))
+    loaded = timings()
+    if loaded:
+        for name, exec_time in loaded.items():
+            print("Resource {:<15} {:>8.3f}s".format(name, exec_time))
+    else:
+        print("No resource was created at import time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Side databases which are derived from another database (e.g. OMW) and rebuilt when it changes
+Latest version can be found at https://github.com/letuananh/omwtk
+
+Usage:
+    class MyIndex(SideDB):
+        def build(self, ctx):
+            ctx.cur.execute('INSERT INTO my_table SELECT ... FROM srcdb.synset_def')
+    MyIndex('data/my_index.db', src_path='data/omw.db').ensure()
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+import os
+import logging
+
+from puchikarui import Schema, with_ctx
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+META_SCRIPT = 'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);'
+
+
+def getLogger():
+    return logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------------
+# Functions
+# -------------------------------------------------------------------------------
+
+def file_stamp(path):
+    ''' Modification stamp of a file (mtime in nanoseconds and size) '''
+    st = os.stat(path)
+    return '{}:{}'.format(st.st_mtime_ns, st.st_size)
+
+
+class SideDB(Schema):
+    ''' A database derived from a source database (attached as srcdb while it is built)
+    The modification stamp of the source is kept in the meta table, the database is rebuilt when the stamp changes.
+    Subclasses implement build(ctx) and must not commit '''
+
+    def __init__(self, data_source, src_path=None, setup_script=''):
+        super().__init__(data_source, setup_script=META_SCRIPT + setup_script)
+        self.src_path = src_path
+        self.add_table('meta', ['key', 'value'], id_cols=('key',))
+
+    def build(self, ctx):
+        raise NotImplementedError()
+
+    @with_ctx
+    def is_stale(self, ctx=None):
+        row = ctx.meta.select_single('key = ?', ('stamp',))
+        return row is None or row.value != file_stamp(self.src_path)
+
+    @with_ctx
+    def rebuild(self, ctx=None):
+        ''' Build the database in one transaction (nothing is changed when the build fails) '''
+        stamp = file_stamp(self.src_path)
+        ctx.commit()
+        # a database cannot be attached inside a transaction
+        ctx.cur.execute('ATTACH DATABASE ? AS srcdb', (self.src_path,))
+        try:
+            self.build(ctx)
+            ctx.cur.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', ('stamp', stamp))
+            ctx.commit()
+        except:
+            ctx.rollback()
+            raise
+        finally:
+            ctx.cur.execute('DETACH DATABASE srcdb')
+
+    @with_ctx
+    def ensure(self, ctx=None):
+        if self.is_stale(ctx=ctx):
+            self.rebuild(ctx=ctx)
+        return self
@@ -1,3004 +1,89 @@
-WN_NTUMC_TOP3000 = [
-    { "synset" : """02604760-v""", "def" : """have the quality of being""", "freq" : """10742""" },
-    { "synset" : """00007846-n""", "def" : """a human being""", "freq" : """6833""" },
-    { "synset" : """00007846-n""", "def" : """person, singular, assertive existential pronoun""", "freq" : """6833""" },
-    { "synset" : """00007846-n""", "def" : """pronoun, person, singular; quantifier: assertive existential""", "freq" : """6833""" },
-    { "synset" : """02616386-v""", "def" : """be identical to""", "freq" : """3019""" },
-    { "synset" : """02616386-v""", "def" : """be someone or something""", "freq" : """3019""" },
-    { "synset" : """01009240-v""", "def" : """express in words""", "freq" : """1861""" },
-    { "synset" : """00024073-r""", "def" : """negation of a word or group of words""", "freq" : """1837""" },
-    { "synset" : """00031264-n""", "def" : """any number of entities (members) considered as a unit""", "freq" : """1345""" },
-    { "synset" : """02203362-v""", "def" : """have or possess, either in a concrete or an abstract sense""", "freq" : """1202""" },
-    { "synset" : """00027167-n""", "def" : """a point or extent in space""", "freq" : """992""" },
-    { "synset" : """00027167-n""", "def" : """a point or extent in space""", "freq" : """992""" },
-    { "synset" : """02655135-v""", "def" : """occupy a certain position or area""", "freq" : """901""" },
-    { "synset" : """02655135-v""", "def" : """be somewhere""", "freq" : """901""" },
-    { "synset" : """10287213-n""", "def" : """an adult person who is male (as opposed to a woman)""", "freq" : """749""" },
-    { "synset" : """02603699-v""", "def" : """have an existence, be extant""", "freq" : """701""" },
-    { "synset" : """02749904-v""", "def" : """happen, occur, take place""", "freq" : """698""" },
-    { "synset" : """02129289-v""", "def" : """perceive by sight or have the power to perceive by sight""", "freq" : """613""" },
-    { "synset" : """02133435-v""", "def" : """give a certain impression or have a certain outward aspect""", "freq" : """607""" },
-    { "synset" : """01158872-v""", "def" : """put into service""", "freq" : """603""" },
-    { "synset" : """01158872-v""", "def" : """make work or employ for a particular purpose or for its inherent or natural purpose""", "freq" : """603""" },
-    { "synset" : """00594621-v""", "def" : """be cognizant or aware of a fact or a specific piece of information""", "freq" : """585""" },
-    { "synset" : """00594621-v""", "def" : """possess knowledge or information about""", "freq" : """585""" },
-    { "synset" : """00594621-v""", "def" : """know""", "freq" : """585""" },
-    { "synset" : """02560585-v""", "def" : """engage in""", "freq" : """526""" },
-    { "synset" : """02186470-a""", "def" : """being one more than one""", "freq" : """508""" },
-    { "synset" : """02560585-v""", "def" : """engage in""", "freq" : """508""" },
-    { "synset" : """02069355-a""", "def" : """not the same one or ones already mentioned or implied""", "freq" : """483""" },
-    { "synset" : """02069355-a""", "def" : """quantifier, other""", "freq" : """483""" },
-    { "synset" : """00120316-v""", "def" : """give certain properties to something""", "freq" : """459""" },
-    { "synset" : """15203791-n""", "def" : """a period of time containing 365 (or 366) days""", "freq" : """426""" },
-    { "synset" : """02186338-a""", "def" : """used of a single unit or thing""", "freq" : """422""" },
-    { "synset" : """02186338-a""", "def" : """not two or more""", "freq" : """422""" },
-    { "synset" : """00047534-r""", "def" : """in addition""", "freq" : """411""" },
-    { "synset" : """00017445-r""", "def" : """used as an intensive especially to indicate something unexpected""", "freq" : """394""" },
-    { "synset" : """01825237-v""", "def" : """feel or have a desire for""", "freq" : """389""" },
-    { "synset" : """01825237-v""", "def" : """want strongly""", "freq" : """389""" },
-    { "synset" : """02630189-v""", "def" : """have as a feature""", "freq" : """377""" },
-    { "synset" : """00345761-v""", "def" : """take the first step or steps in carrying out an action""", "freq" : """375""" },
-    { "synset" : """00099341-r""", "def" : """used to form the comparative of some adjectives and adverbs, indicates that the adjective or adverb is more of something""", "freq" : """374""" },
-    { "synset" : """01551633-a""", "def" : """a quantifier that can be used with count nouns and is often preceded by `as' or `too' or `so' or `that'""", "freq" : """347""" },
-    { "synset" : """01551633-a""", "def" : """amounting to a large but indefinite number""", "freq" : """347""" },
-    { "synset" : """01551633-a""", "def" : """quantifier, plural pronoun""", "freq" : """347""" },
-    { "synset" : """01551633-a""", "def" : """quantifier, plural""", "freq" : """347""" },
-    { "synset" : """10582746-n""", "def" : """someone who serves in the armed forces""", "freq" : """346""" },
-    { "synset" : """10582746-n""", "def" : """a member of a military force""", "freq" : """346""" },
-    { "synset" : """01835496-v""", "def" : """change location""", "freq" : """343""" },
-    { "synset" : """01835496-v""", "def" : """move, travel, or proceed, also metaphorically""", "freq" : """343""" },
-    { "synset" : """02530167-v""", "def" : """make an effort or attempt""", "freq" : """342""" },
-    { "synset" : """00117620-r""", "def" : """subsequently or soon afterward""", "freq" : """333""" },
-    { "synset" : """00149583-v""", "def" : """enter or assume a certain state or condition""", "freq" : """327""" },
-    { "synset" : """10804406-n""", "def" : """a young person (especially a young man or boy)""", "freq" : """323""" },
-    { "synset" : """00146594-r""", "def" : """to a very great extent or degree""", "freq" : """322""" },
-    { "synset" : """01640850-a""", "def" : """not of long duration""", "freq" : """310""" },
-    { "synset" : """01640850-a""", "def" : """having just (or relatively recently) come into being or been made or acquired or discovered""", "freq" : """310""" },
-    { "synset" : """00049433-r""", "def" : """in the historical present""", "freq" : """283""" },
-    { "synset" : """00049433-r""", "def" : """at this point in the narration of a series of past events""", "freq" : """283""" },
-    { "synset" : """01849221-v""", "def" : """move toward, travel toward something or somebody or approach something or somebody""", "freq" : """276""" },
-    { "synset" : """02169702-v""", "def" : """perceive (sound) via the auditory sense""", "freq" : """275""" },
-    { "synset" : """00689344-v""", "def" : """judge or regard""", "freq" : """274""" },
-    { "synset" : """00689344-v""", "def" : """look upon""", "freq" : """274""" },
-    { "synset" : """00689344-v""", "def" : """judge""", "freq" : """274""" },
-    { "synset" : """02130524-v""", "def" : """perceive with attention""", "freq" : """274""" },
-    { "synset" : """02130524-v""", "def" : """direct one's gaze towards""", "freq" : """274""" },
-    { "synset" : """02327200-v""", "def" : """give something useful or necessary to""", "freq" : """270""" },
-    { "synset" : """02664769-v""", "def" : """be identical or equivalent to""", "freq" : """270""" },
-    { "synset" : """05311054-n""", "def" : """the organ of sight""", "freq" : """263""" },
-    { "synset" : """00031899-r""", "def" : """used to give emphasis""", "freq" : """260""" },
-    { "synset" : """01768724-a""", "def" : """belonging to or on behalf of a specified person (especially yourself)""", "freq" : """259""" },
-    { "synset" : """01768724-a""", "def" : """preceded by a possessive""", "freq" : """259""" },
-    { "synset" : """00004722-r""", "def" : """and nothing more""", "freq" : """258""" },
-    { "synset" : """07942152-n""", "def" : """any group of human beings (men or women or children) collectively""", "freq" : """257""" },
-    { "synset" : """00020759-r""", "def" : """not ever""", "freq" : """255""" },
-    { "synset" : """00020759-r""", "def" : """at no time in the past or future""", "freq" : """255""" },
-    { "synset" : """01016002-v""", "def" : """report or maintain""", "freq" : """254""" },
-    { "synset" : """00040365-r""", "def" : """anew""", "freq" : """249""" },
-    { "synset" : """02269286-a""", "def" : """quantifier, used to refer to the entire quantity or extent of something""", "freq" : """247""" },
-    { "synset" : """02269286-a""", "def" : """entity, universal pronoun""", "freq" : """247""" },
-    { "synset" : """02269286-a""", "def" : """quantifier, universal""", "freq" : """247""" },
-    { "synset" : """00784342-v""", "def" : """inquire about""", "freq" : """244""" },
-    { "synset" : """01617192-v""", "def" : """make or cause to be or to become""", "freq" : """243""" },
-    { "synset" : """02005948-v""", "def" : """reach a destination""", "freq" : """235""" },
-    { "synset" : """02005948-v""", "def" : """arrive by movement or progress""", "freq" : """235""" },
-    { "synset" : """02210855-v""", "def" : """come into the possession of something concrete or abstract""", "freq" : """235""" },
-    { "synset" : """02632940-v""", "def" : """have as a part, be made up out of""", "freq" : """234""" },
-    { "synset" : """00031304-r""", "def" : """with reference to action or condition""", "freq" : """233""" },
-    { "synset" : """00031304-r""", "def" : """without change, interruption, or cessation""", "freq" : """233""" },
-    { "synset" : """01010862-a""", "def" : """preceding all others in time or space or degree""", "freq" : """232""" },
-    { "synset" : """00008600-r""", "def" : """without any others being included or involved""", "freq" : """226""" },
-    { "synset" : """02186580-a""", "def" : """being one more than two""", "freq" : """221""" },
-    { "synset" : """02108026-v""", "def" : """go through (mental or physical states or experiences)""", "freq" : """220""" },
-    { "synset" : """02626604-v""", "def" : """undergo a change or development""", "freq" : """220""" },
-    { "synset" : """02423183-v""", "def" : """make it possible through a specific action or lack of action for something to happen""", "freq" : """219""" },
-    { "synset" : """07309599-n""", "def" : """an instance or single occasion for some event""", "freq" : """219""" },
-    { "synset" : """05564590-n""", "def" : """the (prehensile) extremity of the superior limb""", "freq" : """215""" },
-    { "synset" : """01391351-a""", "def" : """limited or below average in number or quantity or magnitude or extent""", "freq" : """213""" },
-    { "synset" : """05538625-n""", "def" : """the upper part of the human body or the front part of the body in animals""", "freq" : """208""" },
-    { "synset" : """05538625-n""", "def" : """contains the face and brains""", "freq" : """208""" },
-    { "synset" : """02681795-v""", "def" : """keep in a certain state, position, or activity""", "freq" : """206""" },
-    { "synset" : """02681795-v""", "def" : """e.g.,""", "freq" : """206""" },
-    { "synset" : """00719734-v""", "def" : """regard something as probable or likely""", "freq" : """204""" },
-    { "synset" : """00019339-r""", "def" : """at all times""", "freq" : """196""" },
-    { "synset" : """00019339-r""", "def" : """all the time and on every occasion""", "freq" : """196""" },
-    { "synset" : """01009240-v""", "def" : """express in words""", "freq" : """196""" },
-    { "synset" : """05600637-n""", "def" : """the front of the human head from the forehead to the chin and ear to ear""", "freq" : """193""" },
-    { "synset" : """01123148-a""", "def" : """having desirable or positive qualities especially those suitable for a thing specified""", "freq" : """190""" },
-    { "synset" : """00952524-v""", "def" : """let something be known""", "freq" : """189""" },
-    { "synset" : """02620587-v""", "def" : """form or compose""", "freq" : """189""" },
-    { "synset" : """00631737-v""", "def" : """expect, believe, or suppose""", "freq" : """188""" },
-    { "synset" : """00108479-r""", "def" : """in or at this place""", "freq" : """187""" },
-    { "synset" : """00108479-r""", "def" : """where the speaker or writer is""", "freq" : """187""" },
-    { "synset" : """01907258-v""", "def" : """change orientation or direction, also in the abstract sense""", "freq" : """187""" },
-    { "synset" : """01904930-v""", "def" : """use one's feet to advance""", "freq" : """184""" },
-    { "synset" : """01904930-v""", "def" : """advance by steps""", "freq" : """184""" },
-    { "synset" : """02547586-v""", "def" : """give help or assistance""", "freq" : """183""" },
-    { "synset" : """02547586-v""", "def" : """be of service""", "freq" : """183""" },
-    { "synset" : """04928903-n""", "def" : """how something is done or how it happens""", "freq" : """183""" },
-    { "synset" : """00048475-r""", "def" : """in these times""", "freq" : """182""" },
-    { "synset" : """00109151-r""", "def" : """in or at that place""", "freq" : """181""" },
-    { "synset" : """01771535-v""", "def" : """undergo an emotional sensation or be in a particular state of mind""", "freq" : """181""" },
-    { "synset" : """00027384-r""", "def" : """despite anything to the contrary (usually following a concession)""", "freq" : """180""" },
-    { "synset" : """00047392-r""", "def" : """to a degree exceeding normal or proper limits""", "freq" : """180""" },
-    { "synset" : """00111609-r""", "def" : """used to form the superlative, greatest in size or degree""", "freq" : """180""" },
-    { "synset" : """02316868-v""", "def" : """cause to have, in the abstract sense or physical sense""", "freq" : """179""" },
-    { "synset" : """00073033-r""", "def" : """(of actions or states) slightly short of or not quite accomplished""", "freq" : """175""" },
-    { "synset" : """00073033-r""", "def" : """all but""", "freq" : """175""" },
-    { "synset" : """01712704-v""", "def" : """carry out or perform an action""", "freq" : """173""" },
-    { "synset" : """01546111-v""", "def" : """be standing""", "freq" : """169""" },
-    { "synset" : """01546111-v""", "def" : """be upright""", "freq" : """169""" },
-    { "synset" : """10112591-n""", "def" : """a person you know well and regard with affection and trust""", "freq" : """169""" },
-    { "synset" : """15155220-n""", "def" : """time for Earth to make a complete rotation on its axis""", "freq" : """169""" },
-    { "synset" : """10622053-n""", "def" : """an enlisted man or woman who serves in an army""", "freq" : """166""" },
-    { "synset" : """00752493-v""", "def" : """make a request or demand for something to somebody""", "freq" : """165""" },
-    { "synset" : """01391351-a""", "def" : """limited or below average in number or quantity or magnitude or extent""", "freq" : """163""" },
-    { "synset" : """15167027-n""", "def" : """the time after sunset and before sunrise while it is dark outside""", "freq" : """163""" },
-    { "synset" : """00004722-r""", "def" : """and nothing more""", "freq" : """162""" },
-    { "synset" : """02339171-v""", "def" : """be the cause or source of""", "freq" : """160""" },
-    { "synset" : """15270431-n""", "def" : """a period of time considered as a resource under your control and sufficient to accomplish something""", "freq" : """160""" },
-    { "synset" : """00345761-v""", "def" : """take the first step or steps in carrying out an action""", "freq" : """159""" },
-    { "synset" : """00591115-v""", "def" : """perceive (an idea or situation) mentally""", "freq" : """159""" },
-    { "synset" : """02248465-v""", "def" : """come upon, as if by accident""", "freq" : """159""" },
-    { "synset" : """02248465-v""", "def" : """meet with""", "freq" : """159""" },
-    { "synset" : """00149583-v""", "def" : """enter or assume a certain state or condition""", "freq" : """157""" },
-    { "synset" : """03544360-n""", "def" : """a dwelling that serves as living quarters for one or more families""", "freq" : """157""" },
-    { "synset" : """00035058-r""", "def" : """many times at short intervals""", "freq" : """153""" },
-    { "synset" : """05833840-n""", "def" : """the content of cognition""", "freq" : """151""" },
-    { "synset" : """05833840-n""", "def" : """the main thing you are thinking about""", "freq" : """151""" },
-    { "synset" : """14410605-n""", "def" : """a state of difficulty that needs to be resolved""", "freq" : """151""" },
-    { "synset" : """00715239-v""", "def" : """come to believe on the basis of emotion, intuitions, or indefinite grounds""", "freq" : """150""" },
-    { "synset" : """00339934-v""", "def" : """come to pass""", "freq" : """149""" },
-    { "synset" : """09917593-n""", "def" : """a young person of either sex""", "freq" : """148""" },
-    { "synset" : """00341917-v""", "def" : """come to pass""", "freq" : """147""" },
-    { "synset" : """00341917-v""", "def" : """arrive, as in due course""", "freq" : """147""" },
-    { "synset" : """01275562-a""", "def" : """of great significance or value""", "freq" : """146""" },
-    { "synset" : """02009433-v""", "def" : """go away from a place""", "freq" : """146""" },
-    { "synset" : """02684924-v""", "def" : """continue a certain state, condition, or activity""", "freq" : """146""" },
-    { "synset" : """08497294-n""", "def" : """a particular geographical region of indefinite boundary (usually serving some special purpose or distinguished by its people or culture or geography)""", "freq" : """146""" },
-    { "synset" : """08213817-n""", "def" : """army unit smaller than a division, which can be divided into several companies, squadrons, or batteries and often into two battalions.
-
-""", "freq" : """145""" },
-    { "synset" : """02627934-v""", "def" : """require as useful, just, or proper""", "freq" : """144""" },
-    { "synset" : """10285313-n""", "def" : """a youthful male person""", "freq" : """144""" },
-    { "synset" : """02204692-v""", "def" : """have ownership or possession of""", "freq" : """143""" },
-    { "synset" : """10787470-n""", "def" : """an adult female person (as opposed to a man)""", "freq" : """143""" },
-    { "synset" : """00595935-v""", "def" : """know how to do or perform something""", "freq" : """142""" },
-    { "synset" : """00358431-v""", "def" : """pass from physical life and lose all bodily attributes and functions necessary to sustain life""", "freq" : """141""" },
-    { "synset" : """02154508-v""", "def" : """discover or determine the existence, presence, or fact of""", "freq" : """141""" },
-    { "synset" : """13740168-n""", "def" : """a quantity of no importance""", "freq" : """141""" },
-    { "synset" : """13740168-n""", "def" : """thing (object:), singular, negative pronoun""", "freq" : """141""" },
-    { "synset" : """13740168-n""", "def" : """pronoun, thing, singular; quantifier: negative existential""", "freq" : """141""" },
-    { "synset" : """02128873-v""", "def" : """perceive or be contemporaneous with""", "freq" : """140""" },
-    { "synset" : """01382086-a""", "def" : """above average in size or number or quantity or magnitude or extent""", "freq" : """139""" },
-    { "synset" : """01553340-a""", "def" : """more than one but indefinitely small in number""", "freq" : """138""" },
-    { "synset" : """01494310-v""", "def" : """put into a certain place or abstract location""", "freq" : """138""" },
-    { "synset" : """02251743-v""", "def" : """give money, usually in exchange for goods or services""", "freq" : """138""" },
-    { "synset" : """01553629-a""", "def" : """great in quantity or degree or extent""", "freq" : """137""" },
-    { "synset" : """01821266-a""", "def" : """capable of happening or existing""", "freq" : """136""" },
-    { "synset" : """02148788-v""", "def" : """give an exhibition of to an interested audience""", "freq" : """136""" },
-    { "synset" : """05840188-n""", "def" : """a subdivision of a particular kind of thing""", "freq" : """136""" },
-    { "synset" : """14845743-n""", "def" : """binary compound that occurs at room temperature as a clear colorless odorless tasteless liquid""", "freq" : """136""" },
-    { "synset" : """14845743-n""", "def" : """freezes into ice below 0 degrees centigrade and boils above 100 degrees centigrade""", "freq" : """136""" },
-    { "synset" : """14845743-n""", "def" : """widely used as a solvent""", "freq" : """136""" },
-    { "synset" : """02268485-a""", "def" : """quantifier, not any or not at all""", "freq" : """135""" },
-    { "synset" : """01494310-v""", "def" : """put into a certain place or abstract location""", "freq" : """135""" },
-    { "synset" : """01210854-a""", "def" : """greater than normal in degree or intensity or amount""", "freq" : """134""" },
-    { "synset" : """01555133-a""", "def" : """a quantifier meaning greater in size or amount or extent or degree""", "freq" : """134""" },
-    { "synset" : """01555133-a""", "def" : """above; more than""", "freq" : """134""" },
-    { "synset" : """01543123-v""", "def" : """be seated""", "freq" : """134""" },
-    { "synset" : """02561995-v""", "def" : """get (something) done""", "freq" : """134""" },
-    { "synset" : """00700884-a""", "def" : """definite but not specified or identified""", "freq" : """131""" },
-    { "synset" : """05121418-n""", "def" : """the property possessed by a sum or total or indefinite quantity of units or individuals""", "freq" : """131""" },
-    { "synset" : """02186665-a""", "def" : """being one more than three""", "freq" : """130""" },
-    { "synset" : """02267308-a""", "def" : """quantifier, an unspecified amount of""", "freq" : """130""" },
-    { "synset" : """02267308-a""", "def" : """quantifier, assertive existential pronoun""", "freq" : """130""" },
-    { "synset" : """02267308-a""", "def" : """quantifier, assertive existential""", "freq" : """130""" },
-    { "synset" : """02068476-a""", "def" : """same in identity""", "freq" : """129""" },
-    { "synset" : """02649830-v""", "def" : """inhabit or live in""", "freq" : """129""" },
-    { "synset" : """02649830-v""", "def" : """be an inhabitant of""", "freq" : """129""" },
-    { "synset" : """00117985-v""", "def" : """stay the same""", "freq" : """128""" },
-    { "synset" : """00117985-v""", "def" : """remain in a certain state""", "freq" : """128""" },
-    { "synset" : """02133435-v""", "def" : """give a certain impression or have a certain outward aspect""", "freq" : """126""" },
-    { "synset" : """05839024-n""", "def" : """a category of things distinguished by some common characteristic or quality""", "freq" : """126""" },
-    { "synset" : """08276720-n""", "def" : """an educational institution""", "freq" : """125""" },
-    { "synset" : """00038625-r""", "def" : """as might be expected""", "freq" : """123""" },
-    { "synset" : """00300247-r""", "def" : """by chance""", "freq" : """123""" },
-    { "synset" : """00595630-v""", "def" : """be aware of the truth of something""", "freq" : """123""" },
-    { "synset" : """00595630-v""", "def" : """have a belief or faith in something""", "freq" : """123""" },
-    { "synset" : """00595630-v""", "def" : """regard as true beyond any doubt""", "freq" : """123""" },
-    { "synset" : """00697589-v""", "def" : """reach, make, or come to a decision about something""", "freq" : """123""" },
-    { "synset" : """01654628-v""", "def" : """make by combining materials and parts""", "freq" : """123""" },
-    { "synset" : """02287789-v""", "def" : """fail to keep or to maintain""", "freq" : """123""" },
-    { "synset" : """02287789-v""", "def" : """cease to have, either physically or in an abstract sense""", "freq" : """123""" },
-    { "synset" : """02077656-v""", "def" : """take something or somebody with oneself somewhere""", "freq" : """122""" },
-    { "synset" : """02210119-v""", "def" : """get something""", "freq" : """122""" },
-    { "synset" : """02210119-v""", "def" : """come into possession of""", "freq" : """122""" },
-    { "synset" : """02133435-v""", "def" : """give a certain impression or have a certain outward aspect""", "freq" : """121""" },
-    { "synset" : """05611302-n""", "def" : """that which is responsible for one's thoughts and feelings""", "freq" : """120""" },
-    { "synset" : """05611302-n""", "def" : """the seat of the faculty of reason""", "freq" : """120""" },
-    { "synset" : """10780632-n""", "def" : """a married woman""", "freq" : """120""" },
-    { "synset" : """10780632-n""", "def" : """a man's partner in marriage""", "freq" : """120""" },
-    { "synset" : """01437963-a""", "def" : """primarily temporal sense""", "freq" : """118""" },
-    { "synset" : """01437963-a""", "def" : """being or indicating a relatively great or greater than average duration or passage of time or a duration as specified""", "freq" : """118""" },
-    { "synset" : """00683280-v""", "def" : """accept as true""", "freq" : """118""" },
-    { "synset" : """00683280-v""", "def" : """take to be true""", "freq" : """118""" },
-    { "synset" : """02927512-a""", "def" : """of or relating to the United States of America or its people or language or culture""", "freq" : """117""" },
-    { "synset" : """00047534-r""", "def" : """in addition""", "freq" : """117""" },
-    { "synset" : """00118032-r""", "def" : """in that case or as a consequence""", "freq" : """117""" },
-    { "synset" : """06286395-n""", "def" : """a unit of language that native speakers can identify""", "freq" : """117""" },
-    { "synset" : """00182406-v""", "def" : """make an addition (to)""", "freq" : """116""" },
-    { "synset" : """00182406-v""", "def" : """join or combine or unite with others""", "freq" : """116""" },
-    { "synset" : """00182406-v""", "def" : """increase the quality, quantity, size or scope of""", "freq" : """116""" },
-    { "synset" : """02238085-v""", "def" : """come into possession of""", "freq" : """116""" },
-    { "synset" : """04105893-n""", "def" : """an area within a building enclosed by walls and floor and ceiling""", "freq" : """116""" },
-    { "synset" : """00625119-v""", "def" : """interpret something that is written or printed""", "freq" : """115""" },
-    { "synset" : """01386883-a""", "def" : """relatively large in size or number or extent""", "freq" : """114""" },
-    { "synset" : """01386883-a""", "def" : """larger than others of its kind""", "freq" : """114""" },
-    { "synset" : """15122231-n""", "def" : """an indefinite period (usually marked by specific attributes or activities)""", "freq" : """114""" },
-    { "synset" : """05216365-n""", "def" : """the entire structure of an organism (an animal, plant, or human being)""", "freq" : """113""" },
-    { "synset" : """13809207-n""", "def" : """something determined in relation to something that includes it""", "freq" : """113""" },
-    { "synset" : """00138611-r""", "def" : """with considerable certainty""", "freq" : """112""" },
-    { "synset" : """00138611-r""", "def" : """without much doubt""", "freq" : """112""" },
-    { "synset" : """01090335-v""", "def" : """be engaged in a fight""", "freq" : """112""" },
-    { "synset" : """01090335-v""", "def" : """carry on a fight""", "freq" : """112""" },
-    { "synset" : """01698271-v""", "def" : """produce a literary work""", "freq" : """112""" },
-    { "synset" : """00628491-v""", "def" : """use or exercise the mind or one's power of reason in order to make inferences, decisions, or arrive at a solution or judgments""", "freq" : """111""" },
-    { "synset" : """02004874-v""", "def" : """go or come back to place, condition, or activity where one has been before""", "freq" : """111""" },
-    { "synset" : """02629535-v""", "def" : """include or contain""", "freq" : """111""" },
-    { "synset" : """02629535-v""", "def" : """have as a component""", "freq" : """111""" },
-    { "synset" : """00588888-v""", "def" : """know and comprehend the nature or meaning of""", "freq" : """110""" },
-    { "synset" : """01645601-v""", "def" : """give rise to""", "freq" : """110""" },
-    { "synset" : """01645601-v""", "def" : """cause to happen or occur, not always intentionally""", "freq" : """110""" },
-    { "synset" : """01835496-v""", "def" : """change location""", "freq" : """110""" },
-    { "synset" : """01835496-v""", "def" : """move, travel, or proceed, also metaphorically""", "freq" : """110""" },
-    { "synset" : """02627934-v""", "def" : """require as useful, just, or proper""", "freq" : """110""" },
-    { "synset" : """00514884-a""", "def" : """including all components without exception""", "freq" : """109""" },
-    { "synset" : """00514884-a""", "def" : """being one unit or constituting the full amount or extent or duration""", "freq" : """109""" },
-    { "synset" : """00514884-a""", "def" : """complete""", "freq" : """109""" },
-    { "synset" : """01730329-a""", "def" : """immediately past""", "freq" : """109""" },
-    { "synset" : """01730329-a""", "def" : """last""", "freq" : """109""" },
-    { "synset" : """00939277-v""", "def" : """make plain and comprehensible""", "freq" : """109""" },
-    { "synset" : """01643620-a""", "def" : """(used especially of persons) having lived for a relatively long time or attained a specific age""", "freq" : """108""" },
-    { "synset" : """02202146-a""", "def" : """coming next after the first in position in space or time or degree or magnitude""", "freq" : """108""" },
-    { "synset" : """00962447-v""", "def" : """exchange thoughts""", "freq" : """108""" },
-    { "synset" : """00962447-v""", "def" : """talk with""", "freq" : """108""" },
-    { "synset" : """08654360-n""", "def" : """the territory occupied by one of the constituent administrative districts of a nation""", "freq" : """108""" },
-    { "synset" : """01382086-a""", "def" : """above average in size or number or quantity or magnitude or extent""", "freq" : """107""" },
-    { "synset" : """01646941-a""", "def" : """(used of living things especially persons) in an early period of life or development or growth""", "freq" : """107""" },
-    { "synset" : """02186338-a""", "def" : """used of a single unit or thing""", "freq" : """107""" },
-    { "synset" : """02186338-a""", "def" : """not two or more""", "freq" : """107""" },
-    { "synset" : """00031798-r""", "def" : """prior to a specified or implied time""", "freq" : """107""" },
-    { "synset" : """00061203-r""", "def" : """happening at a time subsequent to a reference time""", "freq" : """107""" },
-    { "synset" : """00146387-r""", "def" : """at any time""", "freq" : """107""" },
-    { "synset" : """00690614-v""", "def" : """deem to be""", "freq" : """107""" },
-    { "synset" : """00918872-v""", "def" : """establish after a calculation, investigation, experiment, survey, or study""", "freq" : """107""" },
-    { "synset" : """13104059-n""", "def" : """a tall perennial woody plant having a main trunk and branches forming a distinct elevated crown""", "freq" : """107""" },
-    { "synset" : """13104059-n""", "def" : """includes both gymnosperms and angiosperms""", "freq" : """107""" },
-    { "synset" : """00607780-v""", "def" : """recall knowledge from memory""", "freq" : """106""" },
-    { "synset" : """00607780-v""", "def" : """have a recollection""", "freq" : """106""" },
-    { "synset" : """01926311-v""", "def" : """move fast by using one's feet, with one foot off the ground at any given time""", "freq" : """106""" },
-    { "synset" : """05898568-n""", "def" : """a series of steps to be carried out or goals to be accomplished""", "freq" : """106""" },
-    { "synset" : """01433493-a""", "def" : """primarily spatial sense""", "freq" : """105""" },
-    { "synset" : """01433493-a""", "def" : """of relatively great or greater than average spatial extension or extension as specified""", "freq" : """105""" },
-    { "synset" : """05563770-n""", "def" : """a human limb""", "freq" : """104""" },
-    { "synset" : """05563770-n""", "def" : """technically the part of the superior limb between the shoulder and the elbow but commonly used to refer to the whole superior limb""", "freq" : """104""" },
-    { "synset" : """02186750-a""", "def" : """being one more than four""", "freq" : """103""" },
-    { "synset" : """01323958-v""", "def" : """cause to die""", "freq" : """103""" },
-    { "synset" : """01323958-v""", "def" : """put to death, usually intentionally or knowingly""", "freq" : """103""" },
-    { "synset" : """02020590-v""", "def" : """reach a destination, either real or abstract""", "freq" : """103""" },
-    { "synset" : """02374451-n""", "def" : """solid-hoofed herbivorous quadruped domesticated since prehistoric times ❲Equus caballus❳""", "freq" : """103""" },
-    { "synset" : """08524735-n""", "def" : """a large and densely populated urban area""", "freq" : """103""" },
-    { "synset" : """08524735-n""", "def" : """may include several independent administrative districts""", "freq" : """103""" },
-    { "synset" : """15169873-n""", "def" : """any period of seven consecutive days""", "freq" : """103""" },
-    { "synset" : """15205532-n""", "def" : """a period of 100 years""", "freq" : """103""" },
-    { "synset" : """00422090-v""", "def" : """come into sight or view""", "freq" : """102""" },
-    { "synset" : """00429060-v""", "def" : """cut down on""", "freq" : """102""" },
-    { "synset" : """00429060-v""", "def" : """make a reduction in""", "freq" : """102""" },
-    { "synset" : """02207206-v""", "def" : """obtain by purchase""", "freq" : """102""" },
-    { "synset" : """02207206-v""", "def" : """acquire by means of a financial transaction""", "freq" : """102""" },
-    { "synset" : """06634376-n""", "def" : """a message received and understood""", "freq" : """102""" },
-    { "synset" : """00145713-r""", "def" : """as much as necessary""", "freq" : """101""" },
-    { "synset" : """11410625-n""", "def" : """a phenomenon that follows and is caused by some previous phenomenon""", "freq" : """101""" },
-    { "synset" : """02526085-v""", "def" : """to gain with effort""", "freq" : """100""" },
-    { "synset" : """02603699-v""", "def" : """have an existence, be extant""", "freq" : """100""" },
-    { "synset" : """02637938-v""", "def" : """stay in one place and anticipate or expect something""", "freq" : """100""" },
-    { "synset" : """08050678-n""", "def" : """the organization that is the governing authority of a political unit""", "freq" : """100""" },
-    { "synset" : """10332385-n""", "def" : """a woman who has given birth to a child (also used as a term of address to your mother)""", "freq" : """100""" },
-    { "synset" : """00021878-r""", "def" : """on certain occasions or in certain cases but not always""", "freq" : """99""" },
-    { "synset" : """00095320-r""", "def" : """spatially or metaphorically from a higher to a lower level or position""", "freq" : """98""" },
-    { "synset" : """00118869-r""", "def" : """on one occasion""", "freq" : """98""" },
-    { "synset" : """01188725-v""", "def" : """have need of""", "freq" : """98""" },
-    { "synset" : """01493741-v""", "def" : """cause to be in a certain state""", "freq" : """98""" },
-    { "synset" : """01493741-v""", "def" : """cause to be in a certain relation""", "freq" : """98""" },
-    { "synset" : """02708420-v""", "def" : """pass time in a specific way""", "freq" : """98""" },
-    { "synset" : """03221720-n""", "def" : """a swinging or sliding barrier that will close the entrance to a room or building or vehicle""", "freq" : """98""" },
-    { "synset" : """02186470-a""", "def" : """being one more than one""", "freq" : """96""" },
-    { "synset" : """00106921-r""", "def" : """under normal conditions""", "freq" : """96""" },
-    { "synset" : """02199590-v""", "def" : """transfer possession of something concrete or abstract to somebody""", "freq" : """96""" },
-    { "synset" : """06290637-n""", "def" : """the phonological or orthographic sound or appearance of a word that can be used to describe or identify something""", "freq" : """96""" },
-    { "synset" : """01638438-a""", "def" : """of long duration""", "freq" : """95""" },
-    { "synset" : """01638438-a""", "def" : """not new""", "freq" : """95""" },
-    { "synset" : """00059086-r""", "def" : """to a great degree or extent""", "freq" : """95""" },
-    { "synset" : """00158309-r""", "def" : """indicating exactness or preciseness""", "freq" : """95""" },
-    { "synset" : """02296726-v""", "def" : """make available or accessible, provide or furnish""", "freq" : """95""" },
-    { "synset" : """02372605-v""", "def" : """follow a procedure or take a course""", "freq" : """95""" },
-    { "synset" : """05660268-n""", "def" : """a way of doing something, especially a systematic way""", "freq" : """95""" },
-    { "synset" : """05660268-n""", "def" : """implies an orderly logical arrangement (usually in steps)""", "freq" : """95""" },
-    { "synset" : """00227507-a""", "def" : """having the most positive qualities""", "freq" : """94""" },
-    { "synset" : """00993014-v""", "def" : """communicate or express by writing""", "freq" : """94""" },
-    { "synset" : """01617192-v""", "def" : """make or cause to be or to become""", "freq" : """94""" },
-    { "synset" : """00037396-n""", "def" : """something done (usually as opposed to something said)""", "freq" : """94""" },
-    { "synset" : """04096066-n""", "def" : """an open way (generally public) for travel or transportation""", "freq" : """94""" },
-    { "synset" : """06333653-n""", "def" : """a language unit by which a person or thing is known""", "freq" : """94""" },
-    { "synset" : """15113229-n""", "def" : """an amount of time""", "freq" : """94""" },
-    { "synset" : """00955148-v""", "def" : """mean or intend to express or convey""", "freq" : """93""" },
-    { "synset" : """02599636-v""", "def" : """carry out""", "freq" : """92""" },
-    { "synset" : """15227846-n""", "def" : """a period of time equal to 1/24th of a day""", "freq" : """92""" },
-    { "synset" : """00183053-a""", "def" : """obtainable or accessible and ready for use or service""", "freq" : """91""" },
-    { "synset" : """00075161-r""", "def" : """in or to or toward a former location""", "freq" : """91""" },
-    { "synset" : """00108773-r""", "def" : """in this circumstance or respect or on this point or detail""", "freq" : """91""" },
-    { "synset" : """01028748-v""", "def" : """assign a specified (usually proper) name to""", "freq" : """91""" },
-    { "synset" : """05011790-n""", "def" : """the degree of hotness or coldness of a body or environment (corresponding to its molecular activity)""", "freq" : """91""" },
-    { "synset" : """08649345-n""", "def" : """a place within a region identified relative to a center or reference location""", "freq" : """91""" },
-    { "synset" : """00043003-r""", "def" : """from that fact or reason or as a result""", "freq" : """90""" },
-    { "synset" : """00597915-v""", "def" : """gain knowledge or skills""", "freq" : """90""" },
-    { "synset" : """00575741-n""", "def" : """activity directed toward making or doing something""", "freq" : """90""" },
-    { "synset" : """00644503-n""", "def" : """a detailed critical inspection""", "freq" : """90""" },
-    { "synset" : """00947128-n""", "def" : """the act of using""", "freq" : """90""" },
-    { "synset" : """04362025-n""", "def" : """the outer boundary of an artifact or a material layer constituting or resembling such a boundary""", "freq" : """90""" },
-    { "synset" : """09536058-n""", "def" : """the supernatural being conceived as the perfect and omnipotent and omniscient originator and ruler of the universe""", "freq" : """90""" },
-    { "synset" : """09536058-n""", "def" : """the object of worship in monotheistic religions""", "freq" : """90""" },
-    { "synset" : """02635189-v""", "def" : """have as a logical consequence""", "freq" : """89""" },
-    { "synset" : """05563266-n""", "def" : """the part of the leg of a human being below the ankle joint""", "freq" : """89""" },
-    { "synset" : """02064745-a""", "def" : """unlike in nature or quality or form or degree""", "freq" : """88""" },
-    { "synset" : """00043003-r""", "def" : """from that fact or reason or as a result""", "freq" : """88""" },
-    { "synset" : """02690708-v""", "def" : """be located or situated somewhere""", "freq" : """88""" },
-    { "synset" : """02690708-v""", "def" : """occupy a certain position""", "freq" : """88""" },
-    { "synset" : """07966140-n""", "def" : """an extended social group having a distinctive cultural and economic organization""", "freq" : """88""" },
-    { "synset" : """01101391-a""", "def" : """applying to all or most members of a category or group""", "freq" : """87""" },
-    { "synset" : """00117903-r""", "def" : """at that time""", "freq" : """87""" },
-    { "synset" : """10289039-n""", "def" : """the generic use of the word to refer to any human being""", "freq" : """87""" },
-    { "synset" : """00156601-v""", "def" : """become bigger or greater in amount""", "freq" : """86""" },
-    { "synset" : """00173338-v""", "def" : """remove something concrete, as by lifting, pushing, or taking off, or remove something abstract""", "freq" : """86""" },
-    { "synset" : """00829107-v""", "def" : """impart skills or knowledge to""", "freq" : """86""" },
-    { "synset" : """00941990-v""", "def" : """express in speech""", "freq" : """86""" },
-    { "synset" : """02285629-v""", "def" : """come upon after searching""", "freq" : """86""" },
-    { "synset" : """02285629-v""", "def" : """find the location of something that was missed or lost""", "freq" : """86""" },
-    { "synset" : """02445925-v""", "def" : """work in a specific place, with a specific subject, or in a specific function""", "freq" : """86""" },
-    { "synset" : """04334599-n""", "def" : """a thoroughfare (usually including sidewalks) that is lined with buildings""", "freq" : """86""" },
-    { "synset" : """09334396-n""", "def" : """the solid part of the earth's surface""", "freq" : """86""" },
-    { "synset" : """10317007-n""", "def" : """any person in the armed services who holds a position of authority or command""", "freq" : """86""" },
-    { "synset" : """15165289-n""", "def" : """the time period between dawn and noon""", "freq" : """86""" },
-    { "synset" : """15244650-n""", "def" : """a particular point in time""", "freq" : """86""" },
-    { "synset" : """00770437-v""", "def" : """cause to do""", "freq" : """85""" },
-    { "synset" : """00770437-v""", "def" : """cause to act in a specified manner""", "freq" : """85""" },
-    { "synset" : """02016523-v""", "def" : """to come or go into""", "freq" : """85""" },
-    { "synset" : """05817396-n""", "def" : """a piece of information about circumstances that exist or events that have occurred""", "freq" : """85""" },
-    { "synset" : """02134672-v""", "def" : """seem to be true, probable, or apparent""", "freq" : """84""" },
-    { "synset" : """02612762-v""", "def" : """be present at (meetings, church services, university), etc.""", "freq" : """84""" },
-    { "synset" : """00786195-n""", "def" : """earnest and conscientious activity intended to do or accomplish something""", "freq" : """84""" },
-    { "synset" : """02460502-a""", "def" : """consistent with fact or reality""", "freq" : """83""" },
-    { "synset" : """02460502-a""", "def" : """not false""", "freq" : """83""" },
-    { "synset" : """00052374-v""", "def" : """be dressed in""", "freq" : """83""" },
-    { "synset" : """11410625-n""", "def" : """a phenomenon that follows and is caused by some previous phenomenon""", "freq" : """83""" },
-    { "synset" : """15234764-n""", "def" : """a unit of time equal to 60 seconds or 1/60th of an hour""", "freq" : """83""" },
-    { "synset" : """00074095-r""", "def" : """in the past""", "freq" : """82""" },
-    { "synset" : """00120796-v""", "def" : """cause to move""", "freq" : """82""" },
-    { "synset" : """00120796-v""", "def" : """cause to be in a certain position or condition""", "freq" : """82""" },
-    { "synset" : """02132745-v""", "def" : """look at with fixed eyes""", "freq" : """82""" },
-    { "synset" : """04546855-n""", "def" : """an architectural partition with a height and length greater than its thickness""", "freq" : """82""" },
-    { "synset" : """04546855-n""", "def" : """used to divide or enclose an area or to support another structure""", "freq" : """82""" },
-    { "synset" : """01580050-a""", "def" : """absolutely essential""", "freq" : """81""" },
-    { "synset" : """02798370-a""", "def" : """relating to human society and its members""", "freq" : """81""" },
-    { "synset" : """00056729-r""", "def" : """in the slightest degree or in any respect""", "freq" : """81""" },
-    { "synset" : """00339934-v""", "def" : """come to pass""", "freq" : """81""" },
-    { "synset" : """07193596-n""", "def" : """an instance of questioning""", "freq" : """81""" },
-    { "synset" : """13650045-n""", "def" : """a linear unit of length equal to 12 inches or a third of a yard""", "freq" : """81""" },
-    { "synset" : """01552885-a""", "def" : """a quantifier that can be used with count nouns and is often preceded by `a'""", "freq" : """80""" },
-    { "synset" : """01552885-a""", "def" : """a small but indefinite number""", "freq" : """80""" },
-    { "synset" : """02062670-a""", "def" : """closely similar or comparable in kind or quality or quantity or degree""", "freq" : """80""" },
-    { "synset" : """00033663-r""", "def" : """to a small degree""", "freq" : """80""" },
-    { "synset" : """00033663-r""", "def" : """somewhat""", "freq" : """80""" },
-    { "synset" : """00674607-v""", "def" : """pick out, select, or choose from a number of alternatives""", "freq" : """80""" },
-    { "synset" : """10129825-n""", "def" : """a young woman""", "freq" : """80""" },
-    { "synset" : """00812952-a""", "def" : """at or near the beginning of a period of time or course of events or before the usual or expected time""", "freq" : """79""" },
-    { "synset" : """00096333-r""", "def" : """spatially or metaphorically from a lower to a higher position""", "freq" : """79""" },
-    { "synset" : """00118363-r""", "def" : """in a manner that facilitates""", "freq" : """79""" },
-    { "synset" : """00028565-v""", "def" : """change one's facial expression by spreading the lips, often to signal pleasure""", "freq" : """79""" },
-    { "synset" : """01951480-v""", "def" : """cause to go somewhere""", "freq" : """79""" },
-    { "synset" : """02681795-v""", "def" : """keep in a certain state, position, or activity""", "freq" : """79""" },
-    { "synset" : """02681795-v""", "def" : """e.g.,""", "freq" : """79""" },
-    { "synset" : """00161630-r""", "def" : """without speed""", "freq" : """78""" },
-    { "synset" : """01645601-v""", "def" : """give rise to""", "freq" : """78""" },
-    { "synset" : """01645601-v""", "def" : """cause to happen or occur, not always intentionally""", "freq" : """78""" },
-    { "synset" : """02235842-v""", "def" : """convey or reveal information""", "freq" : """78""" },
-    { "synset" : """00973077-n""", "def" : """the waging of armed conflict against an enemy""", "freq" : """78""" },
-    { "synset" : """04981941-n""", "def" : """the distinctive quality or pitch or condition of a person's speech""", "freq" : """78""" },
-    { "synset" : """01593649-a""", "def" : """conforming with or constituting a norm or standard or level or type or social norm""", "freq" : """77""" },
-    { "synset" : """01593649-a""", "def" : """not abnormal""", "freq" : """77""" },
-    { "synset" : """02186580-a""", "def" : """being one more than two""", "freq" : """77""" },
-    { "synset" : """02186833-a""", "def" : """denoting a quantity consisting of six items or units""", "freq" : """77""" },
-    { "synset" : """00987071-v""", "def" : """give a description of""", "freq" : """77""" },
-    { "synset" : """02150510-v""", "def" : """look attentively""", "freq" : """77""" },
-    { "synset" : """08664443-n""", "def" : """a point located with respect to surface features of some region""", "freq" : """77""" },
-    { "synset" : """13384557-n""", "def" : """the most common medium of exchange""", "freq" : """77""" },
-    { "synset" : """13384557-n""", "def" : """functions as legal tender""", "freq" : """77""" },
-    { "synset" : """01557120-a""", "def" : """quantifier meaning the greatest in number""", "freq" : """76""" },
-    { "synset" : """00011093-r""", "def" : """in a good or proper or satisfactory manner or to a high standard""", "freq" : """76""" },
-    { "synset" : """00117620-r""", "def" : """subsequently or soon afterward""", "freq" : """76""" },
-    { "synset" : """00594337-v""", "def" : """be familiar or acquainted with a person or an object""", "freq" : """76""" },
-    { "synset" : """01824736-v""", "def" : """prefer or wish to do something""", "freq" : """76""" },
-    { "synset" : """00582388-n""", "def" : """the principal activity in your life that you do to earn money""", "freq" : """76""" },
-    { "synset" : """04599396-n""", "def" : """a product produced or accomplished through the effort or activity or agency of a person or thing""", "freq" : """76""" },
-    { "synset" : """04599396-n""", "def" : """any form of work to be done or undertaken""", "freq" : """76""" },
-    { "synset" : """08462320-n""", "def" : """a collection of facts from which conclusions may be drawn""", "freq" : """76""" },
-    { "synset" : """09178999-n""", "def" : """a rational motive for a belief or action""", "freq" : """76""" },
-    { "synset" : """00636888-v""", "def" : """use as a basis for""", "freq" : """75""" },
-    { "synset" : """00636888-v""", "def" : """found on""", "freq" : """75""" },
-    { "synset" : """00953216-v""", "def" : """narrate or give a detailed account of""", "freq" : """75""" },
-    { "synset" : """02434976-v""", "def" : """become part of""", "freq" : """75""" },
-    { "synset" : """02434976-v""", "def" : """become a member of a group or organization""", "freq" : """75""" },
-    { "synset" : """04090263-n""", "def" : """a shoulder firearm with a long barrel and a rifled bore""", "freq" : """75""" },
-    { "synset" : """04924103-n""", "def" : """how long something has existed""", "freq" : """75""" },
-    { "synset" : """05560787-n""", "def" : """a human limb""", "freq" : """75""" },
-    { "synset" : """05560787-n""", "def" : """commonly used to refer to a whole limb but technically only the part of the limb between the knee and ankle""", "freq" : """75""" },
-    { "synset" : """05982152-n""", "def" : """an anticipated outcome that is intended or that guides your planned actions""", "freq" : """75""" },
-    { "synset" : """13275847-n""", "def" : """the total spent for goods or services including money and time and labor""", "freq" : """75""" },
-    { "synset" : """00493460-a""", "def" : """being or characteristic of a single thing or person""", "freq" : """74""" },
-    { "synset" : """00974367-v""", "def" : """make known""", "freq" : """74""" },
-    { "synset" : """00974367-v""", "def" : """make an announcement""", "freq" : """74""" },
-    { "synset" : """01998432-v""", "def" : """to travel behind, go after, come after""", "freq" : """74""" },
-    { "synset" : """02267989-v""", "def" : """require (time or space)""", "freq" : """74""" },
-    { "synset" : """02413480-v""", "def" : """exert oneself by doing mental or physical work for a purpose or out of necessity""", "freq" : """74""" },
-    { "synset" : """02413480-v""", "def" : """work""", "freq" : """74""" },
-    { "synset" : """02202307-a""", "def" : """coming next after the second and just before the fourth in position""", "freq" : """73""" },
-    { "synset" : """02385102-a""", "def" : """great in vertical dimension""", "freq" : """73""" },
-    { "synset" : """02385102-a""", "def" : """high in stature""", "freq" : """73""" },
-    { "synset" : """00004722-r""", "def" : """and nothing more""", "freq" : """73""" },
-    { "synset" : """00146926-r""", "def" : """in such a condition or manner, especially as expressed or implied""", "freq" : """73""" },
-    { "synset" : """00644583-v""", "def" : """consider in detail and subject to an analysis in order to discover essential features or meaning""", "freq" : """73""" },
-    { "synset" : """01009240-v""", "def" : """express in words""", "freq" : """73""" },
-    { "synset" : """01777210-v""", "def" : """find enjoyable or agreeable""", "freq" : """73""" },
-    { "synset" : """01999798-v""", "def" : """take somebody somewhere""", "freq" : """73""" },
-    { "synset" : """02242464-v""", "def" : """exchange or deliver for money or its equivalent""", "freq" : """73""" },
-    { "synset" : """00953559-n""", "def" : """a hostile meeting of opposing military forces in the course of a war""", "freq" : """73""" },
-    { "synset" : """04748836-n""", "def" : """the quality of being unlike or dissimilar""", "freq" : """73""" },
-    { "synset" : """07519253-n""", "def" : """an emotion experienced in anticipation of some specific pain or danger (usually accompanied by a desire to flee or fight)""", "freq" : """73""" },
-    { "synset" : """10020890-n""", "def" : """a licensed medical practitioner""", "freq" : """73""" },
-    { "synset" : """10405694-n""", "def" : """a person who requires medical care""", "freq" : """73""" },
-    { "synset" : """14580897-n""", "def" : """the tangible substance that goes into the makeup of a physical object""", "freq" : """73""" },
-    { "synset" : """15246853-n""", "def" : """an indefinitely short time""", "freq" : """73""" },
-    { "synset" : """00095280-a""", "def" : """no longer having or seeming to have or expecting to have life""", "freq" : """72""" },
-    { "synset" : """00689344-v""", "def" : """judge or regard""", "freq" : """72""" },
-    { "synset" : """00689344-v""", "def" : """look upon""", "freq" : """72""" },
-    { "synset" : """00689344-v""", "def" : """judge""", "freq" : """72""" },
-    { "synset" : """01449974-v""", "def" : """move while supporting, either in a vehicle or in one's hands or on one's body""", "freq" : """72""" },
-    { "synset" : """03467984-n""", "def" : """a weapon that discharges a missile at high velocity (especially from a metal tube or barrel)""", "freq" : """72""" },
-    { "synset" : """04587648-n""", "def" : """a framework of wood or metal that contains a glass windowpane and is built into a wall or roof to admit light or air""", "freq" : """72""" },
-    { "synset" : """07308889-n""", "def" : """an occurrence of something""", "freq" : """72""" },
-    { "synset" : """10080869-n""", "def" : """a male parent (also used as a term of address to your father)""", "freq" : """72""" },
-    { "synset" : """13920835-n""", "def" : """a state at a particular time""", "freq" : """72""" },
-    { "synset" : """13943968-n""", "def" : """a special situation""", "freq" : """72""" },
-    { "synset" : """01554510-a""", "def" : """small in quantity or degree""", "freq" : """71""" },
-    { "synset" : """01554510-a""", "def" : """not much or almost none or (with `a') at least some""", "freq" : """71""" },
-    { "synset" : """01554510-a""", "def" : """quantifier, singular pronoun""", "freq" : """71""" },
-    { "synset" : """02187296-a""", "def" : """being one more than nine""", "freq" : """71""" },
-    { "synset" : """01100145-v""", "def" : """be the winner in a contest or competition""", "freq" : """71""" },
-    { "synset" : """01100145-v""", "def" : """be victorious""", "freq" : """71""" },
-    { "synset" : """00893955-n""", "def" : """activity leading to skilled behavior""", "freq" : """71""" },
-    { "synset" : """02958343-n""", "def" : """a motor vehicle with four wheels""", "freq" : """71""" },
-    { "synset" : """02958343-n""", "def" : """usually propelled by an internal combustion engine""", "freq" : """71""" },
-    { "synset" : """02991711-n""", "def" : """any small compartment""", "freq" : """71""" },
-    { "synset" : """09044862-n""", "def" : """North American republic containing 50 states - 48 conterminous states in North America plus Alaska in northwest North America and the Hawaiian Islands in the Pacific Ocean""", "freq" : """71""" },
-    { "synset" : """09044862-n""", "def" : """achieved independence in 1776""", "freq" : """71""" },
-    { "synset" : """00001740-a""", "def" : """having the necessary means or skill or know-how or authority to do something""", "freq" : """70""" },
-    { "synset" : """00232936-r""", "def" : """from a particular thing or place or position""", "freq" : """70""" },
-    { "synset" : """00125841-v""", "def" : """pass into a condition gradually, take on a specific property or attribute""", "freq" : """70""" },
-    { "synset" : """00125841-v""", "def" : """become""", "freq" : """70""" },
-    { "synset" : """01072949-v""", "def" : """participate in games or sport""", "freq" : """70""" },
-    { "synset" : """05098942-n""", "def" : """the physical magnitude of something (how big it is)""", "freq" : """70""" },
-    { "synset" : """05833840-n""", "def" : """the content of cognition""", "freq" : """70""" },
-    { "synset" : """05833840-n""", "def" : """the main thing you are thinking about""", "freq" : """70""" },
-    { "synset" : """13279262-n""", "def" : """something that remunerates""", "freq" : """70""" },
-    { "synset" : """15123115-n""", "def" : """a point or period in time""", "freq" : """70""" },
-    { "synset" : """15209413-n""", "def" : """one of the twelve divisions of the calendar year""", "freq" : """70""" },
-    { "synset" : """00230335-a""", "def" : """superior to another (of the same class or set or kind) in excellence or quality or desirability or suitability""", "freq" : """69""" },
-    { "synset" : """00230335-a""", "def" : """more highly skilled than another""", "freq" : """69""" },
-    { "synset" : """02187296-a""", "def" : """being one more than nine""", "freq" : """69""" },
-    { "synset" : """01752495-v""", "def" : """bring forth or yield""", "freq" : """69""" },
-    { "synset" : """05093890-n""", "def" : """a position on a scale of intensity or amount or quality""", "freq" : """69""" },
-    { "synset" : """07110615-n""", "def" : """the sound made by the vibration of vocal folds modified by the resonance of the vocal tract""", "freq" : """69""" },
-    { "synset" : """15262921-n""", "def" : """the present time or age""", "freq" : """69""" },
-    { "synset" : """00060939-r""", "def" : """earlier in time""", "freq" : """68""" },
-    { "synset" : """00060939-r""", "def" : """previously""", "freq" : """68""" },
-    { "synset" : """00099527-r""", "def" : """used to form the comparative of some adjectives and adverbs, indicates that the adjective or adverb is less of something""", "freq" : """68""" },
-    { "synset" : """00632236-v""", "def" : """take to be the case or to be true""", "freq" : """68""" },
-    { "synset" : """00632236-v""", "def" : """accept without verification or proof""", "freq" : """68""" },
-    { "synset" : """00921300-v""", "def" : """be a signal for or a symptom of""", "freq" : """68""" },
-    { "synset" : """01027174-v""", "def" : """state or say further""", "freq" : """68""" },
-    { "synset" : """08168978-n""", "def" : """a politically organized body of people under a single government""", "freq" : """68""" },
-    { "synset" : """10193967-n""", "def" : """a married man""", "freq" : """68""" },
-    { "synset" : """10193967-n""", "def" : """a woman's partner in marriage""", "freq" : """68""" },
-    { "synset" : """15286249-n""", "def" : """a magnitude or frequency relative to a time unit""", "freq" : """68""" },
-    { "synset" : """00520214-a""", "def" : """having every necessary or normal part or component or step""", "freq" : """67""" },
-    { "synset" : """01556355-a""", "def" : """quantifier meaning greater in number""", "freq" : """67""" },
-    { "synset" : """00015388-n""", "def" : """a living organism characterized by voluntary movement""", "freq" : """67""" },
-    { "synset" : """00181781-n""", "def" : """a vote to select the winner of a position or political office""", "freq" : """67""" },
-    { "synset" : """07085375-n""", "def" : """the relative prominence of a syllable or musical note (especially with regard to stress or pitch)""", "freq" : """67""" },
-    { "synset" : """08223802-n""", "def" : """a group of people living in a particular local area""", "freq" : """67""" },
-    { "synset" : """08665504-n""", "def" : """an urban area with a fixed boundary that is smaller than a city""", "freq" : """67""" },
-    { "synset" : """10307234-n""", "def" : """one of the persons who compose a social group (especially individuals who have joined and participate in a group organization)""", "freq" : """67""" },
-    { "synset" : """10665698-n""", "def" : """a learner who is enrolled in an educational institution""", "freq" : """67""" },
-    { "synset" : """14483917-n""", "def" : """a possibility due to a favorable combination of circumstances""", "freq" : """67""" },
-    { "synset" : """00037641-r""", "def" : """in truth (often tends to intensify)""", "freq" : """66""" },
-    { "synset" : """00084223-r""", "def" : """to a distinctly greater extent or degree than is common""", "freq" : """66""" },
-    { "synset" : """00205885-v""", "def" : """to make better""", "freq" : """66""" },
-    { "synset" : """01346003-v""", "def" : """cause to open or to become open""", "freq" : """66""" },
-    { "synset" : """01636397-v""", "def" : """form a mental image of something that is not present or that is not the case""", "freq" : """66""" },
-    { "synset" : """02106006-v""", "def" : """perceive by a physical sensation, e.g., coming from the skin or muscles""", "freq" : """66""" },
-    { "synset" : """02529284-v""", "def" : """fail to do something""", "freq" : """66""" },
-    { "synset" : """02529284-v""", "def" : """leave something undone""", "freq" : """66""" },
-    { "synset" : """02714315-n""", "def" : """a positively charged electrode by which electrons leave an electrical device""", "freq" : """66""" },
-    { "synset" : """08078020-n""", "def" : """a social unit living together""", "freq" : """66""" },
-    { "synset" : """08190482-n""", "def" : """an opposing military force""", "freq" : """66""" },
-    { "synset" : """13927383-n""", "def" : """the general state of things""", "freq" : """66""" },
-    { "synset" : """13927383-n""", "def" : """the combination of circumstances at a given time""", "freq" : """66""" },
-    { "synset" : """13963192-n""", "def" : """a characteristic state or mode of living""", "freq" : """66""" },
-    { "synset" : """02716739-a""", "def" : """of or relating to an economy, the system of production and management of material wealth""", "freq" : """65""" },
-    { "synset" : """00923793-v""", "def" : """indicate a place, direction, person, or thing""", "freq" : """65""" },
-    { "synset" : """00923793-v""", "def" : """either spatially or figuratively""", "freq" : """65""" },
-    { "synset" : """01216670-v""", "def" : """have or hold in one's hands or grip""", "freq" : """65""" },
-    { "synset" : """02423183-v""", "def" : """make it possible through a specific action or lack of action for something to happen""", "freq" : """65""" },
-    { "synset" : """05548840-n""", "def" : """the part of the body between the neck and the upper arm""", "freq" : """65""" },
-    { "synset" : """05839024-n""", "def" : """a category of things distinguished by some common characteristic or quality""", "freq" : """65""" },
-    { "synset" : """05856388-n""", "def" : """a numerical quantity measured or assigned or computed""", "freq" : """65""" },
-    { "synset" : """06193203-n""", "def" : """a complex mental state involving beliefs and feelings and values and dispositions to act in certain ways""", "freq" : """65""" },
-    { "synset" : """06624161-n""", "def" : """a written message addressed to a person or organization""", "freq" : """65""" },
-    { "synset" : """06999647-n""", "def" : """a diagram or picture illustrating textual material""", "freq" : """65""" },
-    { "synset" : """08630039-n""", "def" : """the extended spatial location of something""", "freq" : """65""" },
-    { "synset" : """09918248-n""", "def" : """a human offspring (son or daughter) of any age""", "freq" : """65""" },
-    { "synset" : """11495041-n""", "def" : """the force applied to a unit area of surface""", "freq" : """65""" },
-    { "synset" : """11495041-n""", "def" : """measured in pascals (SI unit) or in dynes (cgs unit)""", "freq" : """65""" },
-    { "synset" : """11508092-n""", "def" : """a cloud of fine particles suspended in a gas""", "freq" : """65""" },
-    { "synset" : """00061677-r""", "def" : """happening unexpectedly""", "freq" : """64""" },
-    { "synset" : """00031820-v""", "def" : """produce laughter""", "freq" : """64""" },
-    { "synset" : """00120796-v""", "def" : """cause to move""", "freq" : """64""" },
-    { "synset" : """00120796-v""", "def" : """cause to be in a certain position or condition""", "freq" : """64""" },
-    { "synset" : """00522751-v""", "def" : """receive a specified treatment (abstract)""", "freq" : """64""" },
-    { "synset" : """00817311-v""", "def" : """declare to be true or admit the existence or reality or truth of""", "freq" : """64""" },
-    { "synset" : """00965035-v""", "def" : """to give an account or representation of in words""", "freq" : """64""" },
-    { "synset" : """01822936-v""", "def" : """feel concern or interest""", "freq" : """64""" },
-    { "synset" : """02455407-v""", "def" : """follow with the eyes or the mind""", "freq" : """64""" },
-    { "synset" : """06481320-n""", "def" : """a database containing an ordered array of items (names or topics)""", "freq" : """64""" },
-    { "synset" : """13817526-n""", "def" : """a proportion in relation to a whole (which is usually the amount per hundred)""", "freq" : """64""" },
-    { "synset" : """00744916-a""", "def" : """not easy""", "freq" : """63""" },
-    { "synset" : """00744916-a""", "def" : """requiring great physical or mental effort to accomplish or comprehend or endure""", "freq" : """63""" },
-    { "synset" : """00112009-r""", "def" : """very""", "freq" : """63""" },
-    { "synset" : """00159040-r""", "def" : """as an example""", "freq" : """63""" },
-    { "synset" : """00613683-v""", "def" : """go and leave behind, either intentionally or by neglect or forgetfulness""", "freq" : """63""" },
-    { "synset" : """00664788-v""", "def" : """establish the validity of something, as by an example, explanation or experiment""", "freq" : """63""" },
-    { "synset" : """00815686-v""", "def" : """react verbally""", "freq" : """63""" },
-    { "synset" : """01023820-n""", "def" : """a particular course of action intended to achieve a result""", "freq" : """63""" },
-    { "synset" : """03956922-n""", "def" : """buildings for carrying on industrial labor""", "freq" : """63""" },
-    { "synset" : """05898568-n""", "def" : """a series of steps to be carried out or goals to be accomplished""", "freq" : """63""" },
-    { "synset" : """05946687-n""", "def" : """a strong belief in a supernatural power or powers that control human destiny""", "freq" : """63""" },
-    { "synset" : """13582013-n""", "def" : """a concept of quantity involving zero and units""", "freq" : """63""" },
-    { "synset" : """00749230-a""", "def" : """posing no difficulty""", "freq" : """62""" },
-    { "synset" : """00749230-a""", "def" : """requiring little effort""", "freq" : """62""" },
-    { "synset" : """00230746-v""", "def" : """become larger, greater, or bigger""", "freq" : """62""" },
-    { "synset" : """00230746-v""", "def" : """expand or gain""", "freq" : """62""" },
-    { "synset" : """00805376-v""", "def" : """be in accord""", "freq" : """62""" },
-    { "synset" : """00805376-v""", "def" : """be in agreement""", "freq" : """62""" },
-    { "synset" : """01024190-v""", "def" : """make reference to""", "freq" : """62""" },
-    { "synset" : """01733477-v""", "def" : """organize or be responsible for""", "freq" : """62""" },
-    { "synset" : """02410855-v""", "def" : """be employed""", "freq" : """62""" },
-    { "synset" : """02452885-v""", "def" : """keep from happening or arising""", "freq" : """62""" },
-    { "synset" : """02452885-v""", "def" : """make impossible""", "freq" : """62""" },
-    { "synset" : """00029378-n""", "def" : """something that happens at a given place and time""", "freq" : """62""" },
-    { "synset" : """03841666-n""", "def" : """place of business where professional or clerical duties are performed""", "freq" : """62""" },
-    { "synset" : """05190804-n""", "def" : """possession of controlling influence""", "freq" : """62""" },
-    { "synset" : """05682950-n""", "def" : """a sense of concern with and curiosity about someone or something""", "freq" : """62""" },
-    { "synset" : """05839024-n""", "def" : """a category of things distinguished by some common characteristic or quality""", "freq" : """62""" },
-    { "synset" : """00393105-a""", "def" : """being of the achromatic color of maximum lightness""", "freq" : """61""" },
-    { "synset" : """00393105-a""", "def" : """having little or no hue owing to reflection of almost all incident light""", "freq" : """61""" },
-    { "synset" : """02071420-a""", "def" : """marked by correspondence or resemblance""", "freq" : """61""" },
-    { "synset" : """02202047-a""", "def" : """indicating the beginning unit in a series""", "freq" : """61""" },
-    { "synset" : """00037226-r""", "def" : """in accordance with truth or fact or reality""", "freq" : """61""" },
-    { "synset" : """00084223-r""", "def" : """to a distinctly greater extent or degree than is common""", "freq" : """61""" },
-    { "synset" : """00101323-r""", "def" : """to a considerable degree""", "freq" : """61""" },
-    { "synset" : """00101323-r""", "def" : """very much""", "freq" : """61""" },
-    { "synset" : """00153263-v""", "def" : """make bigger or more""", "freq" : """61""" },
-    { "synset" : """00452512-v""", "def" : """make full, also in a metaphorical sense""", "freq" : """61""" },
-    { "synset" : """00610167-v""", "def" : """dismiss from the mind""", "freq" : """61""" },
-    { "synset" : """00610167-v""", "def" : """stop remembering""", "freq" : """61""" },
-    { "synset" : """01168468-v""", "def" : """take in solid food""", "freq" : """61""" },
-    { "synset" : """00172710-n""", "def" : """how a result is obtained or an end is achieved""", "freq" : """61""" },
-    { "synset" : """00884466-n""", "def" : """education imparted in a series of lessons or meetings""", "freq" : """61""" },
-    { "synset" : """05399847-n""", "def" : """the fluid (red in vertebrates) that is pumped through the body by the heart and contains plasma, blood cells, and platelets""", "freq" : """61""" },
-    { "synset" : """08191230-n""", "def" : """a permanent organization of the military land forces of a nation or state""", "freq" : """61""" },
-    { "synset" : """01731351-a""", "def" : """temporal sense""", "freq" : """60""" },
-    { "synset" : """01731351-a""", "def" : """intermediate between past and future""", "freq" : """60""" },
-    { "synset" : """01731351-a""", "def" : """now existing or happening or in consideration""", "freq" : """60""" },
-    { "synset" : """00033922-r""", "def" : """in the near future""", "freq" : """60""" },
-    { "synset" : """00104661-r""", "def" : """if nothing else""", "freq" : """60""" },
-    { "synset" : """00598954-v""", "def" : """get to know or become aware of, usually accidentally""", "freq" : """60""" },
-    { "synset" : """00746718-v""", "def" : """give instructions to or direct somebody to do something with authority""", "freq" : """60""" },
-    { "synset" : """01826723-v""", "def" : """expect and wish""", "freq" : """60""" },
-    { "synset" : """02169891-v""", "def" : """hear with intention""", "freq" : """60""" },
-    { "synset" : """06364641-n""", "def" : """creative writing of recognized artistic value""", "freq" : """60""" },
-    { "synset" : """08058098-n""", "def" : """an institution created to conduct business""", "freq" : """60""" },
-    { "synset" : """08082602-n""", "def" : """one of the groups of Christians who have their own beliefs and forms of worship""", "freq" : """60""" },
-    { "synset" : """08221897-n""", "def" : """a gathering of spectators or listeners at a (usually public) performance""", "freq" : """60""" },
-    { "synset" : """00097840-r""", "def" : """at or to or in the direction of one's home or family""", "freq" : """59""" },
-    { "synset" : """00098714-r""", "def" : """on the contrary""", "freq" : """59""" },
-    { "synset" : """00818974-v""", "def" : """be emphatic or resolute and refuse to budge""", "freq" : """59""" },
-    { "synset" : """00943837-v""", "def" : """give expression to""", "freq" : """59""" },
-    { "synset" : """02665617-v""", "def" : """bear a physical resemblance to""", "freq" : """59""" },
-    { "synset" : """02719399-v""", "def" : """have a tendency or disposition to do or be something""", "freq" : """59""" },
-    { "synset" : """02719399-v""", "def" : """be inclined""", "freq" : """59""" },
-    { "synset" : """00639556-n""", "def" : """the act of conducting a controlled test or investigation""", "freq" : """59""" },
-    { "synset" : """03028079-n""", "def" : """a place for public (especially Christian) worship""", "freq" : """59""" },
-    { "synset" : """05254795-n""", "def" : """a covering for the body (or parts of it) consisting of a dense growth of threadlike structures (as on the human head)""", "freq" : """59""" },
-    { "synset" : """05254795-n""", "def" : """helps to prevent heat loss""", "freq" : """59""" },
-    { "synset" : """01411451-a""", "def" : """has a good chance of being the case or of coming about""", "freq" : """58""" },
-    { "synset" : """01930512-a""", "def" : """completely prepared or in condition for immediate action or use or progress""", "freq" : """58""" },
-    { "synset" : """02321009-a""", "def" : """having strength or power greater than average or expected""", "freq" : """58""" },
-    { "synset" : """00102736-r""", "def" : """before anything else""", "freq" : """58""" },
-    { "synset" : """00014742-v""", "def" : """be asleep""", "freq" : """58""" },
-    { "synset" : """00674607-v""", "def" : """pick out, select, or choose from a number of alternatives""", "freq" : """58""" },
-    { "synset" : """00729378-v""", "def" : """have a wish or desire to know something""", "freq" : """58""" },
-    { "synset" : """01547001-v""", "def" : """be lying, be prostrate""", "freq" : """58""" },
-    { "synset" : """01547001-v""", "def" : """be in a horizontal position""", "freq" : """58""" },
-    { "synset" : """01552519-v""", "def" : """separate with or as if with an instrument""", "freq" : """58""" },
-    { "synset" : """01635432-v""", "def" : """imagine""", "freq" : """58""" },
-    { "synset" : """01635432-v""", "def" : """conceive of""", "freq" : """58""" },
-    { "synset" : """01635432-v""", "def" : """see in one's mind""", "freq" : """58""" },
-    { "synset" : """02005948-v""", "def" : """reach a destination""", "freq" : """58""" },
-    { "synset" : """02005948-v""", "def" : """arrive by movement or progress""", "freq" : """58""" },
-    { "synset" : """02617567-v""", "def" : """proceed or get along""", "freq" : """58""" },
-    { "synset" : """02633881-v""", "def" : """be shown or be found to be""", "freq" : """58""" },
-    { "synset" : """02697725-v""", "def" : """represent, as of a character on stage""", "freq" : """58""" },
-    { "synset" : """05665146-n""", "def" : """a practical method or art applied to some particular task""", "freq" : """58""" },
-    { "synset" : """06722453-n""", "def" : """a message that is stated or declared""", "freq" : """58""" },
-    { "synset" : """06722453-n""", "def" : """a communication (oral or written) setting forth particulars or facts etc""", "freq" : """58""" },
-    { "synset" : """15237250-n""", "def" : """the warmest season of the year""", "freq" : """58""" },
-    { "synset" : """15237250-n""", "def" : """in the northern hemisphere it extends from the summer solstice to the autumnal equinox""", "freq" : """58""" },
-    { "synset" : """01535709-a""", "def" : """belonging to the modern era""", "freq" : """57""" },
-    { "synset" : """01535709-a""", "def" : """since the Middle Ages""", "freq" : """57""" },
-    { "synset" : """00018781-r""", "def" : """to a degree (not used with a negative)""", "freq" : """57""" },
-    { "synset" : """00104345-r""", "def" : """not less than""", "freq" : """57""" },
-    { "synset" : """00300247-r""", "def" : """by chance""", "freq" : """57""" },
-    { "synset" : """00126264-v""", "def" : """cause to change""", "freq" : """57""" },
-    { "synset" : """00126264-v""", "def" : """make different""", "freq" : """57""" },
-    { "synset" : """00126264-v""", "def" : """cause a transformation""", "freq" : """57""" },
-    { "synset" : """00652900-v""", "def" : """examine and note the similarities or differences of""", "freq" : """57""" },
-    { "synset" : """00715239-v""", "def" : """come to believe on the basis of emotion, intuitions, or indefinite grounds""", "freq" : """57""" },
-    { "synset" : """00875394-v""", "def" : """make a proposal, declare a plan for something""", "freq" : """57""" },
-    { "synset" : """00918872-v""", "def" : """establish after a calculation, investigation, experiment, survey, or study""", "freq" : """57""" },
-    { "synset" : """01015244-v""", "def" : """provide evidence for""", "freq" : """57""" },
-    { "synset" : """01850315-v""", "def" : """cause to move or shift into a new position or place, both in a concrete and in an abstract sense""", "freq" : """57""" },
-    { "synset" : """01860795-v""", "def" : """come to a halt, stop moving""", "freq" : """57""" },
-    { "synset" : """02608347-v""", "def" : """have a beginning, in a temporal, spatial, or evaluative sense""", "freq" : """57""" },
-    { "synset" : """05305806-n""", "def" : """either of two fleshy folds of tissue that surround the mouth and play a role in speaking""", "freq" : """57""" },
-    { "synset" : """10053808-n""", "def" : """a worker who is hired to perform a job""", "freq" : """57""" },
-    { "synset" : """10084295-n""", "def" : """a youthful female person""", "freq" : """57""" },
-    { "synset" : """02174896-a""", "def" : """having few parts""", "freq" : """56""" },
-    { "synset" : """02174896-a""", "def" : """not complex or complicated or involved""", "freq" : """56""" },
-    { "synset" : """00812298-v""", "def" : """deal with (something unpleasant) head on""", "freq" : """56""" },
-    { "synset" : """01871979-v""", "def" : """move with force,""", "freq" : """56""" },
-    { "synset" : """01930874-v""", "def" : """operate or control a vehicle""", "freq" : """56""" },
-    { "synset" : """02676054-v""", "def" : """be relevant to""", "freq" : """56""" },
-    { "synset" : """02677097-v""", "def" : """connect closely and often incriminatingly""", "freq" : """56""" },
-    { "synset" : """02680814-v""", "def" : """put an end to a state or an activity""", "freq" : """56""" },
-    { "synset" : """02729414-v""", "def" : """act or be so as to become in a specified state""", "freq" : """56""" },
-    { "synset" : """04191595-n""", "def" : """a structure that provides privacy and protection from danger""", "freq" : """56""" },
-    { "synset" : """05145118-n""", "def" : """the property of having material worth (often indicated by the amount of money something would bring if sold)""", "freq" : """56""" },
-    { "synset" : """05702275-n""", "def" : """the process whereby a person concentrates on some features of the environment to the (relative) exclusion of others""", "freq" : """56""" },
-    { "synset" : """08065234-n""", "def" : """the people or companies engaged in a particular kind of commercial enterprise""", "freq" : """56""" },
-    { "synset" : """08523483-n""", "def" : """an area that is approximately central within some larger region""", "freq" : """56""" },
-    { "synset" : """14449126-n""", "def" : """a condition requiring relief""", "freq" : """56""" },
-    { "synset" : """00428404-a""", "def" : """readily apparent to the mind""", "freq" : """55""" },
-    { "synset" : """01212469-a""", "def" : """less than normal in degree or intensity or amount""", "freq" : """55""" },
-    { "synset" : """00007015-r""", "def" : """(of quantities) imprecise but fairly close to correct""", "freq" : """55""" },
-    { "synset" : """00121135-r""", "def" : """in the way indicated""", "freq" : """55""" },
-    { "synset" : """00144722-r""", "def" : """definitely or positively""", "freq" : """55""" },
-    { "synset" : """00802318-v""", "def" : """consent to, give permission""", "freq" : """55""" },
-    { "synset" : """00802318-v""", "def" : """permit""", "freq" : """55""" },
-    { "synset" : """01438902-v""", "def" : """cause to come into a particular state or condition""", "freq" : """55""" },
-    { "synset" : """02670890-v""", "def" : """serve a purpose, role, or function""", "freq" : """55""" },
-    { "synset" : """07109730-n""", "def" : """the words that are spoken""", "freq" : """55""" },
-    { "synset" : """08559508-n""", "def" : """where you live at a particular time""", "freq" : """55""" },
-    { "synset" : """09411430-n""", "def" : """a large natural stream of water (larger than a creek)""", "freq" : """55""" },
-    { "synset" : """09681351-n""", "def" : """a person belonging to the worldwide group claiming descent from Jacob (or converted to it) and connected by cultural or religious ties""", "freq" : """55""" },
-    { "synset" : """09945905-n""", "def" : """a friend who is frequently in the company of another""", "freq" : """55""" },
-    { "synset" : """01932973-a""", "def" : """being or occurring in fact or actuality""", "freq" : """54""" },
-    { "synset" : """01932973-a""", "def" : """having verified existence""", "freq" : """54""" },
-    { "synset" : """01932973-a""", "def" : """not illusory""", "freq" : """54""" },
-    { "synset" : """00109660-v""", "def" : """undergo a change""", "freq" : """54""" },
-    { "synset" : """00109660-v""", "def" : """become different in essence""", "freq" : """54""" },
-    { "synset" : """00109660-v""", "def" : """losing one's or its original nature""", "freq" : """54""" },
-    { "synset" : """00339934-v""", "def" : """come to pass""", "freq" : """54""" },
-    { "synset" : """01034312-v""", "def" : """to consider or examine in speech or writing""", "freq" : """54""" },
-    { "synset" : """05084201-n""", "def" : """the property created by the space between two objects or points""", "freq" : """54""" },
-    { "synset" : """05810561-n""", "def" : """the experience of being alive""", "freq" : """54""" },
-    { "synset" : """05810561-n""", "def" : """the course of human events and activities""", "freq" : """54""" },
-    { "synset" : """05823932-n""", "def" : """your basis for belief or disbelief""", "freq" : """54""" },
-    { "synset" : """05823932-n""", "def" : """knowledge on which to base belief""", "freq" : """54""" },
-    { "synset" : """13776621-n""", "def" : """a great amount or extent""", "freq" : """54""" },
-    { "synset" : """15157225-n""", "def" : """a day assigned to a particular purpose or observance""", "freq" : """54""" },
-    { "synset" : """00018302-r""", "def" : """to some (great or small) extent""", "freq" : """53""" },
-    { "synset" : """00073033-r""", "def" : """(of actions or states) slightly short of or not quite accomplished""", "freq" : """53""" },
-    { "synset" : """00073033-r""", "def" : """all but""", "freq" : """53""" },
-    { "synset" : """00074641-r""", "def" : """at or to or toward the front""", "freq" : """53""" },
-    { "synset" : """00074641-r""", "def" : """forward""", "freq" : """53""" },
-    { "synset" : """00598954-v""", "def" : """get to know or become aware of, usually accidentally""", "freq" : """53""" },
-    { "synset" : """00609683-v""", "def" : """keep in mind for attention or consideration""", "freq" : """53""" },
-    { "synset" : """00609683-v""", "def" : """keep in mind for attention or consideration""", "freq" : """53""" },
-    { "synset" : """00815686-v""", "def" : """react verbally""", "freq" : """53""" },
-    { "synset" : """00962447-v""", "def" : """exchange thoughts""", "freq" : """53""" },
-    { "synset" : """00962447-v""", "def" : """talk with""", "freq" : """53""" },
-    { "synset" : """01508368-v""", "def" : """propel through the air""", "freq" : """53""" },
-    { "synset" : """01957529-v""", "def" : """sit and travel on the back of animal, usually while controlling its motions""", "freq" : """53""" },
-    { "synset" : """02554922-v""", "def" : """contribute to the progress or growth of""", "freq" : """53""" },
-    { "synset" : """02609764-v""", "def" : """have an end, in a temporal, spatial, or quantitative sense""", "freq" : """53""" },
-    { "synset" : """02609764-v""", "def" : """either spatial or metaphorical""", "freq" : """53""" },
-    { "synset" : """02611373-v""", "def" : """be in some specified state or condition""", "freq" : """53""" },
-    { "synset" : """05558717-n""", "def" : """the posterior part of a human (or animal) body from the neck to the end of the spine""", "freq" : """53""" },
-    { "synset" : """05566504-n""", "def" : """any of the terminal members of the hand (sometimes excepting the thumb)""", "freq" : """53""" },
-    { "synset" : """06387980-n""", "def" : """the words of something written""", "freq" : """53""" },
-    { "synset" : """09917593-n""", "def" : """a young person of either sex""", "freq" : """53""" },
-    { "synset" : """00392812-a""", "def" : """being of the achromatic color of maximum darkness""", "freq" : """52""" },
-    { "synset" : """00392812-a""", "def" : """having little or no hue owing to absorption of almost all incident light""", "freq" : """52""" },
-    { "synset" : """01047561-a""", "def" : """referring to the second of two things or persons mentioned (or the last one or ones of several)""", "freq" : """52""" },
-    { "synset" : """01383756-a""", "def" : """large or big relative to something else""", "freq" : """52""" },
-    { "synset" : """02186750-a""", "def" : """being one more than four""", "freq" : """52""" },
-    { "synset" : """02922263-a""", "def" : """of or relating to Jews or their culture or religion""", "freq" : """52""" },
-    { "synset" : """00033308-r""", "def" : """only a moment ago""", "freq" : """52""" },
-    { "synset" : """00039941-r""", "def" : """from appearances alone""", "freq" : """52""" },
-    { "synset" : """00148869-r""", "def" : """in reality or actuality""", "freq" : """52""" },
-    { "synset" : """00360932-v""", "def" : """come into existence through birth""", "freq" : """52""" },
-    { "synset" : """00484166-v""", "def" : """come or bring to a finish or an end""", "freq" : """52""" },
-    { "synset" : """00965035-v""", "def" : """to give an account or representation of in words""", "freq" : """52""" },
-    { "synset" : """00966809-v""", "def" : """announce as the result of an investigation or experience or finding""", "freq" : """52""" },
-    { "synset" : """01621555-v""", "def" : """create or manufacture a man-made product""", "freq" : """52""" },
-    { "synset" : """01820302-v""", "def" : """derive or receive pleasure from""", "freq" : """52""" },
-    { "synset" : """01820302-v""", "def" : """get enjoyment from""", "freq" : """52""" },
-    { "synset" : """01820302-v""", "def" : """take pleasure in""", "freq" : """52""" },
-    { "synset" : """01831531-v""", "def" : """move so as to change position, perform a nontranslational motion""", "freq" : """52""" },
-    { "synset" : """02005948-v""", "def" : """reach a destination""", "freq" : """52""" },
-    { "synset" : """02005948-v""", "def" : """arrive by movement or progress""", "freq" : """52""" },
-    { "synset" : """00034479-n""", "def" : """an action""", "freq" : """52""" },
-    { "synset" : """00250259-n""", "def" : """act of improving by expanding or enlarging or refining""", "freq" : """52""" },
-    { "synset" : """03748886-n""", "def" : """commodities offered for sale""", "freq" : """52""" },
-    { "synset" : """05138488-n""", "def" : """the quality (positive or negative) that renders something desirable or valuable""", "freq" : """52""" },
-    { "synset" : """05758059-n""", "def" : """the accumulation of knowledge or skill that results from direct participation in events or activities""", "freq" : """52""" },
-    { "synset" : """06418901-n""", "def" : """a reference book containing an alphabetical list of words with information about them""", "freq" : """52""" },
-    { "synset" : """07970406-n""", "def" : """primary social group""", "freq" : """52""" },
-    { "synset" : """07970406-n""", "def" : """parents and children""", "freq" : """52""" },
-    { "synset" : """08266235-n""", "def" : """a set of data arranged in rows and columns""", "freq" : """52""" },
-    { "synset" : """00336831-a""", "def" : """having or feeling no doubt or uncertainty""", "freq" : """51""" },
-    { "synset" : """00336831-a""", "def" : """confident and assured""", "freq" : """51""" },
-    { "synset" : """00791227-a""", "def" : """exercising influence or control""", "freq" : """51""" },
-    { "synset" : """01125429-a""", "def" : """having undesirable or negative qualities""", "freq" : """51""" },
-    { "synset" : """01204557-a""", "def" : """being at or having a relatively great or specific elevation or upward extension""", "freq" : """51""" },
-    { "synset" : """02070188-a""", "def" : """any of various alternatives""", "freq" : """51""" },
-    { "synset" : """02070188-a""", "def" : """some other""", "freq" : """51""" },
-    { "synset" : """02070188-a""", "def" : """quantifier, singular, another""", "freq" : """51""" },
-    { "synset" : """02186665-a""", "def" : """being one more than three""", "freq" : """51""" },
-    { "synset" : """00027384-r""", "def" : """despite anything to the contrary (usually following a concession)""", "freq" : """51""" },
-    { "synset" : """00971015-v""", "def" : """ascribe a quality to or give a name of a common noun that reflects a quality""", "freq" : """51""" },
-    { "synset" : """02166460-v""", "def" : """give careful consideration to""", "freq" : """51""" },
-    { "synset" : """02614387-v""", "def" : """lead a certain kind of life""", "freq" : """51""" },
-    { "synset" : """02614387-v""", "def" : """live in a certain style""", "freq" : """51""" },
-    { "synset" : """00002684-n""", "def" : """a tangible and visible entity""", "freq" : """51""" },
-    { "synset" : """00002684-n""", "def" : """an entity that can cast a shadow""", "freq" : """51""" },
-    { "synset" : """00007846-n""", "def" : """a human being""", "freq" : """51""" },
-    { "synset" : """00007846-n""", "def" : """person, singular, assertive existential pronoun""", "freq" : """51""" },
-    { "synset" : """00007846-n""", "def" : """pronoun, person, singular; quantifier: assertive existential""", "freq" : """51""" },
-    { "synset" : """02818832-n""", "def" : """a piece of furniture that provides a place to sleep""", "freq" : """51""" },
-    { "synset" : """05573602-n""", "def" : """hinge joint in the human leg connecting the tibia and fibula with the femur and protected in front by the patella""", "freq" : """51""" },
-    { "synset" : """05865998-n""", "def" : """a geometric element that has position but no extension""", "freq" : """51""" },
-    { "synset" : """07020895-n""", "def" : """an artistic form of auditory communication incorporating instrumental or vocal tones in a structured and continuous manner""", "freq" : """51""" },
-    { "synset" : """08430568-n""", "def" : """a formation of people or things one beside another""", "freq" : """51""" },
-    { "synset" : """08651247-n""", "def" : """the piece of land on which something is located (or is to be located)""", "freq" : """51""" },
-    { "synset" : """09270894-n""", "def" : """the 3rd planet from the sun""", "freq" : """51""" },
-    { "synset" : """09270894-n""", "def" : """the planet we live on""", "freq" : """51""" },
-    { "synset" : """13954253-n""", "def" : """the state or fact of existing""", "freq" : """51""" },
-    { "synset" : """15166191-n""", "def" : """the part of the day between noon and evening""", "freq" : """51""" },
-    { "synset" : """01247240-a""", "def" : """used of physical heat""", "freq" : """50""" },
-    { "synset" : """01247240-a""", "def" : """having a high or higher than desirable temperature or giving off heat or feeling or causing a sensation of heat or burning""", "freq" : """50""" },
-    { "synset" : """01452593-a""", "def" : """characterized by or producing sound of great volume or intensity""", "freq" : """50""" },
-    { "synset" : """01861205-a""", "def" : """not private""", "freq" : """50""" },
-    { "synset" : """01861205-a""", "def" : """open to or concerning the people as a whole""", "freq" : """50""" },
-    { "synset" : """02336109-a""", "def" : """sufficient for the purpose""", "freq" : """50""" },
-    { "synset" : """00036291-r""", "def" : """to a small degree or extent""", "freq" : """50""" },
-    { "synset" : """00875141-v""", "def" : """push for something""", "freq" : """50""" },
-    { "synset" : """01001857-v""", "def" : """record in a public office or in a court of law""", "freq" : """50""" },
-    { "synset" : """01214265-v""", "def" : """get into one's hands, take physically""", "freq" : """50""" },
-    { "synset" : """01315613-v""", "def" : """try to locate or discover, or try to establish the existence of""", "freq" : """50""" },
-    { "synset" : """01774136-v""", "def" : """dislike intensely""", "freq" : """50""" },
-    { "synset" : """01774136-v""", "def" : """feel antipathy or aversion towards""", "freq" : """50""" },
-    { "synset" : """02427103-v""", "def" : """set up or found""", "freq" : """50""" },
-    { "synset" : """02530167-v""", "def" : """make an effort or attempt""", "freq" : """50""" },
-    { "synset" : """02712772-v""", "def" : """be later in time""", "freq" : """50""" },
-    { "synset" : """00172710-n""", "def" : """how a result is obtained or an end is achieved""", "freq" : """50""" },
-    { "synset" : """05168261-n""", "def" : """the quality of being important and worthy of note""", "freq" : """50""" },
-    { "synset" : """06783768-n""", "def" : """the subject matter at issue""", "freq" : """50""" },
-    { "synset" : """07218470-n""", "def" : """a written document describing the findings of some individual or group""", "freq" : """50""" },
-    { "synset" : """07480068-n""", "def" : """any strong feeling""", "freq" : """50""" },
-    { "synset" : """08441203-n""", "def" : """the collection of rules imposed by authority""", "freq" : """50""" },
-    { "synset" : """00273082-a""", "def" : """devoid of or deficient in light or brightness""", "freq" : """49""" },
-    { "synset" : """00273082-a""", "def" : """shadowed or black""", "freq" : """49""" },
-    { "synset" : """02840478-a""", "def" : """of or relating to a vocation or occupation""", "freq" : """49""" },
-    { "synset" : """02840478-a""", "def" : """especially providing or undergoing training in special skills""", "freq" : """49""" },
-    { "synset" : """00802318-v""", "def" : """consent to, give permission""", "freq" : """49""" },
-    { "synset" : """00802318-v""", "def" : """permit""", "freq" : """49""" },
-    { "synset" : """01848718-v""", "def" : """move away from a place into another direction""", "freq" : """49""" },
-    { "synset" : """02023107-v""", "def" : """come together""", "freq" : """49""" },
-    { "synset" : """02641463-v""", "def" : """wait before acting""", "freq" : """49""" },
-    { "synset" : """00026192-n""", "def" : """the experiencing of affective and emotional states""", "freq" : """49""" },
-    { "synset" : """00786195-n""", "def" : """earnest and conscientious activity intended to do or accomplish something""", "freq" : """49""" },
-    { "synset" : """02743547-n""", "def" : """the products of human creativity""", "freq" : """49""" },
-    { "synset" : """02743547-n""", "def" : """works of art collectively""", "freq" : """49""" },
-    { "synset" : """03322099-n""", "def" : """workplace consisting of farm buildings and cultivated land as a unit""", "freq" : """49""" },
-    { "synset" : """04194289-n""", "def" : """a vessel that carries passengers or freight""", "freq" : """49""" },
-    { "synset" : """04928903-n""", "def" : """how something is done or how it happens""", "freq" : """49""" },
-    { "synset" : """05989479-n""", "def" : """a well-substantiated explanation of some aspect of the natural world""", "freq" : """49""" },
-    { "synset" : """05989479-n""", "def" : """an organized system of accepted knowledge that applies in a variety of circumstances to explain a specific set of phenomena""", "freq" : """49""" },
-    { "synset" : """08569998-n""", "def" : """a piece of land cleared of trees and usually enclosed""", "freq" : """49""" },
-    { "synset" : """09436708-n""", "def" : """the atmosphere and outer space as viewed from the earth""", "freq" : """49""" },
-    { "synset" : """09466280-n""", "def" : """everything that exists anywhere""", "freq" : """49""" },
-    { "synset" : """13649791-n""", "def" : """a unit of length equal to one twelfth of a foot""", "freq" : """49""" },
-    { "synset" : """13651218-n""", "def" : """a unit of length equal to 1,760 yards or 5,280 feet""", "freq" : """49""" },
-    { "synset" : """13651218-n""", "def" : """exactly 1609.344 meters""", "freq" : """49""" },
-    { "synset" : """13754293-n""", "def" : """a quantity that is added""", "freq" : """49""" },
-    { "synset" : """15121406-n""", "def" : """the aggregate of past events""", "freq" : """49""" },
-    { "synset" : """00370869-a""", "def" : """of the color intermediate between green and violet""", "freq" : """48""" },
-    { "synset" : """00370869-a""", "def" : """having a color similar to that of a clear unclouded sky""", "freq" : """48""" },
-    { "synset" : """00031515-r""", "def" : """not now""", "freq" : """48""" },
-    { "synset" : """00728617-v""", "def" : """be fully aware or cognizant of""", "freq" : """48""" },
-    { "synset" : """01824339-v""", "def" : """hope for""", "freq" : """48""" },
-    { "synset" : """01824339-v""", "def" : """have a wish""", "freq" : """48""" },
-    { "synset" : """02504562-v""", "def" : """to cause to do through pressure or necessity, by physical, moral or intellectual means """, "freq" : """48""" },
-    { "synset" : """02913152-n""", "def" : """a structure that has a roof and walls and stands more or less permanently in one place""", "freq" : """48""" },
-    { "synset" : """03259505-n""", "def" : """housing that someone is living in""", "freq" : """48""" },
-    { "synset" : """03294048-n""", "def" : """an instrumentality needed for an undertaking or to perform a service""", "freq" : """48""" },
-    { "synset" : """04956594-n""", "def" : """a visual attribute of things that results from the light they emit or transmit or reflect""", "freq" : """48""" },
-    { "synset" : """05217168-n""", "def" : """alternative names for the body of a human being""", "freq" : """48""" },
-    { "synset" : """05302499-n""", "def" : """the opening through which food is taken in and vocalizations emerge""", "freq" : """48""" },
-    { "synset" : """05821775-n""", "def" : """a small part of something intended as representative of the whole""", "freq" : """48""" },
-    { "synset" : """05984584-n""", "def" : """the content of direct observation or participation in an event""", "freq" : """48""" },
-    { "synset" : """06282651-n""", "def" : """a systematic means of communicating by the use of sounds or conventional symbols""", "freq" : """48""" },
-    { "synset" : """06601327-n""", "def" : """the message that is intended or expressed or signified""", "freq" : """48""" },
-    { "synset" : """09908025-n""", "def" : """a boy or man""", "freq" : """48""" },
-    { "synset" : """10624074-n""", "def" : """a male human offspring""", "freq" : """48""" },
-    { "synset" : """01106405-a""", "def" : """relating to or applicable to or concerned with the administration of a city or town or district rather than a larger area""", "freq" : """47""" },
-    { "synset" : """00018577-r""", "def" : """to the greatest extent""", "freq" : """47""" },
-    { "synset" : """00018577-r""", "def" : """completely""", "freq" : """47""" },
-    { "synset" : """00607780-v""", "def" : """recall knowledge from memory""", "freq" : """47""" },
-    { "synset" : """00607780-v""", "def" : """have a recollection""", "freq" : """47""" },
-    { "synset" : """00690614-v""", "def" : """deem to be""", "freq" : """47""" },
-    { "synset" : """00754942-v""", "def" : """request urgently and forcefully""", "freq" : """47""" },
-    { "synset" : """00797430-v""", "def" : """show unwillingness towards""", "freq" : """47""" },
-    { "synset" : """01182021-v""", "def" : """provide as food""", "freq" : """47""" },
-    { "synset" : """01912159-v""", "def" : """travel across or pass over""", "freq" : """47""" },
-    { "synset" : """01912159-v""", "def" : """cross""", "freq" : """47""" },
-    { "synset" : """02204692-v""", "def" : """have ownership or possession of""", "freq" : """47""" },
-    { "synset" : """05816287-n""", "def" : """knowledge acquired through study or experience or instruction""", "freq" : """47""" },
-    { "synset" : """01395330-a""", "def" : """greater in size or importance or degree""", "freq" : """46""" },
-    { "synset" : """02065665-a""", "def" : """of many different kinds purposefully arranged but lacking any uniformity""", "freq" : """46""" },
-    { "synset" : """02743261-a""", "def" : """characteristic of humanity""", "freq" : """46""" },
-    { "synset" : """02988060-a""", "def" : """of or relating to or belonging to a nation or country""", "freq" : """46""" },
-    { "synset" : """00004722-r""", "def" : """and nothing more""", "freq" : """46""" },
-    { "synset" : """00048739-r""", "def" : """without delay or hesitation""", "freq" : """46""" },
-    { "synset" : """00048739-r""", "def" : """with no time intervening""", "freq" : """46""" },
-    { "synset" : """00831651-v""", "def" : """impart knowledge of some fact, state or affairs, or event to""", "freq" : """46""" },
-    { "synset" : """01731031-v""", "def" : """deliver by singing""", "freq" : """46""" },
-    { "synset" : """02053941-v""", "def" : """move towards""", "freq" : """46""" },
-    { "synset" : """00636921-n""", "def" : """systematic investigation to establish facts""", "freq" : """46""" },
-    { "synset" : """06410904-n""", "def" : """a written work or composition that has been published (printed on pages bound together)""", "freq" : """46""" },
-    { "synset" : """07048000-n""", "def" : """a short musical composition with words""", "freq" : """46""" },
-    { "synset" : """07296428-n""", "def" : """an event that occurs when something passes from one state or phase to another""", "freq" : """46""" },
-    { "synset" : """07929519-n""", "def" : """a beverage consisting of an infusion of ground coffee beans""", "freq" : """46""" },
-    { "synset" : """09119277-n""", "def" : """the largest city in New York State and in the United States""", "freq" : """46""" },
-    { "synset" : """09119277-n""", "def" : """located in southeastern New York at the mouth of the Hudson river""", "freq" : """46""" },
-    { "synset" : """09119277-n""", "def" : """a major financial and cultural center""", "freq" : """46""" },
-    { "synset" : """11473954-n""", "def" : """electromagnetic radiation that can produce a visual sensation""", "freq" : """46""" },
-    { "synset" : """13464820-n""", "def" : """a process in which something passes by degrees to a different stage (especially a more advanced or mature stage)""", "freq" : """46""" },
-    { "synset" : """15121625-n""", "def" : """the time yet to come""", "freq" : """46""" },
-    { "synset" : """01013279-a""", "def" : """coming after all others in time or space or degree or being the only one remaining""", "freq" : """45""" },
-    { "synset" : """01814385-a""", "def" : """involving or characteristic of politics or parties or politicians""", "freq" : """45""" },
-    { "synset" : """01855764-a""", "def" : """pertaining to or constituting a base or basis""", "freq" : """45""" },
-    { "synset" : """02560548-a""", "def" : """having great (or a certain) extent from one side to the other""", "freq" : """45""" },
-    { "synset" : """00059607-r""", "def" : """in a better or more excellent manner or more advantageously or attractively or to a greater degree etc.""", "freq" : """45""" },
-    { "synset" : """00348746-v""", "def" : """set in motion, cause to start""", "freq" : """45""" },
-    { "synset" : """00406243-v""", "def" : """make ready or suitable or equip in advance for a particular purpose or for some use, event, etc""", "freq" : """45""" },
-    { "synset" : """00664788-v""", "def" : """establish the validity of something, as by an example, explanation or experiment""", "freq" : """45""" },
-    { "synset" : """00770437-v""", "def" : """cause to do""", "freq" : """45""" },
-    { "synset" : """00770437-v""", "def" : """cause to act in a specified manner""", "freq" : """45""" },
-    { "synset" : """01158872-v""", "def" : """put into service""", "freq" : """45""" },
-    { "synset" : """01158872-v""", "def" : """make work or employ for a particular purpose or for its inherent or natural purpose""", "freq" : """45""" },
-    { "synset" : """01433294-v""", "def" : """go or come after and bring or take back""", "freq" : """45""" },
-    { "synset" : """02128873-v""", "def" : """perceive or be contemporaneous with""", "freq" : """45""" },
-    { "synset" : """02426171-v""", "def" : """start to operate or function or cause to start operating or functioning""", "freq" : """45""" },
-    { "synset" : """02634265-v""", "def" : """issue or terminate (in a specified way, state, etc.)""", "freq" : """45""" },
-    { "synset" : """02634265-v""", "def" : """end""", "freq" : """45""" },
-    { "synset" : """00023271-n""", "def" : """the psychological result of perception and learning and reasoning""", "freq" : """45""" },
-    { "synset" : """00220522-n""", "def" : """unlawful premeditated killing of a human being by a human being""", "freq" : """45""" },
-    { "synset" : """00634276-n""", "def" : """an investigation of the component parts of a whole and their relations in making up the whole""", "freq" : """45""" },
-    { "synset" : """05125377-n""", "def" : """an area in which something acts or operates or has power or control""", "freq" : """45""" },
-    { "synset" : """05820620-n""", "def" : """an item of information that is typical of a class or group""", "freq" : """45""" },
-    { "synset" : """06999647-n""", "def" : """a diagram or picture illustrating textual material""", "freq" : """45""" },
-    { "synset" : """07355491-n""", "def" : """the event of dying or departure from life""", "freq" : """45""" },
-    { "synset" : """08278169-n""", "def" : """the body of faculty and students of a college""", "freq" : """45""" },
-    { "synset" : """10636598-n""", "def" : """the vital principle or animating force within living things""", "freq" : """45""" },
-    { "synset" : """13255145-n""", "def" : """the financial gain (earned or unearned) accruing over a given period of time""", "freq" : """45""" },
-    { "synset" : """13859043-n""", "def" : """a relational difference between states""", "freq" : """45""" },
-    { "synset" : """13859043-n""", "def" : """especially between states before and after some event""", "freq" : """45""" },
-    { "synset" : """00444519-a""", "def" : """not far distant in time or space or degree or circumstances""", "freq" : """44""" },
-    { "synset" : """01858094-a""", "def" : """confined to particular persons or groups or providing privacy""", "freq" : """44""" },
-    { "synset" : """00039318-r""", "def" : """unmistakably""", "freq" : """44""" },
-    { "synset" : """00047903-r""", "def" : """as the end result of a succession or process""", "freq" : """44""" },
-    { "synset" : """00048138-r""", "def" : """after an unspecified period of time or an especially long delay""", "freq" : """44""" },
-    { "synset" : """00484166-v""", "def" : """come or bring to a finish or an end""", "freq" : """44""" },
-    { "synset" : """00512877-v""", "def" : """render capable or able for some task""", "freq" : """44""" },
-    { "synset" : """00705227-v""", "def" : """have the will and intention to carry out some action""", "freq" : """44""" },
-    { "synset" : """01448100-v""", "def" : """cause to move by pulling""", "freq" : """44""" },
-    { "synset" : """01738597-v""", "def" : """work out""", "freq" : """44""" },
-    { "synset" : """01738774-v""", "def" : """make something new, such as a product or a mental or artistic creation""", "freq" : """44""" },
-    { "synset" : """02016523-v""", "def" : """to come or go into""", "freq" : """44""" },
-    { "synset" : """02240481-v""", "def" : """try to get or reach""", "freq" : """44""" },
-    { "synset" : """02327200-v""", "def" : """give something useful or necessary to""", "freq" : """44""" },
-    { "synset" : """02445509-v""", "def" : """direct the course of""", "freq" : """44""" },
-    { "synset" : """02445509-v""", "def" : """manage or control""", "freq" : """44""" },
-    { "synset" : """02488834-v""", "def" : """take in marriage""", "freq" : """44""" },
-    { "synset" : """02488834-v""", "def" : """married""", "freq" : """44""" },
-    { "synset" : """02684924-v""", "def" : """continue a certain state, condition, or activity""", "freq" : """44""" },
-    { "synset" : """00006484-n""", "def" : """the basic structural and functional unit of all organisms""", "freq" : """44""" },
-    { "synset" : """00006484-n""", "def" : """they may exist as independent units of life (as in monads) or may form colonies or tissues as in higher plants and animals""", "freq" : """44""" },
-    { "synset" : """00791078-n""", "def" : """the act of testing something""", "freq" : """44""" },
-    { "synset" : """02728440-n""", "def" : """clothing in general""", "freq" : """44""" },
-    { "synset" : """09812338-n""", "def" : """a person whose creative work shows sensitivity and imagination""", "freq" : """44""" },
-    { "synset" : """13289467-n""", "def" : """a share set aside for a specific purpose""", "freq" : """44""" },
-    { "synset" : """13308999-n""", "def" : """charge against a citizen's person or property or activity for the support of government""", "freq" : """44""" },
-    { "synset" : """13742573-n""", "def" : """the smallest whole number or a numeral representing this number""", "freq" : """44""" },
-    { "synset" : """13810818-n""", "def" : """something left after other parts have been taken away""", "freq" : """44""" },
-    { "synset" : """00381097-a""", "def" : """of a color at the end of the color spectrum (next to orange)""", "freq" : """43""" },
-    { "synset" : """00381097-a""", "def" : """resembling the color of blood or cherries or tomatoes or rubies""", "freq" : """43""" },
-    { "synset" : """01442186-a""", "def" : """primarily temporal sense""", "freq" : """43""" },
-    { "synset" : """01442186-a""", "def" : """indicating or being or seeming to be limited in duration""", "freq" : """43""" },
-    { "synset" : """02186833-a""", "def" : """denoting a quantity consisting of six items or units""", "freq" : """43""" },
-    { "synset" : """00008007-r""", "def" : """to a complete degree or to the full or entire extent""", "freq" : """43""" },
-    { "synset" : """00008007-r""", "def" : """Completely or entirely""", "freq" : """43""" },
-    { "synset" : """00117985-v""", "def" : """stay the same""", "freq" : """43""" },
-    { "synset" : """00117985-v""", "def" : """remain in a certain state""", "freq" : """43""" },
-    { "synset" : """00137313-v""", "def" : """have an effect upon""", "freq" : """43""" },
-    { "synset" : """00931852-v""", "def" : """denote or connote""", "freq" : """43""" },
-    { "synset" : """01128193-v""", "def" : """shield from danger, injury, destruction, or damage""", "freq" : """43""" },
-    { "synset" : """01775164-v""", "def" : """have a great affection or liking for""", "freq" : """43""" },
-    { "synset" : """01972298-v""", "def" : """descend in free fall under the influence of gravity""", "freq" : """43""" },
-    { "synset" : """02137132-v""", "def" : """make visible or noticeable""", "freq" : """43""" },
-    { "synset" : """00407535-n""", "def" : """any specific behavior""", "freq" : """43""" },
-    { "synset" : """03619890-n""", "def" : """a room equipped for preparing meals""", "freq" : """43""" },
-    { "synset" : """04377057-n""", "def" : """instrumentality that combines interrelated interacting artifacts designed to work as a coherent entity""", "freq" : """43""" },
-    { "synset" : """05289297-n""", "def" : """one of the contractile organs of the body""", "freq" : """43""" },
-    { "synset" : """06392001-n""", "def" : """a self-contained part of a larger composition (written or musical)""", "freq" : """43""" },
-    { "synset" : """07302836-n""", "def" : """the event of something burning (often destructive)""", "freq" : """43""" },
-    { "synset" : """07387509-n""", "def" : """sound of any kind (especially unintelligible or dissonant sound)""", "freq" : """43""" },
-    { "synset" : """08208560-n""", "def" : """a cooperative unit (especially in sports)""", "freq" : """43""" },
-    { "synset" : """08438533-n""", "def" : """the trees and other plants in a large densely wooded area""", "freq" : """43""" },
-    { "synset" : """13783816-n""", "def" : """a mathematical relation such that each element of a given set (the domain of the function) is associated with an element of another set (the range of the function)""", "freq" : """43""" },
-    { "synset" : """15245515-n""", "def" : """a suitable moment""", "freq" : """43""" },
-    { "synset" : """00515380-a""", "def" : """constituting the full quantity or extent""", "freq" : """42""" },
-    { "synset" : """00515380-a""", "def" : """complete""", "freq" : """42""" },
-    { "synset" : """02331262-a""", "def" : """having succeeded or being marked by a favorable outcome""", "freq" : """42""" },
-    { "synset" : """00061528-r""", "def" : """quickly and without warning""", "freq" : """42""" },
-    { "synset" : """00149510-r""", "def" : """in actual fact""", "freq" : """42""" },
-    { "synset" : """00631737-v""", "def" : """expect, believe, or suppose""", "freq" : """42""" },
-    { "synset" : """01058574-v""", "def" : """make or write a comment on""", "freq" : """42""" },
-    { "synset" : """01156834-v""", "def" : """serve oneself to, or consume regularly""", "freq" : """42""" },
-    { "synset" : """01158872-v""", "def" : """put into service""", "freq" : """42""" },
-    { "synset" : """01158872-v""", "def" : """make work or employ for a particular purpose or for its inherent or natural purpose""", "freq" : """42""" },
-    { "synset" : """01619929-v""", "def" : """do away with, cause the destruction or undoing of""", "freq" : """42""" },
-    { "synset" : """01889610-v""", "def" : """move or cause to move back and forth""", "freq" : """42""" },
-    { "synset" : """02288295-v""", "def" : """win something through one's efforts""", "freq" : """42""" },
-    { "synset" : """02084071-n""", "def" : """a member of the genus Canis (probably descended from the common wolf) that has been domesticated by man since prehistoric times""", "freq" : """42""" },
-    { "synset" : """02084071-n""", "def" : """a member of the genus Canis (probably descended from the common wolf) that has been domesticated by man since prehistoric times; occurs in many breeds ❲Canis familiaris❳""", "freq" : """42""" },
-    { "synset" : """04723816-n""", "def" : """an essential and distinguishing attribute of something or someone""", "freq" : """42""" },
-    { "synset" : """05029706-n""", "def" : """the property of being physically or mentally strong""", "freq" : """42""" },
-    { "synset" : """05849789-n""", "def" : """a prominent attribute or aspect of something""", "freq" : """42""" },
-    { "synset" : """05919263-n""", "def" : """the locus of feelings and intuitions""", "freq" : """42""" },
-    { "synset" : """07325990-n""", "def" : """the beginning or early stages""", "freq" : """42""" },
-    { "synset" : """07473441-n""", "def" : """a successful ending of a struggle or contest""", "freq" : """42""" },
-    { "synset" : """07543288-n""", "def" : """a strong positive emotion of regard and affection""", "freq" : """42""" },
-    { "synset" : """08329453-n""", "def" : """an assembly (including one or more judges) to conduct judicial business""", "freq" : """42""" },
-    { "synset" : """09450163-n""", "def" : """the star that is the source of light and heat for the planets in the solar system""", "freq" : """42""" },
-    { "synset" : """09870926-n""", "def" : """a friendly informal reference to a grown man""", "freq" : """42""" },
-    { "synset" : """13720096-n""", "def" : """16 ounces avoirdupois""", "freq" : """42""" },
-    { "synset" : """13736799-n""", "def" : """one of two equal parts of a divisible whole""", "freq" : """42""" },
-    { "synset" : """14449405-n""", "def" : """the state of needing something that is absent or unavailable""", "freq" : """42""" },
-    { "synset" : """14841267-n""", "def" : """a mixture of gases (especially oxygen) required for breathing""", "freq" : """42""" },
-    { "synset" : """14841267-n""", "def" : """the stuff that the wind consists of""", "freq" : """42""" },
-    { "synset" : """15120823-n""", "def" : """the time that has elapsed""", "freq" : """42""" },
-    { "synset" : """00967129-a""", "def" : """being definitely out of the ordinary and unexpected""", "freq" : """41""" },
-    { "synset" : """00967129-a""", "def" : """slightly odd or even a bit weird""", "freq" : """41""" },
-    { "synset" : """01083157-a""", "def" : """containing as much or as many as is possible or normal""", "freq" : """41""" },
-    { "synset" : """02070030-a""", "def" : """distinctly separate from the first""", "freq" : """41""" },
-    { "synset" : """00542120-v""", "def" : """reach or enter a state, relation, condition, use, or position""", "freq" : """41""" },
-    { "synset" : """00545557-v""", "def" : """gain through experience""", "freq" : """41""" },
-    { "synset" : """00925110-v""", "def" : """place in doubt or express doubtful speculation""", "freq" : """41""" },
-    { "synset" : """01020005-v""", "def" : """make mention of""", "freq" : """41""" },
-    { "synset" : """01020005-v""", "def" : """make mention of""", "freq" : """41""" },
-    { "synset" : """01315613-v""", "def" : """try to locate or discover, or try to establish the existence of""", "freq" : """41""" },
-    { "synset" : """02136892-v""", "def" : """manifest or bring back""", "freq" : """41""" },
-    { "synset" : """02213336-v""", "def" : """get something or somebody for a specific purpose""", "freq" : """41""" },
-    { "synset" : """02436349-v""", "def" : """be in charge of, act on, or dispose of""", "freq" : """41""" },
-    { "synset" : """02550868-v""", "def" : """save from ruin, destruction, or harm""", "freq" : """41""" },
-    { "synset" : """02681795-v""", "def" : """keep in a certain state, position, or activity""", "freq" : """41""" },
-    { "synset" : """02681795-v""", "def" : """e.g.,""", "freq" : """41""" },
-    { "synset" : """01023820-n""", "def" : """a particular course of action intended to achieve a result""", "freq" : """41""" },
-    { "synset" : """04726724-n""", "def" : """the essential qualities or characteristics by which something is recognized""", "freq" : """41""" },
-    { "synset" : """05174653-n""", "def" : """an abstract idea of that which is due to a person or governmental body by law or tradition or nature""", "freq" : """41""" },
-    { "synset" : """09225146-n""", "def" : """the part of the earth's surface covered with water (such as a river or lake or ocean)""", "freq" : """41""" },
-    { "synset" : """10259348-n""", "def" : """a commissioned military officer""", "freq" : """41""" },
-    { "synset" : """10694258-n""", "def" : """a person whose occupation is teaching""", "freq" : """41""" },
-    { "synset" : """12102133-n""", "def" : """narrow-leaved green herbage: grown as lawns""", "freq" : """41""" },
-    { "synset" : """12102133-n""", "def" : """used as pasture for grazing animals""", "freq" : """41""" },
-    { "synset" : """12102133-n""", "def" : """cut and dried as hay""", "freq" : """41""" },
-    { "synset" : """13961399-n""", "def" : """the course of existence of an individual""", "freq" : """41""" },
-    { "synset" : """13961399-n""", "def" : """the actions and events that occur in living""", "freq" : """41""" },
-    { "synset" : """00190115-a""", "def" : """having or showing knowledge or understanding or realization or perception""", "freq" : """40""" },
-    { "synset" : """00068368-r""", "def" : """with a forward motion""", "freq" : """40""" },
-    { "synset" : """00085811-r""", "def" : """with rapid movements""", "freq" : """40""" },
-    { "synset" : """00103554-r""", "def" : """the initial time""", "freq" : """40""" },
-    { "synset" : """00426958-v""", "def" : """get lost, as without warning or explanation""", "freq" : """40""" },
-    { "synset" : """00471711-v""", "def" : """terminate, end, or take out""", "freq" : """40""" },
-    { "synset" : """00598954-v""", "def" : """get to know or become aware of, usually accidentally""", "freq" : """40""" },
-    { "synset" : """01034312-v""", "def" : """to consider or examine in speech or writing""", "freq" : """40""" },
-    { "synset" : """01999798-v""", "def" : """take somebody somewhere""", "freq" : """40""" },
-    { "synset" : """02148788-v""", "def" : """give an exhibition of to an interested audience""", "freq" : """40""" },
-    { "synset" : """02450505-v""", "def" : """stop (someone or something) from doing something or being in a certain state""", "freq" : """40""" },
-    { "synset" : """02625339-v""", "def" : """to be the product or result""", "freq" : """40""" },
-    { "synset" : """05930736-n""", "def" : """a perceptual structure""", "freq" : """40""" },
-    { "synset" : """07352190-n""", "def" : """one of a series of ridges that moves across the surface of a liquid (especially across a large body of water)""", "freq" : """40""" },
-    { "synset" : """08059412-n""", "def" : """a business firm whose articles of incorporation have been approved in some state""", "freq" : """40""" },
-    { "synset" : """08457976-n""", "def" : """similar things placed in order or happening one after another""", "freq" : """40""" },
-    { "synset" : """08679972-n""", "def" : """a line leading to a place or point""", "freq" : """40""" },
-    { "synset" : """10123844-n""", "def" : """a general officer of the highest rank""", "freq" : """40""" },
-    { "synset" : """13331198-n""", "def" : """a quantity of money""", "freq" : """40""" },
-    { "synset" : """14483917-n""", "def" : """a possibility due to a favorable combination of circumstances""", "freq" : """40""" },
-    { "synset" : """15239579-n""", "def" : """a period of the year marked by special events or activities in some field""", "freq" : """40""" },
-    { "synset" : """01103021-a""", "def" : """applying to or characterized by or distinguishing something particular or special or unique""", "freq" : """39""" },
-    { "synset" : """01106129-a""", "def" : """national""", "freq" : """39""" },
-    { "synset" : """01106129-a""", "def" : """especially in reference to the government of the United States as distinct from that of its member units""", "freq" : """39""" },
-    { "synset" : """01555416-a""", "def" : """a quantifier meaning not as great in amount or degree""", "freq" : """39""" },
-    { "synset" : """01846413-a""", "def" : """being or existing in a specified place""", "freq" : """39""" },
-    { "synset" : """00035058-r""", "def" : """many times at short intervals""", "freq" : """39""" },
-    { "synset" : """00101051-r""", "def" : """at or to or from a great distance in space""", "freq" : """39""" },
-    { "synset" : """00153568-r""", "def" : """taking care or paying attention""", "freq" : """39""" },
-    { "synset" : """00105958-v""", "def" : """be conscious of a physical, mental, or emotional state""", "freq" : """39""" },
-    { "synset" : """00781000-v""", "def" : """continue talking""", "freq" : """39""" },
-    { "synset" : """00781000-v""", "def" : """go on""", "freq" : """39""" },
-    { "synset" : """00912473-v""", "def" : """utter in a loud voice""", "freq" : """39""" },
-    { "synset" : """00912473-v""", "def" : """talk in a loud voice (usually denoting characteristic manner of speaking)""", "freq" : """39""" },
-    { "synset" : """01745722-v""", "def" : """put into print""", "freq" : """39""" },
-    { "synset" : """02006834-v""", "def" : """reach a point in time, or a certain state or level""", "freq" : """39""" },
-    { "synset" : """02016523-v""", "def" : """to come or go into""", "freq" : """39""" },
-    { "synset" : """02154508-v""", "def" : """discover or determine the existence, presence, or fact of""", "freq" : """39""" },
-    { "synset" : """02154508-v""", "def" : """discover or determine the existence, presence, or fact of""", "freq" : """39""" },
-    { "synset" : """02423183-v""", "def" : """make it possible through a specific action or lack of action for something to happen""", "freq" : """39""" },
-    { "synset" : """02684924-v""", "def" : """continue a certain state, condition, or activity""", "freq" : """39""" },
-    { "synset" : """02699497-v""", "def" : """take the place of or be parallel or equivalent to""", "freq" : """39""" },
-    { "synset" : """02711987-v""", "def" : """be contingent on""", "freq" : """39""" },
-    { "synset" : """00024720-n""", "def" : """the way something is with respect to its main attributes""", "freq" : """39""" },
-    { "synset" : """00035189-n""", "def" : """the action of accomplishing something""", "freq" : """39""" },
-    { "synset" : """03542333-n""", "def" : """a building where travelers can pay for lodging and meals and other services""", "freq" : """39""" },
-    { "synset" : """05107765-n""", "def" : """the relative magnitude of something with reference to a criterion""", "freq" : """39""" },
-    { "synset" : """05637558-n""", "def" : """an ability that has been acquired by training""", "freq" : """39""" },
-    { "synset" : """08871007-n""", "def" : """a division of the United Kingdom""", "freq" : """39""" },
-    { "synset" : """09044862-n""", "def" : """North American republic containing 50 states - 48 conterminous states in North America plus Alaska in northwest North America and the Hawaiian Islands in the Pacific Ocean""", "freq" : """39""" },
-    { "synset" : """09044862-n""", "def" : """achieved independence in 1776""", "freq" : """39""" },
-    { "synset" : """11444117-n""", "def" : """the permanent end of all life functions in an organism or part of an organism""", "freq" : """39""" },
-    { "synset" : """13325010-n""", "def" : """amount of a charge or payment relative to some basis""", "freq" : """39""" },
-    { "synset" : """13723061-n""", "def" : """one thousandth (1/1,000) gram""", "freq" : """39""" },
-    { "synset" : """13942875-n""", "def" : """a condition that accompanies or influences some event or activity""", "freq" : """39""" },
-    { "synset" : """13943400-n""", "def" : """a special set of circumstances""", "freq" : """39""" },
-    { "synset" : """14648100-n""", "def" : """a nonmetallic bivalent element that is normally a colorless odorless tasteless nonflammable diatomic gas""", "freq" : """39""" },
-    { "synset" : """14648100-n""", "def" : """constitutes 21 percent of the atmosphere by volume""", "freq" : """39""" },
-    { "synset" : """14648100-n""", "def" : """the most abundant element in the earth's crust""", "freq" : """39""" },
-    { "synset" : """00372111-a""", "def" : """of a color similar to that of wood or earth""", "freq" : """38""" },
-    { "synset" : """00389310-a""", "def" : """of an achromatic color of any lightness intermediate between the extremes of white and black""", "freq" : """38""" },
-    { "synset" : """00446921-a""", "def" : """at or within a short distance in space or time or having elements near each other""", "freq" : """38""" },
-    { "synset" : """00493460-a""", "def" : """being or characteristic of a single thing or person""", "freq" : """38""" },
-    { "synset" : """01061489-a""", "def" : """able to act at will""", "freq" : """38""" },
-    { "synset" : """01061489-a""", "def" : """not hampered""", "freq" : """38""" },
-    { "synset" : """01061489-a""", "def" : """not under compulsion or restraint""", "freq" : """38""" },
-    { "synset" : """01278818-a""", "def" : """of major significance or importance""", "freq" : """38""" },
-    { "synset" : """01472628-a""", "def" : """of greater importance or stature or rank""", "freq" : """38""" },
-    { "synset" : """00033922-r""", "def" : """in the near future""", "freq" : """38""" },
-    { "synset" : """00050681-r""", "def" : """referring to the degree to which a certain quality is present""", "freq" : """38""" },
-    { "synset" : """00524682-v""", "def" : """take on a certain form, attribute, or aspect""", "freq" : """38""" },
-    { "synset" : """00789448-v""", "def" : """get or try to get into communication (with someone) by telephone""", "freq" : """38""" },
-    { "synset" : """01621555-v""", "def" : """create or manufacture a man-made product""", "freq" : """38""" },
-    { "synset" : """01753788-v""", "def" : """bring into existence""", "freq" : """38""" },
-    { "synset" : """01984902-v""", "def" : """take a seat""", "freq" : """38""" },
-    { "synset" : """02075049-v""", "def" : """flee""", "freq" : """38""" },
-    { "synset" : """02075049-v""", "def" : """take to one's heels""", "freq" : """38""" },
-    { "synset" : """02075049-v""", "def" : """cut and run""", "freq" : """38""" },
-    { "synset" : """02134927-v""", "def" : """appear in a certain way""", "freq" : """38""" },
-    { "synset" : """02280132-v""", "def" : """keep in safety and protect from harm, decay, loss, or destruction""", "freq" : """38""" },
-    { "synset" : """02486932-v""", "def" : """get together socially or for a specific purpose""", "freq" : """38""" },
-    { "synset" : """02635659-v""", "def" : """have as a result or residue""", "freq" : """38""" },
-    { "synset" : """02727462-v""", "def" : """continue in a place, position, or situation""", "freq" : """38""" },
-    { "synset" : """02734488-v""", "def" : """occupy a place or location, also metaphorically""", "freq" : """38""" },
-    { "synset" : """00455599-n""", "def" : """a contest with rules to determine a winner""", "freq" : """38""" },
-    { "synset" : """03365592-n""", "def" : """the inside lower horizontal surface (as of a room, hallway, tent, or other structure)""", "freq" : """38""" },
-    { "synset" : """05129201-n""", "def" : """the linear extent in space from one end to the other""", "freq" : """38""" },
-    { "synset" : """05129201-n""", "def" : """the longest dimension of something that is fixed in place""", "freq" : """38""" },
-    { "synset" : """05282746-n""", "def" : """hard bonelike structures in the jaws of vertebrates""", "freq" : """38""" },
-    { "synset" : """05282746-n""", "def" : """used for biting and chewing or for attack and defense""", "freq" : """38""" },
-    { "synset" : """05805475-n""", "def" : """the cognitive condition of someone who understands""", "freq" : """38""" },
-    { "synset" : """05981230-n""", "def" : """the goal intended to be attained (and which is believed to be attainable)""", "freq" : """38""" },
-    { "synset" : """06396142-n""", "def" : """a subdivision of a written work""", "freq" : """38""" },
-    { "synset" : """06396142-n""", "def" : """usually numbered and titled""", "freq" : """38""" },
-    { "synset" : """06613686-n""", "def" : """a form of entertainment that enacts a story by sound and a sequence of images giving the illusion of continuous movement""", "freq" : """38""" },
-    { "synset" : """06784003-n""", "def" : """a question raised for consideration or solution""", "freq" : """38""" },
-    { "synset" : """08513718-n""", "def" : """any area set aside for a particular purpose""", "freq" : """38""" },
-    { "synset" : """08552138-n""", "def" : """a region marked off for administrative or other purposes""", "freq" : """38""" },
-    { "synset" : """10375506-n""", "def" : """a man who is very old""", "freq" : """38""" },
-    { "synset" : """10794014-n""", "def" : """writes (books or stories or articles or the like) professionally (for pay)""", "freq" : """38""" },
-    { "synset" : """13447361-n""", "def" : """a process in which one or more substances are changed into others""", "freq" : """38""" },
-    { "synset" : """13790912-n""", "def" : """a relation that provides the foundation for something""", "freq" : """38""" },
-    { "synset" : """14839846-n""", "def" : """fine powdery material such as dry earth or pollen that can be blown about in the air""", "freq" : """38""" },
-    { "synset" : """15164957-n""", "def" : """the time after sunrise and before sunset while it is light outside""", "freq" : """38""" },
-    { "synset" : """15166462-n""", "def" : """the latter part of the day (the period of decreasing daylight from late afternoon until nightfall)""", "freq" : """38""" },
-    { "synset" : """00744916-a""", "def" : """not easy""", "freq" : """37""" },
-    { "synset" : """00744916-a""", "def" : """requiring great physical or mental effort to accomplish or comprehend or endure""", "freq" : """37""" },
-    { "synset" : """01148283-a""", "def" : """enjoying or showing or marked by joy or pleasure""", "freq" : """37""" },
-    { "synset" : """02187073-a""", "def" : """being one more than seven""", "freq" : """37""" },
-    { "synset" : """02764251-a""", "def" : """of or relating to the study of the principles of warfare""", "freq" : """37""" },
-    { "synset" : """00002621-r""", "def" : """only a very short time before""", "freq" : """37""" },
-    { "synset" : """00008007-r""", "def" : """to a complete degree or to the full or entire extent""", "freq" : """37""" },
-    { "synset" : """00008007-r""", "def" : """Completely or entirely""", "freq" : """37""" },
-    { "synset" : """00029367-r""", "def" : """besides""", "freq" : """37""" },
-    { "synset" : """00029367-r""", "def" : """in addition""", "freq" : """37""" },
-    { "synset" : """00081486-r""", "def" : """every day""", "freq" : """37""" },
-    { "synset" : """00081486-r""", "def" : """without missing a day""", "freq" : """37""" },
-    { "synset" : """00155621-r""", "def" : """usually""", "freq" : """37""" },
-    { "synset" : """00155621-r""", "def" : """as a rule""", "freq" : """37""" },
-    { "synset" : """00158309-r""", "def" : """indicating exactness or preciseness""", "freq" : """37""" },
-    { "synset" : """00591115-v""", "def" : """perceive (an idea or situation) mentally""", "freq" : """37""" },
-    { "synset" : """00690305-v""", "def" : """have a feeling or perception about oneself in reaction to someone's behavior or attitude""", "freq" : """37""" },
-    { "synset" : """00721098-v""", "def" : """be confident about something""", "freq" : """37""" },
-    { "synset" : """00734054-v""", "def" : """take into consideration for exemplifying purposes""", "freq" : """37""" },
-    { "synset" : """00928015-v""", "def" : """to state or express briefly""", "freq" : """37""" },
-    { "synset" : """01811441-v""", "def" : """be optimistic""", "freq" : """37""" },
-    { "synset" : """01811441-v""", "def" : """be full of hope""", "freq" : """37""" },
-    { "synset" : """01811441-v""", "def" : """have hopes""", "freq" : """37""" },
-    { "synset" : """02075462-v""", "def" : """run away quickly""", "freq" : """37""" },
-    { "synset" : """02370650-v""", "def" : """act or have an effect in a specified way or with a specific effect or outcome""", "freq" : """37""" },
-    { "synset" : """00017222-n""", "def" : """a living organism lacking the power of locomotion""", "freq" : """37""" },
-    { "synset" : """05064037-n""", "def" : """any spatial attributes (especially as defined by outline)""", "freq" : """37""" },
-    { "synset" : """05267345-n""", "def" : """part of an organism consisting of an aggregate of cells having a similar structure and function""", "freq" : """37""" },
-    { "synset" : """05677504-n""", "def" : """a general conscious awareness""", "freq" : """37""" },
-    { "synset" : """05835747-n""", "def" : """an abstract or general idea inferred or derived from specific instances""", "freq" : """37""" },
-    { "synset" : """06303888-n""", "def" : """a word or expression used for some particular thing""", "freq" : """37""" },
-    { "synset" : """08409617-n""", "def" : """a public secondary school usually including grades 9 through 12""", "freq" : """37""" },
-    { "synset" : """09050730-n""", "def" : """the region of the United States lying to the south of the Mason-Dixon line""", "freq" : """37""" },
-    { "synset" : """09426788-n""", "def" : """a division of an ocean or a large body of salt water partially enclosed by land""", "freq" : """37""" },
-    { "synset" : """11511523-n""", "def" : """electrical conduction through a gas in an applied electric field""", "freq" : """37""" },
-    { "synset" : """13489037-n""", "def" : """the process of an individual organism growing organically""", "freq" : """37""" },
-    { "synset" : """13489037-n""", "def" : """a purely biological unfolding of events involved in an organism changing gradually from a simple to a more complex level""", "freq" : """37""" },
-    { "synset" : """14526182-n""", "def" : """the general atmosphere of a place or situation and the effect that it has on people""", "freq" : """37""" },
-    { "synset" : """15206296-n""", "def" : """a time unit of approximately 30 days""", "freq" : """37""" },
-    { "synset" : """00494409-a""", "def" : """considered individually""", "freq" : """36""" },
-    { "synset" : """01495725-a""", "def" : """the greatest or most complete or best possible""", "freq" : """36""" },
-    { "synset" : """01642477-a""", "def" : """new""", "freq" : """36""" },
-    { "synset" : """01687167-a""", "def" : """original and of a kind not seen before""", "freq" : """36""" },
-    { "synset" : """02199177-a""", "def" : """denoting a quantity consisting of 1,000,000 items or units""", "freq" : """36""" },
-    { "synset" : """02952275-a""", "def" : """relating to or characteristic of Christianity""", "freq" : """36""" },
-    { "synset" : """00063172-r""", "def" : """in place of, or as an alternative to""", "freq" : """36""" },
-    { "synset" : """00074407-r""", "def" : """at or to or toward the back or rear""", "freq" : """36""" },
-    { "synset" : """00149510-r""", "def" : """in actual fact""", "freq" : """36""" },
-    { "synset" : """00160834-r""", "def" : """in a relative manner""", "freq" : """36""" },
-    { "synset" : """00160834-r""", "def" : """by comparison to something else""", "freq" : """36""" },
-    { "synset" : """00166025-r""", "def" : """for an extended time or at a distant time""", "freq" : """36""" },
-    { "synset" : """00423971-v""", "def" : """come out into view, as from concealment""", "freq" : """36""" },
-    { "synset" : """00624476-v""", "def" : """interpret something in a certain way""", "freq" : """36""" },
-    { "synset" : """00624476-v""", "def" : """convey a particular meaning or impression""", "freq" : """36""" },
-    { "synset" : """00765649-v""", "def" : """force or impel in an indicated direction""", "freq" : """36""" },
-    { "synset" : """01095218-v""", "def" : """do duty or hold offices""", "freq" : """36""" },
-    { "synset" : """01095218-v""", "def" : """serve in a specific function""", "freq" : """36""" },
-    { "synset" : """01921964-v""", "def" : """go upward with gradual or continuous progress""", "freq" : """36""" },
-    { "synset" : """01977701-v""", "def" : """let fall to the ground""", "freq" : """36""" },
-    { "synset" : """02108026-v""", "def" : """go through (mental or physical states or experiences)""", "freq" : """36""" },
-    { "synset" : """02118476-v""", "def" : """notice or perceive""", "freq" : """36""" },
-    { "synset" : """02267060-v""", "def" : """pay out""", "freq" : """36""" },
-    { "synset" : """02547586-v""", "def" : """give help or assistance""", "freq" : """36""" },
-    { "synset" : """02547586-v""", "def" : """be of service""", "freq" : """36""" },
-    { "synset" : """02717102-v""", "def" : """have with oneself""", "freq" : """36""" },
-    { "synset" : """02717102-v""", "def" : """have on one's person""", "freq" : """36""" },
-    { "synset" : """00028270-n""", "def" : """the continuum of experience in which events pass from the future through the present to the past""", "freq" : """36""" },
-    { "synset" : """00174412-n""", "def" : """any maneuver made as part of progress toward a goal""", "freq" : """36""" },
-    { "synset" : """00719705-n""", "def" : """a specific piece of work required to be done as a duty or for a specific fee""", "freq" : """36""" },
-    { "synset" : """00912960-n""", "def" : """the act or process of producing something""", "freq" : """36""" },
-    { "synset" : """03183080-n""", "def" : """an instrumentality invented for a particular purpose""", "freq" : """36""" },
-    { "synset" : """03224032-n""", "def" : """the entrance (the space in a wall) through which you enter or leave a room or building""", "freq" : """36""" },
-    { "synset" : """03224032-n""", "def" : """the space that a door can close""", "freq" : """36""" },
-    { "synset" : """04424218-n""", "def" : """an artifact""", "freq" : """36""" },
-    { "synset" : """04981139-n""", "def" : """the particular auditory effect produced by a given cause""", "freq" : """36""" },
-    { "synset" : """05320899-n""", "def" : """the sense organ for hearing and equilibrium""", "freq" : """36""" },
-    { "synset" : """05855004-n""", "def" : """a special abstraction""", "freq" : """36""" },
-    { "synset" : """05899087-n""", "def" : """a system of projects or services intended to meet a public need""", "freq" : """36""" },
-    { "synset" : """06208751-n""", "def" : """a way of regarding situations or topics etc.""", "freq" : """36""" },
-    { "synset" : """07221094-n""", "def" : """a message that tells the particulars of an act or occurrence or course of events""", "freq" : """36""" },
-    { "synset" : """07221094-n""", "def" : """presented in writing or drama or cinema or as a radio or television program""", "freq" : """36""" },
-    { "synset" : """07319103-n""", "def" : """an event that accomplishes its intended purpose""", "freq" : """36""" },
-    { "synset" : """08438533-n""", "def" : """the trees and other plants in a large densely wooded area""", "freq" : """36""" },
-    { "synset" : """08660339-n""", "def" : """the extended two-dimensional outer boundary of a three-dimensional object""", "freq" : """36""" },
-    { "synset" : """09876454-n""", "def" : """a male with the same parents as someone else""", "freq" : """36""" },
-    { "synset" : """10794014-n""", "def" : """writes (books or stories or articles or the like) professionally (for pay)""", "freq" : """36""" },
-    { "synset" : """14006945-n""", "def" : """the state of being active""", "freq" : """36""" },
-    { "synset" : """01251128-a""", "def" : """having a low or inadequate temperature or feeling a sensation of coldness or having been made cold by e.g. ice or refrigeration""", "freq" : """35""" },
-    { "synset" : """01375174-a""", "def" : """apprehended with certainty""", "freq" : """35""" },
-    { "synset" : """02032953-a""", "def" : """being or located on or directed toward the side of the body to the west when facing north""", "freq" : """35""" },
-    { "synset" : """02187073-a""", "def" : """being one more than seven""", "freq" : """35""" },
-    { "synset" : """02583619-a""", "def" : """worn to shreds""", "freq" : """35""" },
-    { "synset" : """02583619-a""", "def" : """or wearing torn or ragged clothing""", "freq" : """35""" },
-    { "synset" : """00035718-r""", "def" : """to a moderately sufficient extent or degree""", "freq" : """35""" },
-    { "synset" : """00637259-v""", "def" : """make a mathematical calculation or computation""", "freq" : """35""" },
-    { "synset" : """00647094-v""", "def" : """determine the measurements of something or somebody, take measurements of""", "freq" : """35""" },
-    { "synset" : """00898434-v""", "def" : """express or signify by nodding""", "freq" : """35""" },
-    { "synset" : """01332730-v""", "def" : """provide with a covering or cause to be covered""", "freq" : """35""" },
-    { "synset" : """01482075-v""", "def" : """be suspended or hanging""", "freq" : """35""" },
-    { "synset" : """01645601-v""", "def" : """give rise to""", "freq" : """35""" },
-    { "synset" : """01645601-v""", "def" : """cause to happen or occur, not always intentionally""", "freq" : """35""" },
-    { "synset" : """01729431-v""", "def" : """produce tones with the voice""", "freq" : """35""" },
-    { "synset" : """02087745-v""", "def" : """move in a curve or arc, usually with the intent of hitting""", "freq" : """35""" },
-    { "synset" : """02140033-v""", "def" : """to show, make visible or apparent""", "freq" : """35""" },
-    { "synset" : """02367363-v""", "def" : """perform an action, or work out or perform (an action)""", "freq" : """35""" },
-    { "synset" : """02635659-v""", "def" : """have as a result or residue""", "freq" : """35""" },
-    { "synset" : """02702508-v""", "def" : """be priced at""", "freq" : """35""" },
-    { "synset" : """02778669-n""", "def" : """round object that is hit or thrown or kicked in games""", "freq" : """35""" },
-    { "synset" : """02916350-n""", "def" : """a projectile that is fired from a gun""", "freq" : """35""" },
-    { "synset" : """03001627-n""", "def" : """a seat for one person, with a support for the back""", "freq" : """35""" },
-    { "synset" : """03315023-n""", "def" : """a building or place that provides a particular service or is used for a particular industry""", "freq" : """35""" },
-    { "synset" : """05024254-n""", "def" : """the property of a body that causes it to have weight in a gravitational field""", "freq" : """35""" },
-    { "synset" : """05671325-n""", "def" : """a vaguely specified concern""", "freq" : """35""" },
-    { "synset" : """05861855-n""", "def" : """a mathematical function that is the sum of a number of terms""", "freq" : """35""" },
-    { "synset" : """06532095-n""", "def" : """a legal document codifying the result of deliberations of a committee or society or legislative body""", "freq" : """35""" },
-    { "synset" : """08061042-n""", "def" : """a commercial or industrial enterprise and the people who constitute it""", "freq" : """35""" },
-    { "synset" : """08179689-n""", "def" : """people in general considered as a whole""", "freq" : """35""" },
-    { "synset" : """08182379-n""", "def" : """a large number of things or people considered together""", "freq" : """35""" },
-    { "synset" : """08212347-n""", "def" : """the force of workers available""", "freq" : """35""" },
-    { "synset" : """08365855-n""", "def" : """a form of socialism that abolishes private ownership""", "freq" : """35""" },
-    { "synset" : """08566028-n""", "def" : """either extremity of something that has length""", "freq" : """35""" },
-    { "synset" : """08679972-n""", "def" : """a line leading to a place or point""", "freq" : """35""" },
-    { "synset" : """10399491-n""", "def" : """a father or mother""", "freq" : """35""" },
-    { "synset" : """10399491-n""", "def" : """one who begets or one who gives birth to or nurtures and raises a child""", "freq" : """35""" },
-    { "synset" : """10399491-n""", "def" : """a relative who plays the role of guardian""", "freq" : """35""" },
-    { "synset" : """01594146-a""", "def" : """approximating the statistical norm or average or expected value""", "freq" : """34""" },
-    { "synset" : """01652380-a""", "def" : """affording unobstructed entrance and exit""", "freq" : """34""" },
-    { "synset" : """01652380-a""", "def" : """not shut or closed""", "freq" : """34""" },
-    { "synset" : """01823092-a""", "def" : """not capable of occurring or being accomplished or dealt with""", "freq" : """34""" },
-    { "synset" : """01878466-a""", "def" : """marked by suitability or rightness or appropriateness""", "freq" : """34""" },
-    { "synset" : """02187793-a""", "def" : """being one more than fourteen""", "freq" : """34""" },
-    { "synset" : """02191232-a""", "def" : """being ten more than forty""", "freq" : """34""" },
-    { "synset" : """00047534-r""", "def" : """in addition""", "freq" : """34""" },
-    { "synset" : """00099712-r""", "def" : """comparative of much""", "freq" : """34""" },
-    { "synset" : """00099712-r""", "def" : """to a greater degree or extent""", "freq" : """34""" },
-    { "synset" : """00672433-v""", "def" : """judge tentatively or form an estimate of (quantities or time)""", "freq" : """34""" },
-    { "synset" : """00686447-v""", "def" : """consider or hold as true""", "freq" : """34""" },
-    { "synset" : """00756338-v""", "def" : """assert or affirm strongly""", "freq" : """34""" },
-    { "synset" : """00756338-v""", "def" : """state to be true or existing""", "freq" : """34""" },
-    { "synset" : """00772189-v""", "def" : """present reasons and arguments""", "freq" : """34""" },
-    { "synset" : """00917300-v""", "def" : """express a supposition""", "freq" : """34""" },
-    { "synset" : """01000214-v""", "def" : """make a record of""", "freq" : """34""" },
-    { "synset" : """01000214-v""", "def" : """set down in permanent form""", "freq" : """34""" },
-    { "synset" : """01033527-v""", "def" : """act on verbally or in some form of artistic expression""", "freq" : """34""" },
-    { "synset" : """01091427-v""", "def" : """fight against or resist strongly""", "freq" : """34""" },
-    { "synset" : """01637982-v""", "def" : """make a discovery, make a new finding""", "freq" : """34""" },
-    { "synset" : """01835496-v""", "def" : """change location""", "freq" : """34""" },
-    { "synset" : """01835496-v""", "def" : """move, travel, or proceed, also metaphorically""", "freq" : """34""" },
-    { "synset" : """02110552-v""", "def" : """undergo passive experience of""", "freq" : """34""" },
-    { "synset" : """02143283-v""", "def" : """make manifest""", "freq" : """34""" },
-    { "synset" : """02165304-v""", "def" : """throw a glance at""", "freq" : """34""" },
-    { "synset" : """02165304-v""", "def" : """take a brief look at""", "freq" : """34""" },
-    { "synset" : """02171039-v""", "def" : """listen and pay attention""", "freq" : """34""" },
-    { "synset" : """02207206-v""", "def" : """obtain by purchase""", "freq" : """34""" },
-    { "synset" : """02207206-v""", "def" : """acquire by means of a financial transaction""", "freq" : """34""" },
-    { "synset" : """02210855-v""", "def" : """come into the possession of something concrete or abstract""", "freq" : """34""" },
-    { "synset" : """02346895-v""", "def" : """choose and follow""", "freq" : """34""" },
-    { "synset" : """02346895-v""", "def" : """as of theories, ideas, policies, strategies or plans""", "freq" : """34""" },
-    { "synset" : """02443849-v""", "def" : """direct or control""", "freq" : """34""" },
-    { "synset" : """02443849-v""", "def" : """projects, businesses, etc.""", "freq" : """34""" },
-    { "synset" : """02637592-v""", "def" : """be left""", "freq" : """34""" },
-    { "synset" : """02637592-v""", "def" : """of persons, questions, problems, results, evidence, etc.""", "freq" : """34""" },
-    { "synset" : """02700867-v""", "def" : """contain or hold""", "freq" : """34""" },
-    { "synset" : """02700867-v""", "def" : """have within""", "freq" : """34""" },
-    { "synset" : """02719930-v""", "def" : """be a part or adjunct""", "freq" : """34""" },
-    { "synset" : """02727039-v""", "def" : """change or be different within limits""", "freq" : """34""" },
-    { "synset" : """00720565-n""", "def" : """the actions and activities assigned to or required or expected of a person or group""", "freq" : """34""" },
-    { "synset" : """00883297-n""", "def" : """the activities of educating or instructing""", "freq" : """34""" },
-    { "synset" : """00883297-n""", "def" : """activities that impart knowledge or skill""", "freq" : """34""" },
-    { "synset" : """04105068-n""", "def" : """a protective covering that covers or forms the top of a building""", "freq" : """34""" },
-    { "synset" : """05403149-n""", "def" : """an amber, watery fluid, rich in proteins, that separates out when blood coagulates""", "freq" : """34""" },
-    { "synset" : """05546540-n""", "def" : """the part of an organism (human or animal) that connects the head to the rest of the body""", "freq" : """34""" },
-    { "synset" : """05547508-n""", "def" : """the passage to the stomach and lungs""", "freq" : """34""" },
-    { "synset" : """05547508-n""", "def" : """in the front part of the neck below the chin and above the collarbone""", "freq" : """34""" },
-    { "synset" : """05552607-n""", "def" : """the part of the human torso between the neck and the diaphragm or the corresponding part in other vertebrates""", "freq" : """34""" },
-    { "synset" : """05868954-n""", "def" : """an abstract part of something""", "freq" : """34""" },
-    { "synset" : """05980875-n""", "def" : """the state of affairs that a plan is intended to achieve and that (when achieved) terminates behavior intended to achieve it""", "freq" : """34""" },
-    { "synset" : """06256697-n""", "def" : """one side of one leaf (of a book or magazine or newspaper or letter etc.) or the written or pictorial matter it contains""", "freq" : """34""" },
-    { "synset" : """06635509-n""", "def" : """information (data or ideas or observations) that can be used or reworked into a finished form""", "freq" : """34""" },
-    { "synset" : """06636259-n""", "def" : """a statement or assertion of verified information about something that is the case or has happened""", "freq" : """34""" },
-    { "synset" : """07965937-n""", "def" : """people in general""", "freq" : """34""" },
-    { "synset" : """07965937-n""", "def" : """especially a distinctive group of people with some shared interest""", "freq" : """34""" },
-    { "synset" : """08209687-n""", "def" : """the force of policemen and officers""", "freq" : """34""" },
-    { "synset" : """08507558-n""", "def" : """the place where something begins, where it springs into being""", "freq" : """34""" },
-    { "synset" : """08546183-n""", "def" : """a region created by territorial division for the purpose of local government""", "freq" : """34""" },
-    { "synset" : """08621598-n""", "def" : """the particular portion of space occupied by something""", "freq" : """34""" },
-    { "synset" : """13650447-n""", "def" : """a unit of length equal to 3 feet""", "freq" : """34""" },
-    { "synset" : """13650447-n""", "def" : """defined as 91.44 centimeters""", "freq" : """34""" },
-    { "synset" : """13650447-n""", "def" : """originally taken to be the average length of a stride""", "freq" : """34""" },
-    { "synset" : """00445548-a""", "def" : """separated in space or coming from or going to a distance""", "freq" : """33""" },
-    { "synset" : """00816481-a""", "def" : """being or occurring at an advanced period of time or after a usual or expected time""", "freq" : """33""" },
-    { "synset" : """01143279-a""", "def" : """happening without warning or in a short space of time""", "freq" : """33""" },
-    { "synset" : """01277426-a""", "def" : """most important element""", "freq" : """33""" },
-    { "synset" : """01394922-a""", "def" : """small or little relative to something else""", "freq" : """33""" },
-    { "synset" : """02186970-a""", "def" : """being one more than six""", "freq" : """33""" },
-    { "synset" : """02196107-a""", "def" : """being ten more than ninety""", "freq" : """33""" },
-    { "synset" : """02202443-a""", "def" : """coming next after the third and just before the fifth in position or time or degree or magnitude""", "freq" : """33""" },
-    { "synset" : """03003344-a""", "def" : """of or relating to or characteristic of England or its culture or people""", "freq" : """33""" },
-    { "synset" : """00029985-r""", "def" : """to or at a greater extent or degree or a more advanced stage""", "freq" : """33""" },
-    { "synset" : """00246296-r""", "def" : """absolutely""", "freq" : """33""" },
-    { "synset" : """00158503-v""", "def" : """raise the level or amount of something""", "freq" : """33""" },
-    { "synset" : """00423702-v""", "def" : """appear or become visible""", "freq" : """33""" },
-    { "synset" : """00423702-v""", "def" : """make a showing""", "freq" : """33""" },
-    { "synset" : """00592883-v""", "def" : """accept (someone) to be what is claimed or accept his power and authority""", "freq" : """33""" },
-    { "synset" : """00634472-v""", "def" : """decide by reasoning""", "freq" : """33""" },
-    { "synset" : """00634472-v""", "def" : """draw or come to a conclusion""", "freq" : """33""" },
-    { "synset" : """00690614-v""", "def" : """deem to be""", "freq" : """33""" },
-    { "synset" : """00717358-v""", "def" : """show a response or a reaction to something""", "freq" : """33""" },
-    { "synset" : """00720063-v""", "def" : """look forward to the probable occurrence of""", "freq" : """33""" },
-    { "synset" : """00730758-v""", "def" : """make, formulate, or derive in the mind""", "freq" : """33""" },
-    { "synset" : """00918872-v""", "def" : """establish after a calculation, investigation, experiment, survey, or study""", "freq" : """33""" },
-    { "synset" : """00958334-v""", "def" : """to say, state, or perform again""", "freq" : """33""" },
-    { "synset" : """01010118-v""", "def" : """state emphatically and authoritatively""", "freq" : """33""" },
-    { "synset" : """01021128-v""", "def" : """clarify by giving an example of""", "freq" : """33""" },
-    { "synset" : """01078783-v""", "def" : """oppose, as in hostility or a competition""", "freq" : """33""" },
-    { "synset" : """01206218-v""", "def" : """make physical contact with, come in contact with""", "freq" : """33""" },
-    { "synset" : """01744611-v""", "def" : """have (one's written work) issued for publication""", "freq" : """33""" },
-    { "synset" : """01940403-v""", "def" : """travel through the air""", "freq" : """33""" },
-    { "synset" : """01940403-v""", "def" : """be airborne""", "freq" : """33""" },
-    { "synset" : """02236124-v""", "def" : """receive willingly something given or offered""", "freq" : """33""" },
-    { "synset" : """02409412-v""", "def" : """engage or hire for work""", "freq" : """33""" },
-    { "synset" : """02528380-v""", "def" : """be unsuccessful""", "freq" : """33""" },
-    { "synset" : """02692882-v""", "def" : """be around, often idly or without specific purpose""", "freq" : """33""" },
-    { "synset" : """03699975-n""", "def" : """any mechanical or electrical device that transmits or modifies energy to perform or assist in the performance of human tasks""", "freq" : """33""" },
-    { "synset" : """05901508-n""", "def" : """a plan of action adopted by an individual or social group""", "freq" : """33""" },
-    { "synset" : """08168978-n""", "def" : """a politically organized body of people under a single government""", "freq" : """33""" },
-    { "synset" : """09303008-n""", "def" : """a local and well-defined elevation of the land""", "freq" : """33""" },
-    { "synset" : """09738708-n""", "def" : """a native or inhabitant of the United States""", "freq" : """33""" },
-    { "synset" : """09937250-n""", "def" : """a commissioned military officer in the United States Army or Air Force or Marines who ranks above a lieutenant colonel and below a brigadier general""", "freq" : """33""" },
-    { "synset" : """10153414-n""", "def" : """an informal term for a youth or man""", "freq" : """33""" },
-    { "synset" : """13743269-n""", "def" : """the cardinal number that is the sum of one and one or a numeral representing this number""", "freq" : """33""" },
-    { "synset" : """14585519-n""", "def" : """a tiny piece of anything""", "freq" : """33""" },
-    { "synset" : """15163797-n""", "def" : """first day of the week""", "freq" : """33""" },
-    { "synset" : """15163797-n""", "def" : """observed as a day of rest and worship by most Christians""", "freq" : """33""" },
-    { "synset" : """00492677-a""", "def" : """belonging to or participated in by a community as a whole""", "freq" : """32""" },
-    { "synset" : """00492677-a""", "def" : """public""", "freq" : """32""" },
-    { "synset" : """00515380-a""", "def" : """constituting the full quantity or extent""", "freq" : """32""" },
-    { "synset" : """00515380-a""", "def" : """complete""", "freq" : """32""" },
-    { "synset" : """00624026-a""", "def" : """large or relatively large in number or amount or extent or degree""", "freq" : """32""" },
-    { "synset" : """01184932-a""", "def" : """of comparatively great physical weight or density""", "freq" : """32""" },
-    { "synset" : """02188317-a""", "def" : """denoting a quantity consisting of 20 items or units""", "freq" : """32""" },
-    { "synset" : """00008600-r""", "def" : """without any others being included or involved""", "freq" : """32""" },
-    { "synset" : """00039058-r""", "def" : """without doubt or question""", "freq" : """32""" },
-    { "synset" : """00079947-r""", "def" : """at an earlier place""", "freq" : """32""" },
-    { "synset" : """00231557-v""", "def" : """increase in size by natural process""", "freq" : """32""" },
-    { "synset" : """00618878-v""", "def" : """recognize as being""", "freq" : """32""" },
-    { "synset" : """00618878-v""", "def" : """establish the identity of someone or something""", "freq" : """32""" },
-    { "synset" : """00684838-v""", "def" : """consider as part of something""", "freq" : """32""" },
-    { "synset" : """00708538-v""", "def" : """have in mind as a purpose""", "freq" : """32""" },
-    { "synset" : """00728617-v""", "def" : """be fully aware or cognizant of""", "freq" : """32""" },
-    { "synset" : """00803325-v""", "def" : """grant authorization or clearance for""", "freq" : """32""" },
-    { "synset" : """00940384-v""", "def" : """articulate""", "freq" : """32""" },
-    { "synset" : """00940384-v""", "def" : """either verbally or with a cry, shout, or noise""", "freq" : """32""" },
-    { "synset" : """01060494-v""", "def" : """convey, as of a compliment, regards, attention, etc.""", "freq" : """32""" },
-    { "synset" : """01060494-v""", "def" : """bestow""", "freq" : """32""" },
-    { "synset" : """01345109-v""", "def" : """move so that an opening or passage is obstructed""", "freq" : """32""" },
-    { "synset" : """01345109-v""", "def" : """make shut""", "freq" : """32""" },
-    { "synset" : """01447257-v""", "def" : """exert pressure or force to or upon""", "freq" : """32""" },
-    { "synset" : """01686956-v""", "def" : """show in, or as in, a picture""", "freq" : """32""" },
-    { "synset" : """01767163-v""", "def" : """be worried, concerned, anxious, troubled, or uneasy""", "freq" : """32""" },
-    { "synset" : """01857392-v""", "def" : """stay put (in a certain place)""", "freq" : """32""" },
-    { "synset" : """01885845-v""", "def" : """move slowly""", "freq" : """32""" },
-    { "synset" : """01885845-v""", "def" : """in the case of people or animals with the body near the ground""", "freq" : """32""" },
-    { "synset" : """02050132-v""", "def" : """go across or through""", "freq" : """32""" },
-    { "synset" : """02077656-v""", "def" : """take something or somebody with oneself somewhere""", "freq" : """32""" },
-    { "synset" : """02202384-v""", "def" : """retain possession of""", "freq" : """32""" },
-    { "synset" : """02525447-v""", "def" : """have an effect or outcome""", "freq" : """32""" },
-    { "synset" : """02525447-v""", "def" : """often the one desired or expected""", "freq" : """32""" },
-    { "synset" : """02530167-v""", "def" : """make an effort or attempt""", "freq" : """32""" },
-    { "synset" : """02531625-v""", "def" : """put to the test, as for its quality, or give experimental use to""", "freq" : """32""" },
-    { "synset" : """02633881-v""", "def" : """be shown or be found to be""", "freq" : """32""" },
-    { "synset" : """02710402-v""", "def" : """be adjacent or come together""", "freq" : """32""" },
-    { "synset" : """02726305-n""", "def" : """a suite of rooms usually on one floor of an apartment house""", "freq" : """32""" },
-    { "synset" : """03327234-n""", "def" : """a barrier that serves to enclose an area""", "freq" : """32""" },
-    { "synset" : """05134547-n""", "def" : """the extent downward or backward or inward""", "freq" : """32""" },
-    { "synset" : """05143077-n""", "def" : """a reason for wanting something done""", "freq" : """32""" },
-    { "synset" : """05671325-n""", "def" : """a vaguely specified concern""", "freq" : """32""" },
-    { "synset" : """05814291-n""", "def" : """some situation or event that is thought about""", "freq" : """32""" },
-    { "synset" : """06548671-n""", "def" : """document giving the tax collector information about the taxpayer's tax liability""", "freq" : """32""" },
-    { "synset" : """06765044-n""", "def" : """a statement that expresses a personal opinion or belief or adds information""", "freq" : """32""" },
-    { "synset" : """07007945-n""", "def" : """a dramatic work intended for performance by actors on a stage""", "freq" : """32""" },
-    { "synset" : """07289831-n""", "def" : """an event""", "freq" : """32""" },
-    { "synset" : """07484265-n""", "def" : """the feeling that accompanies an unsatisfied state""", "freq" : """32""" },
-    { "synset" : """07800091-n""", "def" : """food for domestic livestock""", "freq" : """32""" },
-    { "synset" : """07991364-n""", "def" : """a group of people who adhere to a common faith and habitually attend a given church""", "freq" : """32""" },
-    { "synset" : """13278375-n""", "def" : """a sum of money paid or a claim discharged""", "freq" : """32""" },
-    { "synset" : """14322699-n""", "def" : """a symptom of some physical hurt or disorder""", "freq" : """32""" },
-    { "synset" : """14634591-n""", "def" : """a common nonmetallic element belonging to the halogens""", "freq" : """32""" },
-    { "synset" : """14634591-n""", "def" : """best known as a heavy yellow irritating toxic gas""", "freq" : """32""" },
-    { "synset" : """14634591-n""", "def" : """used to purify water and as a bleaching agent and disinfectant""", "freq" : """32""" },
-    { "synset" : """14634591-n""", "def" : """occurs naturally only as a salt (as in sea water)""", "freq" : """32""" },
-    { "synset" : """00515380-a""", "def" : """constituting the full quantity or extent""", "freq" : """31""" },
-    { "synset" : """00515380-a""", "def" : """complete""", "freq" : """31""" },
-    { "synset" : """00889831-a""", "def" : """having the same quantity, value, or measure as another""", "freq" : """31""" },
-    { "synset" : """01010271-a""", "def" : """occurring at or forming an end or termination""", "freq" : """31""" },
-    { "synset" : """01767329-a""", "def" : """concerning or affecting a particular person or his or her private life and personality""", "freq" : """31""" },
-    { "synset" : """02188817-a""", "def" : """being five more than twenty""", "freq" : """31""" },
-    { "synset" : """00107416-r""", "def" : """in the recent past""", "freq" : """31""" },
-    { "synset" : """00147876-r""", "def" : """with ease""", "freq" : """31""" },
-    { "synset" : """00631737-v""", "def" : """expect, believe, or suppose""", "freq" : """31""" },
-    { "synset" : """00689950-v""", "def" : """look on as or consider""", "freq" : """31""" },
-    { "synset" : """01028748-v""", "def" : """assign a specified (usually proper) name to""", "freq" : """31""" },
-    { "synset" : """01629589-v""", "def" : """cause to happen or to occur as a consequence""", "freq" : """31""" },
-    { "synset" : """01638368-v""", "def" : """make or work out a plan for""", "freq" : """31""" },
-    { "synset" : """01638368-v""", "def" : """devise""", "freq" : """31""" },
-    { "synset" : """01824736-v""", "def" : """prefer or wish to do something""", "freq" : """31""" },
-    { "synset" : """01974062-v""", "def" : """raise from a lower to a higher position""", "freq" : """31""" },
-    { "synset" : """02015598-v""", "def" : """move out of or depart from""", "freq" : """31""" },
-    { "synset" : """02051694-v""", "def" : """move past""", "freq" : """31""" },
-    { "synset" : """02297142-v""", "def" : """present for acceptance or rejection""", "freq" : """31""" },
-    { "synset" : """02324478-v""", "def" : """bestow a quality on""", "freq" : """31""" },
-    { "synset" : """02375131-v""", "def" : """carry out or participate in an activity""", "freq" : """31""" },
-    { "synset" : """02375131-v""", "def" : """be involved in""", "freq" : """31""" },
-    { "synset" : """02378453-v""", "def" : """have a personal or business relationship with someone""", "freq" : """31""" },
-    { "synset" : """02554922-v""", "def" : """contribute to the progress or growth of""", "freq" : """31""" },
-    { "synset" : """02612762-v""", "def" : """be present at (meetings, church services, university), etc.""", "freq" : """31""" },
-    { "synset" : """02620587-v""", "def" : """form or compose""", "freq" : """31""" },
-    { "synset" : """02632167-v""", "def" : """have as an attribute, knowledge, or skill""", "freq" : """31""" },
-    { "synset" : """02632353-v""", "def" : """be without""", "freq" : """31""" },
-    { "synset" : """00308370-n""", "def" : """a journey for some purpose (usually including the return)""", "freq" : """31""" },
-    { "synset" : """00877625-n""", "def" : """a quick look""", "freq" : """31""" },
-    { "synset" : """01113068-n""", "def" : """the exchange of goods for an agreed sum of money""", "freq" : """31""" },
-    { "synset" : """03354903-n""", "def" : """emblem usually consisting of a rectangular piece of cloth of distinctive design""", "freq" : """31""" },
-    { "synset" : """05768553-n""", "def" : """a series of mental images and emotions occurring during sleep""", "freq" : """31""" },
-    { "synset" : """05809878-n""", "def" : """all of your experiences that determine how things appear to you""", "freq" : """31""" },
-    { "synset" : """05919866-n""", "def" : """the idea that is intended""", "freq" : """31""" },
-    { "synset" : """05928118-n""", "def" : """an iconic mental representation""", "freq" : """31""" },
-    { "synset" : """06267145-n""", "def" : """a daily or weekly publication on folded sheets""", "freq" : """31""" },
-    { "synset" : """06267145-n""", "def" : """contains news and articles and advertisements""", "freq" : """31""" },
-    { "synset" : """06285090-n""", "def" : """a string of words satisfying the grammatical rules of a language""", "freq" : """31""" },
-    { "synset" : """06482401-n""", "def" : """a distinct part that can be specified separately in a group of things that could be enumerated on a list""", "freq" : """31""" },
-    { "synset" : """07327805-n""", "def" : """anything that contributes causally to a result""", "freq" : """31""" },
-    { "synset" : """09428741-n""", "def" : """a very thin slice (of tissue or mineral or other substance) for examination under a microscope""", "freq" : """31""" },
-    { "synset" : """11452218-n""", "def" : """a thermodynamic quantity equivalent to the capacity of a physical system to do work""", "freq" : """31""" },
-    { "synset" : """11452218-n""", "def" : """the units of energy are joules or ergs""", "freq" : """31""" },
-    { "synset" : """11499284-n""", "def" : """energy that is radiated or transmitted in the form of rays or waves or particles""", "freq" : """31""" },
-    { "synset" : """11669921-n""", "def" : """a plant cultivated for its blooms or blossoms""", "freq" : """31""" },
-    { "synset" : """13658828-n""", "def" : """a metric unit of length equal to one hundredth of a meter""", "freq" : """31""" },
-    { "synset" : """13809207-n""", "def" : """something determined in relation to something that includes it""", "freq" : """31""" },
-    { "synset" : """15266911-n""", "def" : """the point in time at which something ends""", "freq" : """31""" },
-    { "synset" : """00292937-a""", "def" : """actively or fully engaged or occupied""", "freq" : """30""" },
-    { "synset" : """00880207-a""", "def" : """made greater in size or amount or degree""", "freq" : """30""" },
-    { "synset" : """01086545-a""", "def" : """holding or containing nothing""", "freq" : """30""" },
-    { "synset" : """01104026-a""", "def" : """unique or specific to a person or thing or category""", "freq" : """30""" },
-    { "synset" : """01387319-a""", "def" : """unusually great in size or amount or degree or especially extent or scope""", "freq" : """30""" },
-    { "synset" : """01409581-a""", "def" : """resembling or similar""", "freq" : """30""" },
-    { "synset" : """01409581-a""", "def" : """having the same or some of the same characteristics""", "freq" : """30""" },
-    { "synset" : """01606648-a""", "def" : """in or characteristic of a region of the United States south of (approximately) the Mason-Dixon line""", "freq" : """30""" },
-    { "synset" : """02335828-a""", "def" : """of a quantity that can fulfill a need or requirement but without being abundant""", "freq" : """30""" },
-    { "synset" : """00012779-r""", "def" : """thoroughly or completely""", "freq" : """30""" },
-    { "synset" : """00012779-r""", "def" : """fully""", "freq" : """30""" },
-    { "synset" : """00021212-r""", "def" : """now and then or here and there""", "freq" : """30""" },
-    { "synset" : """00022131-r""", "def" : """to the same degree""", "freq" : """30""" },
-    { "synset" : """00025559-r""", "def" : """in or at or to some place""", "freq" : """30""" },
-    { "synset" : """00060632-r""", "def" : """at an earlier time or formerly""", "freq" : """30""" },
-    { "synset" : """00066781-r""", "def" : """at or in the front""", "freq" : """30""" },
-    { "synset" : """00634906-v""", "def" : """find the solution to (a problem or question) or understand the meaning of""", "freq" : """30""" },
-    { "synset" : """00755745-v""", "def" : """consider obligatory""", "freq" : """30""" },
-    { "synset" : """00755745-v""", "def" : """request and expect""", "freq" : """30""" },
-    { "synset" : """00813978-v""", "def" : """speak with others about (something)""", "freq" : """30""" },
-    { "synset" : """00813978-v""", "def" : """talk (something) over in detail""", "freq" : """30""" },
-    { "synset" : """00813978-v""", "def" : """have a discussion""", "freq" : """30""" },
-    { "synset" : """00887463-v""", "def" : """give entirely to a specific person, activity, or cause""", "freq" : """30""" },
-    { "synset" : """01023259-v""", "def" : """repeat a passage from""", "freq" : """30""" },
-    { "synset" : """01135783-v""", "def" : """start firing a weapon""", "freq" : """30""" },
-    { "synset" : """01170052-v""", "def" : """take in liquids""", "freq" : """30""" },
-    { "synset" : """01494310-v""", "def" : """put into a certain place or abstract location""", "freq" : """30""" },
-    { "synset" : """01732921-v""", "def" : """lead, as in the performance of a composition""", "freq" : """30""" },
-    { "synset" : """01733477-v""", "def" : """organize or be responsible for""", "freq" : """30""" },
-    { "synset" : """01955984-v""", "def" : """be carried or travel on or in a vehicle""", "freq" : """30""" },
-    { "synset" : """02055649-v""", "def" : """move very fast""", "freq" : """30""" },
-    { "synset" : """02168965-v""", "def" : """look searchingly""", "freq" : """30""" },
-    { "synset" : """02461314-v""", "def" : """express one's preference for a candidate or for a measure or resolution""", "freq" : """30""" },
-    { "synset" : """02461314-v""", "def" : """cast a vote""", "freq" : """30""" },
-    { "synset" : """02514187-v""", "def" : """interact in a certain way""", "freq" : """30""" },
-    { "synset" : """01220984-n""", "def" : """manner of acting or controlling yourself""", "freq" : """30""" },
-    { "synset" : """03247620-n""", "def" : """a substance that is used as a medicine or narcotic""", "freq" : """30""" },
-    { "synset" : """03497657-n""", "def" : """headdress that protects the head from bad weather""", "freq" : """30""" },
-    { "synset" : """03497657-n""", "def" : """has shaped crown and usually a brim""", "freq" : """30""" },
-    { "synset" : """05091770-n""", "def" : """a measure of how likely it is that some event will occur""", "freq" : """30""" },
-    { "synset" : """05091770-n""", "def" : """a number expressing the ratio of favorable cases to the whole number of cases possible""", "freq" : """30""" },
-    { "synset" : """05387544-n""", "def" : """either of two saclike respiratory organs in the chest of vertebrates""", "freq" : """30""" },
-    { "synset" : """05387544-n""", "def" : """serves to remove carbon dioxide and provide oxygen to the blood""", "freq" : """30""" },
-    { "synset" : """08307589-n""", "def" : """a formally arranged gathering""", "freq" : """30""" },
-    { "synset" : """09358358-n""", "def" : """the natural satellite of the Earth""", "freq" : """30""" },
-    { "synset" : """10420031-n""", "def" : """one praying humbly for something""", "freq" : """30""" },
-    { "synset" : """13244109-n""", "def" : """something owned""", "freq" : """30""" },
-    { "synset" : """13244109-n""", "def" : """any tangible or intangible possession that is owned by someone""", "freq" : """30""" },
-    { "synset" : """13957601-n""", "def" : """the state of being present""", "freq" : """30""" },
-    { "synset" : """13957601-n""", "def" : """current existence""", "freq" : """30""" },
-    { "synset" : """14974264-n""", "def" : """a material made of cellulose pulp derived mainly from wood or rags or certain grasses""", "freq" : """30""" },
-    { "synset" : """00077645-a""", "def" : """filled with fear or apprehension""", "freq" : """29""" },
-    { "synset" : """00134701-a""", "def" : """suitable for a particular person or place or condition etc""", "freq" : """29""" },
-    { "synset" : """00489108-a""", "def" : """occurring or encountered or experienced or observed frequently or in accordance with regular practice or procedure""", "freq" : """29""" },
-    { "synset" : """00834198-a""", "def" : """producing or capable of producing an intended result or having a striking effect""", "freq" : """29""" },
-    { "synset" : """01727926-a""", "def" : """earlier than the present time""", "freq" : """29""" },
-    { "synset" : """01727926-a""", "def" : """no longer current""", "freq" : """29""" },
-    { "synset" : """01778212-a""", "def" : """involving the body as distinguished from the mind or spirit""", "freq" : """29""" },
-    { "synset" : """02118379-a""", "def" : """concerned with work or important matters rather than play or trivialities""", "freq" : """29""" },
-    { "synset" : """02390335-a""", "def" : """marked by extreme lack of restraint or control""", "freq" : """29""" },
-    { "synset" : """02760116-a""", "def" : """relating to the study or practice of medicine""", "freq" : """29""" },
-    { "synset" : """00010466-r""", "def" : """to the greatest degree or extent""", "freq" : """29""" },
-    { "synset" : """00010466-r""", "def" : """completely or entirely""", "freq" : """29""" },
-    { "synset" : """00049102-r""", "def" : """used to preface a command or reproof or request""", "freq" : """29""" },
-    { "synset" : """00415963-r""", "def" : """more than necessary""", "freq" : """29""" },
-    { "synset" : """00149583-v""", "def" : """enter or assume a certain state or condition""", "freq" : """29""" },
-    { "synset" : """00352826-v""", "def" : """bring to an end or halt""", "freq" : """29""" },
-    { "synset" : """00591115-v""", "def" : """perceive (an idea or situation) mentally""", "freq" : """29""" },
-    { "synset" : """00699815-v""", "def" : """fix conclusively or authoritatively""", "freq" : """29""" },
-    { "synset" : """00721437-v""", "def" : """make a discovery""", "freq" : """29""" },
-    { "synset" : """00907147-v""", "def" : """express complaints, discontent, displeasure, or unhappiness""", "freq" : """29""" },
-    { "synset" : """00917300-v""", "def" : """express a supposition""", "freq" : """29""" },
-    { "synset" : """01013367-v""", "def" : """to stress, single out as important""", "freq" : """29""" },
-    { "synset" : """01440139-v""", "def" : """move forward or upward in order to touch""", "freq" : """29""" },
-    { "synset" : """01440139-v""", "def" : """also in a metaphorical sense""", "freq" : """29""" },
-    { "synset" : """01525666-v""", "def" : """perform as expected when applied""", "freq" : """29""" },
-    { "synset" : """01640855-v""", "def" : """put in effect""", "freq" : """29""" },
-    { "synset" : """01725051-v""", "def" : """play on an instrument""", "freq" : """29""" },
-    { "synset" : """01733477-v""", "def" : """organize or be responsible for""", "freq" : """29""" },
-    { "synset" : """01935233-v""", "def" : """to go or travel towards""", "freq" : """29""" },
-    { "synset" : """02014165-v""", "def" : """depart for someplace""", "freq" : """29""" },
-    { "synset" : """02118933-v""", "def" : """observe with care or pay close attention to""", "freq" : """29""" },
-    { "synset" : """02150948-v""", "def" : """see or watch""", "freq" : """29""" },
-    { "synset" : """02466670-v""", "def" : """make laws, bills, etc. or bring into effect by legislation""", "freq" : """29""" },
-    { "synset" : """02493030-v""", "def" : """go to see a place, as for entertainment""", "freq" : """29""" },
-    { "synset" : """02618149-v""", "def" : """continue to live through hardship or adversity""", "freq" : """29""" },
-    { "synset" : """02624263-v""", "def" : """come into existence""", "freq" : """29""" },
-    { "synset" : """02624263-v""", "def" : """take on form or shape""", "freq" : """29""" },
-    { "synset" : """02646378-v""", "def" : """be worthy or deserving""", "freq" : """29""" },
-    { "synset" : """02676789-v""", "def" : """be pertinent or relevant or applicable""", "freq" : """29""" },
-    { "synset" : """00021265-n""", "def" : """any substance that can be metabolized by an animal to give energy and build tissue""", "freq" : """29""" },
-    { "synset" : """00039297-n""", "def" : """close interaction""", "freq" : """29""" },
-    { "synset" : """00585174-n""", "def" : """performance of duties or provision of space and equipment helpful to others""", "freq" : """29""" },
-    { "synset" : """00941140-n""", "def" : """ideas or actions intended to deal with a problem or situation""", "freq" : """29""" },
-    { "synset" : """01114824-n""", "def" : """a particular instance of selling""", "freq" : """29""" },
-    { "synset" : """01503061-n""", "def" : """warm-blooded egg-laying vertebrates characterized by feathers and forelimbs modified as wings""", "freq" : """29""" },
-    { "synset" : """02472293-n""", "def" : """any living or extinct member of the family Hominidae characterized by superior intelligence, articulate speech, and erect carriage""", "freq" : """29""" },
-    { "synset" : """02852523-n""", "def" : """a solid piece of something (usually having flat rectangular sides)""", "freq" : """29""" },
-    { "synset" : """03057021-n""", "def" : """an outer garment that has sleeves and covers the body from shoulder down""", "freq" : """29""" },
-    { "synset" : """03057021-n""", "def" : """worn outdoors""", "freq" : """29""" },
-    { "synset" : """04565375-n""", "def" : """any instrument or instrumentality used in fighting or hunting""", "freq" : """29""" },
-    { "synset" : """05099796-n""", "def" : """the amount of energy transmitted (as by acoustic or electromagnetic radiation)""", "freq" : """29""" },
-    { "synset" : """05194578-n""", "def" : """a powerful effect or influence""", "freq" : """29""" },
-    { "synset" : """05195362-n""", "def" : """a force that compels""", "freq" : """29""" },
-    { "synset" : """05330244-n""", "def" : """located near the base of the neck""", "freq" : """29""" },
-    { "synset" : """05838176-n""", "def" : """a position or opinion or judgment reached after consideration""", "freq" : """29""" },
-    { "synset" : """06739990-n""", "def" : """an explanation of the cause of some phenomenon""", "freq" : """29""" },
-    { "synset" : """06746005-n""", "def" : """a statement (either spoken or written) that is made to reply to a question or request or criticism or accusation""", "freq" : """29""" },
-    { "synset" : """06878071-n""", "def" : """a facial expression characterized by turning up the corners of the mouth""", "freq" : """29""" },
-    { "synset" : """06878071-n""", "def" : """usually shows pleasure or amusement""", "freq" : """29""" },
-    { "synset" : """07283608-n""", "def" : """an event that happens""", "freq" : """29""" },
-    { "synset" : """08008335-n""", "def" : """a group of people who work together""", "freq" : """29""" },
-    { "synset" : """08226699-n""", "def" : """a community of people smaller than a town""", "freq" : """29""" },
-    { "synset" : """08256968-n""", "def" : """an organization to gain political power""", "freq" : """29""" },
-    { "synset" : """08355791-n""", "def" : """the executive and legislative and judicial branches of the federal government of the United States""", "freq" : """29""" },
-    { "synset" : """08544813-n""", "def" : """the territory occupied by a nation""", "freq" : """29""" },
-    { "synset" : """08653314-n""", "def" : """the region above the ground""", "freq" : """29""" },
-    { "synset" : """09367991-n""", "def" : """anything that is necessary but lacking""", "freq" : """29""" },
-    { "synset" : """09632518-n""", "def" : """a person who works at a specific occupation""", "freq" : """29""" },
-    { "synset" : """09923673-n""", "def" : """a native or naturalized member of a state or other political community""", "freq" : """29""" },
-    { "synset" : """10014939-n""", "def" : """someone who controls resources and expenditures""", "freq" : """29""" },
-    { "synset" : """10078806-n""", "def" : """a person who operates a farm""", "freq" : """29""" },
-    { "synset" : """13285176-n""", "def" : """assets belonging to or due to or contributed by an individual person or group""", "freq" : """29""" },
-    { "synset" : """13358549-n""", "def" : """a reserve of money set aside for some purpose""", "freq" : """29""" },
-    { "synset" : """13961642-n""", "def" : """the condition of living or the state of being alive""", "freq" : """29""" },
-    { "synset" : """15211484-n""", "def" : """the month following April and preceding June""", "freq" : """29""" },
-    { "synset" : """01672607-a""", "def" : """not exceptional in any way especially in quality or ability or size or degree""", "freq" : """28""" },
-    { "synset" : """02176178-a""", "def" : """complicated in structure""", "freq" : """28""" },
-    { "synset" : """02176178-a""", "def" : """consisting of interconnected parts""", "freq" : """28""" },
-    { "synset" : """00003483-r""", "def" : """in essence""", "freq" : """28""" },
-    { "synset" : """00003483-r""", "def" : """at bottom or by one's (or its) very nature""", "freq" : """28""" },
-    { "synset" : """00027384-r""", "def" : """despite anything to the contrary (usually following a concession)""", "freq" : """28""" },
-    { "synset" : """00073897-r""", "def" : """for the most part""", "freq" : """28""" },
-    { "synset" : """00147386-r""", "def" : """to so extreme a degree""", "freq" : """28""" },
-    { "synset" : """00157967-r""", "def" : """without anybody else or anything else""", "freq" : """28""" },
-    { "synset" : """00181342-r""", "def" : """as soon as""", "freq" : """28""" },
-    { "synset" : """00709625-v""", "def" : """plan something for a specific role or purpose or effect""", "freq" : """28""" },
-    { "synset" : """00746718-v""", "def" : """give instructions to or direct somebody to do something with authority""", "freq" : """28""" },
-    { "synset" : """00772967-v""", "def" : """bring forward and present to the mind""", "freq" : """28""" },
-    { "synset" : """00836236-v""", "def" : """express indirectly by an image, form, or model""", "freq" : """28""" },
-    { "synset" : """00836236-v""", "def" : """be a symbol""", "freq" : """28""" },
-    { "synset" : """00917772-v""", "def" : """make a prediction about""", "freq" : """28""" },
-    { "synset" : """00917772-v""", "def" : """tell in advance""", "freq" : """28""" },
-    { "synset" : """00981276-v""", "def" : """formulate in a particular style or language""", "freq" : """28""" },
-    { "synset" : """01137138-v""", "def" : """hit with a missile from a weapon""", "freq" : """28""" },
-    { "synset" : """01564144-v""", "def" : """destroy completely""", "freq" : """28""" },
-    { "synset" : """01564144-v""", "def" : """damage irreparably""", "freq" : """28""" },
-    { "synset" : """01569566-v""", "def" : """set up for use""", "freq" : """28""" },
-    { "synset" : """01647229-v""", "def" : """set up or lay the groundwork for""", "freq" : """28""" },
-    { "synset" : """01654628-v""", "def" : """make by combining materials and parts""", "freq" : """28""" },
-    { "synset" : """02144835-v""", "def" : """prevent from being seen or discovered""", "freq" : """28""" },
-    { "synset" : """02205098-v""", "def" : """have left""", "freq" : """28""" },
-    { "synset" : """02205272-v""", "def" : """take into one's possession""", "freq" : """28""" },
-    { "synset" : """02327200-v""", "def" : """give something useful or necessary to""", "freq" : """28""" },
-    { "synset" : """02441022-v""", "def" : """exercise authoritative control or power over""", "freq" : """28""" },
-    { "synset" : """02448185-v""", "def" : """create (as an entity)""", "freq" : """28""" },
-    { "synset" : """02450256-v""", "def" : """share in something""", "freq" : """28""" },
-    { "synset" : """02524171-v""", "def" : """attain success or reach a desired goal""", "freq" : """28""" },
-    { "synset" : """02546075-v""", "def" : """bestow honor or rewards upon""", "freq" : """28""" },
-    { "synset" : """00658082-n""", "def" : """care provided to improve a situation (especially medical procedures or applications that are intended to relieve illness or injury)""", "freq" : """28""" },
-    { "synset" : """01207609-n""", "def" : """the activity of contributing to the fulfillment of a need or furtherance of an effort or purpose""", "freq" : """28""" },
-    { "synset" : """02876657-n""", "def" : """a glass or plastic vessel used for storing drinks or other liquids""", "freq" : """28""" },
-    { "synset" : """02876657-n""", "def" : """typically cylindrical without handles and with a narrow neck that can be plugged or capped""", "freq" : """28""" },
-    { "synset" : """04928903-n""", "def" : """how something is done or how it happens""", "freq" : """28""" },
-    { "synset" : """05598147-n""", "def" : """the organ of smell and entrance to the respiratory tract""", "freq" : """28""" },
-    { "synset" : """05598147-n""", "def" : """the prominent part of the face of man or other mammals""", "freq" : """28""" },
-    { "synset" : """05793554-n""", "def" : """the fundamental assumptions from which something is begun or developed or calculated or explained""", "freq" : """28""" },
-    { "synset" : """05809745-n""", "def" : """an inherited pattern of thought or action""", "freq" : """28""" },
-    { "synset" : """05916739-n""", "def" : """a vague idea in which some confidence is placed""", "freq" : """28""" },
-    { "synset" : """05930736-n""", "def" : """a perceptual structure""", "freq" : """28""" },
-    { "synset" : """06738281-n""", "def" : """a statement that makes something comprehensible by describing the relevant structure or operation or circumstances etc.""", "freq" : """28""" },
-    { "synset" : """07285403-n""", "def" : """an event as apprehended""", "freq" : """28""" },
-    { "synset" : """08114861-n""", "def" : """a specialized division of a large organization""", "freq" : """28""" },
-    { "synset" : """08160276-n""", "def" : """the body of citizens of a state or country""", "freq" : """28""" },
-    { "synset" : """08214272-n""", "def" : """small military unit""", "freq" : """28""" },
-    { "synset" : """08214272-n""", "def" : """usually two or three platoons""", "freq" : """28""" },
-    { "synset" : """08322981-n""", "def" : """a committee having supervisory powers""", "freq" : """28""" },
-    { "synset" : """08565701-n""", "def" : """the boundary of a surface""", "freq" : """28""" },
-    { "synset" : """08641113-n""", "def" : """a surrounding or nearby region""", "freq" : """28""" },
-    { "synset" : """09275473-n""", "def" : """the 2nd smallest continent (actually a vast peninsula of Eurasia)""", "freq" : """28""" },
-    { "synset" : """09275473-n""", "def" : """the British use `Europe' to refer to all of the continent except the British Isles""", "freq" : """28""" },
-    { "synset" : """11525955-n""", "def" : """air moving (sometimes with considerable force) from an area of high pressure to an area of low pressure""", "freq" : """28""" },
-    { "synset" : """13333833-n""", "def" : """the capital raised by a corporation through the issue of shares entitling holders to an ownership interest (equity)""", "freq" : """28""" },
-    { "synset" : """13939604-n""", "def" : """the condition of things generally""", "freq" : """28""" },
-    { "synset" : """14002279-n""", "def" : """a state of equilibrium""", "freq" : """28""" },
-    { "synset" : """15163979-n""", "def" : """the second day of the week""", "freq" : """28""" },
-    { "synset" : """15163979-n""", "def" : """the first working day""", "freq" : """28""" },
-    { "synset" : """00409440-a""", "def" : """(used of color) having a dark hue""", "freq" : """27""" },
-    { "synset" : """01343918-a""", "def" : """arousing or holding the attention""", "freq" : """27""" },
-    { "synset" : """02189306-a""", "def" : """being ten more than twenty""", "freq" : """27""" },
-    { "synset" : """02529264-a""", "def" : """having or producing a comfortable and agreeable degree of heat or imparting or maintaining heat""", "freq" : """27""" },
-    { "synset" : """02814453-a""", "def" : """relating to or associated with heat""", "freq" : """27""" },
-    { "synset" : """02830501-a""", "def" : """of or relating to or characteristic of literature""", "freq" : """27""" },
-    { "synset" : """02869563-a""", "def" : """relating to or using sight""", "freq" : """27""" },
-    { "synset" : """02952622-a""", "def" : """of or relating to Protestants or Protestantism""", "freq" : """27""" },
-    { "synset" : """02982729-a""", "def" : """of or relating to the hypothalamus""", "freq" : """27""" },
-    { "synset" : """00053744-r""", "def" : """almost""", "freq" : """27""" },
-    { "synset" : """00053744-r""", "def" : """nearly""", "freq" : """27""" },
-    { "synset" : """00136991-v""", "def" : """leave unchanged or undisturbed or refrain from taking""", "freq" : """27""" },
-    { "synset" : """00348746-v""", "def" : """set in motion, cause to start""", "freq" : """27""" },
-    { "synset" : """00522751-v""", "def" : """receive a specified treatment (abstract)""", "freq" : """27""" },
-    { "synset" : """00661824-v""", "def" : """examine so as to determine accuracy, quality, or condition""", "freq" : """27""" },
-    { "synset" : """00704690-v""", "def" : """make plans for something""", "freq" : """27""" },
-    { "synset" : """00708538-v""", "def" : """have in mind as a purpose""", "freq" : """27""" },
-    { "synset" : """00720961-v""", "def" : """discern or comprehend""", "freq" : """27""" },
-    { "synset" : """00806502-v""", "def" : """give sanction to""", "freq" : """27""" },
-    { "synset" : """00920336-v""", "def" : """find out, learn, or determine with certainty, usually by making an inquiry or other effort""", "freq" : """27""" },
-    { "synset" : """00950431-v""", "def" : """show consideration for""", "freq" : """27""" },
-    { "synset" : """00950431-v""", "def" : """take into account""", "freq" : """27""" },
-    { "synset" : """01439190-v""", "def" : """take hold of so as to seize or restrain or stop the motion of""", "freq" : """27""" },
-    { "synset" : """01719302-v""", "def" : """play a role or part""", "freq" : """27""" },
-    { "synset" : """02023107-v""", "def" : """come together""", "freq" : """27""" },
-    { "synset" : """02292125-v""", "def" : """obtain""", "freq" : """27""" },
-    { "synset" : """02484570-v""", "def" : """kill by firing a missile""", "freq" : """27""" },
-    { "synset" : """02522864-v""", "def" : """be successful""", "freq" : """27""" },
-    { "synset" : """02522864-v""", "def" : """achieve a goal""", "freq" : """27""" },
-    { "synset" : """02635956-v""", "def" : """tend to or result in""", "freq" : """27""" },
-    { "synset" : """02666239-v""", "def" : """be different""", "freq" : """27""" },
-    { "synset" : """00584367-n""", "def" : """the occupation for which you are paid""", "freq" : """27""" },
-    { "synset" : """04199027-n""", "def" : """footwear shaped to fit the foot (below the ankle) with a flexible upper of leather or plastic and a sole and heel of heavier material""", "freq" : """27""" },
-    { "synset" : """04298171-n""", "def" : """a flight of stairs or a flight of steps""", "freq" : """27""" },
-    { "synset" : """05101815-n""", "def" : """the length of a straight line passing through the center of a circle and connecting two points on the circumference""", "freq" : """27""" },
-    { "synset" : """05194151-n""", "def" : """a power to affect persons or events especially power based on prestige etc""", "freq" : """27""" },
-    { "synset" : """05815517-n""", "def" : """a subject of study""", "freq" : """27""" },
-    { "synset" : """05985602-n""", "def" : """the unwritten lore (stories and proverbs and riddles and songs) of a culture""", "freq" : """27""" },
-    { "synset" : """06724763-n""", "def" : """a statement that represents something in words""", "freq" : """27""" },
-    { "synset" : """06755947-n""", "def" : """a stipulated condition""", "freq" : """27""" },
-    { "synset" : """06891493-n""", "def" : """a dramatic or musical entertainment""", "freq" : """27""" },
-    { "synset" : """07138085-n""", "def" : """an extended communication (often interactive) dealing with some particular topic""", "freq" : """27""" },
-    { "synset" : """08110373-n""", "def" : """taxonomic group whose members can interbreed""", "freq" : """27""" },
-    { "synset" : """08179879-n""", "def" : """the people who inhabit a territory or state""", "freq" : """27""" },
-    { "synset" : """08208016-n""", "def" : """group of people willing to obey orders""", "freq" : """27""" },
-    { "synset" : """08233056-n""", "def" : """an organization of employees formed to bargain with the employer""", "freq" : """27""" },
-    { "synset" : """08324514-n""", "def" : """a special group delegated to consider some matter""", "freq" : """27""" },
-    { "synset" : """08397255-n""", "def" : """soldiers collectively""", "freq" : """27""" },
-    { "synset" : """08625073-n""", "def" : """location near or direction toward the right side""", "freq" : """27""" },
-    { "synset" : """08625073-n""", "def" : """i.e. the side to the south when a person or object faces east""", "freq" : """27""" },
-    { "synset" : """09070793-n""", "def" : """the capital of the United States in the District of Columbia and a tourist mecca""", "freq" : """27""" },
-    { "synset" : """09070793-n""", "def" : """George Washington commissioned Charles L'Enfant to lay out the city in 1791""", "freq" : """27""" },
-    { "synset" : """09468604-n""", "def" : """a long depression in the surface of the land that usually contains a river""", "freq" : """27""" },
-    { "synset" : """10009276-n""", "def" : """a police officer who investigates crimes""", "freq" : """27""" },
-    { "synset" : """10243137-n""", "def" : """a polite name for any woman""", "freq" : """27""" },
-    { "synset" : """10256756-n""", "def" : """a person who favors a political philosophy of progress and reform and the protection of civil liberties""", "freq" : """27""" },
-    { "synset" : """13723712-n""", "def" : """a metric unit of weight equal to one thousandth of a kilogram""", "freq" : """27""" },
-    { "synset" : """13786413-n""", "def" : """a symbol or function representing a mathematical operation""", "freq" : """27""" },
-    { "synset" : """13981403-n""", "def" : """a legal state created by a declaration of war and ended by official declaration during which the international rules of war apply""", "freq" : """27""" },
-    { "synset" : """14590293-n""", "def" : """an isotonic solution of sodium chloride and distilled water""", "freq" : """27""" },
-    { "synset" : """00310433-a""", "def" : """developed or executed with care and in minute detail""", "freq" : """26""" },
-    { "synset" : """00375969-a""", "def" : """of the color between blue and yellow in the color spectrum""", "freq" : """26""" },
-    { "synset" : """00375969-a""", "def" : """similar to the color of fresh grass""", "freq" : """26""" },
-    { "synset" : """00385756-a""", "def" : """of the color intermediate between green and orange in the color spectrum""", "freq" : """26""" },
-    { "synset" : """00385756-a""", "def" : """of something resembling the color of an egg yolk""", "freq" : """26""" },
-    { "synset" : """00727564-a""", "def" : """free from external control and constraint""", "freq" : """26""" },
-    { "synset" : """01010271-a""", "def" : """occurring at or forming an end or termination""", "freq" : """26""" },
-    { "synset" : """01084644-a""", "def" : """generously supplied with""", "freq" : """26""" },
-    { "synset" : """01553340-a""", "def" : """more than one but indefinitely small in number""", "freq" : """26""" },
-    { "synset" : """01555732-a""", "def" : """the superlative of `much' that can be used with mass nouns and is usually preceded by `the'""", "freq" : """26""" },
-    { "synset" : """01555732-a""", "def" : """a quantifier meaning the greatest in amount or extent or degree""", "freq" : """26""" },
-    { "synset" : """01618053-a""", "def" : """easily perceived and understood""", "freq" : """26""" },
-    { "synset" : """02196107-a""", "def" : """being ten more than ninety""", "freq" : """26""" },
-    { "synset" : """02249766-a""", "def" : """isolated from others""", "freq" : """26""" },
-    { "synset" : """02468635-a""", "def" : """exhibiting the qualities or characteristics that identify a group or kind or category""", "freq" : """26""" },
-    { "synset" : """00007015-r""", "def" : """(of quantities) imprecise but fairly close to correct""", "freq" : """26""" },
-    { "synset" : """00008007-r""", "def" : """to a complete degree or to the full or entire extent""", "freq" : """26""" },
-    { "synset" : """00008007-r""", "def" : """Completely or entirely""", "freq" : """26""" },
-    { "synset" : """00017639-r""", "def" : """to a greater degree or extent""", "freq" : """26""" },
-    { "synset" : """00036291-r""", "def" : """to a small degree or extent""", "freq" : """26""" },
-    { "synset" : """00051848-r""", "def" : """without deviation""", "freq" : """26""" },
-    { "synset" : """00071165-r""", "def" : """in the area or vicinity""", "freq" : """26""" },
-    { "synset" : """00119578-r""", "def" : """from another point of view""", "freq" : """26""" },
-    { "synset" : """00300247-r""", "def" : """by chance""", "freq" : """26""" },
-    { "synset" : """00123170-v""", "def" : """become different in some particular way, without permanently losing one's or its former characteristics or essence""", "freq" : """26""" },
-    { "synset" : """00126264-v""", "def" : """cause to change""", "freq" : """26""" },
-    { "synset" : """00126264-v""", "def" : """make different""", "freq" : """26""" },
-    { "synset" : """00126264-v""", "def" : """cause a transformation""", "freq" : """26""" },
-    { "synset" : """00674607-v""", "def" : """pick out, select, or choose from a number of alternatives""", "freq" : """26""" },
-    { "synset" : """00689950-v""", "def" : """look on as or consider""", "freq" : """26""" },
-    { "synset" : """00711715-v""", "def" : """take into consideration, have in view""", "freq" : """26""" },
-    { "synset" : """00884011-v""", "def" : """make a promise or commitment""", "freq" : """26""" },
-    { "synset" : """00941990-v""", "def" : """express in speech""", "freq" : """26""" },
-    { "synset" : """01013367-v""", "def" : """to stress, single out as important""", "freq" : """26""" },
-    { "synset" : """01060494-v""", "def" : """convey, as of a compliment, regards, attention, etc.""", "freq" : """26""" },
-    { "synset" : """01060494-v""", "def" : """bestow""", "freq" : """26""" },
-    { "synset" : """01134781-v""", "def" : """fire a shot""", "freq" : """26""" },
-    { "synset" : """01134781-v""", "def" : """release""", "freq" : """26""" },
-    { "synset" : """01651293-v""", "def" : """enter upon an activity or enterprise""", "freq" : """26""" },
-    { "synset" : """01752884-v""", "def" : """cause to happen, occur or exist""", "freq" : """26""" },
-    { "synset" : """01828736-v""", "def" : """get pleasure from""", "freq" : """26""" },
-    { "synset" : """01842690-v""", "def" : """travel or go by means of a certain kind of transportation, or a certain route""", "freq" : """26""" },
-    { "synset" : """01968569-v""", "def" : """move upward""", "freq" : """26""" },
-    { "synset" : """01974062-v""", "def" : """raise from a lower to a higher position""", "freq" : """26""" },
-    { "synset" : """02106006-v""", "def" : """perceive by a physical sensation, e.g., coming from the skin or muscles""", "freq" : """26""" },
-    { "synset" : """02106506-v""", "def" : """to become aware of through the senses""", "freq" : """26""" },
-    { "synset" : """02203362-v""", "def" : """have or possess, either in a concrete or an abstract sense""", "freq" : """26""" },
-    { "synset" : """02219940-v""", "def" : """assume sponsorship of""", "freq" : """26""" },
-    { "synset" : """02556126-v""", "def" : """give moral or psychological support, aid, or courage to""", "freq" : """26""" },
-    { "synset" : """02621395-v""", "def" : """to compose or represent""", "freq" : """26""" },
-    { "synset" : """02720149-v""", "def" : """come as a logical consequence""", "freq" : """26""" },
-    { "synset" : """02720149-v""", "def" : """follow logically""", "freq" : """26""" },
-    { "synset" : """00087663-n""", "def" : """a grant made by a law court""", "freq" : """26""" },
-    { "synset" : """00456199-n""", "def" : """a single play of a sport or other contest""", "freq" : """26""" },
-    { "synset" : """00624738-n""", "def" : """the activity of exerting your muscles in various ways to keep fit""", "freq" : """26""" },
-    { "synset" : """01002956-n""", "def" : """the act of making and recording a measurement""", "freq" : """26""" },
-    { "synset" : """04424418-n""", "def" : """an entity that is not named specifically""", "freq" : """26""" },
-    { "synset" : """04493505-n""", "def" : """conduit consisting of a long hollow object (usually cylindrical) used to hold and conduct objects or liquids or gases""", "freq" : """26""" },
-    { "synset" : """04916342-n""", "def" : """a basic or essential attribute shared by all members of a class""", "freq" : """26""" },
-    { "synset" : """05026843-n""", "def" : """the vertical force exerted by a mass as a result of gravity""", "freq" : """26""" },
-    { "synset" : """05149325-n""", "def" : """what something is used for""", "freq" : """26""" },
-    { "synset" : """05698247-n""", "def" : """the state of being unsure of something""", "freq" : """26""" },
-    { "synset" : """05817845-n""", "def" : """an isolated fact that is considered separately from the whole""", "freq" : """26""" },
-    { "synset" : """05870055-n""", "def" : """a single person or thing""", "freq" : """26""" },
-    { "synset" : """06252138-n""", "def" : """the activity of communicating""", "freq" : """26""" },
-    { "synset" : """06252138-n""", "def" : """the activity of conveying information""", "freq" : """26""" },
-    { "synset" : """06345993-n""", "def" : """a heading that names a statute or legislative bill""", "freq" : """26""" },
-    { "synset" : """06345993-n""", "def" : """may give a brief summary of the matters it deals with""", "freq" : """26""" },
-    { "synset" : """06613686-n""", "def" : """a form of entertainment that enacts a story by sound and a sequence of images giving the illusion of continuous movement""", "freq" : """26""" },
-    { "synset" : """06647206-n""", "def" : """anything (such as a document or a phonograph record or a photograph) providing permanent evidence of or information about past events""", "freq" : """26""" },
-    { "synset" : """06723908-n""", "def" : """a statement regarded as an object""", "freq" : """26""" },
-    { "synset" : """06729864-n""", "def" : """an assertion of a right (as to money or property)""", "freq" : """26""" },
-    { "synset" : """07168623-n""", "def" : """a command given by a superior (e.g., a military or law enforcement officer) that must be obeyed""", "freq" : """26""" },
-    { "synset" : """07221094-n""", "def" : """a message that tells the particulars of an act or occurrence or course of events""", "freq" : """26""" },
-    { "synset" : """07221094-n""", "def" : """presented in writing or drama or cinema or as a radio or television program""", "freq" : """26""" },
-    { "synset" : """08053576-n""", "def" : """an organization founded and united for a specific purpose""", "freq" : """26""" },
-    { "synset" : """08059870-n""", "def" : """the members of a business organization that owns or operates one or more establishments""", "freq" : """26""" },
-    { "synset" : """09270894-n""", "def" : """the 3rd planet from the sun""", "freq" : """26""" },
-    { "synset" : """09270894-n""", "def" : """the planet we live on""", "freq" : """26""" },
-    { "synset" : """09397391-n""", "def" : """a small lake""", "freq" : """26""" },
-    { "synset" : """09505418-n""", "def" : """any supernatural being worshipped as controlling some part of the world or some aspect of life or who is the personification of a force""", "freq" : """26""" },
-    { "synset" : """10150940-n""", "def" : """a visitor to whom hospitality is extended""", "freq" : """26""" },
-    { "synset" : """13723061-n""", "def" : """one thousandth (1/1,000) gram""", "freq" : """26""" },
-    { "synset" : """13817526-n""", "def" : """a proportion in relation to a whole (which is usually the amount per hundred)""", "freq" : """26""" },
-    { "synset" : """13963970-n""", "def" : """the state of being a married couple voluntarily joined for life (or until divorce)""", "freq" : """26""" },
-    { "synset" : """13991823-n""", "def" : """the condition of being free""", "freq" : """26""" },
-    { "synset" : """13991823-n""", "def" : """the power to act or speak or think without externally imposed restraints""", "freq" : """26""" },
-    { "synset" : """14070360-n""", "def" : """an impairment of health or a condition of abnormal functioning""", "freq" : """26""" },
-    { "synset" : """15164570-n""", "def" : """the seventh and last day of the week""", "freq" : """26""" },
-    { "synset" : """15164570-n""", "def" : """observed as the Sabbath by Jews and some Christians""", "freq" : """26""" },
-    { "synset" : """15211806-n""", "def" : """the month following May and preceding July""", "freq" : """26""" },
-    { "synset" : """15227846-n""", "def" : """a period of time equal to 1/24th of a day""", "freq" : """26""" },
-    { "synset" : """00006032-a""", "def" : """estimated by comparison""", "freq" : """25""" },
-    { "synset" : """00006032-a""", "def" : """not absolute or complete""", "freq" : """25""" },
-    { "synset" : """00217728-a""", "def" : """delighting the senses or exciting intellectual or emotional admiration""", "freq" : """25""" },
-    { "synset" : """01074650-a""", "def" : """characteristic of or befitting a friend""", "freq" : """25""" },
-    { "synset" : """01342237-a""", "def" : """having or showing interest""", "freq" : """25""" },
-    { "synset" : """01342237-a""", "def" : """especially curiosity or fascination or concern""", "freq" : """25""" },
-    { "synset" : """01415021-a""", "def" : """small in range or scope""", "freq" : """25""" },
-    { "synset" : """01471538-a""", "def" : """greater in scope or effect""", "freq" : """25""" },
-    { "synset" : """02057829-a""", "def" : """free from danger or the risk of harm""", "freq" : """25""" },
-    { "synset" : """02187465-a""", "def" : """denoting a quantity consisting of 12 items or units""", "freq" : """25""" },
-    { "synset" : """02410393-a""", "def" : """not thin""", "freq" : """25""" },
-    { "synset" : """02410393-a""", "def" : """of a specific thickness or of relatively great extent from one surface to the opposite usually in the smallest of the three solid dimensions""", "freq" : """25""" },
-    { "synset" : """02529945-a""", "def" : """neither warm nor very cold""", "freq" : """25""" },
-    { "synset" : """02529945-a""", "def" : """giving relief from heat""", "freq" : """25""" },
-    { "synset" : """02920951-a""", "def" : """of or relating to or supporting Catholicism""", "freq" : """25""" },
-    { "synset" : """02959406-a""", "def" : """of or relating to or characteristic of the former Soviet Union or its people""", "freq" : """25""" },
-    { "synset" : """00043003-r""", "def" : """from that fact or reason or as a result""", "freq" : """25""" },
-    { "synset" : """00068368-r""", "def" : """with a forward motion""", "freq" : """25""" },
-    { "synset" : """00150134-r""", "def" : """admittedly""", "freq" : """25""" },
-    { "synset" : """00033599-v""", "def" : """have a certain outward or facial expression""", "freq" : """25""" },
-    { "synset" : """00121046-v""", "def" : """undergo""", "freq" : """25""" },
-    { "synset" : """00636574-v""", "def" : """reason by deduction""", "freq" : """25""" },
-    { "synset" : """00636574-v""", "def" : """establish by deduction""", "freq" : """25""" },
-    { "synset" : """00713167-v""", "def" : """make a logical or causal connection""", "freq" : """25""" },
-    { "synset" : """00720063-v""", "def" : """look forward to the probable occurrence of""", "freq" : """25""" },
-    { "synset" : """00764222-v""", "def" : """consent or assent to a condition, or agree to do something""", "freq" : """25""" },
-    { "synset" : """00792471-v""", "def" : """order, request, or command to come""", "freq" : """25""" },
-    { "synset" : """00913065-v""", "def" : """utter a sudden loud cry""", "freq" : """25""" },
-    { "synset" : """00913065-v""", "def" : """utter a sudden loud cry""", "freq" : """25""" },
-    { "synset" : """00923793-v""", "def" : """indicate a place, direction, person, or thing""", "freq" : """25""" },
-    { "synset" : """00923793-v""", "def" : """either spatially or figuratively""", "freq" : """25""" },
-    { "synset" : """01182709-v""", "def" : """give what is desired or needed, especially support, food or sustenance""", "freq" : """25""" },
-    { "synset" : """01405044-v""", "def" : """cause to move by striking""", "freq" : """25""" },
-    { "synset" : """01712704-v""", "def" : """carry out or perform an action""", "freq" : """25""" },
-    { "synset" : """01825237-v""", "def" : """feel or have a desire for""", "freq" : """25""" },
-    { "synset" : """01825237-v""", "def" : """want strongly""", "freq" : """25""" },
-    { "synset" : """02107248-v""", "def" : """register (perceptual input)""", "freq" : """25""" },
-    { "synset" : """02132745-v""", "def" : """look at with fixed eyes""", "freq" : """25""" },
-    { "synset" : """02193194-v""", "def" : """detect with the senses""", "freq" : """25""" },
-    { "synset" : """02230772-v""", "def" : """place into the hands or custody of""", "freq" : """25""" },
-    { "synset" : """02236124-v""", "def" : """receive willingly something given or offered""", "freq" : """25""" },
-    { "synset" : """02308741-v""", "def" : """contribute to some cause""", "freq" : """25""" },
-    { "synset" : """02559752-v""", "def" : """stop from happening or developing""", "freq" : """25""" },
-    { "synset" : """02634567-v""", "def" : """be the result of""", "freq" : """25""" },
-    { "synset" : """02680814-v""", "def" : """put an end to a state or an activity""", "freq" : """25""" },
-    { "synset" : """02740745-v""", "def" : """be confronted with""", "freq" : """25""" },
-    { "synset" : """00034213-n""", "def" : """any state or process known through the senses rather than by intuition or reasoning""", "freq" : """25""" },
-    { "synset" : """00162632-n""", "def" : """the act of making up your mind about something""", "freq" : """25""" },
-    { "synset" : """00911048-n""", "def" : """the act of constructing something""", "freq" : """25""" },
-    { "synset" : """01134861-n""", "def" : """the management of someone or something""", "freq" : """25""" },
-    { "synset" : """01144133-n""", "def" : """an act of formulating a program for a definite course of action""", "freq" : """25""" },
-    { "synset" : """01170962-n""", "def" : """the act of fighting""", "freq" : """25""" },
-    { "synset" : """01170962-n""", "def" : """any contest or struggle""", "freq" : """25""" },
-    { "synset" : """01173038-n""", "def" : """a powerful stroke with the fist or a weapon""", "freq" : """25""" },
-    { "synset" : """02402425-n""", "def" : """domesticated bovine animals as a group regardless of sex or age ❲Bos taurus❳""", "freq" : """25""" },
-    { "synset" : """02746365-n""", "def" : """large but transportable armament""", "freq" : """25""" },
-    { "synset" : """02883344-n""", "def" : """a (usually rectangular) container""", "freq" : """25""" },
-    { "synset" : """02883344-n""", "def" : """may have a lid""", "freq" : """25""" },
-    { "synset" : """03479952-n""", "def" : """an interior passage or corridor onto which rooms open""", "freq" : """25""" },
-    { "synset" : """03540595-n""", "def" : """a health facility where patients receive treatment""", "freq" : """25""" },
-    { "synset" : """03931044-n""", "def" : """a visual representation (of an object or scene or person or abstraction) produced on a surface""", "freq" : """25""" },
-    { "synset" : """04007894-n""", "def" : """an artifact that has been created by someone or some process""", "freq" : """25""" },
-    { "synset" : """04202417-n""", "def" : """a mercantile establishment for the retail sale of goods or services""", "freq" : """25""" },
-    { "synset" : """04379243-n""", "def" : """a piece of furniture having a smooth flat top that is usually supported by one or more vertical legs""", "freq" : """25""" },
-    { "synset" : """05038593-n""", "def" : """the strength of a solution""", "freq" : """25""" },
-    { "synset" : """05038593-n""", "def" : """number of molecules of a substance in a given volume""", "freq" : """25""" },
-    { "synset" : """05086269-n""", "def" : """the distance (measured in the direction of propagation) between two points in the same phase in consecutive cycles of a wave""", "freq" : """25""" },
-    { "synset" : """05093890-n""", "def" : """a position on a scale of intensity or amount or quality""", "freq" : """25""" },
-    { "synset" : """05339047-n""", "def" : """arteries that accompany the bronchioles""", "freq" : """25""" },
-    { "synset" : """05388805-n""", "def" : """the hollow muscular organ located behind the sternum and between the lungs""", "freq" : """25""" },
-    { "synset" : """05388805-n""", "def" : """its rhythmic contractions move the blood through the body""", "freq" : """25""" },
-    { "synset" : """05935060-n""", "def" : """something that is remembered""", "freq" : """25""" },
-    { "synset" : """06656408-n""", "def" : """a line of argument rationalizing the course of action of a government""", "freq" : """25""" },
-    { "synset" : """06671637-n""", "def" : """something (as a course of action) that is recommended as advisable""", "freq" : """25""" },
-    { "synset" : """06743506-n""", "def" : """a statement that solves a problem or explains how to solve the problem""", "freq" : """25""" },
-    { "synset" : """07140659-n""", "def" : """an exchange of views on some topic""", "freq" : """25""" },
-    { "synset" : """07575726-n""", "def" : """the main meal of the day served in the evening or at midday""", "freq" : """25""" },
-    { "synset" : """08408709-n""", "def" : """one of two or more contesting groups""", "freq" : """25""" },
-    { "synset" : """09083390-n""", "def" : """largest city in Illinois""", "freq" : """25""" },
-    { "synset" : """09083390-n""", "def" : """a bustling Great Lakes port that extends 26 miles along the southwestern shoreline of Lake Michigan""", "freq" : """25""" },
-    { "synset" : """09213565-n""", "def" : """sloping land (especially the slope beside a body of water)""", "freq" : """25""" },
-    { "synset" : """09679925-n""", "def" : """a member of a Catholic church""", "freq" : """25""" },
-    { "synset" : """09945905-n""", "def" : """a friend who is frequently in the company of another""", "freq" : """25""" },
-    { "synset" : """09984659-n""", "def" : """someone who pays for goods or services""", "freq" : """25""" },
-    { "synset" : """10100761-n""", "def" : """a person who lacks good judgment""", "freq" : """25""" },
-    { "synset" : """11501381-n""", "def" : """water falling in drops from vapor condensed in the atmosphere""", "freq" : """25""" },
-    { "synset" : """13275495-n""", "def" : """amounts paid for goods and services that may be currently tax deductible (as opposed to capital expenditures)""", "freq" : """25""" },
-    { "synset" : """13779032-n""", "def" : """the amount of 3-dimensional space occupied by an object""", "freq" : """25""" },
-    { "synset" : """13780719-n""", "def" : """a relation between people""", "freq" : """25""" },
-    { "synset" : """13960974-n""", "def" : """the state of being absent""", "freq" : """25""" },
-    { "synset" : """14939900-n""", "def" : """a substance that is fluid at room temperature and pressure""", "freq" : """25""" },
-    { "synset" : """15204983-n""", "def" : """a period of 10 years""", "freq" : """25""" },
-    { "synset" : """15237044-n""", "def" : """the season of growth""", "freq" : """25""" },
-    { "synset" : """15237044-n""", "def" : """spring""", "freq" : """25""" },
-    { "synset" : """15237044-n""", "def" : """the beginning of spring""", "freq" : """25""" },
-    { "synset" : """15282696-n""", "def" : """distance travelled per unit time""", "freq" : """25""" },
-    { "synset" : """15290337-n""", "def" : """any distinct time period in a sequence of events""", "freq" : """25""" },
-    { "synset" : """00447472-a""", "def" : """nearest in space or position""", "freq" : """24""" },
-    { "synset" : """00447472-a""", "def" : """immediately adjoining without intervening space""", "freq" : """24""" },
-    { "synset" : """00490035-a""", "def" : """not usual or common or ordinary""", "freq" : """24""" },
-    { "synset" : """01104026-a""", "def" : """unique or specific to a person or thing or category""", "freq" : """24""" },
-    { "synset" : """01496021-a""", "def" : """the least possible""", "freq" : """24""" },
-    { "synset" : """01618376-a""", "def" : """clearly revealed to the mind or the senses or judgment""", "freq" : """24""" },
-    { "synset" : """02188720-a""", "def" : """being four more than twenty""", "freq" : """24""" },
-    { "synset" : """02191232-a""", "def" : """being ten more than forty""", "freq" : """24""" },
-    { "synset" : """03048558-a""", "def" : """of or relating to or consisting of two terms""", "freq" : """24""" },
-    { "synset" : """00006105-r""", "def" : """in large part""", "freq" : """24""" },
-    { "synset" : """00006105-r""", "def" : """mainly or chiefly""", "freq" : """24""" },
-    { "synset" : """00046002-r""", "def" : """in other respects or ways""", "freq" : """24""" },
-    { "synset" : """00048739-r""", "def" : """without delay or hesitation""", "freq" : """24""" },
-    { "synset" : """00048739-r""", "def" : """with no time intervening""", "freq" : """24""" },
-    { "synset" : """00053004-r""", "def" : """an expression of agreement normally occurring at the beginning of a sentence""", "freq" : """24""" },
-    { "synset" : """00075269-r""", "def" : """in or to or toward an original condition""", "freq" : """24""" },
-    { "synset" : """00085811-r""", "def" : """with rapid movements""", "freq" : """24""" },
-    { "synset" : """00004032-v""", "def" : """heave or utter a sigh""", "freq" : """24""" },
-    { "synset" : """00004032-v""", "def" : """breathe deeply and heavily""", "freq" : """24""" },
-    { "synset" : """00162688-v""", "def" : """substitute a person or thing for (another that is broken or inefficient or lost or no longer working or yielding what is expected)""", "freq" : """24""" },
-    { "synset" : """00220869-v""", "def" : """make strong or stronger""", "freq" : """24""" },
-    { "synset" : """00339934-v""", "def" : """come to pass""", "freq" : """24""" },
-    { "synset" : """00733895-v""", "def" : """have a firm conviction as to the goodness of something""", "freq" : """24""" },
-    { "synset" : """00752764-v""", "def" : """express the need or desire for""", "freq" : """24""" },
-    { "synset" : """00752764-v""", "def" : """ask for""", "freq" : """24""" },
-    { "synset" : """00775831-v""", "def" : """be against""", "freq" : """24""" },
-    { "synset" : """00775831-v""", "def" : """express opposition to""", "freq" : """24""" },
-    { "synset" : """00811375-v""", "def" : """stay clear from""", "freq" : """24""" },
-    { "synset" : """00811375-v""", "def" : """keep away from""", "freq" : """24""" },
-    { "synset" : """00811375-v""", "def" : """keep out of the way of someone or something""", "freq" : """24""" },
-    { "synset" : """00816556-v""", "def" : """declare untrue""", "freq" : """24""" },
-    { "synset" : """00816556-v""", "def" : """contradict""", "freq" : """24""" },
-    { "synset" : """00903385-v""", "def" : """stop blaming or grant forgiveness""", "freq" : """24""" },
-    { "synset" : """00923793-v""", "def" : """indicate a place, direction, person, or thing""", "freq" : """24""" },
-    { "synset" : """00923793-v""", "def" : """either spatially or figuratively""", "freq" : """24""" },
-    { "synset" : """00943837-v""", "def" : """give expression to""", "freq" : """24""" },
-    { "synset" : """01060317-v""", "def" : """convey or communicate""", "freq" : """24""" },
-    { "synset" : """01060317-v""", "def" : """of a smile, a look, a physical gesture""", "freq" : """24""" },
-    { "synset" : """01072262-v""", "def" : """compete for something""", "freq" : """24""" },
-    { "synset" : """01072262-v""", "def" : """engage in a contest""", "freq" : """24""" },
-    { "synset" : """01072262-v""", "def" : """measure oneself against others""", "freq" : """24""" },
-    { "synset" : """01078783-v""", "def" : """oppose, as in hostility or a competition""", "freq" : """24""" },
-    { "synset" : """01082606-v""", "def" : """become a participant""", "freq" : """24""" },
-    { "synset" : """01082606-v""", "def" : """be involved in""", "freq" : """24""" },
-    { "synset" : """01192628-v""", "def" : """be able to spare or give up""", "freq" : """24""" },
-    { "synset" : """01378556-v""", "def" : """distribute or disperse widely""", "freq" : """24""" },
-    { "synset" : """01494310-v""", "def" : """put into a certain place or abstract location""", "freq" : """24""" },
-    { "synset" : """01843689-v""", "def" : """go to certain places as for sightseeing""", "freq" : """24""" },
-    { "synset" : """01930117-v""", "def" : """travel or be transported in a vehicle""", "freq" : """24""" },
-    { "synset" : """01996735-v""", "def" : """march in a procession""", "freq" : """24""" },
-    { "synset" : """02038357-v""", "def" : """to incline or bend from a vertical position""", "freq" : """24""" },
-    { "synset" : """02148788-v""", "def" : """give an exhibition of to an interested audience""", "freq" : """24""" },
-    { "synset" : """02150948-v""", "def" : """see or watch""", "freq" : """24""" },
-    { "synset" : """02492198-v""", "def" : """provide entertainment for""", "freq" : """24""" },
-    { "synset" : """02635033-v""", "def" : """be the reason or explanation for""", "freq" : """24""" },
-    { "synset" : """02665282-v""", "def" : """appear like""", "freq" : """24""" },
-    { "synset" : """02665282-v""", "def" : """be similar or bear a likeness to""", "freq" : """24""" },
-    { "synset" : """02670398-v""", "def" : """contribute or conduce to""", "freq" : """24""" },
-    { "synset" : """02671613-v""", "def" : """function as or act like""", "freq" : """24""" },
-    { "synset" : """00028651-n""", "def" : """the unlimited expanse in which everything is located""", "freq" : """24""" },
-    { "synset" : """00030358-n""", "def" : """something that people do or cause to happen""", "freq" : """24""" },
-    { "synset" : """00122661-n""", "def" : """the act of firing a projectile""", "freq" : """24""" },
-    { "synset" : """00249501-n""", "def" : """gradual improvement or growth or development""", "freq" : """24""" },
-    { "synset" : """00331950-n""", "def" : """a change of position that does not entail a change of location""", "freq" : """24""" },
-    { "synset" : """00577525-n""", "def" : """work done by one person or group that benefits another""", "freq" : """24""" },
-    { "synset" : """03179701-n""", "def" : """a piece of furniture with a writing surface and usually drawers or other compartments""", "freq" : """24""" },
-    { "synset" : """03876519-n""", "def" : """graphic art consisting of an artistic composition made by applying paints to a surface""", "freq" : """24""" },
-    { "synset" : """03892891-n""", "def" : """something less than the whole of a human artifact""", "freq" : """24""" },
-    { "synset" : """04341686-n""", "def" : """a thing constructed""", "freq" : """24""" },
-    { "synset" : """04341686-n""", "def" : """a complex entity constructed of many parts""", "freq" : """24""" },
-    { "synset" : """04468005-n""", "def" : """public transport provided by a line of railway cars coupled together and drawn by a locomotive""", "freq" : """24""" },
-    { "synset" : """04543158-n""", "def" : """any of various kinds of wheeled vehicles drawn by an animal or a tractor""", "freq" : """24""" },
-    { "synset" : """04679738-n""", "def" : """the feelings expressed on a person's face""", "freq" : """24""" },
-    { "synset" : """05124057-n""", "def" : """the greatest possible degree of something""", "freq" : """24""" },
-    { "synset" : """05149325-n""", "def" : """what something is used for""", "freq" : """24""" },
-    { "synset" : """05850624-n""", "def" : """a distinct feature or element in a problem""", "freq" : """24""" },
-    { "synset" : """06532330-n""", "def" : """legal document setting forth rules governing a particular kind of activity""", "freq" : """24""" },
-    { "synset" : """06765044-n""", "def" : """a statement that expresses a personal opinion or belief or adds information""", "freq" : """24""" },
-    { "synset" : """07082573-n""", "def" : """the quality of a person's voice""", "freq" : """24""" },
-    { "synset" : """07292694-n""", "def" : """something that results""", "freq" : """24""" },
-    { "synset" : """07337390-n""", "def" : """an instance of change""", "freq" : """24""" },
-    { "synset" : """07337390-n""", "def" : """the rate or magnitude of change""", "freq" : """24""" },
-    { "synset" : """08161757-n""", "def" : """the legislature of the United States government""", "freq" : """24""" },
-    { "synset" : """08178547-n""", "def" : """the group of people comprising the government of a sovereign state""", "freq" : """24""" },
-    { "synset" : """08337324-n""", "def" : """an administrative unit of government""", "freq" : """24""" },
-    { "synset" : """09947232-n""", "def" : """someone who composes music, usually as a profession""", "freq" : """24""" },
-    { "synset" : """11439690-n""", "def" : """any collection of particles (e.g., smoke or dust) or gases that is visible""", "freq" : """24""" },
-    { "synset" : """13750844-n""", "def" : """the cardinal number that is the product of 10 and 100""", "freq" : """24""" },
-    { "synset" : """13962498-n""", "def" : """the absence of life or state of being dead""", "freq" : """24""" },
-    { "synset" : """14462946-n""", "def" : """a flaw or weak point""", "freq" : """24""" },
-    { "synset" : """14498096-n""", "def" : """the state of being covered with unclean things""", "freq" : """24""" },
-    { "synset" : """15235126-n""", "def" : """1/60 of a minute""", "freq" : """24""" },
-    { "synset" : """15235126-n""", "def" : """the basic unit of time adopted under the Systeme International d'Unites""", "freq" : """24""" },
-    { "synset" : """15237782-n""", "def" : """the coldest season of the year""", "freq" : """24""" },
-    { "synset" : """15237782-n""", "def" : """in the northern hemisphere it extends from the winter solstice to the vernal equinox""", "freq" : """24""" },
-    { "synset" : """15290337-n""", "def" : """any distinct time period in a sequence of events""", "freq" : """24""" },
-    { "synset" : """00231761-a""", "def" : """changed for the better in health or fitness""", "freq" : """23""" },
-    { "synset" : """00309740-a""", "def" : """exercising or taking care great enough to bring assurance""", "freq" : """23""" },
-    { "synset" : """00451510-a""", "def" : """close in relevance or relationship""", "freq" : """23""" },
-    { "synset" : """00611047-a""", "def" : """consisting of or derived from tradition""", "freq" : """23""" },
-    { "synset" : """00760916-a""", "def" : """direct in spatial dimensions""", "freq" : """23""" },
-    { "synset" : """00760916-a""", "def" : """proceeding without deviation or interruption""", "freq" : """23""" },
-    { "synset" : """00760916-a""", "def" : """straight and short""", "freq" : """23""" },
-    { "synset" : """00965606-a""", "def" : """well known or easily recognized""", "freq" : """23""" },
-    { "synset" : """00980527-a""", "def" : """not moving quickly""", "freq" : """23""" },
-    { "synset" : """00980527-a""", "def" : """taking a comparatively long time""", "freq" : """23""" },
-    { "synset" : """01206474-a""", "def" : """being at or having a relatively small elevation or upward extension""", "freq" : """23""" },
-    { "synset" : """01387319-a""", "def" : """unusually great in size or amount or degree or especially extent or scope""", "freq" : """23""" },
-    { "synset" : """01496021-a""", "def" : """the least possible""", "freq" : """23""" },
-    { "synset" : """01514827-a""", "def" : """connected by participation or association or use""", "freq" : """23""" },
-    { "synset" : """01586342-a""", "def" : """pleasant or pleasing or agreeable in nature or appearance""", "freq" : """23""" },
-    { "synset" : """02186970-a""", "def" : """being one more than six""", "freq" : """23""" },
-    { "synset" : """02547317-a""", "def" : """covered or soaked with a liquid such as water""", "freq" : """23""" },
-    { "synset" : """00056539-r""", "def" : """to an extraordinary extent or degree""", "freq" : """23""" },
-    { "synset" : """00107987-r""", "def" : """in a gradual manner""", "freq" : """23""" },
-    { "synset" : """00120095-r""", "def" : """at the same instant""", "freq" : """23""" },
-    { "synset" : """00145571-r""", "def" : """to a sufficient degree""", "freq" : """23""" },
-    { "synset" : """00176383-r""", "def" : """to a considerable degree""", "freq" : """23""" },
-    { "synset" : """00226550-r""", "def" : """at or to a point across intervening space etc.""", "freq" : """23""" },
-    { "synset" : """00082081-v""", "def" : """improve the condition of""", "freq" : """23""" },
-    { "synset" : """00155143-v""", "def" : """increase in value or to a higher point""", "freq" : """23""" },
-    { "synset" : """00233335-v""", "def" : """place limits on (extent or access)""", "freq" : """23""" },
-    { "synset" : """00515154-v""", "def" : """subject to a process or treatment, with the aim of readying for some purpose, improving, or remedying a condition""", "freq" : """23""" },
-    { "synset" : """00611256-v""", "def" : """recapture the past""", "freq" : """23""" },
-    { "synset" : """00611256-v""", "def" : """indulge in memories""", "freq" : """23""" },
-    { "synset" : """00664788-v""", "def" : """establish the validity of something, as by an example, explanation or experiment""", "freq" : """23""" },
-    { "synset" : """00706047-v""", "def" : """intend with some possibility of fulfilment""", "freq" : """23""" },
-    { "synset" : """00875394-v""", "def" : """make a proposal, declare a plan for something""", "freq" : """23""" },
-    { "synset" : """00945853-v""", "def" : """give or make a list of""", "freq" : """23""" },
-    { "synset" : """00945853-v""", "def" : """name individually""", "freq" : """23""" },
-    { "synset" : """00945853-v""", "def" : """give the names of""", "freq" : """23""" },
-    { "synset" : """00948071-v""", "def" : """determine the number or amount of""", "freq" : """23""" },
-    { "synset" : """00963570-v""", "def" : """use language""", "freq" : """23""" },
-    { "synset" : """01058574-v""", "def" : """make or write a comment on""", "freq" : """23""" },
-    { "synset" : """01183573-v""", "def" : """fill or meet a want or need""", "freq" : """23""" },
-    { "synset" : """01380638-v""", "def" : """assemble or get together""", "freq" : """23""" },
-    { "synset" : """01505254-v""", "def" : """direct toward itself or oneself by means of some psychological power or physical attributes""", "freq" : """23""" },
-    { "synset" : """01780729-v""", "def" : """be afraid or feel anxious or apprehensive about a possible or probable situation or event""", "freq" : """23""" },
-    { "synset" : """01928838-v""", "def" : """shift or move by taking a step""", "freq" : """23""" },
-    { "synset" : """01983264-v""", "def" : """rise to one's feet""", "freq" : """23""" },
-    { "synset" : """01992503-v""", "def" : """move forward, also in the metaphorical sense""", "freq" : """23""" },
-    { "synset" : """02035919-v""", "def" : """form a curve""", "freq" : """23""" },
-    { "synset" : """02217266-v""", "def" : """obtain or provide money for""", "freq" : """23""" },
-    { "synset" : """02321757-v""", "def" : """take without the owner's consent""", "freq" : """23""" },
-    { "synset" : """02418686-v""", "def" : """be at play""", "freq" : """23""" },
-    { "synset" : """02418686-v""", "def" : """be engaged in playful activity""", "freq" : """23""" },
-    { "synset" : """02418686-v""", "def" : """amuse oneself in a way characteristic of children""", "freq" : """23""" },
-    { "synset" : """02541251-v""", "def" : """be used by""", "freq" : """23""" },
-    { "synset" : """02541251-v""", "def" : """as of a utility""", "freq" : """23""" },
-    { "synset" : """02630871-v""", "def" : """have""", "freq" : """23""" },
-    { "synset" : """02641035-v""", "def" : """interrupt temporarily an activity before continuing""", "freq" : """23""" },
-    { "synset" : """02677567-v""", "def" : """engage as a participant""", "freq" : """23""" },
-    { "synset" : """02697120-v""", "def" : """pose a threat to""", "freq" : """23""" },
-    { "synset" : """02697120-v""", "def" : """present a danger to""", "freq" : """23""" },
-    { "synset" : """02718309-v""", "def" : """have in common""", "freq" : """23""" },
-    { "synset" : """00031921-n""", "def" : """an abstraction belonging to or characteristic of two entities or parts together""", "freq" : """23""" },
-    { "synset" : """00063652-n""", "def" : """an attainment that is successful""", "freq" : """23""" },
-    { "synset" : """00275572-n""", "def" : """the use of a dye to color specimens for microscopic study""", "freq" : """23""" },
-    { "synset" : """00410247-n""", "def" : """a customary way of operation or behavior""", "freq" : """23""" },
-    { "synset" : """00426928-n""", "def" : """an activity that diverts or amuses or stimulates""", "freq" : """23""" },
-    { "synset" : """00795720-n""", "def" : """any piece of work that is undertaken or attempted""", "freq" : """23""" },
-    { "synset" : """01120448-n""", "def" : """the act of paying money""", "freq" : """23""" },
-    { "synset" : """03525454-n""", "def" : """a holding device""", "freq" : """23""" },
-    { "synset" : """03574816-n""", "def" : """a device that requires skill for proper use""", "freq" : """23""" },
-    { "synset" : """03665366-n""", "def" : """any device serving as a source of illumination""", "freq" : """23""" },
-    { "synset" : """03924069-n""", "def" : """sound recording consisting of a disk with a continuous groove""", "freq" : """23""" },
-    { "synset" : """03924069-n""", "def" : """used to reproduce music by rotating while a phonograph needle tracks in the groove""", "freq" : """23""" },
-    { "synset" : """03932203-n""", "def" : """a separate part of a whole""", "freq" : """23""" },
-    { "synset" : """04306080-n""", "def" : """a facility equipped with special equipment and personnel for a particular purpose""", "freq" : """23""" },
-    { "synset" : """04679738-n""", "def" : """the feelings expressed on a person's face""", "freq" : """23""" },
-    { "synset" : """04679738-n""", "def" : """the feelings expressed on a person's face""", "freq" : """23""" },
-    { "synset" : """05064037-n""", "def" : """any spatial attributes (especially as defined by outline)""", "freq" : """23""" },
-    { "synset" : """05155821-n""", "def" : """the quality of having a superior or more favorable position""", "freq" : """23""" },
-    { "synset" : """05395690-n""", "def" : """an enlarged and muscular saclike organ of the alimentary canal""", "freq" : """23""" },
-    { "synset" : """05395690-n""", "def" : """the principal organ of digestion""", "freq" : """23""" },
-    { "synset" : """05671325-n""", "def" : """a vaguely specified concern""", "freq" : """23""" },
-    { "synset" : """05729036-n""", "def" : """an arrangement of values of a variable showing their observed or theoretical frequency of occurrence""", "freq" : """23""" },
-    { "synset" : """05814650-n""", "def" : """an important question that is in dispute and must be settled""", "freq" : """23""" },
-    { "synset" : """05939636-n""", "def" : """an erroneous mental representation""", "freq" : """23""" },
-    { "synset" : """06300193-n""", "def" : """the form of a word after all affixes are removed""", "freq" : """23""" },
-    { "synset" : """06514093-n""", "def" : """a record or narrative description of past events""", "freq" : """23""" },
-    { "synset" : """06602472-n""", "def" : """the meaning of a word or expression""", "freq" : """23""" },
-    { "synset" : """06602472-n""", "def" : """the way in which a word or expression or situation can be interpreted""", "freq" : """23""" },
-    { "synset" : """06643408-n""", "def" : """an indication that makes something evident""", "freq" : """23""" },
-    { "synset" : """07168131-n""", "def" : """an authoritative direction or instruction to do something""", "freq" : """23""" },
-    { "synset" : """07291794-n""", "def" : """the concluding parts of an event or occurrence""", "freq" : """23""" },
-    { "synset" : """07996689-n""", "def" : """a group of things of the same kind that belong together and are so used""", "freq" : """23""" },
-    { "synset" : """08431437-n""", "def" : """an arrangement of objects or people side by side in a line""", "freq" : """23""" },
-    { "synset" : """08434259-n""", "def" : """an interconnected system of things or people""", "freq" : """23""" },
-    { "synset" : """08435388-n""", "def" : """a group of independent but interrelated elements comprising a unified whole""", "freq" : """23""" },
-    { "synset" : """08663860-n""", "def" : """the upper part of anything""", "freq" : """23""" },
-    { "synset" : """08663860-n""", "def" : """top""", "freq" : """23""" },
-    { "synset" : """08664443-n""", "def" : """a point located with respect to surface features of some region""", "freq" : """23""" },
-    { "synset" : """09148970-n""", "def" : """a state in the eastern United States""", "freq" : """23""" },
-    { "synset" : """09148970-n""", "def" : """one of the original 13 colonies""", "freq" : """23""" },
-    { "synset" : """09148970-n""", "def" : """one of the Confederate States in the American Civil War""", "freq" : """23""" },
-    { "synset" : """09623038-n""", "def" : """a person who rules or guides or inspires others""", "freq" : """23""" },
-    { "synset" : """09988063-n""", "def" : """an informal term for a father""", "freq" : """23""" },
-    { "synset" : """09988063-n""", "def" : """probably derived from baby talk""", "freq" : """23""" },
-    { "synset" : """09992837-n""", "def" : """a female human offspring""", "freq" : """23""" },
-    { "synset" : """10352299-n""", "def" : """a person who lives (or is located) near another""", "freq" : """23""" },
-    { "synset" : """10371450-n""", "def" : """someone who is appointed or elected to an office and who holds a position of trust""", "freq" : """23""" },
-    { "synset" : """10372373-n""", "def" : """a worker who holds or is invested with an office""", "freq" : """23""" },
-    { "synset" : """13661273-n""", "def" : """the basic monetary unit in many countries""", "freq" : """23""" },
-    { "synset" : """13661273-n""", "def" : """equal to 100 cents""", "freq" : """23""" },
-    { "synset" : """13855627-n""", "def" : """the opposition or dissimilarity of things that are compared""", "freq" : """23""" },
-    { "synset" : """13878634-n""", "def" : """a plane rectangle with four equal sides and four right angles""", "freq" : """23""" },
-    { "synset" : """13878634-n""", "def" : """a four-sided regular polygon""", "freq" : """23""" },
-    { "synset" : """13941125-n""", "def" : """the point or degree to which something extends""", "freq" : """23""" },
-    { "synset" : """14024882-n""", "def" : """a natural and periodic state of rest during which consciousness of the world is suspended""", "freq" : """23""" },
-    { "synset" : """14728724-n""", "def" : """any of a large group of nitrogenous organic compounds that are essential constituents of living cells""", "freq" : """23""" },
-    { "synset" : """14728724-n""", "def" : """consist of polymers of amino acids""", "freq" : """23""" },
-    { "synset" : """14728724-n""", "def" : """essential in the diet of animals for growth and for repair of tissues""", "freq" : """23""" },
-    { "synset" : """14728724-n""", "def" : """can be obtained from meat and eggs and milk and legumes""", "freq" : """23""" },
-    { "synset" : """14956325-n""", "def" : """water soaked soil""", "freq" : """23""" },
-    { "synset" : """14956325-n""", "def" : """soft wet earth""", "freq" : """23""" },
-    { "synset" : """15137890-n""", "def" : """leisure time away from work devoted to rest or pleasure""", "freq" : """23""" },
-    { "synset" : """15159583-n""", "def" : """the specified day of the month""", "freq" : """23""" },
-    { "synset" : """15246353-n""", "def" : """a period of indeterminate length (usually short) marked by some action or condition""", "freq" : """23""" },
-    { "synset" : """15254028-n""", "def" : """an era of history having some distinctive feature""", "freq" : """23""" },
-    { "synset" : """00043765-a""", "def" : """presently existing in fact and not merely potential or possible""", "freq" : """22""" },
-    { "synset" : """00106020-a""", "def" : """having the normally expected amount""", "freq" : """22""" },
-    { "synset" : """00122128-a""", "def" : """earlier in time""", "freq" : """22""" },
-    { "synset" : """00356926-a""", "def" : """typical or distinctive""", "freq" : """22""" },
-    { "synset" : """00483146-a""", "def" : """connected with or engaged in or sponsored by or used in commerce or commercial enterprises""", "freq" : """22""" },
-    { "synset" : """00493297-a""", "def" : """affecting the people or community as a whole""", "freq" : """22""" },
-    { "synset" : """00517554-a""", "def" : """consisting of one of two equivalent parts in value or quantity""", "freq" : """22""" },
-    { "synset" : """00625055-a""", "def" : """of considerable size""", "freq" : """22""" },
-    { "synset" : """00817424-a""", "def" : """being or occurring at an early stage of development""", "freq" : """22""" },
-    { "synset" : """00986027-a""", "def" : """having an (over)abundance of flesh""", "freq" : """22""" },
-    { "synset" : """01099707-a""", "def" : """being nothing more than specified""", "freq" : """22""" },
-    { "synset" : """01471002-a""", "def" : """greater in number or size or amount""", "freq" : """22""" },
-    { "synset" : """01569965-a""", "def" : """in accordance with nature""", "freq" : """22""" },
-    { "synset" : """01569965-a""", "def" : """relating to or concerning nature""", "freq" : """22""" },
-    { "synset" : """01579128-a""", "def" : """conclusive in a process or progression""", "freq" : """22""" },
-    { "synset" : """02058794-a""", "def" : """involving or causing danger or risk""", "freq" : """22""" },
-    { "synset" : """02058794-a""", "def" : """liable to hurt or harm""", "freq" : """22""" },
-    { "synset" : """02564986-a""", "def" : """disposed or inclined toward""", "freq" : """22""" },
-    { "synset" : """02804590-a""", "def" : """relating to or characteristic of or situated in suburbs""", "freq" : """22""" },
-    { "synset" : """02847894-a""", "def" : """involving financial matters""", "freq" : """22""" },
-    { "synset" : """02957276-a""", "def" : """of or pertaining to or characteristic of Russia or its people or culture or language""", "freq" : """22""" },
-    { "synset" : """00027795-r""", "def" : """up to the present time""", "freq" : """22""" },
-    { "synset" : """00038625-r""", "def" : """as might be expected""", "freq" : """22""" },
-    { "synset" : """00079499-r""", "def" : """during the night of the present day""", "freq" : """22""" },
-    { "synset" : """00095612-r""", "def" : """away from a more central or a more northerly place""", "freq" : """22""" },
-    { "synset" : """00101490-r""", "def" : """at or to a certain point or degree""", "freq" : """22""" },
-    { "synset" : """00116791-r""", "def" : """in contact with each other or in proximity""", "freq" : """22""" },
-    { "synset" : """00001740-v""", "def" : """draw air into, and expel out of, the lungs""", "freq" : """22""" },
-    { "synset" : """00010435-v""", "def" : """behave in a certain manner""", "freq" : """22""" },
-    { "synset" : """00010435-v""", "def" : """show a certain behavior""", "freq" : """22""" },
-    { "synset" : """00010435-v""", "def" : """conduct or comport oneself""", "freq" : """22""" },
-    { "synset" : """00047745-v""", "def" : """have on one's person""", "freq" : """22""" },
-    { "synset" : """00425967-v""", "def" : """be issued or published""", "freq" : """22""" },
-    { "synset" : """00610538-v""", "def" : """put in the mind of someone""", "freq" : """22""" },
-    { "synset" : """00662589-v""", "def" : """be careful or certain to do something""", "freq" : """22""" },
-    { "synset" : """00662589-v""", "def" : """make certain of something""", "freq" : """22""" },
-    { "synset" : """00664788-v""", "def" : """establish the validity of something, as by an example, explanation or experiment""", "freq" : """22""" },
-    { "synset" : """00717358-v""", "def" : """show a response or a reaction to something""", "freq" : """22""" },
-    { "synset" : """00725274-v""", "def" : """cause to be surprised""", "freq" : """22""" },
-    { "synset" : """00734054-v""", "def" : """take into consideration for exemplifying purposes""", "freq" : """22""" },
-    { "synset" : """00743344-v""", "def" : """be in or establish communication with""", "freq" : """22""" },
-    { "synset" : """00842989-v""", "def" : """bring an accusation against""", "freq" : """22""" },
-    { "synset" : """00842989-v""", "def" : """level a charge against""", "freq" : """22""" },
-    { "synset" : """00870213-v""", "def" : """notify of danger, potential harm, or risk""", "freq" : """22""" },
-    { "synset" : """00915830-v""", "def" : """speak softly""", "freq" : """22""" },
-    { "synset" : """00915830-v""", "def" : """in a low voice""", "freq" : """22""" },
-    { "synset" : """01016778-v""", "def" : """state categorically""", "freq" : """22""" },
-    { "synset" : """01119169-v""", "def" : """launch an attack or assault on""", "freq" : """22""" },
-    { "synset" : """01119169-v""", "def" : """begin hostilities or start warfare with""", "freq" : """22""" },
-    { "synset" : """01296462-v""", "def" : """cause to be attached""", "freq" : """22""" },
-    { "synset" : """01826498-v""", "def" : """like better""", "freq" : """22""" },
-    { "synset" : """01826498-v""", "def" : """value more highly""", "freq" : """22""" },
-    { "synset" : """01866192-v""", "def" : """move by turning over or rotating""", "freq" : """22""" },
-    { "synset" : """01963942-v""", "def" : """move forward by leaps and bounds""", "freq" : """22""" },
-    { "synset" : """01976089-v""", "def" : """take and lift upward""", "freq" : """22""" },
-    { "synset" : """02074677-v""", "def" : """run away from confinement""", "freq" : """22""" },
-    { "synset" : """02108026-v""", "def" : """go through (mental or physical states or experiences)""", "freq" : """22""" },
-    { "synset" : """02394183-v""", "def" : """assume, as of positions or roles""", "freq" : """22""" },
-    { "synset" : """02450505-v""", "def" : """stop (someone or something) from doing something or being in a certain state""", "freq" : """22""" },
-    { "synset" : """02453321-v""", "def" : """prevent the occurrence of""", "freq" : """22""" },
-    { "synset" : """02453321-v""", "def" : """prevent from happening""", "freq" : """22""" },
-    { "synset" : """02453321-v""", "def" : """to protect from or to keep away anything undesirable; to ward off""", "freq" : """22""" },
-    { "synset" : """02627934-v""", "def" : """require as useful, just, or proper""", "freq" : """22""" },
-    { "synset" : """02637202-v""", "def" : """dwell""", "freq" : """22""" },
-    { "synset" : """02653381-v""", "def" : """originate (in)""", "freq" : """22""" },
-    { "synset" : """02678438-v""", "def" : """be on the mind of""", "freq" : """22""" },
-    { "synset" : """02679899-v""", "def" : """keep or maintain in unaltered condition""", "freq" : """22""" },
-    { "synset" : """02679899-v""", "def" : """cause to remain or last""", "freq" : """22""" },
-    { "synset" : """00410247-n""", "def" : """a customary way of operation or behavior""", "freq" : """22""" },
-    { "synset" : """00583246-n""", "def" : """the particular occupation for which you are trained""", "freq" : """22""" },
-    { "synset" : """01792640-n""", "def" : """adult female chicken""", "freq" : """22""" },
-    { "synset" : """02727825-n""", "def" : """equipment designed to serve a specific function""", "freq" : """22""" },
-    { "synset" : """02793495-n""", "def" : """an outlying farm building for storing grain or animal feed and housing farm animals""", "freq" : """22""" },
-    { "synset" : """02821627-n""", "def" : """a room used primarily for sleeping""", "freq" : """22""" },
-    { "synset" : """04679419-n""", "def" : """the general outward appearance of something""", "freq" : """22""" },
-    { "synset" : """04986883-n""", "def" : """a pitch or change in pitch of the voice that serves to distinguish words in tonal languages""", "freq" : """22""" },
-    { "synset" : """05218119-n""", "def" : """the dead body of a human being""", "freq" : """22""" },
-    { "synset" : """05481095-n""", "def" : """that part of the central nervous system that includes all the higher nervous centers""", "freq" : """22""" },
-    { "synset" : """05481095-n""", "def" : """enclosed within the skull""", "freq" : """22""" },
-    { "synset" : """05481095-n""", "def" : """continuous with the spinal cord""", "freq" : """22""" },
-    { "synset" : """05602835-n""", "def" : """either side of the face below the eyes""", "freq" : """22""" },
-    { "synset" : """05611822-n""", "def" : """an abstract mental location""", "freq" : """22""" },
-    { "synset" : """05808794-n""", "def" : """the cognitive process of understanding a written linguistic message""", "freq" : """22""" },
-    { "synset" : """05936704-n""", "def" : """a clear and telling mental image""", "freq" : """22""" },
-    { "synset" : """05980875-n""", "def" : """the state of affairs that a plan is intended to achieve and that (when achieved) terminates behavior intended to achieve it""", "freq" : """22""" },
-    { "synset" : """06203956-n""", "def" : """the intense dislike for and prejudice against Jewish people""", "freq" : """22""" },
-    { "synset" : """06536853-n""", "def" : """a statute in draft before it becomes law""", "freq" : """22""" },
-    { "synset" : """06648724-n""", "def" : """a fact or assertion offered as evidence that something is true""", "freq" : """22""" },
-    { "synset" : """07191279-n""", "def" : """an urgent or peremptory request""", "freq" : """22""" },
-    { "synset" : """07307477-n""", "def" : """a single distinct event""", "freq" : """22""" },
-    { "synset" : """07349299-n""", "def" : """a cataclysm resulting from a destructive sea wave caused by an earthquake or volcanic eruption""", "freq" : """22""" },
-    { "synset" : """07516354-n""", "def" : """a strong emotion""", "freq" : """22""" },
-    { "synset" : """07516354-n""", "def" : """a feeling that is oriented toward some real or supposed grievance""", "freq" : """22""" },
-    { "synset" : """08398773-n""", "def" : """a collection containing a variety of sorts of things""", "freq" : """22""" },
-    { "synset" : """08506641-n""", "def" : """a region where a battle is being (or has been) fought""", "freq" : """22""" },
-    { "synset" : """09636339-n""", "def" : """a person with dark skin who comes from Africa (or whose ancestors came from Africa)""", "freq" : """22""" },
-    { "synset" : """09815188-n""", "def" : """insulting terms of address for people who are stupid or irritating or ridiculous""", "freq" : """22""" },
-    { "synset" : """09988063-n""", "def" : """an informal term for a father""", "freq" : """22""" },
-    { "synset" : """09988063-n""", "def" : """probably derived from baby talk""", "freq" : """22""" },
-    { "synset" : """13250048-n""", "def" : """the land on which real estate is located""", "freq" : """22""" },
-    { "synset" : """13750415-n""", "def" : """ten 10s""", "freq" : """22""" },
-    { "synset" : """13994148-n""", "def" : """freedom from control or influence of another or others""", "freq" : """22""" },
-    { "synset" : """14298815-n""", "def" : """an injury to living tissue (especially an injury involving a cut or break in the skin)""", "freq" : """22""" },
-    { "synset" : """14428160-n""", "def" : """a relative position or degree of value in a graded group""", "freq" : """22""" },
-    { "synset" : """14480065-n""", "def" : """a distinct state of matter in a system""", "freq" : """22""" },
-    { "synset" : """14480065-n""", "def" : """matter that is identical in chemical composition and physical state and separated from other material by the phase boundary""", "freq" : """22""" },
-    { "synset" : """14820425-n""", "def" : """a mixture of two partially miscible liquids A and B produces two conjugate solutions: one of A in B and another of B in A""", "freq" : """22""" },
-    { "synset" : """14881303-n""", "def" : """a brittle transparent solid with irregular atomic structure""", "freq" : """22""" },
-    { "synset" : """14915184-n""", "def" : """water frozen in the solid state""", "freq" : """22""" },
-    { "synset" : """14922107-n""", "def" : """a component of a mixture that has been separated by a fractional process""", "freq" : """22""" },
-    { "synset" : """15097017-n""", "def" : """a surface-active chemical widely used in industry and laundering""", "freq" : """22""" },
-    { "synset" : """15140405-n""", "def" : """the period during which something is functional (as between birth and death)""", "freq" : """22""" },
-    { "synset" : """15211189-n""", "def" : """the month following March and preceding May""", "freq" : """22""" },
-    { "synset" : """15213406-n""", "def" : """the month following October and preceding December""", "freq" : """22""" },
-    { "synset" : """15228378-n""", "def" : """clock time""", "freq" : """22""" },
-    { "synset" : """15247110-n""", "def" : """a very short time (as the time it takes the eye to blink or the heart to beat)""", "freq" : """22""" },
-    { "synset" : """00527188-a""", "def" : """of worldwide scope or applicability""", "freq" : """21""" },
-    { "synset" : """00825089-a""", "def" : """relating to or characteristic of the western parts of the world or the West as opposed to the eastern or oriental parts""", "freq" : """21""" },
-    { "synset" : """00979697-a""", "def" : """done or occurring in a brief period of time""", "freq" : """21""" },
-    { "synset" : """01003277-a""", "def" : """having come or been brought to a conclusion""", "freq" : """21""" },
-    { "synset" : """01011973-a""", "def" : """occurring at the beginning""", "freq" : """21""" },
-    { "synset" : """01047301-a""", "def" : """referring to the first of two things or persons mentioned (or the earlier one or ones of several)""", "freq" : """21""" },
-    { "synset" : """01067415-a""", "def" : """occurring from time to time""", "freq" : """21""" },
-    { "synset" : """01089369-a""", "def" : """involving less than the standard or customary time for an activity""", "freq" : """21""" },
-    { "synset" : """01375831-a""", "def" : """widely known and esteemed""", "freq" : """21""" },
-    { "synset" : """01436003-a""", "def" : """having little length or lacking in length""", "freq" : """21""" },
-    { "synset" : """01580775-a""", "def" : """necessary for relief or supply""", "freq" : """21""" },
-    { "synset" : """01679055-a""", "def" : """relating or belonging to the class of chemical compounds having a carbon basis""", "freq" : """21""" },
-    { "synset" : """01834304-a""", "def" : """concerned with actual use or practice""", "freq" : """21""" },
-    { "synset" : """02187161-a""", "def" : """denoting a quantity consisting of one more than eight and one less than ten""", "freq" : """21""" },
-    { "synset" : """02867783-a""", "def" : """characterized by or capable of producing music""", "freq" : """21""" },
-    { "synset" : """00033663-r""", "def" : """to a small degree""", "freq" : """21""" },
-    { "synset" : """00033663-r""", "def" : """somewhat""", "freq" : """21""" },
-    { "synset" : """00065294-r""", "def" : """two times""", "freq" : """21""" },
-    { "synset" : """00066781-r""", "def" : """at or in the front""", "freq" : """21""" },
-    { "synset" : """00088931-r""", "def" : """seemingly without interruption""", "freq" : """21""" },
-    { "synset" : """00098714-r""", "def" : """on the contrary""", "freq" : """21""" },
-    { "synset" : """00118965-r""", "def" : """at a previous time""", "freq" : """21""" },
-    { "synset" : """00138060-r""", "def" : """in like or similar manner""", "freq" : """21""" },
-    { "synset" : """00159040-r""", "def" : """as an example""", "freq" : """21""" },
-    { "synset" : """00196203-r""", "def" : """in the right manner""", "freq" : """21""" },
-    { "synset" : """00233295-r""", "def" : """from one's possession""", "freq" : """21""" },
-    { "synset" : """00146138-v""", "def" : """undergo a transformation or a change of position or action""", "freq" : """21""" },
-    { "synset" : """00598954-v""", "def" : """get to know or become aware of, usually accidentally""", "freq" : """21""" },
-    { "synset" : """00609100-v""", "def" : """be unable to remember""", "freq" : """21""" },
-    { "synset" : """00637259-v""", "def" : """make a mathematical calculation or computation""", "freq" : """21""" },
-    { "synset" : """00644583-v""", "def" : """consider in detail and subject to an analysis in order to discover essential features or meaning""", "freq" : """21""" },
-    { "synset" : """00678282-v""", "def" : """plan for an activity or event""", "freq" : """21""" },
-    { "synset" : """00701040-v""", "def" : """shape or influence""", "freq" : """21""" },
-    { "synset" : """00701040-v""", "def" : """give direction to""", "freq" : """21""" },
-    { "synset" : """00706243-v""", "def" : """present for consideration, examination, criticism, etc.""", "freq" : """21""" },
-    { "synset" : """00723349-v""", "def" : """come to one's mind""", "freq" : """21""" },
-    { "synset" : """00723349-v""", "def" : """suggest itself""", "freq" : """21""" },
-    { "synset" : """00734348-v""", "def" : """have on one's mind, think about actively""", "freq" : """21""" },
-    { "synset" : """00759944-v""", "def" : """address a deity, a prophet, a saint or an object of worship""", "freq" : """21""" },
-    { "synset" : """00759944-v""", "def" : """say a prayer""", "freq" : """21""" },
-    { "synset" : """00871405-v""", "def" : """to utter intentions of injury or punishment against""", "freq" : """21""" },
-    { "synset" : """00901103-v""", "def" : """cause to come to know personally""", "freq" : """21""" },
-    { "synset" : """00927430-v""", "def" : """drop a hint""", "freq" : """21""" },
-    { "synset" : """00927430-v""", "def" : """intimate by a hint""", "freq" : """21""" },
-    { "synset" : """00941166-v""", "def" : """cause to be heard or known""", "freq" : """21""" },
-    { "synset" : """00941166-v""", "def" : """express or utter""", "freq" : """21""" },
-    { "synset" : """00967625-v""", "def" : """prepare and issue for public distribution or sale""", "freq" : """21""" },
-    { "synset" : """00989602-v""", "def" : """deliver (a speech, oration, or idea)""", "freq" : """21""" },
-    { "synset" : """01024190-v""", "def" : """make reference to""", "freq" : """21""" },
-    { "synset" : """01041415-v""", "def" : """signal with the hands or nod""", "freq" : """21""" },
-    { "synset" : """01181295-v""", "def" : """help to some food""", "freq" : """21""" },
-    { "synset" : """01181295-v""", "def" : """help with food or drink""", "freq" : """21""" },
-    { "synset" : """01236164-v""", "def" : """hit against""", "freq" : """21""" },
-    { "synset" : """01236164-v""", "def" : """come into sudden contact with""", "freq" : """21""" },
-    { "synset" : """01443021-v""", "def" : """make a hole, especially with a pointed power or hand tool""", "freq" : """21""" },
-    { "synset" : """01633343-v""", "def" : """have the idea for""", "freq" : """21""" },
-    { "synset" : """01640855-v""", "def" : """put in effect""", "freq" : """21""" },
-    { "synset" : """01970826-v""", "def" : """move downward and lower, but not necessarily all the way""", "freq" : """21""" },
-    { "synset" : """01976841-v""", "def" : """to fall vertically""", "freq" : """21""" },
-    { "synset" : """02005496-v""", "def" : """return home""", "freq" : """21""" },
-    { "synset" : """02015598-v""", "def" : """move out of or depart from""", "freq" : """21""" },
-    { "synset" : """02109045-v""", "def" : """experience or feel or submit to""", "freq" : """21""" },
-    { "synset" : """02154508-v""", "def" : """discover or determine the existence, presence, or fact of""", "freq" : """21""" },
-    { "synset" : """02154508-v""", "def" : """discover or determine the existence, presence, or fact of""", "freq" : """21""" },
-    { "synset" : """02400760-v""", "def" : """select by a vote for an office or membership""", "freq" : """21""" },
-    { "synset" : """02405390-v""", "def" : """take the place or move into the position of""", "freq" : """21""" },
-    { "synset" : """02415039-v""", "def" : """to exert effort in order to do, make, or perform something""", "freq" : """21""" },
-    { "synset" : """02506546-v""", "def" : """force somebody to do something""", "freq" : """21""" },
-    { "synset" : """02547586-v""", "def" : """give help or assistance""", "freq" : """21""" },
-    { "synset" : """02547586-v""", "def" : """be of service""", "freq" : """21""" },
-    { "synset" : """02627934-v""", "def" : """require as useful, just, or proper""", "freq" : """21""" },
-    { "synset" : """02627934-v""", "def" : """require as useful, just, or proper""", "freq" : """21""" },
-    { "synset" : """02645839-v""", "def" : """have weight""", "freq" : """21""" },
-    { "synset" : """02645839-v""", "def" : """have import, carry weight""", "freq" : """21""" },
-    { "synset" : """02669477-v""", "def" : """be greater in scope or size than some standard""", "freq" : """21""" },
-    { "synset" : """02679899-v""", "def" : """keep or maintain in unaltered condition""", "freq" : """21""" },
-    { "synset" : """02679899-v""", "def" : """cause to remain or last""", "freq" : """21""" },
-    { "synset" : """02685951-v""", "def" : """stretch out over a distance, space, time, or scope""", "freq" : """21""" },
-    { "synset" : """02685951-v""", "def" : """run or extend between two points or beyond a certain point""", "freq" : """21""" },
-    { "synset" : """00122661-n""", "def" : """the act of firing a projectile""", "freq" : """21""" },
-    { "synset" : """00471613-n""", "def" : """a ball game played with a bat and ball between two teams of nine players""", "freq" : """21""" },
-    { "synset" : """00471613-n""", "def" : """teams take turns at bat trying to score runs""", "freq" : """21""" },
-    { "synset" : """00953559-n""", "def" : """a hostile meeting of opposing military forces in the course of a war""", "freq" : """21""" },
-    { "synset" : """01318381-n""", "def" : """a single domestic animal""", "freq" : """21""" },
-    { "synset" : """02472293-n""", "def" : """any living or extinct member of the family Hominidae characterized by superior intelligence, articulate speech, and erect carriage""", "freq" : """21""" },
-    { "synset" : """02691156-n""", "def" : """an aircraft that has a fixed wing and is powered by propellers or jets""", "freq" : """21""" },
-    { "synset" : """03972524-n""", "def" : """a small pouch inside a garment for carrying small articles""", "freq" : """21""" },
-    { "synset" : """03984381-n""", "def" : """a structure attached to the exterior of a building often forming a covered entrance""", "freq" : """21""" },
-    { "synset" : """05169813-n""", "def" : """the quality of being significant""", "freq" : """21""" },
-    { "synset" : """05192451-n""", "def" : """the power of attracting or holding one's attention (because it is unusual or exciting etc.)""", "freq" : """21""" },
-    { "synset" : """05353819-n""", "def" : """one of two arteries (branches of the pulmonary trunk) that carry venous blood from the heart to the lungs""", "freq" : """21""" },
-    { "synset" : """05670710-n""", "def" : """something that interests you because it is important or affects you""", "freq" : """21""" },
-    { "synset" : """05687338-n""", "def" : """a source of difficulty""", "freq" : """21""" },
-    { "synset" : """05770926-n""", "def" : """the process of using your mind to consider something carefully""", "freq" : """21""" },
-    { "synset" : """05809878-n""", "def" : """all of your experiences that determine how things appear to you""", "freq" : """21""" },
-    { "synset" : """05945642-n""", "def" : """a personal belief or judgment that is not founded on proof or certainty""", "freq" : """21""" },
-    { "synset" : """05951180-n""", "def" : """a future prospect or potential""", "freq" : """21""" },
-    { "synset" : """05954894-n""", "def" : """beliefs of a person or social group in which they have an emotional investment (either for or against something)""", "freq" : """21""" },
-    { "synset" : """06356515-n""", "def" : """the code that identifies where a piece of information is stored""", "freq" : """21""" },
-    { "synset" : """06409752-n""", "def" : """an essay (especially one written as an assignment)""", "freq" : """21""" },
-    { "synset" : """06642138-n""", "def" : """information about recent and important events""", "freq" : """21""" },
-    { "synset" : """06743506-n""", "def" : """a statement that solves a problem or explains how to solve the problem""", "freq" : """21""" },
-    { "synset" : """06746005-n""", "def" : """a statement (either spoken or written) that is made to reply to a question or request or criticism or accusation""", "freq" : """21""" },
-    { "synset" : """07183151-n""", "def" : """a contentious speech act""", "freq" : """21""" },
-    { "synset" : """07183151-n""", "def" : """a dispute where there is strong disagreement""", "freq" : """21""" },
-    { "synset" : """07205104-n""", "def" : """a negative""", "freq" : """21""" },
-    { "synset" : """07356676-n""", "def" : """a change resulting in an increase""", "freq" : """21""" },
-    { "synset" : """07490713-n""", "def" : """a fundamental feeling that is hard to define but that people desire to experience""", "freq" : """21""" },
-    { "synset" : """07516997-n""", "def" : """a feeling of intense anger""", "freq" : """21""" },
-    { "synset" : """08168978-n""", "def" : """a politically organized body of people under a single government""", "freq" : """21""" },
-    { "synset" : """08389572-n""", "def" : """group of guns or missile launchers operated together at one place""", "freq" : """21""" },
-    { "synset" : """08414119-n""", "def" : """a body of citizens sworn to give a true verdict according to the evidence presented in a court of law""", "freq" : """21""" },
-    { "synset" : """08620061-n""", "def" : """the precise location of something""", "freq" : """21""" },
-    { "synset" : """08620061-n""", "def" : """a spatially limited location""", "freq" : """21""" },
-    { "synset" : """09190918-n""", "def" : """an active and efficient cause""", "freq" : """21""" },
-    { "synset" : """09190918-n""", "def" : """capable of producing a certain effect""", "freq" : """21""" },
-    { "synset" : """09394007-n""", "def" : """any of the nine large celestial bodies in the solar system that revolve around the sun and shine by reflected light""", "freq" : """21""" },
-    { "synset" : """09394007-n""", "def" : """Mercury, Venus, Earth, Mars, Jupiter, Saturn, Uranus, Neptune, and Pluto in order of their proximity to the sun""", "freq" : """21""" },
-    { "synset" : """09394007-n""", "def" : """viewed from the constellation Hercules, all the planets rotate around the sun in a counterclockwise direction""", "freq" : """21""" },
-    { "synset" : """09931640-n""", "def" : """someone in charge of training an athlete or a team""", "freq" : """21""" },
-    { "synset" : """11083656-n""", "def" : """a teacher and prophet born in Bethlehem and active in Nazareth""", "freq" : """21""" },
-    { "synset" : """11083656-n""", "def" : """his life and sermons form the basis for Christianity (circa 4 BC - AD 29)""", "freq" : """21""" },
-    { "synset" : """11506738-n""", "def" : """a deformation of an object in which parallel planes remain parallel but are shifted in a direction parallel to themselves""", "freq" : """21""" },
-    { "synset" : """13714491-n""", "def" : """a degree on the centigrade scale of temperature""", "freq" : """21""" },
-    { "synset" : """13742573-n""", "def" : """the smallest whole number or a numeral representing this number""", "freq" : """21""" },
-    { "synset" : """13777344-n""", "def" : """an amount of something available for use""", "freq" : """21""" },
-    { "synset" : """13819207-n""", "def" : """the relative magnitudes of two quantities (usually expressed as a quotient)""", "freq" : """21""" },
-    { "synset" : """13840719-n""", "def" : """social relations involving intrigue to gain authority or power""", "freq" : """21""" },
-    { "synset" : """13934596-n""", "def" : """the totality of surrounding conditions""", "freq" : """21""" },
-    { "synset" : """14447908-n""", "def" : """a healthy state of wellbeing free from disease""", "freq" : """21""" },
-    { "synset" : """14625458-n""", "def" : """any of several chemical elements that are usually shiny solids that conduct heat or electricity and can be formed into sheets etc.""", "freq" : """21""" },
-    { "synset" : """15282696-n""", "def" : """distance travelled per unit time""", "freq" : """21""" },
-    { "synset" : """00002098-a""", "def" : """not having the necessary means or skill or know-how""", "freq" : """20""" },
-    { "synset" : """00044353-a""", "def" : """existing in possibility""", "freq" : """20""" },
-    { "synset" : """00220082-a""", "def" : """pleasing by delicacy or grace""", "freq" : """20""" },
-    { "synset" : """00220082-a""", "def" : """not imposing""", "freq" : """20""" },
-    { "synset" : """00306314-a""", "def" : """having capacity or ability""", "freq" : """20""" },
-    { "synset" : """00442361-a""", "def" : """located at a great distance in time or space or degree""", "freq" : """20""" },
-    { "synset" : """00631391-a""", "def" : """free from error""", "freq" : """20""" },
-    { "synset" : """00631391-a""", "def" : """especially conforming to fact or truth""", "freq" : """20""" },
-    { "synset" : """00810916-a""", "def" : """having or showing keen interest or intense desire or impatient expectancy""", "freq" : """20""" },
-    { "synset" : """00979366-a""", "def" : """accomplished rapidly and without delay""", "freq" : """20""" },
-    { "synset" : """01037540-a""", "def" : """of concern to or concerning the affairs of other nations (other than your own)""", "freq" : """20""" },
-    { "synset" : """01155354-a""", "def" : """dispassionate""", "freq" : """20""" },
-    { "synset" : """01411065-a""", "def" : """equal in amount or value""", "freq" : """20""" },
-    { "synset" : """01509527-a""", "def" : """possessing or displaying a distinctive feature to a heightened degree""", "freq" : """20""" },
-    { "synset" : """01678729-a""", "def" : """for a special service or occasion""", "freq" : """20""" },
-    { "synset" : """01729566-a""", "def" : """belonging to some prior time""", "freq" : """20""" },
-    { "synset" : """01817500-a""", "def" : """characterized by or displaying affirmation or acceptance or certainty etc.""", "freq" : """20""" },
-    { "synset" : """01972820-a""", "def" : """being connected either logically or causally or by shared characteristics""", "freq" : """20""" },
-    { "synset" : """02031986-a""", "def" : """being or located on or directed toward the side of the body to the east when facing north""", "freq" : """20""" },
-    { "synset" : """02109678-a""", "def" : """independent""", "freq" : """20""" },
-    { "synset" : """02109678-a""", "def" : """not united or joint""", "freq" : """20""" },
-    { "synset" : """02126430-a""", "def" : """situated in a particular spot or position""", "freq" : """20""" },
-    { "synset" : """02187465-a""", "def" : """denoting a quantity consisting of 12 items or units""", "freq" : """20""" },
-    { "synset" : """02192184-a""", "def" : """being ten more than fifty""", "freq" : """20""" },
-    { "synset" : """02748635-a""", "def" : """of or relating to or resulting from industry""", "freq" : """20""" },
-    { "synset" : """00028797-r""", "def" : """by contrast""", "freq" : """20""" },
-    { "synset" : """00028797-r""", "def" : """on the other hand""", "freq" : """20""" },
-    { "synset" : """00035718-r""", "def" : """to a moderately sufficient extent or degree""", "freq" : """20""" },
-    { "synset" : """00037226-r""", "def" : """in accordance with truth or fact or reality""", "freq" : """20""" },
-    { "synset" : """00041954-r""", "def" : """without distinction of one from others""", "freq" : """20""" },
-    { "synset" : """00047903-r""", "def" : """as the end result of a succession or process""", "freq" : """20""" },
-    { "synset" : """00106921-r""", "def" : """under normal conditions""", "freq" : """20""" },
-    { "synset" : """00120095-r""", "def" : """at the same instant""", "freq" : """20""" },
-    { "synset" : """00158309-r""", "def" : """indicating exactness or preciseness""", "freq" : """20""" },
-    { "synset" : """00066191-v""", "def" : """shed tears because of sadness, rage, or pain""", "freq" : """20""" },
-    { "synset" : """00344643-v""", "def" : """happen, occur, or be the case in the course of events or by chance""", "freq" : """20""" },
-    { "synset" : """00489837-v""", "def" : """express as a number or measure or quantity""", "freq" : """20""" },
-    { "synset" : """00540235-v""", "def" : """extend in scope or range or area""", "freq" : """20""" },
-    { "synset" : """00693780-v""", "def" : """keep in mind or convey as a conviction or view""", "freq" : """20""" },
-    { "synset" : """00712135-v""", "def" : """judge to be probable""", "freq" : """20""" },
-    { "synset" : """00730052-v""", "def" : """intend to refer to""", "freq" : """20""" },
-    { "synset" : """00817003-v""", "def" : """refuse to accept or believe""", "freq" : """20""" },
-    { "synset" : """00865387-v""", "def" : """utter obscenities or profanities""", "freq" : """20""" },
-    { "synset" : """00890590-v""", "def" : """make certain of""", "freq" : """20""" },
-    { "synset" : """01031256-v""", "def" : """cause to be directed or transmitted to another place""", "freq" : """20""" },
-    { "synset" : """01031256-v""", "def" : """mail""", "freq" : """20""" },
-    { "synset" : """01180351-v""", "def" : """provide (usually but not necessarily food)""", "freq" : """20""" },
-    { "synset" : """01215137-v""", "def" : """take into custody""", "freq" : """20""" },
-    { "synset" : """01346978-v""", "def" : """become closed""", "freq" : """20""" },
-    { "synset" : """01437254-v""", "def" : """to cause or order to be taken, directed, or transmitted to another place""", "freq" : """20""" },
-    { "synset" : """01525666-v""", "def" : """perform as expected when applied""", "freq" : """20""" },
-    { "synset" : """01545883-v""", "def" : """not move""", "freq" : """20""" },
-    { "synset" : """01545883-v""", "def" : """be in a resting position""", "freq" : """20""" },
-    { "synset" : """01780202-v""", "def" : """be afraid or scared of""", "freq" : """20""" },
-    { "synset" : """01780202-v""", "def" : """be frightened of""", "freq" : """20""" },
-    { "synset" : """01855606-v""", "def" : """change residence, affiliation, or place of employment""", "freq" : """20""" },
-    { "synset" : """01983264-v""", "def" : """rise to one's feet""", "freq" : """20""" },
-    { "synset" : """01991931-v""", "def" : """travel along a certain course""", "freq" : """20""" },
-    { "synset" : """02015598-v""", "def" : """move out of or depart from""", "freq" : """20""" },
-    { "synset" : """02020590-v""", "def" : """reach a destination, either real or abstract""", "freq" : """20""" },
-    { "synset" : """02058994-v""", "def" : """move fast""", "freq" : """20""" },
-    { "synset" : """02200686-v""", "def" : """give as a present""", "freq" : """20""" },
-    { "synset" : """02200686-v""", "def" : """make a gift of""", "freq" : """20""" },
-    { "synset" : """02238770-v""", "def" : """get by special effort""", "freq" : """20""" },
-    { "synset" : """02416278-v""", "def" : """work together on a common enterprise of project""", "freq" : """20""" },
-    { "synset" : """02443849-v""", "def" : """direct or control""", "freq" : """20""" },
-    { "synset" : """02443849-v""", "def" : """projects, businesses, etc.""", "freq" : """20""" },
-    { "synset" : """02467662-v""", "def" : """separate into parts or portions""", "freq" : """20""" },
-    { "synset" : """02510337-v""", "def" : """lessen the intensity of""", "freq" : """20""" },
-    { "synset" : """02510337-v""", "def" : """temper""", "freq" : """20""" },
-    { "synset" : """02510337-v""", "def" : """hold in restraint""", "freq" : """20""" },
-    { "synset" : """02510337-v""", "def" : """hold or keep within limits""", "freq" : """20""" },
-    { "synset" : """02568672-v""", "def" : """carry out or practice""", "freq" : """20""" },
-    { "synset" : """02568672-v""", "def" : """as of jobs and professions""", "freq" : """20""" },
-    { "synset" : """02611630-v""", "def" : """determine the essential quality of""", "freq" : """20""" },
-    { "synset" : """02618149-v""", "def" : """continue to live through hardship or adversity""", "freq" : """20""" },
-    { "synset" : """02661252-v""", "def" : """be at variance with""", "freq" : """20""" },
-    { "synset" : """02661252-v""", "def" : """be out of line with""", "freq" : """20""" },
-    { "synset" : """02700104-v""", "def" : """go together""", "freq" : """20""" },
-    { "synset" : """02716165-v""", "def" : """be present or associated with an event or entity""", "freq" : """20""" },
-    { "synset" : """00033615-n""", "def" : """how much there is or how many there are of something that you can quantify""", "freq" : """20""" },
-    { "synset" : """00315986-n""", "def" : """the act of moving something from one location to another""", "freq" : """20""" },
-    { "synset" : """00334509-n""", "def" : """motion of hands or body to emphasize or help to express a thought or feeling""", "freq" : """20""" },
-    { "synset" : """00620752-n""", "def" : """productive work (especially physical work done for wages)""", "freq" : """20""" },
-    { "synset" : """01094725-n""", "def" : """the activity of providing goods and services involving financial and commercial and industrial aspects""", "freq" : """20""" },
-    { "synset" : """01202415-n""", "def" : """the action of incorporating a racial or religious group into a community""", "freq" : """20""" },
-    { "synset" : """01207609-n""", "def" : """the activity of contributing to the fulfillment of a need or furtherance of an effort or purpose""", "freq" : """20""" },
-    { "synset" : """01726692-n""", "def" : """limbless scaly elongate reptile""", "freq" : """20""" },
-    { "synset" : """01726692-n""", "def" : """some are venomous""", "freq" : """20""" },
-    { "synset" : """02206856-n""", "def" : """any of numerous hairy-bodied insects including social and solitary species""", "freq" : """20""" },
-    { "synset" : """02403454-n""", "def" : """female of domestic cattle""", "freq" : """20""" },
-    { "synset" : """04205759-n""", "def" : """a solid missile discharged from a firearm""", "freq" : """20""" },
-    { "synset" : """04490091-n""", "def" : """an automotive vehicle suitable for hauling""", "freq" : """20""" },
-    { "synset" : """04617289-n""", "def" : """any attribute or quality considered as having its own existence""", "freq" : """20""" },
-    { "synset" : """05221895-n""", "def" : """a part of an animal that has a special function or is supplied by a given artery or nerve""", "freq" : """20""" },
-    { "synset" : """05565064-n""", "def" : """a hand with the fingers clenched in the palm (as for hitting)""", "freq" : """20""" },
-    { "synset" : """05675130-n""", "def" : """an alert cognitive state in which you are aware of yourself and your situation""", "freq" : """20""" },
-    { "synset" : """05868954-n""", "def" : """an abstract part of something""", "freq" : """20""" },
-    { "synset" : """05943300-n""", "def" : """a belief (or system of beliefs) accepted as authoritative by some group or school""", "freq" : """20""" },
-    { "synset" : """06253690-n""", "def" : """a communication (usually brief) that is written or spoken or signaled""", "freq" : """20""" },
-    { "synset" : """06599788-n""", "def" : """the subject matter of a conversation or discussion""", "freq" : """20""" },
-    { "synset" : """06606808-n""", "def" : """a brief version of the essential meaning of something""", "freq" : """20""" },
-    { "synset" : """06799897-n""", "def" : """a mark that is long relative to its width""", "freq" : """20""" },
-    { "synset" : """07133701-n""", "def" : """the use of speech for informal exchange of views or ideas or information etc.""", "freq" : """20""" },
-    { "synset" : """07573696-n""", "def" : """the food served and eaten at one time""", "freq" : """20""" },
-    { "synset" : """07844042-n""", "def" : """a white nutritious liquid secreted by mammals and used as food by human beings""", "freq" : """20""" },
-    { "synset" : """07885223-n""", "def" : """a single serving of a beverage""", "freq" : """20""" },
-    { "synset" : """08180639-n""", "def" : """a social class comprising those who do manual labor or work for wages""", "freq" : """20""" },
-    { "synset" : """08286163-n""", "def" : """the body of faculty and students at a university""", "freq" : """20""" },
-    { "synset" : """08337324-n""", "def" : """an administrative unit of government""", "freq" : """20""" },
-    { "synset" : """08366753-n""", "def" : """the system of production and distribution and consumption""", "freq" : """20""" },
-    { "synset" : """08420278-n""", "def" : """a financial institution that accepts deposits and channels the money into lending activities""", "freq" : """20""" },
-    { "synset" : """08431942-n""", "def" : """a row or line of people (especially soldiers or police) standing abreast of one another""", "freq" : """20""" },
-    { "synset" : """08544419-n""", "def" : """a place off to the side of an area""", "freq" : """20""" },
-    { "synset" : """08569777-n""", "def" : """somewhere (away from a studio or office or library or laboratory) where practical work is done or data is collected""", "freq" : """20""" },
-    { "synset" : """08573472-n""", "def" : """the side that is forward or prominent""", "freq" : """20""" },
-    { "synset" : """08932568-n""", "def" : """the capital and largest city of France""", "freq" : """20""" },
-    { "synset" : """08932568-n""", "def" : """and international center of culture and commerce""", "freq" : """20""" },
-    { "synset" : """09052652-n""", "def" : """the region of the United States lying to the north of the Mason-Dixon line""", "freq" : """20""" },
-    { "synset" : """09334396-n""", "def" : """the solid part of the earth's surface""", "freq" : """20""" },
-    { "synset" : """09428293-n""", "def" : """the shore of a sea or ocean""", "freq" : """20""" },
-    { "synset" : """09448361-n""", "def" : """a natural body of running water flowing on or under the earth""", "freq" : """20""" },
-    { "synset" : """09617867-n""", "def" : """a person with special knowledge or ability who performs skillfully""", "freq" : """20""" },
-    { "synset" : """09879144-n""", "def" : """uncomplimentary terms for a policeman""", "freq" : """20""" },
-    { "synset" : """09889691-n""", "def" : """a candidate for an election, award or honour""", "freq" : """20""" },
-    { "synset" : """09931640-n""", "def" : """someone in charge of training an athlete or a team""", "freq" : """20""" },
-    { "synset" : """09945905-n""", "def" : """a friend who is frequently in the company of another""", "freq" : """20""" },
-    { "synset" : """10177150-n""", "def" : """a person who is an authority on history and who studies it and writes about it""", "freq" : """20""" },
-    { "synset" : """10439851-n""", "def" : """a person who participates in or is skilled at some game""", "freq" : """20""" },
-    { "synset" : """10548537-n""", "def" : """a man salesperson""", "freq" : """20""" },
-    { "synset" : """10602985-n""", "def" : """a female person who has the same parents as another person""", "freq" : """20""" },
-    { "synset" : """10627082-n""", "def" : """the immaterial part of a person""", "freq" : """20""" },
-    { "synset" : """10627082-n""", "def" : """the actuating cause of an individual life""", "freq" : """20""" },
-    { "synset" : """11458624-n""", "def" : """the influence that produces a change in a physical quantity""", "freq" : """20""" },
-    { "synset" : """11524662-n""", "def" : """the atmospheric conditions that comprise the state of the atmosphere in terms of temperature and wind and clouds and precipitation""", "freq" : """20""" },
-    { "synset" : """13152742-n""", "def" : """the main organ of photosynthesis and transpiration in higher plants""", "freq" : """20""" },
-    { "synset" : """13275288-n""", "def" : """money paid out""", "freq" : """20""" },
-    { "synset" : """13275288-n""", "def" : """an amount spent""", "freq" : """20""" },
-    { "synset" : """13490343-n""", "def" : """a progression from simpler to more complex forms""", "freq" : """20""" },
-    { "synset" : """13530408-n""", "def" : """the process of oxidizing""", "freq" : """20""" },
-    { "synset" : """13530408-n""", "def" : """the addition of oxygen to a compound with a loss of electrons""", "freq" : """20""" },
-    { "synset" : """13530408-n""", "def" : """always occurs accompanied by reduction""", "freq" : """20""" },
-    { "synset" : """13742358-n""", "def" : """a mathematical element that when added to another number yields the same number""", "freq" : """20""" },
-    { "synset" : """13867641-n""", "def" : """the trace of a point whose direction of motion changes""", "freq" : """20""" },
-    { "synset" : """13945919-n""", "def" : """the relative position or standing of things or especially persons in a society""", "freq" : """20""" },
-    { "synset" : """13983515-n""", "def" : """absence of light or illumination""", "freq" : """20""" },
-    { "synset" : """14374432-n""", "def" : """a relatively permanent state of worry and nervousness occurring in a variety of mental disorders, usually accompanied by compulsive behavior or attacks of panic""", "freq" : """20""" },
-    { "synset" : """14802450-n""", "def" : """an alloy of iron with small amounts of carbon""", "freq" : """20""" },
-    { "synset" : """14802450-n""", "def" : """widely used in construction""", "freq" : """20""" },
-    { "synset" : """14802450-n""", "def" : """mechanical properties can be varied over a wide range""", "freq" : """20""" },
-    { "synset" : """14842992-n""", "def" : """the loose soft material that makes up a large part of the land surface""", "freq" : """20""" },
-    { "synset" : """00309021-a""", "def" : """exercising caution or showing care or attention""", "freq" : """19""" },
-    { "synset" : """00577405-a""", "def" : """in conformance to or agreement with""", "freq" : """19""" },
-    { "synset" : """00670530-a""", "def" : """used as expletives""", "freq" : """19""" },
-    { "synset" : """01038102-a""", "def" : """of concern to or concerning the internal affairs of a nation""", "freq" : """19""" },
-    { "synset" : """01105620-a""", "def" : """not caused by a specific agent""", "freq" : """19""" },
-    { "synset" : """01105620-a""", "def" : """used also of staining in making microscope slides""", "freq" : """19""" },
-    { "synset" : """01277426-a""", "def" : """most important element""", "freq" : """19""" },
-    { "synset" : """01318741-a""", "def" : """suffering from physical injury especially that suffered in battle""", "freq" : """19""" },
-    { "synset" : """01385255-a""", "def" : """extraordinarily large in size or extent or amount or power or degree""", "freq" : """19""" },
-    { "synset" : """01392249-a""", "def" : """very small""", "freq" : """19""" },
-    { "synset" : """01568375-a""", "def" : """concerning or belonging to all or at least two or more nations""", "freq" : """19""" },
-    { "synset" : """01618376-a""", "def" : """clearly revealed to the mind or the senses or judgment""", "freq" : """19""" },
-    { "synset" : """01839317-a""", "def" : """precisely as stated""", "freq" : """19""" },
-    { "synset" : """01927279-a""", "def" : """determined or actuated by emotion rather than reason""", "freq" : """19""" },
-    { "synset" : """02187699-a""", "def" : """being one more than thirteen""", "freq" : """19""" },
-    { "synset" : """02188317-a""", "def" : """denoting a quantity consisting of 20 items or units""", "freq" : """19""" },
-    { "synset" : """02190278-a""", "def" : """being ten more than thirty""", "freq" : """19""" },
-    { "synset" : """02198752-a""", "def" : """denoting a quantity consisting of 1,000 items or units""", "freq" : """19""" },
-    { "synset" : """02261386-a""", "def" : """existing as or having characteristics of a liquid""", "freq" : """19""" },
-    { "synset" : """02261386-a""", "def" : """especially tending to flow""", "freq" : """19""" },
-    { "synset" : """02561888-a""", "def" : """not wide""", "freq" : """19""" },
-    { "synset" : """02743391-a""", "def" : """relating to a person""", "freq" : """19""" },
-    { "synset" : """00007703-r""", "def" : """in part""", "freq" : """19""" },
-    { "synset" : """00007703-r""", "def" : """in some degree""", "freq" : """19""" },
-    { "synset" : """00007703-r""", "def" : """not wholly""", "freq" : """19""" },
-    { "synset" : """00014285-r""", "def" : """to a great extent or degree""", "freq" : """19""" },
-    { "synset" : """00025728-r""", "def" : """to or in any or all places""", "freq" : """19""" },
-    { "synset" : """00025728-r""", "def" : """pronoun, location; quantifier: universal""", "freq" : """19""" },
-    { "synset" : """00029367-r""", "def" : """besides""", "freq" : """19""" },
-    { "synset" : """00029367-r""", "def" : """in addition""", "freq" : """19""" },
-    { "synset" : """00048475-r""", "def" : """in these times""", "freq" : """19""" },
-    { "synset" : """00065822-r""", "def" : """the item at the end""", "freq" : """19""" },
-    { "synset" : """00100681-r""", "def" : """during an early stage""", "freq" : """19""" },
-    { "synset" : """00110533-r""", "def" : """within a building""", "freq" : """19""" },
-    { "synset" : """00160440-r""", "def" : """in a close relation or position in time or space""", "freq" : """19""" },
-    { "synset" : """00161193-r""", "def" : """without much difficulty""", "freq" : """19""" },
-    { "synset" : """00165018-r""", "def" : """in a serious manner""", "freq" : """19""" },
-    { "synset" : """00191579-r""", "def" : """a figure of speech used as a way to provide further information, or to be more specific or exact about something""", "freq" : """19""" },
-    { "synset" : """00409709-r""", "def" : """near in time or place or relationship""", "freq" : """19""" },
-    { "synset" : """00501990-r""", "def" : """to or toward the inside of""", "freq" : """19""" },
-    { "synset" : """00094460-v""", "def" : """come to have or undergo a change of (physical features and attributes)""", "freq" : """19""" },
-    { "synset" : """00286008-v""", "def" : """color with a liquid dye or tint""", "freq" : """19""" },
-    { "synset" : """00296178-v""", "def" : """alter or regulate so as to achieve accuracy or conform to a standard""", "freq" : """19""" },
-    { "synset" : """00679389-v""", "def" : """select as an alternative over another""", "freq" : """19""" },
-    { "synset" : """00685683-v""", "def" : """refuse to accept or acknowledge""", "freq" : """19""" },
-    { "synset" : """00690614-v""", "def" : """deem to be""", "freq" : """19""" },
-    { "synset" : """00725748-v""", "def" : """discover or come upon accidentally, suddenly, or unexpectedly""", "freq" : """19""" },
-    { "synset" : """00725748-v""", "def" : """catch somebody doing something or in a certain state""", "freq" : """19""" },
-    { "synset" : """00781000-v""", "def" : """continue talking""", "freq" : """19""" },
-    { "synset" : """00781000-v""", "def" : """go on""", "freq" : """19""" },
-    { "synset" : """00807461-v""", "def" : """express or raise an objection or protest or criticism or express dissent""", "freq" : """19""" },
-    { "synset" : """00895304-v""", "def" : """argue or speak in defense of""", "freq" : """19""" },
-    { "synset" : """00918580-v""", "def" : """maintain with or as if with a bet""", "freq" : """19""" },
-    { "synset" : """00930806-v""", "def" : """imply as a possibility""", "freq" : """19""" },
-    { "synset" : """00933821-v""", "def" : """make known to the public information that was previously known only to a few people or that was meant to be kept a secret""", "freq" : """19""" },
-    { "synset" : """01044533-v""", "def" : """talk indistinctly""", "freq" : """19""" },
-    { "synset" : """01044533-v""", "def" : """usually in a low voice""", "freq" : """19""" },
-    { "synset" : """01207402-v""", "def" : """take up by hand""", "freq" : """19""" },
-    { "synset" : """01207951-v""", "def" : """form a cover over""", "freq" : """19""" },
-    { "synset" : """01249724-v""", "def" : """move over something with pressure""", "freq" : """19""" },
-    { "synset" : """01433294-v""", "def" : """go or come after and bring or take back""", "freq" : """19""" },
-    { "synset" : """01573515-v""", "def" : """separate or cause to separate abruptly""", "freq" : """19""" },
-    { "synset" : """01640550-v""", "def" : """create the design for""", "freq" : """19""" },
-    { "synset" : """01640550-v""", "def" : """create or execute in an artistic or highly skilled manner""", "freq" : """19""" },
-    { "synset" : """01714208-v""", "def" : """give a performance (of something)""", "freq" : """19""" },
-    { "synset" : """01776952-v""", "def" : """be fond of""", "freq" : """19""" },
-    { "synset" : """01963942-v""", "def" : """move forward by leaps and bounds""", "freq" : """19""" },
-    { "synset" : """01968569-v""", "def" : """move upward""", "freq" : """19""" },
-    { "synset" : """02118476-v""", "def" : """notice or perceive""", "freq" : """19""" },
-    { "synset" : """02133185-v""", "def" : """look at attentively""", "freq" : """19""" },
-    { "synset" : """02289295-v""", "def" : """earn on some commercial or business transaction""", "freq" : """19""" },
-    { "synset" : """02289295-v""", "def" : """earn as salary or wages""", "freq" : """19""" },
-    { "synset" : """02295550-v""", "def" : """use jointly or in common""", "freq" : """19""" },
-    { "synset" : """02374764-v""", "def" : """perform a function""", "freq" : """19""" },
-    { "synset" : """02440244-v""", "def" : """be in charge of""", "freq" : """19""" },
-    { "synset" : """02472223-v""", "def" : """include in a list""", "freq" : """19""" },
-    { "synset" : """02536557-v""", "def" : """have and exert influence or effect""", "freq" : """19""" },
-    { "synset" : """02593107-v""", "def" : """devote (part of) one's life or efforts to, as of countries, institutions, or ideas""", "freq" : """19""" },
-    { "synset" : """02620587-v""", "def" : """form or compose""", "freq" : """19""" },
-    { "synset" : """02627753-v""", "def" : """grow out of, have roots in, originate in""", "freq" : """19""" },
-    { "synset" : """02704928-v""", "def" : """persist for a specified period of time""", "freq" : """19""" },
-    { "synset" : """02721438-v""", "def" : """make a possibility or provide opportunity for""", "freq" : """19""" },
-    { "synset" : """02721438-v""", "def" : """permit to be attainable or cause to remain""", "freq" : """19""" },
-    { "synset" : """02735897-v""", "def" : """be of use""", "freq" : """19""" },
-    { "synset" : """00415676-n""", "def" : """a course of conduct""", "freq" : """19""" },
-    { "synset" : """00550771-n""", "def" : """the act of presenting a play or a piece of music or other entertainment""", "freq" : """19""" },
-    { "synset" : """00996969-n""", "def" : """the act or process of assigning numbers to phenomena according to a rule""", "freq" : """19""" },
-    { "synset" : """01133281-n""", "def" : """the act of managing something""", "freq" : """19""" },
-    { "synset" : """01182654-n""", "def" : """a comprehensive term for any proceeding in a court of law whereby an individual seeks a legal remedy""", "freq" : """19""" },
-    { "synset" : """01460457-n""", "def" : """animal reproductive body consisting of an ovum or embryo together with nutritive and protective envelopes""", "freq" : """19""" },
-    { "synset" : """01460457-n""", "def" : """especially the thin-shelled reproductive body laid by e.g. female birds""", "freq" : """19""" },
-    { "synset" : """02849154-n""", "def" : """bedding that keeps a person warm in bed""", "freq" : """19""" },
-    { "synset" : """02944826-n""", "def" : """temporary living quarters specially built by the army for soldiers""", "freq" : """19""" },
-    { "synset" : """03629986-n""", "def" : """a workplace for the conduct of scientific research""", "freq" : """19""" },
-    { "synset" : """04673965-n""", "def" : """outward or visible aspect of a person or thing""", "freq" : """19""" },
-    { "synset" : """05035353-n""", "def" : """physical energy or intensity""", "freq" : """19""" },
-    { "synset" : """05196375-n""", "def" : """power to direct or determine""", "freq" : """19""" },
-    { "synset" : """05200169-n""", "def" : """the quality of being able to perform""", "freq" : """19""" },
-    { "synset" : """05200169-n""", "def" : """a quality that permits or facilitates achievement or accomplishment""", "freq" : """19""" },
-    { "synset" : """05217168-n""", "def" : """alternative names for the body of a human being""", "freq" : """19""" },
-    { "synset" : """05671974-n""", "def" : """that which concerns a person with regard to a particular role or situation""", "freq" : """19""" },
-    { "synset" : """05682570-n""", "def" : """a state in which you want to learn more about something""", "freq" : """19""" },
-    { "synset" : """05799212-n""", "def" : """trying something to find out about it""", "freq" : """19""" },
-    { "synset" : """05837957-n""", "def" : """an opinion formed by judging something""", "freq" : """19""" },
-    { "synset" : """05890249-n""", "def" : """a hypothetical description of a complex entity or process""", "freq" : """19""" },
-    { "synset" : """05892651-n""", "def" : """required activity""", "freq" : """19""" },
-    { "synset" : """05941423-n""", "def" : """any cognitive content held as true""", "freq" : """19""" },
-    { "synset" : """05942888-n""", "def" : """an unshakable belief in something without need for proof or evidence""", "freq" : """19""" },
-    { "synset" : """06520944-n""", "def" : """a binding agreement between two or more persons that is enforceable by law""", "freq" : """19""" },
-    { "synset" : """07527352-n""", "def" : """the emotion of great happiness""", "freq" : """19""" },
-    { "synset" : """07906284-n""", "def" : """a liquor made from fermented mash of grain""", "freq" : """19""" },
-    { "synset" : """07965085-n""", "def" : """a group of persons associated by some common tie or occupation and regarded as an entity""", "freq" : """19""" },
-    { "synset" : """08213978-n""", "def" : """army unit smaller than a division, typically consisting of a small number of battalions""", "freq" : """19""" },
-    { "synset" : """08401248-n""", "def" : """a division of some larger or more complex organization""", "freq" : """19""" },
-    { "synset" : """08625462-n""", "def" : """location near or direction toward the left side""", "freq" : """19""" },
-    { "synset" : """08625462-n""", "def" : """i.e. the side to the north when a person or object faces east""", "freq" : """19""" },
-    { "synset" : """08682575-n""", "def" : """the countries of (originally) Europe and (now including) North America and South America""", "freq" : """19""" },
-    { "synset" : """09143786-n""", "def" : """a large commercial and industrial city in northeastern Texas located in the heart of the northern Texas oil fields""", "freq" : """19""" },
-    { "synset" : """09385911-n""", "def" : """a portion of a natural object""", "freq" : """19""" },
-    { "synset" : """09604451-n""", "def" : """a fictitious detective in stories by A. Conan Doyle""", "freq" : """19""" },
-    { "synset" : """10165957-n""", "def" : """an official appointed by a government agency to conduct an investigation or administrative hearing so that the agency can exercise its statutory powers""", "freq" : """19""" },
-    { "synset" : """10231515-n""", "def" : """a male sovereign""", "freq" : """19""" },
-    { "synset" : """10231515-n""", "def" : """ruler of a kingdom""", "freq" : """19""" },
-    { "synset" : """10325013-n""", "def" : """a man distinguished by exceptional courage and nobility and strength""", "freq" : """19""" },
-    { "synset" : """10480730-n""", "def" : """someone who is a member of the faculty at a college or university""", "freq" : """19""" },
-    { "synset" : """10508710-n""", "def" : """a person who enjoys reading""", "freq" : """19""" },
-    { "synset" : """10601451-n""", "def" : """term of address for a man""", "freq" : """19""" },
-    { "synset" : """10628222-n""", "def" : """an American who lives in the South""", "freq" : """19""" },
-    { "synset" : """10631941-n""", "def" : """an expert who is devoted to one occupation or branch of learning""", "freq" : """19""" },
-    { "synset" : """11466043-n""", "def" : """a form of energy that is transferred by a difference in temperature""", "freq" : """19""" },
-    { "synset" : """12390485-n""", "def" : """large-flowered garden plant derived chiefly from the wild pansy of Europe and having velvety petals of various colors ❲Viola tricolor hortensis❳""", "freq" : """19""" },
-    { "synset" : """13356112-n""", "def" : """assets in the form of money""", "freq" : """19""" },
-    { "synset" : """13398953-n""", "def" : """the temporary provision of money (usually at interest)""", "freq" : """19""" },
-    { "synset" : """13624190-n""", "def" : """a metric unit of capacity, formerly defined as the volume of one kilogram of pure water under standard conditions""", "freq" : """19""" },
-    { "synset" : """13624190-n""", "def" : """now equal to 1,000 cubic centimeters (or approximately 1.75 pints)""", "freq" : """19""" },
-    { "synset" : """13744044-n""", "def" : """the cardinal number that is the sum of one and one and one""", "freq" : """19""" },
-    { "synset" : """14460565-n""", "def" : """an undivided or unbroken completeness or totality with nothing wanting""", "freq" : """19""" },
-    { "synset" : """14619225-n""", "def" : """the smallest component of an element having the chemical properties of the element""", "freq" : """19""" },
-    { "synset" : """14798039-n""", "def" : """a colorless nonflammable liquid used as a solvent for fats and oils""", "freq" : """19""" },
-    { "synset" : """14798039-n""", "def" : """because of its toxicity its use as a cleaning fluid or fire extinguisher has declined""", "freq" : """19""" },
-    { "synset" : """14856893-n""", "def" : """waste matter carried away in sewers or drains""", "freq" : """19""" },
-    { "synset" : """14857021-n""", "def" : """water mixed with waste matter""", "freq" : """19""" },
-    { "synset" : """15073973-n""", "def" : """anterior pituitary hormone that stimulates the function of the thyroid gland""", "freq" : """19""" },
-    { "synset" : """15153787-n""", "def" : """a late time of life""", "freq" : """19""" },
-    { "synset" : """00431004-a""", "def" : """not clearly understood or expressed""", "freq" : """18""" },
-    { "synset" : """00741867-a""", "def" : """being changed over time so as to be e.g. stronger or more complete or more useful""", "freq" : """18""" },
-    { "synset" : """00976508-a""", "def" : """acting or moving or capable of acting or moving quickly""", "freq" : """18""" },
-    { "synset" : """01050890-a""", "def" : """deserving or inciting pity""", "freq" : """18""" },
-    { "synset" : """01152746-a""", "def" : """yielding readily to pressure or weight""", "freq" : """18""" },
-    { "synset" : """01552419-a""", "def" : """amounting to a large indefinite number""", "freq" : """18""" },
-    { "synset" : """01578312-a""", "def" : """furthest or highest in degree or order""", "freq" : """18""" },
-    { "synset" : """01578312-a""", "def" : """utmost or extreme""", "freq" : """18""" },
-    { "synset" : """01677433-a""", "def" : """remarkable or out of the ordinary in degree or magnitude or effect""", "freq" : """18""" },
-    { "synset" : """01825671-a""", "def" : """having great power or force or potency or effect""", "freq" : """18""" },
-    { "synset" : """01905653-a""", "def" : """free of extraneous elements of any kind""", "freq" : """18""" },
-    { "synset" : """01919428-a""", "def" : """marked by absence of sound""", "freq" : """18""" },
-    { "synset" : """02050452-a""", "def" : """living in or characteristic of farming or country life""", "freq" : """18""" },
-    { "synset" : """02161432-a""", "def" : """important in effect or meaning""", "freq" : """18""" },
-    { "synset" : """02188108-a""", "def" : """being one more than seventeen""", "freq" : """18""" },
-    { "synset" : """02551380-a""", "def" : """free from liquid or moisture""", "freq" : """18""" },
-    { "synset" : """02551380-a""", "def" : """lacking natural or normal moisture or depleted of water""", "freq" : """18""" },
-    { "synset" : """02551380-a""", "def" : """or no longer wet""", "freq" : """18""" },
-    { "synset" : """02599939-a""", "def" : """associated with academia or an academy""", "freq" : """18""" },
-    { "synset" : """02874876-a""", "def" : """relating to or marked by communism""", "freq" : """18""" },
-    { "synset" : """02991122-a""", "def" : """relating to or characteristic of art or artists""", "freq" : """18""" },
-    { "synset" : """03016202-a""", "def" : """of or relating to or characteristic of Greece or the Greeks or the Greek language""", "freq" : """18""" },
-    { "synset" : """00007884-r""", "def" : """partially or to the extent of a half""", "freq" : """18""" },
-    { "synset" : """00053274-r""", "def" : """in a swift manner""", "freq" : """18""" },
-    { "synset" : """00060939-r""", "def" : """earlier in time""", "freq" : """18""" },
-    { "synset" : """00060939-r""", "def" : """previously""", "freq" : """18""" },
-    { "synset" : """00070166-r""", "def" : """with low volume""", "freq" : """18""" },
-    { "synset" : """00116994-r""", "def" : """assembled in one place""", "freq" : """18""" },
-    { "synset" : """00137915-r""", "def" : """in the order given""", "freq" : """18""" },
-    { "synset" : """00144722-r""", "def" : """definitely or positively""", "freq" : """18""" },
-    { "synset" : """00155488-r""", "def" : """at some eventual time in the future""", "freq" : """18""" },
-    { "synset" : """00177289-r""", "def" : """with strength or in a strong manner""", "freq" : """18""" },
-    { "synset" : """00181075-r""", "def" : """separated or at a distance in place or position or time""", "freq" : """18""" },
-    { "synset" : """00010435-v""", "def" : """behave in a certain manner""", "freq" : """18""" },
-    { "synset" : """00010435-v""", "def" : """show a certain behavior""", "freq" : """18""" },
-    { "synset" : """00010435-v""", "def" : """conduct or comport oneself""", "freq" : """18""" },
-    { "synset" : """00029025-v""", "def" : """to draw back the lips and reveal the teeth, in a smile, grimace, or snarl""", "freq" : """18""" },
-    { "synset" : """00050652-v""", "def" : """put clothing on one's body""", "freq" : """18""" },
-    { "synset" : """00183879-v""", "def" : """add as part of something else""", "freq" : """18""" },
-    { "synset" : """00183879-v""", "def" : """put in as part of a set, group, or category""", "freq" : """18""" },
-    { "synset" : """00429060-v""", "def" : """cut down on""", "freq" : """18""" },
-    { "synset" : """00429060-v""", "def" : """make a reduction in""", "freq" : """18""" },
-    { "synset" : """00630380-v""", "def" : """reflect deeply on a subject""", "freq" : """18""" },
-    { "synset" : """00641672-v""", "def" : """combine by multiplication""", "freq" : """18""" },
-    { "synset" : """00665886-v""", "def" : """establish or strengthen as with new evidence or facts""", "freq" : """18""" },
-    { "synset" : """00681429-v""", "def" : """evaluate or estimate the nature, quality, ability, extent, or significance of""", "freq" : """18""" },
-    { "synset" : """00699815-v""", "def" : """fix conclusively or authoritatively""", "freq" : """18""" },
-    { "synset" : """00732224-v""", "def" : """dedicate""", "freq" : """18""" },
-    { "synset" : """00864159-v""", "def" : """express strong disapproval of""", "freq" : """18""" },
-    { "synset" : """00913065-v""", "def" : """utter a sudden loud cry""", "freq" : """18""" },
-    { "synset" : """00913065-v""", "def" : """utter a sudden loud cry""", "freq" : """18""" },
-    { "synset" : """01101913-v""", "def" : """come out better in a competition, race, or conflict""", "freq" : """18""" },
-    { "synset" : """01111816-v""", "def" : """gain points in a game""", "freq" : """18""" },
-    { "synset" : """01295275-v""", "def" : """cause to become joined or linked""", "freq" : """18""" },
-    { "synset" : """01400044-v""", "def" : """deal a blow to, either with the hand or with an instrument""", "freq" : """18""" },
-    { "synset" : """01410223-v""", "def" : """deliver a sharp blow, as with the hand, fist, or weapon""", "freq" : """18""" },
-    { "synset" : """01431230-v""", "def" : """touch with the lips or press the lips (against someone's mouth or other body part) as an expression of love, greeting, etc.""", "freq" : """18""" },
-    { "synset" : """01629403-v""", "def" : """cause to happen or be responsible for""", "freq" : """18""" },
-    { "synset" : """01637982-v""", "def" : """make a discovery, make a new finding""", "freq" : """18""" },
-    { "synset" : """01870275-v""", "def" : """move obliquely or sideways, usually in an uncontrolled manner""", "freq" : """18""" },
-    { "synset" : """01881180-v""", "def" : """move about aimlessly or without any destination, often in search of food or employment""", "freq" : """18""" },
-    { "synset" : """01915365-v""", "def" : """make a passage or journey from one place to another""", "freq" : """18""" },
-    { "synset" : """02078591-v""", "def" : """bring in a new person or object into a familiar environment""", "freq" : """18""" },
-    { "synset" : """02110220-v""", "def" : """go or live through""", "freq" : """18""" },
-    { "synset" : """02154312-v""", "def" : """catch sight of""", "freq" : """18""" },
-    { "synset" : """02379753-v""", "def" : """go into retirement""", "freq" : """18""" },
-    { "synset" : """02379753-v""", "def" : """stop performing one's work or withdraw from one's position""", "freq" : """18""" },
-    { "synset" : """02426395-v""", "def" : """cease to operate or cause to cease operating""", "freq" : """18""" },
-    { "synset" : """02463510-v""", "def" : """refrain from doing something""", "freq" : """18""" },
-    { "synset" : """02507464-v""", "def" : """take the trouble to do something""", "freq" : """18""" },
-    { "synset" : """02507464-v""", "def" : """concern oneself""", "freq" : """18""" },
-    { "synset" : """02526085-v""", "def" : """to gain with effort""", "freq" : """18""" },
-    { "synset" : """02542280-v""", "def" : """act in accordance with someone's rules, commands, or wishes""", "freq" : """18""" },
-    { "synset" : """02594674-v""", "def" : """satisfy or fulfill""", "freq" : """18""" },
-    { "synset" : """02621853-v""", "def" : """act as a barrier between""", "freq" : """18""" },
-    { "synset" : """02621853-v""", "def" : """stand between""", "freq" : """18""" },
-    { "synset" : """02623906-v""", "def" : """develop into a distinctive entity""", "freq" : """18""" },
-    { "synset" : """02667900-v""", "def" : """satisfy a condition or restriction""", "freq" : """18""" },
-    { "synset" : """02676054-v""", "def" : """be relevant to""", "freq" : """18""" },
-    { "synset" : """02687916-v""", "def" : """span an interval of distance, space or time""", "freq" : """18""" },
-    { "synset" : """02702120-v""", "def" : """hold one's ground""", "freq" : """18""" },
-    { "synset" : """02702120-v""", "def" : """maintain a position""", "freq" : """18""" },
-    { "synset" : """02702120-v""", "def" : """be steadfast or upright""", "freq" : """18""" },
-    { "synset" : """00023773-n""", "def" : """the psychological feature that arouses an organism to action toward a desired goal""", "freq" : """18""" },
-    { "synset" : """00023773-n""", "def" : """the reason for the action""", "freq" : """18""" },
-    { "synset" : """00023773-n""", "def" : """that which gives purpose and direction to behavior""", "freq" : """18""" },
-    { "synset" : """00066636-n""", "def" : """an act that fails""", "freq" : """18""" },
-    { "synset" : """00189565-n""", "def" : """a score in baseball made by a runner touching all four bases safely""", "freq" : """18""" },
-    { "synset" : """00520257-n""", "def" : """the act of publicly exhibiting or entertaining""", "freq" : """18""" },
-    { "synset" : """00602220-n""", "def" : """the position of the head of the Department of the Interior""", "freq" : """18""" },
-    { "synset" : """00623862-n""", "def" : """an effort that is inconvenient""", "freq" : """18""" },
-    { "synset" : """00766234-n""", "def" : """an act punishable by law""", "freq" : """18""" },
-    { "synset" : """00766234-n""", "def" : """usually considered an evil act""", "freq" : """18""" },
-    { "synset" : """00795720-n""", "def" : """any piece of work that is undertaken or attempted""", "freq" : """18""" },
-    { "synset" : """00817680-n""", "def" : """the activity of protecting someone or something""", "freq" : """18""" },
-    { "synset" : """00986938-n""", "def" : """the act of firing weapons or artillery at an enemy""", "freq" : """18""" },
-    { "synset" : """01117541-n""", "def" : """the general activity of selling""", "freq" : """18""" },
-    { "synset" : """01170962-n""", "def" : """the act of fighting""", "freq" : """18""" },
-    { "synset" : """01170962-n""", "def" : """any contest or struggle""", "freq" : """18""" },
-    { "synset" : """01320872-n""", "def" : """an animal that produces gametes (ova) that can be fertilized by male gametes (spermatozoa)""", "freq" : """18""" },
-    { "synset" : """01743086-n""", "def" : """large arboreal boa of tropical South America ❲Eunectes murinus❳""", "freq" : """18""" },
-    { "synset" : """02121620-n""", "def" : """feline mammal usually having thick soft fur and no ability to roar: domestic cats""", "freq" : """18""" },
-    { "synset" : """02121620-n""", "def" : """wildcats""", "freq" : """18""" },
-    { "synset" : """02800497-n""", "def" : """the lowermost portion of a structure partly or wholly below ground level""", "freq" : """18""" },
-    { "synset" : """02800497-n""", "def" : """often used for storage""", "freq" : """18""" },
-    { "synset" : """02942699-n""", "def" : """equipment for taking photographs (usually consisting of a lightproof box with a lens at one end and light-sensitive film at the other)""", "freq" : """18""" },
-    { "synset" : """03316406-n""", "def" : """a plant consisting of one or more buildings with facilities for manufacturing""", "freq" : """18""" },
-    { "synset" : """03427296-n""", "def" : """a movable barrier in a fence or wall""", "freq" : """18""" },
-    { "synset" : """04401088-n""", "def" : """electronic equipment that converts sound into electrical signals that can be transmitted over distances and then converts received signals back into sounds""", "freq" : """18""" },
-    { "synset" : """04509592-n""", "def" : """clothing of distinctive design worn by members of a particular group as a means of identification""", "freq" : """18""" },
-    { "synset" : """04733118-n""", "def" : """a characteristic to be considered""", "freq" : """18""" },
-    { "synset" : """05149325-n""", "def" : """what something is used for""", "freq" : """18""" },
-    { "synset" : """05196582-n""", "def" : """the power or right to give orders or make decisions""", "freq" : """18""" },
-    { "synset" : """05499379-n""", "def" : """a basal part of the diencephalon governing autonomic nervous system""", "freq" : """18""" },
-    { "synset" : """05551318-n""", "def" : """either the left or right half of a body""", "freq" : """18""" },
-    { "synset" : """05601758-n""", "def" : """the characteristic parts of a person's face: eyes and nose and mouth and chin""", "freq" : """18""" },
-    { "synset" : """05685538-n""", "def" : """something that baffles understanding and cannot be explained""", "freq" : """18""" },
-    { "synset" : """05707269-n""", "def" : """a deliberate act of omission""", "freq" : """18""" },
-    { "synset" : """05737153-n""", "def" : """a number or letter indicating quality (especially of a student's performance)""", "freq" : """18""" },
-    { "synset" : """05849789-n""", "def" : """a prominent attribute or aspect of something""", "freq" : """18""" },
-    { "synset" : """05888929-n""", "def" : """a tentative insight into the natural world""", "freq" : """18""" },
-    { "synset" : """05888929-n""", "def" : """a concept that is not yet verified but that if true would explain certain facts or phenomena""", "freq" : """18""" },
-    { "synset" : """05946687-n""", "def" : """a strong belief in a supernatural power or powers that control human destiny""", "freq" : """18""" },
-    { "synset" : """05996646-n""", "def" : """a branch of knowledge""", "freq" : """18""" },
-    { "synset" : """06208751-n""", "def" : """a way of regarding situations or topics etc.""", "freq" : """18""" },
-    { "synset" : """06646243-n""", "def" : """a perceptible indication of something not immediately apparent (as a visible clue that something has happened)""", "freq" : """18""" },
-    { "synset" : """06671484-n""", "def" : """a proposal for an appropriate course of action""", "freq" : """18""" },
-    { "synset" : """06738162-n""", "def" : """a brief statement""", "freq" : """18""" },
-    { "synset" : """06806469-n""", "def" : """an arbitrary sign (written or printed) that has acquired a conventional significance""", "freq" : """18""" },
-    { "synset" : """06880249-n""", "def" : """expression without words""", "freq" : """18""" },
-    { "synset" : """06947032-n""", "def" : """an Indo-European language belonging to the West Germanic branch""", "freq" : """18""" },
-    { "synset" : """06947032-n""", "def" : """the official language of Britain and the United States and most of the commonwealth countries""", "freq" : """18""" },
-    { "synset" : """07015510-n""", "def" : """light and humorous drama with a happy ending""", "freq" : """18""" },
-    { "synset" : """07290905-n""", "def" : """the event consisting of the start of something""", "freq" : """18""" },
-    { "synset" : """07308889-n""", "def" : """an occurrence of something""", "freq" : """18""" },
-    { "synset" : """07326557-n""", "def" : """events that provide the generative force that is the origin of something""", "freq" : """18""" },
-    { "synset" : """07405893-n""", "def" : """the motion characteristic of fluids (liquids or gases)""", "freq" : """18""" },
-    { "synset" : """07511733-n""", "def" : """a specific instance of feeling hopeful""", "freq" : """18""" },
-    { "synset" : """07546465-n""", "def" : """the emotion of intense dislike""", "freq" : """18""" },
-    { "synset" : """07546465-n""", "def" : """a feeling of dislike so strong that it demands action""", "freq" : """18""" },
-    { "synset" : """07886849-n""", "def" : """a general name for alcoholic beverages made by fermenting a cereal (or mixture of cereals) flavored with hops""", "freq" : """18""" },
-    { "synset" : """07963711-n""", "def" : """a collection of things that have been combined""", "freq" : """18""" },
-    { "synset" : """07963711-n""", "def" : """an assemblage of separate parts or qualities""", "freq" : """18""" },
-    { "synset" : """07985223-n""", "def" : """a set of two similar things considered as a unit""", "freq" : """18""" },
-    { "synset" : """08355791-n""", "def" : """the executive and legislative and judicial branches of the federal government of the United States""", "freq" : """18""" },
-    { "synset" : """08403225-n""", "def" : """an organization of missionaries in a foreign land sent to carry on religious work""", "freq" : """18""" },
-    { "synset" : """08429052-n""", "def" : """a line of units following one after another""", "freq" : """18""" },
-    { "synset" : """08556386-n""", "def" : """a distant region""", "freq" : """18""" },
-    { "synset" : """08622586-n""", "def" : """a point occupied by troops for tactical reasons""", "freq" : """18""" },
-    { "synset" : """08645963-n""", "def" : """the place where some action occurs""", "freq" : """18""" },
-    { "synset" : """08681777-n""", "def" : """a general direction in which something tends to move""", "freq" : """18""" },
-    { "synset" : """09335240-n""", "def" : """material in the top layer of the surface of the earth in which plants can grow (especially with reference to its quality or use)""", "freq" : """18""" },
-    { "synset" : """09367203-n""", "def" : """anything indispensable""", "freq" : """18""" },
-    { "synset" : """09386422-n""", "def" : """a body having finite mass and internal structure but negligible dimensions""", "freq" : """18""" },
-    { "synset" : """09433442-n""", "def" : """the land along the edge of a body of water""", "freq" : """18""" },
-    { "synset" : """09935990-n""", "def" : """a person who is member of one's class or profession""", "freq" : """18""" },
-    { "synset" : """10014939-n""", "def" : """someone who controls resources and expenditures""", "freq" : """18""" },
-    { "synset" : """10609325-n""", "def" : """a person who is owned by someone""", "freq" : """18""" },
-    { "synset" : """10657969-n""", "def" : """someone who holds shares of stock in a corporation""", "freq" : """18""" },
-    { "synset" : """11410625-n""", "def" : """a phenomenon that follows and is caused by some previous phenomenon""", "freq" : """18""" },
-    { "synset" : """11420831-n""", "def" : """an ordered array of the components of an emission or wave""", "freq" : """18""" },
-    { "synset" : """13381734-n""", "def" : """a written order directing a bank to pay money""", "freq" : """18""" },
-    { "synset" : """13741022-n""", "def" : """one of the elements that collectively form a system of numeration""", "freq" : """18""" },
-    { "synset" : """13761407-n""", "def" : """a small piece or quantity of something""", "freq" : """18""" },
-    { "synset" : """13775093-n""", "def" : """a large indefinite quantity""", "freq" : """18""" },
-    { "synset" : """13871134-n""", "def" : """a straight line or plane that touches a curve or curved surface at a point but does not intersect it at that point""", "freq" : """18""" },
-    { "synset" : """13925752-n""", "def" : """a condition or position in which you find yourself""", "freq" : """18""" },
-    { "synset" : """13939892-n""", "def" : """a specific identifiable position in a continuum or series or especially in a process""", "freq" : """18""" },
-    { "synset" : """14006945-n""", "def" : """the state of being active""", "freq" : """18""" },
-    { "synset" : """14235200-n""", "def" : """an abnormal new mass of tissue that serves no purpose""", "freq" : """18""" },
-    { "synset" : """14434866-n""", "def" : """special importance or significance""", "freq" : """18""" },
-    { "synset" : """14481929-n""", "def" : """capability of existing or happening or being true""", "freq" : """18""" },
-    { "synset" : """14524849-n""", "def" : """a particular environment or surrounding influence""", "freq" : """18""" },
-    { "synset" : """14540765-n""", "def" : """the condition of being susceptible to harm or injury""", "freq" : """18""" },
-    { "synset" : """15101854-n""", "def" : """a stout length of sawn timber""", "freq" : """18""" },
-    { "synset" : """15101854-n""", "def" : """made in a wide variety of sizes and used for many purposes""", "freq" : """18""" },
-    { "synset" : """15140744-n""", "def" : """the period between birth and the present time""", "freq" : """18""" },
-    { "synset" : """15164463-n""", "def" : """the sixth day of the week""", "freq" : """18""" },
-    { "synset" : """15164463-n""", "def" : """the fifth working day""", "freq" : """18""" },
-    { "synset" : """15204297-n""", "def" : """a period of time occupying a regular part of a calendar year that is used for some particular activity""", "freq" : """18""" },
-    { "synset" : """15212739-n""", "def" : """the month following August and preceding October""", "freq" : """18""" },
-    { "synset" : """15278132-n""", "def" : """the rate of flow of energy or particles across a given surface""", "freq" : """18""" },
-    { "synset" : """00051045-a""", "def" : """having the requisite qualities or resources to meet a task""", "freq" : """17""" },
-    { "synset" : """00113818-a""", "def" : """feeling or showing anger""", "freq" : """17""" },
-    { "synset" : """00198147-a""", "def" : """relating to or located in the front""", "freq" : """17""" },
-    { "synset" : """00355611-a""", "def" : """unchanged in character or nature""", "freq" : """17""" },
-    { "synset" : """00417413-a""", "def" : """free from dirt or impurities""", "freq" : """17""" },
-    { "synset" : """00417413-a""", "def" : """or having clean habits""", "freq" : """17""" },
-    { "synset" : """00476819-a""", "def" : """providing or experiencing physical well-being or relief""", "freq" : """17""" },
-    { "synset" : """00666058-a""", "def" : """occurring in or belonging to the present time""", "freq" : """17""" },
-    { "synset" : """01012503-a""", "def" : """preceding all others in time or being as first made or performed""", "freq" : """17""" },
-    { "synset" : """01385255-a""", "def" : """extraordinarily large in size or extent or amount or power or degree""", "freq" : """17""" },
-    { "synset" : """01481612-a""", "def" : """joined in matrimony""", "freq" : """17""" },
-    { "synset" : """01567862-a""", "def" : """limited to or in the interests of a particular nation""", "freq" : """17""" },
-    { "synset" : """01580306-a""", "def" : """absolutely necessary""", "freq" : """17""" },
-    { "synset" : """01580306-a""", "def" : """vitally necessary""", "freq" : """17""" },
-    { "synset" : """01652902-a""", "def" : """affording free passage or access""", "freq" : """17""" },
-    { "synset" : """01729819-a""", "def" : """(used especially of persons) of the immediate past""", "freq" : """17""" },
-    { "synset" : """01749320-a""", "def" : """being complete of its kind and without defect or blemish""", "freq" : """17""" },
-    { "synset" : """01959294-a""", "def" : """in accordance with fixed order or procedure or principle""", "freq" : """17""" },
-    { "synset" : """02021905-a""", "def" : """possessing material wealth""", "freq" : """17""" },
-    { "synset" : """02187793-a""", "def" : """being one more than fourteen""", "freq" : """17""" },
-    { "synset" : """02187903-a""", "def" : """being one more than fifteen""", "freq" : """17""" },
-    { "synset" : """02189306-a""", "def" : """being ten more than twenty""", "freq" : """17""" },
-    { "synset" : """02295298-a""", "def" : """reduced to the simplest and most significant form possible without loss of generality""", "freq" : """17""" },
-    { "synset" : """02343110-a""", "def" : """very good""", "freq" : """17""" },
-    { "synset" : """02343110-a""", "def" : """of the highest quality""", "freq" : """17""" },
-    { "synset" : """00005567-r""", "def" : """involuntarily""", "freq" : """17""" },
-    { "synset" : """00032803-r""", "def" : """incredibly""", "freq" : """17""" },
-    { "synset" : """00059171-r""", "def" : """to a very great degree or extent""", "freq" : """17""" },
-    { "synset" : """00108647-r""", "def" : """to this place (especially toward the speaker)""", "freq" : """17""" },
-    { "synset" : """00144722-r""", "def" : """definitely or positively""", "freq" : """17""" },
-    { "synset" : """00151149-r""", "def" : """emphasizes something to be considered""", "freq" : """17""" },
-    { "synset" : """00205052-r""", "def" : """precisely, exactly""", "freq" : """17""" },
-    { "synset" : """00392690-r""", "def" : """for more time""", "freq" : """17""" },
-    { "synset" : """00409709-r""", "def" : """near in time or place or relationship""", "freq" : """17""" },
-    { "synset" : """00495663-r""", "def" : """to a great degree""", "freq" : """17""" },
-    { "synset" : """00026385-v""", "def" : """become less tense, rest, or take one's ease""", "freq" : """17""" },
-    { "synset" : """00056930-v""", "def" : """cause to be born""", "freq" : """17""" },
-    { "synset" : """00065639-v""", "def" : """undergo (as of injuries and illnesses)""", "freq" : """17""" },
-    { "synset" : """00078760-v""", "def" : """provide treatment for""", "freq" : """17""" },
-    { "synset" : """00169806-v""", "def" : """make less severe or harsh or extreme""", "freq" : """17""" },
-    { "synset" : """00350104-v""", "def" : """take up or begin anew""", "freq" : """17""" },
-    { "synset" : """00522751-v""", "def" : """receive a specified treatment (abstract)""", "freq" : """17""" },
-    { "synset" : """00596644-v""", "def" : """have firsthand knowledge of states, situations, emotions, or sensations""", "freq" : """17""" },
-    { "synset" : """00598954-v""", "def" : """get to know or become aware of, usually accidentally""", "freq" : """17""" },
-    { "synset" : """00607405-v""", "def" : """be a student""", "freq" : """17""" },
-    { "synset" : """00607405-v""", "def" : """follow a course of study""", "freq" : """17""" },
-    { "synset" : """00607405-v""", "def" : """be enrolled at an institute of learning""", "freq" : """17""" },
-    { "synset" : """00623151-v""", "def" : """make sense of""", "freq" : """17""" },
-    { "synset" : """00623151-v""", "def" : """assign a meaning to""", "freq" : """17""" },
-    { "synset" : """00633443-v""", "def" : """to believe especially on uncertain or tentative grounds""", "freq" : """17""" },
-    { "synset" : """00644583-v""", "def" : """consider in detail and subject to an analysis in order to discover essential features or meaning""", "freq" : """17""" },
-    { "synset" : """00734054-v""", "def" : """take into consideration for exemplifying purposes""", "freq" : """17""" },
-    { "synset" : """00749205-v""", "def" : """command with authority""", "freq" : """17""" },
-    { "synset" : """00761713-v""", "def" : """discuss the terms of an arrangement""", "freq" : """17""" },
-    { "synset" : """00771632-v""", "def" : """cause to undertake a certain action""", "freq" : """17""" },
-    { "synset" : """00773432-v""", "def" : """have an argument about something""", "freq" : """17""" },
-    { "synset" : """00781000-v""", "def" : """continue talking""", "freq" : """17""" },
-    { "synset" : """00781000-v""", "def" : """go on""", "freq" : """17""" },
-    { "synset" : """00789138-v""", "def" : """investigate scientifically""", "freq" : """17""" },
-    { "synset" : """00797697-v""", "def" : """give an affirmative reply to""", "freq" : """17""" },
-    { "synset" : """00797697-v""", "def" : """respond favorably to""", "freq" : """17""" },
-    { "synset" : """00865387-v""", "def" : """utter obscenities or profanities""", "freq" : """17""" },
-    { "synset" : """00867409-v""", "def" : """challenge the accuracy, probity, or propriety of""", "freq" : """17""" },
-    { "synset" : """00892315-v""", "def" : """express gratitude or show appreciation to""", "freq" : """17""" },
-    { "synset" : """00896803-v""", "def" : """show to be reasonable or provide adequate ground for""", "freq" : """17""" },
-    { "synset" : """00913065-v""", "def" : """utter a sudden loud cry""", "freq" : """17""" },
-    { "synset" : """00929839-v""", "def" : """express or state indirectly""", "freq" : """17""" },
-    { "synset" : """00933821-v""", "def" : """make known to the public information that was previously known only to a few people or that was meant to be kept a secret""", "freq" : """17""" },
-    { "synset" : """01020005-v""", "def" : """make mention of""", "freq" : """17""" },
-    { "synset" : """01059564-v""", "def" : """refuse to acknowledge""", "freq" : """17""" },
-    { "synset" : """01061017-v""", "def" : """serve as a means for expressing something""", "freq" : """17""" },
-    { "synset" : """01099592-v""", "def" : """fail to win""", "freq" : """17""" },
-    { "synset" : """01301410-v""", "def" : """to close within bounds, limit or hold back from movement""", "freq" : """17""" },
-    { "synset" : """01346804-v""", "def" : """become open""", "freq" : """17""" },
-    { "synset" : """01392237-v""", "def" : """rub with a circular motion""", "freq" : """17""" },
-    { "synset" : """01638368-v""", "def" : """make or work out a plan for""", "freq" : """17""" },
-    { "synset" : """01638368-v""", "def" : """devise""", "freq" : """17""" },
-    { "synset" : """01642924-v""", "def" : """produce""", "freq" : """17""" },
-    { "synset" : """01646075-v""", "def" : """compel or make somebody or something to act in a certain way""", "freq" : """17""" },
-    { "synset" : """01646075-v""", "def" : """make""", "freq" : """17""" },
-    { "synset" : """01650425-v""", "def" : """urge or force (a person) to an action""", "freq" : """17""" },
-    { "synset" : """01650425-v""", "def" : """constrain or motivate""", "freq" : """17""" },
-    { "synset" : """01661243-v""", "def" : """construct, build, or erect""", "freq" : """17""" },
-    { "synset" : """01684899-v""", "def" : """make a painting""", "freq" : """17""" },
-    { "synset" : """01773130-v""", "def" : """maintain (a theory, thoughts, or feelings)""", "freq" : """17""" },
-    { "synset" : """01894649-v""", "def" : """move in a graceful and rhythmical way""", "freq" : """17""" },
-    { "synset" : """01995549-v""", "def" : """move ahead""", "freq" : """17""" },
-    { "synset" : """01995549-v""", "def" : """travel onward in time or space""", "freq" : """17""" },
-    { "synset" : """01999423-v""", "def" : """travel in front of""", "freq" : """17""" },
-    { "synset" : """01999423-v""", "def" : """go in advance of others""", "freq" : """17""" },
-    { "synset" : """02023107-v""", "def" : """come together""", "freq" : """17""" },
-    { "synset" : """02072849-v""", "def" : """for time to move forward""", "freq" : """17""" },
-    { "synset" : """02109190-v""", "def" : """undergo or be subjected to""", "freq" : """17""" },
-    { "synset" : """02128286-v""", "def" : """be a witness to""", "freq" : """17""" },
-    { "synset" : """02136271-v""", "def" : """to throw or bend back (from a surface)""", "freq" : """17""" },
-    { "synset" : """02255462-v""", "def" : """let have""", "freq" : """17""" },
-    { "synset" : """02400037-v""", "def" : """promote over another""", "freq" : """17""" },
-    { "synset" : """02427103-v""", "def" : """set up or found""", "freq" : """17""" },
-    { "synset" : """02447370-v""", "def" : """give the right to""", "freq" : """17""" },
-    { "synset" : """02471327-v""", "def" : """register formally as a participant or member""", "freq" : """17""" },
-    { "synset" : """02532595-v""", "def" : """to conduct a test or investigation""", "freq" : """17""" },
-    { "synset" : """02540347-v""", "def" : """become an adult""", "freq" : """17""" },
-    { "synset" : """02560164-v""", "def" : """ensure observance of laws and rules""", "freq" : """17""" },
-    { "synset" : """02586121-v""", "def" : """win approval or support for""", "freq" : """17""" },
-    { "synset" : """02593912-v""", "def" : """chance to be or do something, without intention or causation""", "freq" : """17""" },
-    { "synset" : """02608347-v""", "def" : """have a beginning, in a temporal, spatial, or evaluative sense""", "freq" : """17""" },
-    { "synset" : """02636132-v""", "def" : """have as a necessary feature""", "freq" : """17""" },
-    { "synset" : """02704818-v""", "def" : """have a certain weight""", "freq" : """17""" },
-    { "synset" : """02720354-v""", "def" : """come after in time, as a result""", "freq" : """17""" },
-    { "synset" : """02727462-v""", "def" : """continue in a place, position, or situation""", "freq" : """17""" },
-    { "synset" : """02730813-v""", "def" : """have or contain a certain wording or form""", "freq" : """17""" },
-    { "synset" : """00007846-n""", "def" : """a human being""", "freq" : """17""" },
-    { "synset" : """00007846-n""", "def" : """person, singular, assertive existential pronoun""", "freq" : """17""" },
-    { "synset" : """00007846-n""", "def" : """pronoun, person, singular; quantifier: assertive existential""", "freq" : """17""" },
-    { "synset" : """00019613-n""", "def" : """the real physical matter of which a person or thing consists""", "freq" : """17""" },
-    { "synset" : """00191142-n""", "def" : """the action of changing something""", "freq" : """17""" },
-    { "synset" : """00306426-n""", "def" : """the act of traveling from one place to another""", "freq" : """17""" },
-    { "synset" : """00949134-n""", "def" : """the act of bringing something to bear""", "freq" : """17""" },
-    { "synset" : """00949134-n""", "def" : """using it for a particular purpose""", "freq" : """17""" },
-    { "synset" : """00954311-n""", "def" : """military action or resources protecting a country against potential enemies""", "freq" : """17""" },
-    { "synset" : """00972621-n""", "def" : """an offensive against an enemy (using weapons)""", "freq" : """17""" },
-    { "synset" : """01077350-n""", "def" : """the act of preventing""", "freq" : """17""" },
-    { "synset" : """01129920-n""", "def" : """the social force that binds you to the courses of action demanded by that force""", "freq" : """17""" },
-    { "synset" : """03067912-n""", "def" : """a paste-up made by sticking together pieces of paper or photographs to form an artistic image""", "freq" : """17""" },
-    { "synset" : """03925226-n""", "def" : """a representation of a person or scene in the form of a print or transparent slide""", "freq" : """17""" },
-    { "synset" : """03925226-n""", "def" : """recorded by a camera on light-sensitive material""", "freq" : """17""" },
-    { "synset" : """03948459-n""", "def" : """a firearm that is held and fired with one hand""", "freq" : """17""" },
-]
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+NTU-MC top 3000 senses (first round of MFS synsets)
+Latest version can be found at https://github.com/letuananh/omwtk
+
+The list is stored in data/wn_ntumc_top3000.tsv (synset, freq, def) and is only read on first use.
+
+Usage:
+    from omwtk.wn_ntumc_top3000 import top3000_synsets, load_top3000
+    first_round = top3000_synsets()          # frozenset of synset IDs
+    top3000 = load_top3000()                 # columns: top3000.synsets, top3000.freqs, top3000.defs
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import os
+import csv
+from collections import namedtuple
+from functools import lru_cache
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+MY_DIR = os.path.dirname(os.path.realpath(__file__))
+TOP3000_PATH = os.path.join(MY_DIR, 'data', 'wn_ntumc_top3000.tsv')
+
+Top3000 = namedtuple('Top3000', ['synsets', 'freqs', 'defs'])
+
+
+# -------------------------------------------------------------------------------
+# Loaders
+# -------------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def load_top3000(path=TOP3000_PATH):
+    ''' Read the list as columns (tuples of synset IDs, frequencies and definitions, one item per row) '''
+    with open(path, encoding='utf-8', newline='') as infile:
+        reader = csv.reader(infile, dialect='excel-tab')
+        next(reader)  # header
+        synsets, freqs, defs = zip(*((sid, int(freq), sdef) for sid, freq, sdef in reader))
+    return Top3000(synsets, freqs, defs)
+
+
+@lru_cache(maxsize=None)
+def top3000_synsets(path=TOP3000_PATH):
+    ''' Distinct synset IDs of the list '''
+    return frozenset(load_top3000(path).synsets)
+
+
+def __getattr__(name):
+    ''' WN_NTUMC_TOP3000 is the list in its old form (one dict of synset, def and freq strings per row), loaded on first use '''
+    if name == 'WN_NTUMC_TOP3000':
+        top = load_top3000()
+        return [{"synset": sid, "def": sdef, "freq": str(freq)} for sid, freq, sdef in zip(top.synsets, top.freqs, top.defs)]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
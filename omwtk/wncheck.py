@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Rule-based validator for extracted definition TSV files (synset ID, ILI, definition)
+Latest version can be found at https://github.com/letuananh/omwtk
+
+The file is streamed line by line and every row is checked against a set of compiled rules.
+All violations are collected (the validator does not stop at the first one).
+Large files are split into byte ranges which are checked by worker processes.
+
+Usage:
+    python3 -m omwtk.wncheck data/wn31.csv -o data/wn31_violations.tsv
+    python3 -m omwtk.wncheck data/wn31.csv -r quote-balance empty-definition -p "html-tag=<[a-z]+>"
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import os
+import re
+import csv
+import logging
+import argparse
+from functools import partial
+from multiprocessing import Pool
+from collections import OrderedDict
+
+from chirptext.leutile import TextReport, Counter, Timer
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+# Rules are checked against the definition column, a row violates a rule when its pattern is found
+RULES = OrderedDict([
+    # odd number of double quotes
+    ('quote-balance', r'^[^"]*"(?:[^"]*"[^"]*")*[^"]*$'),
+    # a quoted definition which does not end with a quote, a bracket or a semicolon
+    ('quote-ending', r'^(?=.*").*[^");]$'),
+    ('trailing-punctuation', r'(?:\s|[,:]|[.;]{2,})$'),
+    ('empty-definition', r'^\s*$'),
+])
+MALFORMED = 'malformed-row'
+DUPLICATE = 'duplicate-id'
+CHUNK_SIZE = 16 * 1024 * 1024  # bytes
+
+
+def getLogger():
+    return logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------------
+# Data structures
+# -------------------------------------------------------------------------------
+
+class Violation(object):
+
+    def __init__(self, rule, line, sid, iid, sdef):
+        self.rule = rule
+        self.line = line
+        self.sid = sid
+        self.iid = iid
+        self.sdef = sdef
+
+    def to_row(self):
+        return (self.rule, self.line, self.sid, self.iid, self.sdef)
+
+    def __repr__(self):
+        return "{} at line {} ({} - {}) {}".format(self.rule, self.line, self.sid, self.iid, self.sdef)
+
+
+def compile_rules(names=None, patterns=None):
+    ''' Compile selected built-in rules (all by default) and extra rules (a list of name=regex) '''
+    rules = OrderedDict()
+    for name in (names if names else RULES.keys()):
+        if name in (MALFORMED, DUPLICATE):
+            continue
+        if name not in RULES:
+            raise Exception("Unknown rule: {}".format(name))
+        rules[name] = re.compile(RULES[name])
+    for pattern in (patterns if patterns else []):
+        name, _, regex = pattern.partition('=')
+        if not regex:
+            raise Exception("Invalid rule (name=regex is expected): {}".format(pattern))
+        rules[name] = re.compile(regex)
+    return rules
+
+
+# -------------------------------------------------------------------------------
+# Application logic
+# -------------------------------------------------------------------------------
+
+def chunk_ranges(path, chunk_size=CHUNK_SIZE):
+    ''' Split a file into byte ranges which start at the beginning of a line '''
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as infile:
+        start = 0
+        while start < size:
+            infile.seek(min(start + chunk_size, size))
+            infile.readline()
+            end = min(infile.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def iter_lines(path, start, end):
+    with open(path, 'rb') as infile:
+        infile.seek(start)
+        pos = start
+        while pos < end:
+            line = infile.readline()
+            if not line:
+                break
+            pos += len(line)
+            yield line.decode('utf-8')
+
+
+def split_row(line):
+    ''' Split one line into fields (a row never spans lines so that chunks can be checked independently)
+    Quoted fields (written by csv.writer) are decoded, None is returned when quotes cannot be parsed within the line '''
+    line = line.rstrip('\r\n')
+    if '"' not in line:
+        return line.split('\t')
+    try:
+        return next(csv.reader([line], dialect='excel-tab', strict=True))
+    except csv.Error:
+        return None
+
+
+def check_chunk(byte_range, path, rules):
+    ''' Check a byte range of a TSV file
+    Return (number of lines, violations with line numbers relative to the chunk, IDs with their first (line, ILI, definition)) '''
+    rules = [(name, re.compile(pattern)) for name, pattern in rules]
+    violations = []
+    ids = {}
+    lines = 0
+    for lines, line in enumerate(iter_lines(path, *byte_range), start=1):
+        row = split_row(line)
+        if row is None or len(row) != 3:
+            violations.append(Violation(MALFORMED, lines, line.split('\t', 1)[0], '', line.rstrip('\r\n')))
+            continue
+        sid, iid, sdef = row
+        if sid in ids:
+            violations.append(Violation(DUPLICATE, lines, sid, iid, sdef))
+        else:
+            ids[sid] = (lines, iid, sdef)
+        for name, rule in rules:
+            if rule.search(sdef):
+                violations.append(Violation(name, lines, sid, iid, sdef))
+    return lines, violations, ids
+
+
+def validate(path, rules=None, workers=1, chunk_size=CHUNK_SIZE, check_ids=True):
+    ''' Validate a definition TSV file, return a Counter (violations by rule) and a list of violations '''
+    rules = rules if rules is not None else compile_rules()
+    # patterns are sent to workers (compiled regex objects are compiled again there)
+    checker = partial(check_chunk, path=path, rules=[(name, rule.pattern) for name, rule in rules.items()])
+    ranges = chunk_ranges(path, chunk_size)
+    if workers > 1 and len(ranges) > 1:
+        with Pool(workers) as pool:
+            results = pool.map(checker, ranges)
+    else:
+        results = map(checker, ranges)
+    c = Counter()
+    violations = []
+    seen = {}
+    offset = 0
+    for lines, chunk_violations, ids in results:
+        if check_ids:
+            # duplicates across chunks
+            for sid, (line, iid, sdef) in ids.items():
+                if sid in seen:
+                    violations.append(Violation(DUPLICATE, line + offset, sid, iid, sdef))
+                else:
+                    seen[sid] = line + offset
+        for v in chunk_violations:
+            v.line += offset
+            if v.rule != DUPLICATE or check_ids:
+                violations.append(v)
+        offset += lines
+    violations.sort(key=lambda v: v.line)
+    for v in violations:
+        c.count(v.rule)
+    c["Rows"] = offset
+    return c, violations
+
+
+def report(c, violations, rp=None, output=None, limit=10):
+    ''' Summarise violations (a few examples for each rule) and write all of them to a TSV file '''
+    rp = rp if rp is not None else TextReport()
+    rp.header("Violations", level="h0")
+    c.summarise(report=rp)
+    by_rule = OrderedDict()
+    for v in violations:
+        by_rule.setdefault(v.rule, []).append(v)
+    for rule, items in by_rule.items():
+        rp.header("{} ({})".format(rule, len(items)))
+        for v in items[:limit]:
+            rp.print("Line {}: {} - {} | {}".format(v.line, v.sid, v.iid, v.sdef))
+        if len(items) > limit:
+            rp.print("... and {} more".format(len(items) - limit))
+    if output:
+        with open(output, 'w', encoding='utf-8', newline='') as outfile:
+            writer = csv.writer(outfile, dialect='excel-tab')
+            writer.writerow(('rule', 'line', 'synset', 'ili', 'definition'))
+            for v in violations:
+                writer.writerow(v.to_row())
+        rp.print("Written to {}".format(output))
+    return rp
+
+
+# -------------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate an extracted definition TSV file")
+    parser.add_argument('input', help='TSV file (synset ID, ILI, definition)')
+    parser.add_argument('-o', '--output', help='Write all violations to this TSV file')
+    parser.add_argument('-r', '--rules', nargs='*', help='Rules to check (default: all), available: {}'.format(', '.join(list(RULES.keys()) + [DUPLICATE])))
+    parser.add_argument('-p', '--patterns', nargs='*', help='Extra rules (name=regex)')
+    parser.add_argument('-w', '--workers', help='Number of worker processes', type=int, default=1)
+    args = parser.parse_args()
+    t = Timer()
+    t.start("Validating {}".format(args.input))
+    check_ids = not args.rules or DUPLICATE in args.rules
+    c, violations = validate(args.input, compile_rules(args.rules, args.patterns), workers=args.workers, check_ids=check_ids)
+    report(c, violations, output=args.output)
+    t.end()
+
+
+if __name__ == "__main__":
+    main()
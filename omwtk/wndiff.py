@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+'''
+Compare definitions of several wordnets (WN-LMF XML, OMW, GWN and PWN-3.0 SQLite) in one pass
+Latest version can be found at https://github.com/letuananh/omwtk
+
+All sources are aligned by PWN-3.0 synset ID (LMF synsets are mapped through the ILI map)
+and merged as sorted streams. For each synset a difference pattern is produced, e.g.
+    AAB-  => the 1st and 2nd sources agree, the 3rd one is different and the 4th one does not have this synset
+
+Usage:
+    python3 -m omwtk.wndiff omw gwn wn30 data/wn31.xml -o data/wn_diff.tsv
+
+@author: Le Tuan Anh <tuananh.ke@gmail.com>
+'''
+
+# Copyright (c) 2017, Le Tuan Anh <tuananh.ke@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+__author__ = "Le Tuan Anh"
+__email__ = "<tuananh.ke@gmail.com>"
+__copyright__ = "Copyright 2017, omwtk"
+__license__ = "MIT"
+__maintainer__ = "Le Tuan Anh"
+__version__ = "0.1"
+__status__ = "Prototype"
+__credits__ = []
+
+########################################################################
+
+import os
+import csv
+import heapq
+import logging
+import argparse
+from itertools import groupby
+from lxml import etree
+
+from chirptext.leutile import TextReport, Counter, Timer
+
+from omwtk.registry import get_omw, get_gwn, get_wn
+from omwtk.ilimap import get_ili_map, PWN30_TAB
+
+# -------------------------------------------------------------------------------
+# Configuration
+# -------------------------------------------------------------------------------
+
+MISSING = '-'
+
+
+def getLogger():
+    return logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------------
+# Sources
+# Each source yields (key, definition) sorted by key, where key is a canonical
+# PWN-3.0 synset ID (satellites use -a as in OMW)
+# -------------------------------------------------------------------------------
+
+def to_key(offset, pos):
+    return '{}-{}'.format(offset, 'a' if pos == 's' else pos)
+
+
+def normalize_def(a_def):
+    ''' Normalize a definition for comparing '''
+    if a_def is None:
+        return ''
+    a_def = ' '.join(a_def.split())
+    return a_def[:-1].strip() if a_def.endswith(';') else a_def
+
+
+def omw_source(lang='eng', db=None):
+    ''' OMW definitions (joined by "; ") '''
+    db = db if db is not None else get_omw()
+    with db.ctx() as ctx:
+        rows = ctx.execute('''SELECT substr(synset, 1, 8) AS offset, substr(synset, 10, 1) AS pos, def FROM synset_def
+        WHERE lang = ? ORDER BY offset, CASE pos WHEN 's' THEN 'a' ELSE pos END, rowid''', (lang,))
+        for key, defs in groupby(rows, key=lambda r: to_key(r[0], r[1])):
+            yield key, '; '.join(d[2] for d in defs)
+
+
+def gwn_source(db=None):
+    ''' Gloss WordNet definitions (gloss surfaces) '''
+    db = db if db is not None else get_gwn()
+    with db.ctx() as ctx:
+        rows = ctx.execute('''SELECT substr(sid, 2) AS offset, substr(sid, 1, 1) AS pos, surface FROM gloss
+        WHERE cat = 'def' ORDER BY offset, CASE pos WHEN 's' THEN 'a' ELSE pos END, id''')
+        for key, defs in groupby(rows, key=lambda r: to_key(r[0], r[1])):
+            yield key, '; '.join(d[2] for d in defs)
+
+
+def wn30_source(db=None):
+    ''' Princeton WordNet 3.0 (WNSQL) definitions '''
+    db = db if db is not None else get_wn()
+    with db.ctx() as ctx:
+        rows = ctx.execute('''SELECT synsetid % 100000000 AS offset, pos, definition FROM synsets
+        ORDER BY offset, CASE pos WHEN 's' THEN 'a' ELSE pos END''')
+        for offset, pos, definition in rows:
+            yield to_key('{:08d}'.format(offset), pos), definition
+
+
+def iter_lmf_elements(path, tags):
+    ''' Stream elements of a WN-LMF file by tag
+    Each element is cleared after it was processed and its preceding siblings are deleted so that memory usage stays flat '''
+    for event, element in etree.iterparse(path, events=('end',), tag=tags):
+        yield element
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def iter_lmf_synsets(path):
+    ''' Stream (id, ili, definition) of all synsets in a WN-LMF file '''
+    for element in iter_lmf_elements(path, 'Synset'):
+        definition = element.find('Definition')
+        yield element.get('id'), element.get('ili'), definition.text if definition is not None else None
+
+
+def lmf_source(path, ili_map):
+    ''' Definitions from a WN-LMF file, mapped to PWN-3.0 by ILI (sorted in memory as XML files are not ordered) '''
+    entries = []
+    for sid, ili, definition in iter_lmf_synsets(path):
+        key = ili_map.ili_to_pwn30(ili)
+        if key:
+            entries.append((key, definition))
+        else:
+            getLogger().debug("Synset {} ({}) cannot be mapped to PWN-3.0".format(sid, ili))
+    entries.sort(key=lambda x: x[0])
+    for key, defs in groupby(entries, key=lambda x: x[0]):
+        yield key, '; '.join(d[1] for d in defs if d[1])
+
+
+def _tag(stream, idx, name):
+    ''' Tag each entry of a source with its index and make sure that the source is sorted '''
+    prev = None
+    for key, definition in stream:
+        if prev is not None and key < prev:
+            raise ValueError("Source {} is not sorted ({} comes after {})".format(name, key, prev))
+        prev = key
+        yield key, idx, definition
+
+
+# -------------------------------------------------------------------------------
+# Diff engine
+# -------------------------------------------------------------------------------
+
+def diff_pattern(defs):
+    ''' Assign a letter to each distinct definition (MISSING for missing definitions) '''
+    classes = {}
+    pattern = []
+    for d in defs:
+        if d is None:
+            pattern.append(MISSING)
+        else:
+            norm = normalize_def(d)
+            if norm not in classes:
+                classes[norm] = chr(ord('A') + len(classes))
+            pattern.append(classes[norm])
+    return ''.join(pattern)
+
+
+def nway_diff(sources):
+    ''' Merge sorted sources (a list of (name, stream)) and yield (key, pattern, definitions) for each synset '''
+    streams = [_tag(stream, idx, name) for idx, (name, stream) in enumerate(sources)]
+    merged = heapq.merge(*streams, key=lambda x: x[0])
+    for key, entries in groupby(merged, key=lambda x: x[0]):
+        defs = [None] * len(sources)
+        for _, idx, definition in entries:
+            defs[idx] = definition
+        yield key, diff_pattern(defs), defs
+
+
+def make_source(name, ili_map_path=PWN30_TAB, lang='eng'):
+    if name == 'omw':
+        return omw_source(lang=lang)
+    elif name == 'gwn':
+        return gwn_source()
+    elif name == 'wn30':
+        return wn30_source()
+    elif os.path.isfile(name):
+        return lmf_source(name, get_ili_map(pwn30_tab=ili_map_path))
+    else:
+        raise Exception("Unknown source: {}".format(name))
+
+
+def wn_diff(source_names, output, ili_map_path=PWN30_TAB, lang='eng', all_rows=False):
+    c = Counter()
+    sources = [(name, make_source(name, ili_map_path, lang)) for name in source_names]
+    with open(output, 'w', encoding='utf-8') as outfile:
+        writer = csv.writer(outfile, dialect='excel-tab')
+        writer.writerow(['synset', 'pattern'] + source_names)
+        for key, pattern, defs in nway_diff(sources):
+            c.count(pattern)
+            # synsets which are identical in all sources are not written by default
+            if all_rows or len(set(pattern)) > 1:
+                writer.writerow([key, pattern] + [d if d is not None else '' for d in defs])
+    rp = TextReport()
+    rp.header("Sources: {}".format(', '.join(source_names)))
+    c.summarise(report=rp)
+    rp.print("Written to {}".format(output))
+
+
+# -------------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare definitions of several wordnets in one pass")
+    parser.add_argument('sources', nargs='+', help='omw, gwn, wn30 or path to a WN-LMF file')
+    parser.add_argument('-o', '--output', help='Output TSV file', default='data/wn_diff.tsv')
+    parser.add_argument('-i', '--ili', help='ILI to PWN-3.0 map', default=PWN30_TAB)
+    parser.add_argument('-l', '--lang', help='OMW language', default='eng')
+    parser.add_argument('-a', '--all', help='Write synsets with identical definitions too', action='store_true')
+    args = parser.parse_args()
+    t = Timer()
+    t.start("N-way wordnet diff")
+    wn_diff(args.sources, args.output, ili_map_path=args.ili, lang=args.lang, all_rows=args.all)
+    t.end()
+
+
+if __name__ == "__main__":
+    main()
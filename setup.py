@@ -84,6 +84,7 @@ setup(
     description='A collection of script to process data for Open Multilingual WordNet',
     long_description=long_description,
     packages=['omwtk'],
+    package_data={'omwtk': ['data/*.tsv']},
     include_package_data=True,
     platforms='any',
     test_suite='test',
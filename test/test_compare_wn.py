@@ -50,12 +50,19 @@ __credits__ = []
 ########################################################################
 
 import os
+import tempfile
 import unittest
 from chirptext import header, TextReport
 from omwtk.compare_wn import omw, gwn, wn30
 from omwtk.compare_wn import SCIENTIFIC_NAME, remove_sciname, has_sciname, TAGS
 from omwtk.compare_wn import read_diff_ssids, compare_synset, join_definitions
+from omwtk.compare_wn import bulk_compare, bulk_omw_synsets, shard_ssids, def_hash, CompareCache, GlossIndex
 from omwtk.compare_wn import get_omw_synsets, get_gwn_synsets, get_wn30_synsets
+from omwtk.compare_wn import SynsetIDSet
+from omwtk.wndiff import nway_diff, diff_pattern
+from omwtk.wncheck import validate, compile_rules, chunk_ranges
+from array import array
+from omwtk.neardup import find_near_dups, lsh_params, LSHIndex
 from yawlib import SynsetID
 
 # -------------------------------------------------------------------------------
@@ -90,6 +97,23 @@ class TestMainApp(unittest.TestCase):
         print("WN synsets: {}".format(len(wn_ssids)))
         print(wn_ssids[:5])
 
+    def test_ssid_set(self):
+        header("Test packed synset ID sets")
+        self.assertEqual(SynsetIDSet.pack('01850676-n'), 101850676)
+        self.assertEqual(SynsetIDSet.pack('v00445467'), 200445467)
+        self.assertEqual(SynsetIDSet.unpack(302386612), SynsetID.from_string('02386612-a'))
+        a = SynsetIDSet.from_ids(['01850676-n', '00445467-v', '01850676-n'])
+        b = SynsetIDSet.from_ids(['00445467-v', '02386612-a'])
+        self.assertEqual(len(a), 2)
+        self.assertIn('00445467-v', a)
+        self.assertNotIn('02386612-a', a)
+        self.assertEqual([str(x) for x in a & b], ['00445467-v'])
+        self.assertEqual([str(x) for x in a - b], ['01850676-n'])
+        self.assertEqual([str(x) for x in a | b], ['01850676-n', '00445467-v', '02386612-a'])
+        invalid = []
+        SynsetIDSet.from_ids(['01850676-n', 'xxx'], on_error=invalid.append)
+        self.assertEqual(invalid, ['xxx'])
+
     def test_remove_sciname(self):
         header("Test removing scientific name")
         d = 'triggerfishes ❲Balistidae❳'
@@ -158,6 +182,142 @@ class TestMainApp(unittest.TestCase):
             tags, odef, gdef = compare_synset(omw, gwn, ss, omw_ctx, gwn_ctx)
             self.assertEqual(tags, set())
 
+    def test_bulk_compare(self):
+        header("Bulk comparison must agree with compare_synset")
+        ssids = ['01850676-n', '00445467-v', '11937102-n', '02386612-a']
+        with omw.ctx() as omw_ctx, gwn.ctx() as gwn_ctx:
+            diffs = list(bulk_compare(ssids, omw_ctx, gwn_ctx, bulk_size=3))
+            self.assertEqual([d.sid for d in diffs], ssids)
+            for d in diffs:
+                tags, odef, gdef = compare_synset(omw, gwn, d.sid, omw_ctx, gwn_ctx)
+                self.assertEqual((d.tags, d.odef, d.gdef), (tags, odef, gdef))
+
+    def test_bulk_omw_synsets(self):
+        header("Bulk loaded OMW synsets must be the same as omw.get_synset()")
+        ssids = ['01850676-n', '00445467-v', '11937102-n', '02386612-a']
+        with omw.ctx() as ctx:
+            synsets, usrs = bulk_omw_synsets(ssids, ctx, lemmas=True)
+            self.assertEqual(list(synsets.keys()), ssids)
+            for sid, ss in synsets.items():
+                expected = omw.get_synset(sid, ctx=ctx)
+                self.assertEqual((ss.lemmas, ss.definitions), (expected.lemmas, expected.definitions))
+
+    def test_shard_ssids(self):
+        ssids = {'00445467-v', '01850676-n', '02386612-a', '11937102-n', '00001740-n'}
+        shards = shard_ssids(ssids, 2)
+        self.assertEqual(shards, [['02386612-a', '00001740-n', '01850676-n'], ['11937102-n', '00445467-v']])
+        self.assertEqual(shard_ssids(ssids, 1), [sum(shards, [])])
+        self.assertEqual(len(shard_ssids(ssids, 10)), 5)
+
+    def test_compare_cache(self):
+        header("Test comparison cache")
+        self.assertEqual(def_hash(['a', 'b']), def_hash(('a', 'b')))
+        self.assertNotEqual(def_hash(['a', 'b']), def_hash(['a b']))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CompareCache(os.path.join(tmpdir, 'cache.db'))
+            cache.store([('01850676-n', 'oh', 'gh', 'rep same sciname', 'odef', 'gdef', 'gdef;')])
+            rows = cache.lookup(['01850676-n', '00445467-v'])
+            self.assertEqual(set(rows.keys()), {'01850676-n'})
+            self.assertEqual(set(rows['01850676-n'].tags.split()), {TAGS.SAME, TAGS.SCINAME, TAGS.REP})
+            self.assertEqual(rows['01850676-n'].gsurface, 'gdef;')
+
+    def test_compare_cache_reuse(self):
+        header("Cached comparisons are reused until OMW definitions or GWN glosses change")
+        from puchikarui import Schema
+        from omwtk.bench import Fixture
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fx = Fixture('50', bench_dir=tmpdir).generate()
+            ssids = fx.sample(20)
+            cache = CompareCache(os.path.join(tmpdir, 'cache.db'))
+            omw_db, gwn_db = Schema(fx.path('omw')), Schema(fx.path('gwn'))
+
+            def run():
+                with omw_db.ctx() as omw_ctx, gwn_db.ctx() as gwn_ctx, cache.ctx() as cache_ctx:
+                    diffs = list(bulk_compare(ssids, omw_ctx, gwn_ctx, bulk_size=7, cache=cache, cache_ctx=cache_ctx))
+                cache.store([CompareCache.to_row(d) for d in diffs if not d.cached])
+                return diffs
+            first = run()
+            self.assertFalse(any(d.cached for d in first))
+            second = run()
+            self.assertTrue(all(d.cached for d in second))
+            self.assertEqual([(d.tags, d.odef, d.gdef) for d in second], [(d.tags, d.odef, d.gdef) for d in first])
+            # a changed gloss item (used to match gloss surfaces) and a changed OMW definition are compared again
+            gwn_sid = SynsetID.from_string(ssids[0]).to_gwnsql()
+            with gwn_db.ctx() as ctx:
+                ctx.execute('UPDATE glossitem SET text = text || ? WHERE id = (SELECT MIN(glossitem.id) FROM glossitem JOIN gloss ON glossitem.gid = gloss.id WHERE gloss.sid = ?)', ('x', gwn_sid))
+            with omw_db.ctx() as ctx:
+                ctx.execute("UPDATE synset_def SET def = def || '!' WHERE synset = ? AND lang = 'eng'", (ssids[1],))
+            third = run()
+            self.assertEqual([d.sid for d in third if not d.cached], ssids[:2])
+            self.assertEqual(third[1].odef, first[1].odef + '!')
+            self.assertTrue(all(d.cached for d in run()))
+
+    def test_nway_diff(self):
+        header("Test N-way wordnet diff")
+        self.assertEqual(diff_pattern(['a cat;', 'a  cat', None, 'a dog']), 'AA-B')
+        src1 = [('00001740-n', 'entity'), ('01850676-n', 'a duck')]
+        src2 = [('00001740-n', 'entity;'), ('00445467-v', 'to walk')]
+        src3 = [('01850676-n', 'a goose')]
+        diffs = list(nway_diff([('a', iter(src1)), ('b', iter(src2)), ('c', iter(src3))]))
+        self.assertEqual([(k, p) for k, p, _ in diffs], [('00001740-n', 'AA-'), ('00445467-v', '-A-'), ('01850676-n', 'A-B')])
+        self.assertEqual(diffs[2][2], ['a duck', None, 'a goose'])
+        unsorted = [('01850676-n', 'a duck'), ('00001740-n', 'entity')]
+        self.assertRaises(ValueError, list, nway_diff([('a', iter(unsorted))]))
+
+    def test_near_dups(self):
+        header("Near-duplicate definitions are clustered per language")
+        self.assertEqual(lsh_params(0.8, 128), (16, 8))
+        entries = [('eng', '11935627-n', 'a variety of aster (Symphyotrichum lateriflorum)'),
+                   ('eng', '11937102-n', 'a variety of asters (Symphyotrichum lateriflorum);'),
+                   ('eng', '09426788-n', 'a large body of salt water partially enclosed by land'),
+                   ('jpn', '09426788-n', '陸地に部分的に囲まれた大きな塩水の体'),
+                   ('jpn', '09428293-n', '陸地に部分的に囲まれた大きな塩水の体。')]
+        results = dict(find_near_dups(iter(entries), threshold=0.7))
+        self.assertEqual([[sid for sid, _ in c] for c in results['eng']], [['11935627-n', '11937102-n']])
+        self.assertEqual([[sid for sid, _ in c] for c in results['jpn']], [['09426788-n', '09428293-n']])
+
+    def test_lsh_bucket_head(self):
+        header("Near-duplicates are merged even when the first member of their bucket is different")
+        index = LSHIndex(threshold=0.5, num_perm=8)  # 4 bands of 2 rows
+        # all three share only the first band, the last two agree on 5 of 8 values
+        for sig in ([1, 1, 2, 2, 3, 3, 4, 4], [1, 1, 5, 6, 7, 8, 9, 10], [1, 1, 5, 0, 7, 0, 9, 0]):
+            index.add(array('Q', sig))
+        self.assertEqual(index.clusters(), [[1, 2]])
+
+    def test_wn_check(self):
+        header("All violations of a definition TSV file are collected")
+        rows = ['00001740-n\ti35545\tthat which is perceived',
+                '00001930-n\ti35546\ta "physical entity',
+                '00002137-n\ti35547\tan abstraction,',
+                '00001740-n\ti35548\t',
+                'malformed']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'wn31.csv')
+            with open(path, 'w') as outfile:
+                outfile.write('\n'.join(rows) + '\n')
+            # tiny chunks so that duplicated IDs are in different chunks
+            self.assertEqual(len(chunk_ranges(path, 16)), 5)
+            for chunk_size in (16, 1024):
+                c, violations = validate(path, chunk_size=chunk_size)
+                self.assertEqual([(v.rule, v.line) for v in violations],
+                                 [('quote-balance', 2), ('quote-ending', 2), ('trailing-punctuation', 3),
+                                  ('duplicate-id', 4), ('empty-definition', 4), ('malformed-row', 5)])
+                self.assertEqual(c['Rows'], 5)
+            # duplicates found across chunks are reported with the same row as in a single chunk
+            chunked = [v.to_row() for v in validate(path, chunk_size=16)[1]]
+            self.assertEqual(chunked, [v.to_row() for v in validate(path, chunk_size=1024)[1]])
+            self.assertIn(('duplicate-id', 4, '00001740-n', 'i35548', ''), chunked)
+            c, violations = validate(path, compile_rules(['empty-definition'], ['abstraction=^an abstraction']), check_ids=False)
+            self.assertEqual([(v.rule, v.line) for v in violations], [('abstraction', 3), ('empty-definition', 4), ('malformed-row', 5)])
+            # quoted fields are decoded, but a row never spans lines: chunked and serial scans report the same lines
+            with open(path, 'a') as outfile:
+                outfile.write('00003000-n\ti3\t"a ""quoted"" def"\n00004000-n\ti4\t"an open\nquote"\n00005000-n\ti5\tlast one\n')
+            expected = [('malformed-row', 5), ('malformed-row', 7), ('malformed-row', 8)]
+            for chunk_size in (16, 1024):
+                c, violations = validate(path, compile_rules(['quote-balance']), chunk_size=chunk_size, check_ids=False)
+                self.assertEqual([(v.rule, v.line) for v in violations], [('quote-balance', 2)] + expected)
+                self.assertEqual(c['Rows'], 9)
+
     def test_def_dup(self):
         header("Check if a definition is not unique")
         sid = '11937102-n'
@@ -169,6 +329,17 @@ class TestMainApp(unittest.TestCase):
         ssids = {str(SynsetID.from_string(g.sid)) for g in glosses}
         self.assertEqual(ssids, {'11935627-n', '11935715-n', '11935794-n', '11935877-n', '11935953-n', '11936027-n', '11936113-n', '11936199-n', '11936287-n', '11936369-n', '11936448-n', '11936539-n', '11936624-n', '11936707-n', '11936782-n', '11936864-n', '11936946-n', '11937023-n', '11937102-n', '11937195-n', '11937278-n', '11937360-n', '11937446-n'})
 
+    def test_gloss_index(self):
+        header("Shared glosses can be looked up from a gloss index")
+        with gwn.ctx() as ctx:
+            index = GlossIndex.build(ctx)
+        ssids = set(index.shared_by('a variety of aster;'))
+        self.assertEqual(len(ssids), 23)
+        self.assertIn('11937102-n', ssids)
+        self.assertTrue(index.is_shared('a variety of aster;'))
+        self.assertIn('11937102-n', index.dup_ssids())
+        self.assertFalse(index.shared_by('** no such gloss **'))
+
     def test_get_usr(self):
         header("Test get information")
         sid = '02386612-a'
@@ -50,9 +50,28 @@ __status__ = "Prototype"
 
 ########################################################################
 
+import os
+import json
+import yaml
+import shutil
 import logging
+import argparse
+import tempfile
 import unittest
+from collections import OrderedDict
+from puchikarui import Schema
 from chirptext import TextReport
+from omwtk import registry
+from omwtk.registry import LazyResource
+from omwtk.multireport import MultiReport
+from omwtk.bench import Fixture, SyntheticWordnet, parse_size, last_results
+from omwtk.ilimap import compile_index, ILIMap, get_ili_map, is_outdated
+from omwtk.patch import resolve_sensekeys, omw_definitions, typo_classes, scan_typos, TypoIndex
+from omwtk.patch import DefFix, apply_fixes, undo_fixes, iter_dup_defs, patch_fixes
+from omwtk.patch import DefPatch, iter_csv_patches, write_patches, PatchStore, iter_nttat_ssids, nttat_shard_paths, write_nttat_shards
+from omwtk.compare_wn import bulk_gwn_definitions
+from omwtk.wn_ntumc_top3000 import load_top3000, top3000_synsets
+from omwtk.extract import MFSRanking, MFSLedger, split_plan, extract_wn31, extract_omw, omw_export_paths
 from omwtk.prejp import romanize, gen_interlinear
 from omwtk.lex2pred import EWDB, parse_lemma, is_gold
 from omwtk.lex2pred import task_mine_mwe, mine_mwe, mine_mwe_nospace, mine_mwe_of, mine_mwe_extra, flag_mwe, mine_mwe_apos_s
@@ -64,6 +83,34 @@ def getLogger():
     return logging.getLogger(__name__)
 
 
+# -------------------------------------------------------------------------------
+# Shared fixture
+# -------------------------------------------------------------------------------
+
+FIXTURE_SIZE = '500'
+_fixture = None
+_fixture_dir = None
+
+
+def get_fixture():
+    ''' A synthetic fixture shared by all test cases of this module (generated on first use) '''
+    global _fixture, _fixture_dir
+    if _fixture is None:
+        _fixture_dir = tempfile.mkdtemp()
+        _fixture = Fixture(FIXTURE_SIZE, bench_dir=_fixture_dir).generate()
+    return _fixture
+
+
+def copy_db(fx, name, tmpdir):
+    ''' Copy a fixture database for tests which modify it '''
+    return shutil.copy(fx.path(name), os.path.join(tmpdir, os.path.basename(fx.path(name))))
+
+
+def tearDownModule():
+    if _fixture_dir is not None:
+        shutil.rmtree(_fixture_dir, ignore_errors=True)
+
+
 class TestOMWTK(unittest.TestCase):
 
     def test_null_args(self):
@@ -71,6 +118,392 @@ class TestOMWTK(unittest.TestCase):
         self.assertTrue(True)
 
 
+class TestRegistry(unittest.TestCase):
+
+    def test_lazy_resource(self):
+        created = []
+        registry.register('dummy', lambda: created.append(1) or TextReport.string())
+        dummy = LazyResource('dummy')
+        self.assertFalse(created)
+        self.assertFalse(registry.is_loaded('dummy'))
+        dummy.write("Hello")
+        self.assertEqual(registry.get('dummy').content(), "Hello")
+        self.assertEqual(len(created), 1)
+        self.assertIn('dummy', registry.timings())
+        with self.assertRaises(KeyError):
+            registry.get('no-such-resource')
+
+
+class TestMultiReport(unittest.TestCase):
+
+    def test_record(self):
+        with MultiReport(jsonl=MultiReport.JSONL, buffer_size=10) as mux:
+            mux.add_sink('report').add_sink('diff')
+            mux.record("[DIFF] 01850676-n", ["OMW: a", "GWN: b"], ('report', 'diff'), synset='01850676-n', tags=['diff'])
+            mux.write("Reason: test\n", 'diff')
+            mux.record("00445467-v", ["OMW: c"], ('report',))
+            expected = TextReport.string()
+            expected.header("[DIFF] 01850676-n")
+            expected.print("OMW: a")
+            expected.print("GWN: b")
+            self.assertEqual(mux.content('diff'), expected.content() + "Reason: test\n")
+            self.assertTrue(mux.content('report').startswith(expected.content()))
+            self.assertIn("00445467-v", mux.content('report'))
+            records = [json.loads(l) for l in mux.content(MultiReport.JSONL).splitlines()]
+            self.assertEqual(records, [{'synset': '01850676-n', 'tags': ['diff']}])
+
+
+class TestBench(unittest.TestCase):
+
+    def test_fixture(self):
+        self.assertEqual(parse_size('100k'), 100000)
+        self.assertEqual(parse_size('250'), 250)
+        self.assertEqual(list(SyntheticWordnet(50, seed=1).synsets()), list(SyntheticWordnet(50, seed=1).synsets()))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fx = Fixture('50', bench_dir=tmpdir).generate()
+            for name in ('omw', 'gwn', 'wn30', 'ewdb', 'ntumc'):
+                self.assertTrue(os.path.isfile(fx.path(name)))
+            with Schema(fx.path('omw')).ctx() as ctx:
+                self.assertEqual(ctx.select('SELECT COUNT(*) FROM synset')[0][0], 50)
+            with Schema(fx.path('gwn')).ctx() as ctx:
+                self.assertEqual(ctx.select("SELECT COUNT(*) FROM gloss WHERE cat='def'")[0][0], 50)
+            self.assertEqual(len(fx.sample(10)), 10)
+        results = [{'case': 'a', 'size': '1k', 'status': 'OK', 'best': 2},
+                   {'case': 'a', 'size': '1k', 'status': 'OK', 'best': 1},
+                   {'case': 'a', 'size': '1k', 'status': 'Error', 'best': None}]
+        self.assertEqual(last_results(results)[('a', '1k')]['best'], 1)
+
+
+class TestExtract(unittest.TestCase):
+
+    def test_mfs_ranking(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            omw_path = copy_db(get_fixture(), 'omw', tmpdir)
+            ranking = MFSRanking(os.path.join(tmpdir, 'rank.db'), omw_path=omw_path)
+            self.assertTrue(ranking.is_stale())
+            ranking.ensure()
+            self.assertFalse(ranking.is_stale())
+            with Schema(omw_path).ctx() as ctx:
+                for k in (10, 50, 1000):
+                    rows = ctx.execute('''SELECT sense.synset FROM sense LEFT JOIN synset_def
+                    ON sense.synset = synset_def.synset AND sense.lang = synset_def.lang
+                    WHERE sense.lang = 'eng' ORDER BY freq DESC, sense.rowid, synset_def.rowid LIMIT ?''', (k,))
+                    self.assertEqual(ranking.topk(k), set(r['synset'] for r in rows))
+                self.assertEqual(set(ranking.rank_range(0, 10)), ranking.topk(10))
+                # ranking must be rebuilt when OMW is modified
+                ctx.execute("UPDATE sense SET freq = 100000 WHERE rowid = (SELECT MAX(rowid) FROM sense WHERE lang='eng')")
+                top_sid = ctx.select("SELECT synset FROM sense WHERE freq = 100000")[0][0]
+            os.utime(omw_path, ns=(0, 0))
+            self.assertTrue(ranking.is_stale())
+            self.assertEqual(ranking.ensure().rank_range(0, 1), [top_sid])
+
+    def test_extract_wn31(self):
+        lmf = '''<LexicalResource><Lexicon id="wn31">
+        <LexicalEntry id="w1"><Lemma writtenForm="dog" partOfSpeech="n"/><Sense id="s1" synset="wn31-02086723-n"/></LexicalEntry>
+        <Synset id="wn31-02086723-n" ili="i46360"><Definition>a member of the genus Canis</Definition></Synset>
+        <Synset id="wn31-00001740-n" ili="i35545"><Definition>that which is perceived</Definition></Synset>
+        </Lexicon></LexicalResource>'''
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, f) for f in ('wn31.xml', 'wn31.csv', 'senses.csv')]
+            with open(paths[0], 'w') as outfile:
+                outfile.write(lmf)
+            extract_wn31(None, argparse.Namespace(input=paths[0], output=paths[1], senses=paths[2]))
+            with open(paths[1]) as infile:
+                self.assertEqual(infile.read().splitlines(), ['wn31-02086723-n\ti46360\ta member of the genus Canis',
+                                                             'wn31-00001740-n\ti35545\tthat which is perceived'])
+            with open(paths[2]) as infile:
+                self.assertEqual(infile.read().splitlines(), ['w1\tdog\tn\ts1\twn31-02086723-n'])
+
+    def test_extract_omw(self):
+        fx = get_fixture()
+        fx.register()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, 'omw')
+            extract_omw(None, argparse.Namespace(topk=None, output=output, langs=['eng', 'jpn'], workers=1))
+            self.assertEqual(omw_export_paths(output, 'eng', 'n'), (output + '_n.txt', output + '_n_lemma.txt'))
+            with Schema(fx.path('omw')).ctx() as ctx:
+                for lang in ('eng', 'jpn'):
+                    rows = ctx.execute('''SELECT lemma, sense.synset, def FROM sense
+                    JOIN word ON sense.wordid = word.wordid AND sense.lang = word.lang
+                    JOIN synset_def ON sense.synset = synset_def.synset AND sense.lang = synset_def.lang
+                    WHERE sense.lang = ? AND pos = 'n' ORDER BY freq DESC, sense.rowid, synset_def.rowid''', (lang,))
+                    expected = OrderedDict()
+                    for lemma, sid, sdef in rows:
+                        expected[(lemma, sid)] = expected[(lemma, sid)] + '; ' + sdef if (lemma, sid) in expected else sdef
+                    out_path, lemma_path = omw_export_paths(output, lang, 'n')
+                    with open(out_path) as infile:
+                        self.assertEqual(infile.read().splitlines(), ['\t'.join(k + (v,)) for k, v in expected.items()])
+                    with open(lemma_path) as infile:
+                        self.assertEqual(infile.read().splitlines(), [lemma for lemma, _ in expected])
+
+    def test_ntumc_top3000(self):
+        top3000 = load_top3000()
+        self.assertEqual(len(top3000.synsets), 3000)
+        self.assertEqual((top3000.synsets[0], top3000.freqs[0], top3000.defs[0]), ('02604760-v', 10742, 'have the quality of being'))
+        self.assertEqual(len(top3000_synsets()), 2199)
+        self.assertIs(top3000_synsets(), top3000_synsets())
+        from omwtk.wn_ntumc_top3000 import WN_NTUMC_TOP3000
+        self.assertEqual(len(WN_NTUMC_TOP3000), 3000)
+        self.assertEqual(WN_NTUMC_TOP3000[0], {"synset": "02604760-v", "def": "have the quality of being", "freq": "10742"})
+
+    def test_mfs_ledger(self):
+        items = list(range(10))
+        self.assertEqual(split_plan(items), [('A', items)])
+        self.assertEqual(split_plan(items, ['3', '*']), [('A', [0, 1, 2]), ('B', list(range(3, 10)))])
+        self.assertEqual(split_plan(items, ['0.5', '2']), [('A', [0, 1, 2, 3, 4]), ('B', [5, 6, 7, 8, 9])])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ranking = MFSRanking(os.path.join(tmpdir, 'rank.db'), omw_path=get_fixture().path('omw')).ensure()
+            ledger = MFSLedger(os.path.join(tmpdir, 'ledger.db'))
+            first = ledger.new_synsets(ranking.ds.path, 50)
+            self.assertEqual(first, ranking.rank_range(0, 50))
+            ledger.import_done(first[:5], 'round1')
+            ledger.issue((sid, 'round2', 'A') for sid in first[5:])
+            self.assertEqual(ledger.summary(), {'round1': 5, 'round2': len(first) - 5})
+            self.assertEqual(ledger.new_synsets(ranking.ds.path, 50), [])
+            second = ledger.new_synsets(ranking.ds.path, 100)
+            self.assertEqual(second, [sid for sid in ranking.rank_range(0, 100) if sid not in first])
+
+
+class TestPatch(unittest.TestCase):
+
+    def test_verify_patch(self):
+        fx = get_fixture()
+        with Schema(fx.path('wn30')).ctx() as wnctx:
+            rows = wnctx.select('SELECT sensekey, synsetid FROM senses ORDER BY senseid LIMIT 20')
+            sensekeys = [r[0] for r in rows]
+            sk_map = resolve_sensekeys(sensekeys + ['no-such-key%1:00:00::'], wnctx)
+        self.assertEqual(list(sk_map.keys()), sensekeys)
+        self.assertEqual([sk_map[r[0]] for r in rows], ['{:08d}-{}'.format(r[1] % 100000000, 'nvar'[r[1] // 100000000 - 1]) for r in rows])
+        with Schema(fx.path('omw')).ctx() as ctx:
+            ssdefs = omw_definitions(set(sk_map.values()) | {'99999999-n'}, ctx)
+            self.assertEqual(set(ssdefs.keys()), set(sk_map.values()))
+            for sid, sdef in ssdefs.items():
+                defs = ctx.select("SELECT def FROM synset_def WHERE synset = ? AND lang = 'eng' ORDER BY rowid", (sid,))
+                self.assertEqual(sdef, '; '.join(r[0] for r in defs))
+
+    def test_typo_scanner(self):
+        self.assertEqual(typo_classes('a dog ( canis )'), ['space_bracket'])
+        self.assertEqual(typo_classes('a  dog , e.g.'), ['double_space', 'trailing_eg', 'space_comma'])
+        self.assertEqual(typo_classes('a   )'), ['space_bracket', 'double_space'])
+        self.assertEqual(typo_classes('a dog:'), ['trailing_colon'])
+        self.assertEqual(typo_classes('a dog (Canis familiaris)'), [])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fx = get_fixture()
+            with Schema(fx.path('omw')).ctx() as ctx:
+                rows = ctx.select("SELECT rowid, synset, lang, def FROM synset_def WHERE def LIKE '% )%' OR def LIKE '%  %' OR def LIKE '% ,%'")
+                expected = [(r[0], r[1], r[2], r[3]) for r in rows]
+                typos = list(scan_typos(ctx.execute('SELECT rowid, synset, lang, def FROM synset_def')))
+            self.assertTrue(expected)
+            self.assertEqual([t[:4] for t in typos], expected)
+            index = TypoIndex(os.path.join(tmpdir, 'typo.db'), omw_path=fx.path('omw')).ensure()
+            self.assertFalse(index.is_stale())
+            self.assertEqual(index.typos(), typos)
+            self.assertEqual(index.typos(['eng']), [t for t in typos if t[2] == 'eng'])
+            # a failed rebuild leaves the index unchanged
+            def failed_build(ctx):
+                ctx.cur.execute('DELETE FROM typo')
+                raise ValueError()
+            index.build = failed_build
+            with self.assertRaises(ValueError):
+                index.rebuild()
+            self.assertFalse(index.is_stale())
+            self.assertEqual(index.typos(), typos)
+
+    def test_apply_fixes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            undo_path = os.path.join(tmpdir, 'undo.jsonl')
+            with Schema(copy_db(get_fixture(), 'omw', tmpdir)).ctx() as ctx:
+                def dump():
+                    return [tuple(r) for r in ctx.select('SELECT rowid, * FROM synset_def ORDER BY rowid')]
+                before = dump()
+                (sid1, def1), (sid2, def2) = [(r[1], r[3]) for r in before[:2]]
+                fixes = [DefFix('update', sid1, 'eng', def1, "it's fixed"),
+                         DefFix('delete', sid2, 'eng', def2, None),
+                         DefFix('update', sid1, 'eng', 'no such definition', 'x')]
+                c = apply_fixes(fixes, ctx, dry_run=True, undo_path=undo_path)
+                self.assertEqual((c['Matched'], c['Not matched'], c['Updated'], c['Deleted']), (2, 1, 1, 1))
+                self.assertEqual(dump(), before)
+                self.assertFalse(os.path.isfile(undo_path))
+                apply_fixes(fixes, ctx, undo_path=undo_path)
+                after = dump()
+                self.assertEqual(len(after), len(before) - 1)
+                self.assertIn("it's fixed", [r[3] for r in after])
+                c = undo_fixes(undo_path, ctx)
+                self.assertEqual((c['Restored'], c['Reinserted']), (1, 1))
+                self.assertEqual(dump(), before)
+                # a failure in the middle of a batch changes nothing
+                ctx.execute("CREATE TEMP TRIGGER fail_fix BEFORE UPDATE ON synset_def WHEN NEW.def = 'fail' BEGIN SELECT RAISE(ABORT, 'failed'); END")
+                with self.assertRaises(Exception):
+                    apply_fixes([DefFix('update', sid1, 'eng', def1, "it's fixed"), DefFix('update', sid2, 'eng', def2, 'fail')], ctx)
+                self.assertEqual(dump(), before)
+                # the second row of the undo log is already in the table
+                with open(undo_path, 'w') as outfile:
+                    outfile.write(json.dumps({'action': 'update', 'defid': before[0][0], 'def': 'restored', 'new_def': def1}) + '\n')
+                    outfile.write(json.dumps({'action': 'delete', 'defid': before[1][0], 'synset': sid2, 'lang': 'eng', 'def': def2}) + '\n')
+                with self.assertRaises(Exception):
+                    undo_fixes(undo_path, ctx)
+                self.assertEqual(dump(), before)
+
+    def test_patch_fixes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with Schema(copy_db(get_fixture(), 'omw', tmpdir)).ctx() as ctx:
+                (sid1, def1), (sid2, def2), (sid3, def3) = ctx.select("SELECT synset, MIN(def) FROM synset_def WHERE lang = 'eng' GROUP BY synset HAVING COUNT(*) = 1 ORDER BY synset LIMIT 3")
+                ctx.execute("UPDATE synset_def SET def = ? WHERE synset = ? AND lang = 'eng'", (def2 + ';', sid2))
+                patches = [DefPatch(synset=sid1, orig_def=def1, new_def='fixed 1'),
+                           DefPatch(synset=sid2, orig_def=def2, new_def='fixed 2'),
+                           DefPatch(synset=sid3, orig_def='no such definition', new_def='fixed 3')]
+                fixes, mismatches = patch_fixes(patches, ctx)
+                # the stored definition (with its trailing semicolon) is the one to be replaced
+                self.assertEqual(fixes, [DefFix('update', sid1, 'eng', def1, 'fixed 1'), DefFix('update', sid2, 'eng', def2 + ';', 'fixed 2')])
+                self.assertEqual(mismatches, patches[2:])
+                c = apply_fixes(fixes, ctx, dry_run=True)
+                self.assertEqual((c['Matched'], c['Updated']), (2, 2))
+                # a synset with two definitions
+                ctx.execute("INSERT INTO synset_def (synset, lang, def) VALUES (?, 'eng', 'another definition')", (sid1,))
+                with self.assertRaises(Exception):
+                    patch_fixes(patches, ctx)
+
+    def test_dup_defs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with Schema(copy_db(get_fixture(), 'omw', tmpdir)).ctx() as ctx:
+                added = []
+                for lang in ('eng', 'jpn'):
+                    sid, sdef = ctx.select('SELECT synset, def FROM synset_def WHERE lang = ? ORDER BY synset LIMIT 1', (lang,))[0]
+                    ctx.execute("INSERT INTO synset_def (synset, lang, def) VALUES (?, ?, ?)", (sid, lang, sdef + '; a longer definition'))
+                    added.append((sid, lang, [sdef, sdef + '; a longer definition'], sdef + '; a longer definition', [sdef]))
+                self.assertEqual(list(iter_dup_defs(ctx)), sorted(added))
+                self.assertEqual(list(iter_dup_defs(ctx, langs=['jpn'])), [added[1]])
+
+    def test_convert_patches(self):
+        records = ['sensekey\tdog%1:05:00::\noriginal_def\ta "domestic" dog\npatched_def\ta domestic dog\ninformat\tjmc\t\n',
+                   'sensekey\tcat%1:05:00::\noriginal_def\ta café cat\npatched_def\ta cat\t\n']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path, yaml_path, jsonl_path = [os.path.join(tmpdir, f) for f in ('patches.csv', 'patches.yaml', 'patches.jsonl')]
+            with open(csv_path, 'w') as outfile:
+                outfile.write(''.join(records))
+            patches = list(iter_csv_patches(csv_path))
+            self.assertEqual([p.to_json() for p in patches], [DefPatch.from_string(r[:-2]).to_json() for r in records])
+            self.assertEqual((patches[0].orig_def, patches[0].informant, patches[1].new_def), ('a "domestic" dog', 'jmc', 'a cat'))
+            with open(yaml_path, 'w') as yaml_file, open(jsonl_path, 'w') as jsonl_file:
+                self.assertEqual(write_patches(iter_csv_patches(csv_path), yaml_file, batch_size=1), 2)
+                write_patches(iter_csv_patches(csv_path), jsonl_file, fmt='jsonl')
+            with open(yaml_path) as yaml_file, open(jsonl_path) as jsonl_file:
+                self.assertEqual(yaml.safe_load(yaml_file), [p.to_json() for p in patches])
+                self.assertEqual([json.loads(line) for line in jsonl_file], [p.to_json() for p in patches])
+
+    def test_patch_store(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fx = get_fixture()
+            with Schema(fx.path('wn30')).ctx() as wnctx:
+                sensekeys = [r[0] for r in wnctx.select('SELECT MIN(sensekey) FROM senses GROUP BY synsetid ORDER BY synsetid LIMIT 2')]
+                sk_map = resolve_sensekeys(sensekeys, wnctx)
+            yaml_path, jsonl_path, json_path = [os.path.join(tmpdir, f) for f in ('a.yaml', 'b.jsonl', 'nttat_1.json')]
+            patches = [DefPatch(sk, 'orig {}'.format(idx), 'new {}'.format(idx)).to_json() for idx, sk in enumerate(sensekeys)]
+            with open(yaml_path, 'w') as outfile:
+                yaml.safe_dump(patches, outfile)
+            with open(jsonl_path, 'w') as outfile:
+                # a duplicate of a YAML patch and a different edit of the same sensekey
+                for p in (patches[1], dict(patches[0], new_def='other')):
+                    outfile.write(json.dumps(p) + '\n')
+            with open(json_path, 'w') as outfile:
+                json.dump([{'synset': sk_map[sensekeys[1]], 'lemmas': ['x'], 'definition': 'new 1'}], outfile)
+            store = PatchStore(os.path.join(tmpdir, 'patches.db'))
+            self.assertEqual([store.ingest(p) for p in (yaml_path, jsonl_path, json_path)], [2, 2, 1])
+            self.assertIsNone(store.ingest(yaml_path))
+            self.assertEqual(len(store.find()), 4)
+            with Schema(fx.path('wn30')).ctx() as wnctx:
+                self.assertEqual(store.resolve(wnctx), 3)
+            overlaps = store.overlaps()
+            self.assertEqual([(o.key, o.conflict, len(o.records)) for o in overlaps],
+                             [(sk_map[sensekeys[0]], True, 2), (sk_map[sensekeys[1]], False, 2)])
+            self.assertEqual([o.key for o in store.overlaps(conflicts_only=True)], [sk_map[sensekeys[0]]])
+            shared = store.find({'sensekey': sensekeys[1]})
+            self.assertEqual(len(shared), 1)
+            self.assertEqual(len(shared[0].paths), 2)
+            self.assertEqual([r.patch.new_def for r in store.find({'path': '%.yaml'}, exclude_conflicts=True)], ['new 1'])
+            # re-ingest a changed file, patches which are no longer in any file are removed
+            with open(jsonl_path, 'w') as outfile:
+                outfile.write(json.dumps(patches[1]) + '\n')
+            os.utime(jsonl_path, ns=(1, 1))
+            self.assertEqual(store.ingest(jsonl_path), 1)
+            self.assertEqual(store.overlaps(conflicts_only=True), [])
+            self.assertEqual(len(store.find()), 3)
+            # patches of deleted files are removed, unless they are also in another file
+            os.remove(jsonl_path)
+            os.remove(json_path)
+            self.assertEqual(store.prune(), [os.path.abspath(jsonl_path), os.path.abspath(json_path)])
+            self.assertEqual([(r.patch.new_def, r.paths) for r in store.find()], [('new 0', [os.path.abspath(yaml_path)]), ('new 1', [os.path.abspath(yaml_path)])])
+            self.assertEqual(store.prune(), [])
+
+    def test_nttat_shards(self):
+        from yawlib import GWordnetSQLite
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fx = get_fixture()
+            gwn = GWordnetSQLite(fx.path('gwn'))
+            with gwn.ctx() as ctx:
+                ssids = ['{}-{}'.format(r[0], r[1]) for r in ctx.select("SELECT offset, pos FROM synset WHERE pos != 's' ORDER BY id LIMIT 7")]
+                nttat_path = os.path.join(tmpdir, 'NTTAT.txt')
+                with open(nttat_path, 'w') as outfile:
+                    for idx, sid in enumerate(ssids + ['99999999-n']):
+                        outfile.write('{}\tword{}\t{}\n'.format(idx, idx, sid))
+                self.assertEqual(list(iter_nttat_ssids(nttat_path)), ssids + ['99999999-n'])
+                entries = bulk_gwn_definitions(ssids + ['99999999-n'], ctx)
+                self.assertEqual(list(entries.keys()), ssids)
+                for sid in ssids:
+                    ss = gwn.get_synset(sid, ctx=ctx)
+                    self.assertEqual(entries[sid], (ss.lemmas, ss.definition))
+            records = [{'synset': sid, 'lemmas': entries[sid][0], 'definition': entries[sid][1]} for sid in ssids]
+            paths = nttat_shard_paths(os.path.join(tmpdir, 'nttat'), 3)
+            self.assertEqual(write_nttat_shards(iter(records), len(records), paths), [2, 2, 3])
+            shards = []
+            for path in paths:
+                with open(path) as infile:
+                    content = infile.read()
+                shards.append(json.loads(content))
+                self.assertEqual(content, json.dumps(shards[-1], indent=2))
+            self.assertEqual(sum(shards, []), records)
+            self.assertEqual(write_nttat_shards([], 0, paths[:1]), [0])
+
+
+class TestILIMap(unittest.TestCase):
+
+    def test_ili_map(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pwn30, pwn31, index = [os.path.join(tmpdir, f) for f in ('pwn30.tab', 'pwn31.tab', 'ili.bin')]
+            with open(pwn30, 'w') as outfile:
+                outfile.write('i1\t00001740-a\ni2\t00001854-s\ni35545\t00001740-n\n')
+            with open(pwn31, 'w') as outfile:
+                outfile.write('i1\t00001740-a\ni35545\t00001741-n\n')
+            ili_map = ILIMap(compile_index(index, pwn30, pwn31))
+            self.assertEqual(len(ili_map), 3)
+            self.assertEqual(ili_map.ili_to_pwn30('i2'), '00001854-a')
+            self.assertEqual(ili_map.pwn30_to_ili('00001854-s'), 'i2')
+            self.assertEqual(ili_map.pwn30_to_ili('n00001740'), 'i35545')
+            self.assertEqual(ili_map.pwn31_to_ili('wn31-00001741-n'), 'i35545')
+            self.assertIsNone(ili_map.ili_to_pwn30('i99999'))
+            self.assertEqual(ili_map.translate(['00001740-n', '00001740-a', '99999999-n'], 'pwn30', 'pwn31'), ['00001741-n', '00001740-a', None])
+            self.assertEqual(ili_map.translate(['i1', 'i7', 'x'], 'ili', 'pwn30'), ['00001740-a', None, None])
+            ili_map.close()
+            # the index is compiled again for other or changed tab files
+            self.assertFalse(is_outdated(index, pwn30, pwn31))
+            self.assertTrue(is_outdated(index, pwn31, pwn31))
+            ili_map = get_ili_map(index, pwn31, pwn31)
+            self.assertEqual(ili_map.ili_to_pwn30('i35545'), '00001741-n')
+            self.assertIs(get_ili_map(index, pwn31, pwn31), ili_map)
+            with open(pwn31, 'a') as outfile:
+                outfile.write('i7\t00001742-n\n')
+            self.assertTrue(is_outdated(index, pwn31, pwn31))
+            self.assertEqual(get_ili_map(index, pwn31, pwn31).ili_to_pwn30('i7'), '00001742-n')
+            # replaced maps are closed
+            self.assertIsNone(ili_map.mm)
+            ili_map = get_ili_map(index, pwn30, pwn31)
+            self.assertEqual(ili_map.ili_to_pwn30('i35545'), '00001740-n')
+            ili_map.close()
+            with ILIMap(index) as other:
+                self.assertEqual(len(other), 3)
+            self.assertIsNone(other.mm)
+
+
 class TestPreJP(unittest.TestCase):
 
     def test_romanize(self):